@@ -2,11 +2,10 @@
 회계 시스템 API - SQLAlchemy ORM 기반
 """
 from fastapi import APIRouter, HTTPException
-from typing import List, Dict, Any, Optional
+from typing import List, Any, Optional
 from pydantic import BaseModel
-from datetime import datetime, date, timedelta
-from decimal import Decimal
-from sqlalchemy import func, and_, or_, extract, cast, Date
+from datetime import datetime, timedelta
+from sqlalchemy import func, and_, or_, extract, cast, select, Date
 from sqlalchemy.orm import Session
 
 from database.database_manager import get_database_manager
@@ -14,7 +13,9 @@ from database.db_wrapper import get_db
 from database.models import (
     Order, OrderItem, Expense, Settlement, MarketOrderRaw
 )
+from database.serializers import fetch_dicts
 from utils.cache import async_cached
+from utils.responses import fast_json
 
 router = APIRouter(prefix="/api/accounting", tags=["accounting"])
 
@@ -66,24 +67,6 @@ def get_session():
     return db_manager.get_session()
 
 
-def model_to_dict(obj) -> Dict:
-    """SQLAlchemy 모델을 딕셔너리로 변환"""
-    if obj is None:
-        return {}
-    result = {}
-    for column in obj.__table__.columns:
-        value = getattr(obj, column.name)
-        if isinstance(value, datetime):
-            result[column.name] = value.isoformat()
-        elif isinstance(value, date):
-            result[column.name] = value.isoformat()
-        elif isinstance(value, Decimal):
-            result[column.name] = float(value)
-        else:
-            result[column.name] = value
-    return result
-
-
 # ==========================================
 # 1. 대시보드 - 회계 요약 통계
 # ==========================================
@@ -382,23 +365,23 @@ async def get_expenses(
     """지출 목록 조회"""
     try:
         with get_session() as session:
-            query = session.query(Expense)
+            stmt = select(*Expense.__table__.columns)
 
             if start_date:
-                query = query.filter(Expense.expense_date >= datetime.strptime(start_date, '%Y-%m-%d').date())
+                stmt = stmt.where(Expense.expense_date >= datetime.strptime(start_date, '%Y-%m-%d').date())
             if end_date:
-                query = query.filter(Expense.expense_date <= datetime.strptime(end_date, '%Y-%m-%d').date())
+                stmt = stmt.where(Expense.expense_date <= datetime.strptime(end_date, '%Y-%m-%d').date())
             if category:
-                query = query.filter(Expense.category == category)
+                stmt = stmt.where(Expense.category == category)
 
-            query = query.order_by(Expense.expense_date.desc())
-            expenses = query.all()
+            stmt = stmt.order_by(Expense.expense_date.desc())
+            expenses = fetch_dicts(session, stmt)
 
-            return {
+            return fast_json({
                 "success": True,
-                "expenses": [model_to_dict(e) for e in expenses],
+                "expenses": expenses,
                 "total": len(expenses)
-            }
+            })
     except Exception as e:
         import traceback
         traceback.print_exc()
@@ -506,19 +489,19 @@ async def get_settlements(market: Optional[str] = None):
     """정산 목록 조회"""
     try:
         with get_session() as session:
-            query = session.query(Settlement)
+            stmt = select(*Settlement.__table__.columns)
 
             if market:
-                query = query.filter(Settlement.market == market)
+                stmt = stmt.where(Settlement.market == market)
 
-            query = query.order_by(Settlement.settlement_date.desc())
-            settlements = query.all()
+            stmt = stmt.order_by(Settlement.settlement_date.desc())
+            settlements = fetch_dicts(session, stmt)
 
-            return {
+            return fast_json({
                 "success": True,
-                "settlements": [model_to_dict(s) for s in settlements],
+                "settlements": settlements,
                 "total": len(settlements)
-            }
+            })
     except Exception as e:
         import traceback
         traceback.print_exc()
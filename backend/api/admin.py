@@ -5,6 +5,7 @@ from fastapi import APIRouter, HTTPException, UploadFile, File, Header, Depends,
 from typing import Optional, Dict, Any, List
 import os
 import time
+import asyncio
 import json
 import shutil
 from pathlib import Path
@@ -14,6 +15,8 @@ from datetime import datetime, timedelta
 try:
     import psutil
     PSUTIL_AVAILABLE = True
+    # cpu_percent(interval=None)는 직전 호출 이후 사용률을 반환하므로 기준점을 미리 잡아둠
+    psutil.cpu_percent(interval=None, percpu=True)
 except ImportError:
     PSUTIL_AVAILABLE = False
     print("[WARN] psutil not available - system monitoring disabled")
@@ -33,6 +36,11 @@ except ImportError:
     print("[WARN] sqlite3 not available - using DatabaseWrapper instead")
 
 from database.db_wrapper import get_db
+from backup.backup_manager import create_backup, restore_backup, list_backups as list_backup_files
+from utils import image_store, metrics, storage_catalog
+from utils.browser_pool import get_browser_pool
+from monitor.price_history_retention import compact_price_history, retention_stats
+from utils.fetch_strategy import get_fetch_tracker
 
 # Admin API 인증 (프로덕션 환경에서만)
 def verify_admin_access(
@@ -172,7 +180,7 @@ async def get_system_status():
         if PSUTIL_AVAILABLE:
             memory = psutil.virtual_memory()
             disk = psutil.disk_usage(str(PROJECT_ROOT))
-            cpu_percent = psutil.cpu_percent(interval=0.1)
+            cpu_percent = psutil.cpu_percent(interval=None)
             uptime_seconds = time.time() - psutil.boot_time()
         else:
             # Default values when psutil not available
@@ -369,39 +377,20 @@ async def get_image_stats():
         # 카테고리 이름 매핑 로드
         category_map = get_category_name_map()
 
-        # Supabase Storage 사용
+        # Supabase Storage 사용 (스토리지 카탈로그에서 집계)
         if supabase:
             try:
-                # 모든 폴더(카테고리) 목록 조회 (페이지네이션)
-                all_folders = []
-                offset = 0
-                limit = 1000
-
-                while True:
-                    folder_batch = supabase.storage.from_("product-images").list(
-                        "",
-                        {
-                            "limit": limit,
-                            "offset": offset
-                        }
-                    )
-
-                    if not folder_batch:
-                        break
-
-                    all_folders.extend(folder_batch)
-
-                    if len(folder_batch) < limit:
-                        break
-
-                    offset += limit
+                # 카탈로그가 비어 있으면 최초 1회 Storage와 동기화
+                await asyncio.to_thread(storage_catalog.ensure_populated)
 
                 folders = []
                 total_images = 0
                 total_size = 0
 
-                for folder_obj in all_folders:
-                    folder_name = folder_obj['name']
+                for stat in storage_catalog.folder_stats():
+                    folder_name = stat['folder']
+                    if not folder_name:
+                        continue
 
                     # 폴더명에서 카테고리 ID 추출 (cat-1 -> 1)
                     category_id = None
@@ -409,56 +398,20 @@ async def get_image_stats():
                     if folder_name.startswith('cat-'):
                         category_id = folder_name.replace('cat-', '')
                         # 카테고리 이름 조회 (folder_name이 이미 "1_흰밥" 형식으로 저장됨)
-                        if category_id in category_map:
-                            display_name = category_map[category_id]  # 그대로 사용 (이미 "1_흰밥" 형식)
-                            print(f"[DEBUG] Folder {folder_name} -> display_name: {display_name}")
-                        else:
-                            print(f"[DEBUG] Category ID {category_id} not found in category_map")
-                            display_name = folder_name
+                        display_name = category_map.get(category_id, folder_name)
 
-                    # 폴더 내 이미지 목록 조회 (페이지네이션)
-                    try:
-                        all_images = []
-                        img_offset = 0
-                        img_limit = 1000
-
-                        while True:
-                            image_batch = supabase.storage.from_("product-images").list(
-                                folder_name,
-                                {
-                                    "limit": img_limit,
-                                    "offset": img_offset
-                                }
-                            )
-
-                            if not image_batch:
-                                break
-
-                            all_images.extend(image_batch)
-
-                            if len(image_batch) < img_limit:
-                                break
-
-                            img_offset += img_limit
-
-                        folder_size = sum(
-                            img.get('metadata', {}).get('size', 0)
-                            for img in all_images
-                        )
-
-                        folders.append({
-                            "name": folder_name,  # 실제 스토리지 폴더명 (cat-1)
-                            "display_name": display_name,  # UI 표시용 이름 (1_흰밥)
-                            "path": f"product-images/{folder_name}",
-                            "image_count": len(all_images),
-                            "size_mb": round(folder_size / (1024 * 1024), 2),
-                            "category_id": int(category_id) if category_id and category_id.isdigit() else 999999  # 정렬용
-                        })
+                    folders.append({
+                        "name": folder_name,  # 실제 스토리지 폴더명 (cat-1)
+                        "display_name": display_name,  # UI 표시용 이름 (1_흰밥)
+                        "path": f"product-images/{folder_name}",
+                        "image_count": stat['image_count'],
+                        "thumbnail_count": stat['thumbnail_count'],
+                        "size_mb": round(stat['size'] / (1024 * 1024), 2),
+                        "category_id": int(category_id) if category_id and category_id.isdigit() else 999999  # 정렬용
+                    })
 
-                        total_images += len(all_images)
-                        total_size += folder_size
-                    except:
-                        continue
+                    total_images += stat['image_count']
+                    total_size += stat['size']
 
                 # 카테고리 ID 순으로 정렬 (숫자 정렬)
                 folders.sort(key=lambda x: x.get('category_id', 999999))
@@ -469,7 +422,8 @@ async def get_image_stats():
                     "total_folders": len(folders),
                     "total_images": total_images,
                     "total_size_mb": round(total_size / (1024 * 1024), 2),
-                    "folders": folders  # 카테고리 ID 순 정렬된 폴더
+                    "folders": folders,  # 카테고리 ID 순 정렬된 폴더
+                    "catalog": storage_catalog.get_status()
                 }
             except Exception as e:
                 print(f"[ERROR] Supabase Storage stats failed: {e}")
@@ -593,84 +547,32 @@ async def get_image_gallery(folder_name: str):
             category_id = folder_name
             storage_folder = f"cat-{category_id}"
 
-        print(f"[DEBUG] Gallery request:")
-        print(f"  - folder_name: {folder_name}")
-        print(f"  - category_id: {category_id}")
-        print(f"  - storage_folder: {storage_folder}")
-
-        # 이미지 목록 조회 (모든 파일 가져오기)
+        # 이미지 목록 조회 (스토리지 카탈로그)
         try:
-            # Supabase Storage list API options
-            # limit: 한 번에 가져올 최대 파일 수 (기본값 100)
-            # offset: 시작 위치
-            # sortBy: 정렬 기준
-
-            # 모든 파일 가져오기 (페이지네이션)
-            all_files = []
-            offset = 0
-            limit = 1000  # 한 번에 1000개씩 가져오기
-
-            while True:
-                files = supabase.storage.from_("product-images").list(
-                    storage_folder,
-                    {
-                        "limit": limit,
-                        "offset": offset,
-                        "sortBy": {"column": "name", "order": "asc"}
-                    }
-                )
-
-                if not files:
-                    print(f"[DEBUG] No files returned at offset {offset}")
-                    break
-
-                print(f"[DEBUG] Batch {offset//limit + 1}: {len(files)} files")
-                all_files.extend(files)
-
-                # 더 이상 파일이 없으면 종료
-                if len(files) < limit:
-                    break
-
-                offset += limit
-
-            print(f"[DEBUG] Total files retrieved: {len(all_files)}")
+            await asyncio.to_thread(storage_catalog.ensure_populated)
 
             image_list = []
-            for file in all_files:
-                # 파일인지 폴더인지 확인 (폴더는 제외)
-                if file.get('id') is None:
-                    # thumbs 폴더 등 제외
-                    if file.get('name') != 'thumbs':
-                        print(f"[DEBUG] Skipping folder: {file.get('name')}")
-                    continue
-
-                filename = file['name']
-
-                # thumbs 폴더 내부 파일은 제외
-                if filename.startswith('thumbs/') or '/thumbs/' in filename:
-                    continue
+            for obj in storage_catalog.list_folder(storage_folder):
+                filename = obj['filename']
 
                 # 원본 이미지 URL 생성
-                storage_path = f"{storage_folder}/{filename}"
-                public_url = get_public_url(storage_path)
+                public_url = get_public_url(obj['path'])
 
-                # 썸네일 URL 생성 (존재 여부는 프론트에서 확인)
-                thumb_path = f"{storage_folder}/thumbs/{filename}"
-                thumbnail_url = get_public_url(thumb_path)
+                # 썸네일 URL (썸네일이 없으면 원본 URL)
+                thumbnail_url = get_public_url(f"{storage_folder}/thumbs/{filename}") if obj['has_thumbnail'] else public_url
 
                 image_list.append({
                     "filename": filename,
                     "path": public_url,  # 원본 URL
                     "thumbnail_path": thumbnail_url,  # 썸네일 URL
-                    "size_kb": round(file.get('metadata', {}).get('size', 0) / 1024, 2) if file.get('metadata') else 0,
-                    "width": 0,  # Supabase Storage는 이미지 메타데이터 제공하지 않음
-                    "height": 0,
+                    "has_thumbnail": bool(obj['has_thumbnail']),
+                    "size_kb": round((obj['size'] or 0) / 1024, 2),
+                    "width": obj['width'] or 0,  # write-through 업로드된 이미지만 기록됨
+                    "height": obj['height'] or 0,
                     "format": filename.split('.')[-1].upper() if '.' in filename else "Unknown",
-                    "modified": file.get('updated_at', file.get('created_at', ''))
+                    "modified": obj['modified_at'] or ''
                 })
 
-            print(f"[DEBUG] Returning {len(image_list)} images with thumbnails")
-
             return {
                 "success": True,
                 "folder": folder_name,
@@ -678,7 +580,7 @@ async def get_image_gallery(folder_name: str):
                 "count": len(image_list)
             }
         except Exception as e:
-            print(f"[ERROR] Failed to list images from Supabase Storage: {e}")
+            print(f"[ERROR] Failed to list images from storage catalog: {e}")
             import traceback
             traceback.print_exc()
             return {"success": False, "detail": f"Supabase Storage 조회 실패: {str(e)}"}
@@ -686,6 +588,30 @@ async def get_image_gallery(folder_name: str):
         raise HTTPException(status_code=500, detail=str(e))
 
 
+@router.get("/images/catalog")
+async def get_storage_catalog_status():
+    """스토리지 카탈로그 상태 (객체 수, 마지막 동기화 시각)"""
+    try:
+        return {
+            "success": True,
+            **storage_catalog.get_status(),
+            "content_addressed": image_store.get_stats()
+        }
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
+
+@router.post("/images/catalog/reconcile")
+async def reconcile_storage_catalog(folder_name: Optional[str] = None):
+    """스토리지 카탈로그를 Supabase Storage 목록과 다시 동기화"""
+    try:
+        folders = [folder_name] if folder_name else None
+        result = await asyncio.to_thread(storage_catalog.reconcile, folders)
+        return {"success": True, **result}
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"카탈로그 동기화 실패: {str(e)}")
+
+
 @router.get("/env/debug", dependencies=[])
 async def debug_environment():
     """환경 변수 디버그"""
@@ -1047,6 +973,7 @@ async def delete_folder(folder_number: int):
                     except:
                         pass
 
+                    storage_catalog.remove_folder(storage_folder)
                     print(f"[INFO] Supabase Storage 폴더 삭제: {storage_folder}")
                 except Exception as e:
                     print(f"[WARN] Supabase Storage 폴더 삭제 실패: {e}")
@@ -1272,22 +1199,22 @@ async def backup_database():
                 "link": "https://supabase.com/dashboard/project/_/settings/addons"
             }
 
-        # SQLite 백업
+        # SQLite 백업 (온라인 백업 API, 주기에 따라 전체/증분 자동 선택)
         if not DB_PATH.exists():
             return {"success": False, "detail": "데이터베이스를 찾을 수 없습니다"}
 
-        # 백업 파일명 (타임스탬프)
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        backup_file = BACKUP_DIR / f"monitoring_backup_{timestamp}.db"
-
-        # 백업 실행
-        shutil.copy2(DB_PATH, backup_file)
+        result = await asyncio.to_thread(create_backup, DB_PATH, BACKUP_DIR)
+        backup_file = BACKUP_DIR / result["filename"]
 
         return {
             "success": True,
             "backup_file": str(backup_file),
-            "size_mb": round(backup_file.stat().st_size / (1024 * 1024), 2),
-            "timestamp": timestamp
+            "type": result["type"],
+            "base": result["base"],
+            "changed_pages": result["changed_pages"],
+            "total_pages": result["total_pages"],
+            "size_mb": result["size_mb"],
+            "timestamp": datetime.now().strftime("%Y%m%d_%H%M%S")
         }
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
@@ -1297,15 +1224,16 @@ async def backup_database():
 async def list_backups():
     """백업 파일 목록"""
     try:
-        backups = []
-        if BACKUP_DIR.exists():
-            for backup_file in sorted(BACKUP_DIR.glob("monitoring_backup_*.db"), reverse=True):
-                backups.append({
-                    "filename": backup_file.name,
-                    "path": str(backup_file),
-                    "size_mb": round(backup_file.stat().st_size / (1024 * 1024), 2),
-                    "created": datetime.fromtimestamp(backup_file.stat().st_mtime).isoformat()
-                })
+        backups = [
+            {
+                "filename": backup["filename"],
+                "path": backup["path"],
+                "type": backup["type"],
+                "size_mb": backup["size_mb"],
+                "created": backup["created_at"].isoformat()
+            }
+            for backup in list_backup_files(BACKUP_DIR)
+        ]
 
         return {
             "success": True,
@@ -1332,21 +1260,16 @@ async def restore_database(backup_filename: str):
 
         # SQLite 복원
         backup_file = BACKUP_DIR / backup_filename
-        if not backup_file.exists():
+        if Path(backup_filename).name != backup_filename or not backup_file.exists():
             return {"success": False, "detail": "백업 파일을 찾을 수 없습니다"}
 
-        # 현재 DB 백업
-        current_backup = BACKUP_DIR / f"before_restore_{datetime.now().strftime('%Y%m%d_%H%M%S')}.db"
-        if DB_PATH.exists():
-            shutil.copy2(DB_PATH, current_backup)
-
-        # 복원
-        shutil.copy2(backup_file, DB_PATH)
+        # 무결성 검사 → 현재 DB 전체 백업 → 쓰기 중지 후 백업 API로 복원
+        result = await asyncio.to_thread(restore_backup, backup_filename, DB_PATH, BACKUP_DIR)
 
         return {
             "success": True,
             "message": "데이터베이스가 복원되었습니다",
-            "current_backup": str(current_backup)
+            "current_backup": str(BACKUP_DIR / result["current_backup"]) if result["current_backup"] else None
         }
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
@@ -1481,10 +1404,10 @@ async def get_environment_variables():
 
 @router.get("/performance/metrics")
 async def get_performance_metrics():
-    """성능 메트릭"""
+    """성능 메트릭 (호스트 + 애플리케이션 요약)"""
     try:
-        # CPU 사용률
-        cpu_percent = psutil.cpu_percent(interval=1, percpu=True)
+        # CPU 사용률 (직전 호출 이후 평균, 대기 없음)
+        cpu_percent = psutil.cpu_percent(interval=None, percpu=True)
 
         # 메모리
         memory = psutil.virtual_memory()
@@ -1514,12 +1437,69 @@ async def get_performance_metrics():
             "network": {
                 "sent_mb": net_io.bytes_sent / (1024 * 1024),
                 "recv_mb": net_io.bytes_recv / (1024 * 1024)
-            }
+            },
+            # 라우트/DB/스크래핑/PlayAuto/스케줄러 지연 시간 (모든 워커 합산)
+            "application": await asyncio.to_thread(metrics.summary),
+            # FlareSolverr 브라우저 세션 풀 (현재 워커)
+            "browser_pool": get_browser_pool().stats()
         }
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
 
+@router.get("/performance/slow-queries")
+async def get_slow_queries(limit: int = 20, sort: str = "total"):
+    """
+    쿼리별 실행 통계 상위 목록 (현재 워커 기준)
+
+    Args:
+        sort: total | avg | p95 | calls | max
+    """
+    try:
+        from database.query_profiler import get_profiler, SLOW_QUERY_MS, N_PLUS_ONE_THRESHOLD
+        profiler = get_profiler()
+        if profiler is None:
+            raise HTTPException(status_code=503, detail="쿼리 프로파일러가 활성화되지 않았습니다")
+
+        return {
+            "success": True,
+            "worker_pid": os.getpid(),
+            "since": profiler.started_at.isoformat(),
+            "slow_query_ms": SLOW_QUERY_MS,
+            "n_plus_one_threshold": N_PLUS_ONE_THRESHOLD,
+            "top": profiler.top(limit=limit, sort=sort),
+            "n_plus_one": profiler.n_plus_one()[:limit],
+            "recent_slow": profiler.recent_slow()
+        }
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
+
+@router.post("/performance/slow-queries/reset")
+async def reset_slow_queries():
+    """쿼리 통계 초기화 (현재 워커)"""
+    from database.query_profiler import get_profiler
+    profiler = get_profiler()
+    if profiler is not None:
+        profiler.reset()
+    return {"success": True, "worker_pid": os.getpid()}
+
+
+@router.get("/performance/fetch-strategies")
+async def get_fetch_strategies():
+    """도메인별 페이지 가져오기 전략 통계 (direct / cookie_replay / flaresolverr, 현재 워커)"""
+    return {"success": True, "worker_pid": os.getpid(), **get_fetch_tracker().stats()}
+
+
+@router.post("/performance/fetch-strategies/reset")
+async def reset_fetch_strategies(domain: Optional[str] = None):
+    """가져오기 전략 통계 초기화 (domain 미지정 시 전체, 현재 워커)"""
+    get_fetch_tracker().reset(domain)
+    return {"success": True, "worker_pid": os.getpid()}
+
+
 @router.post("/cleanup/old-orders")
 async def cleanup_old_orders(days: int = 90):
     """오래된 주문 삭제"""
@@ -1549,6 +1529,24 @@ async def cleanup_old_orders(days: int = 90):
         raise HTTPException(status_code=500, detail=str(e))
 
 
+@router.get("/performance/price-history")
+async def get_price_history_retention():
+    """가격 이력 단계별(원본/시간/일 요약) 행 수와 보존 설정"""
+    try:
+        return {"success": True, **await asyncio.to_thread(retention_stats)}
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"가격 이력 통계 조회 실패: {str(e)}")
+
+
+@router.post("/cleanup/price-history")
+async def cleanup_price_history():
+    """가격 이력 압축 + 보존 기간 지난 원본/시간 요약/읽은 알림 삭제 (스케줄러 작업 즉시 실행)"""
+    try:
+        return {"success": True, **await asyncio.to_thread(compact_price_history)}
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"가격 이력 압축 실패: {str(e)}")
+
+
 @router.post("/cleanup/temp-files")
 async def cleanup_temp_files():
     """임시 파일 정리"""
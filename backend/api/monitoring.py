@@ -1,22 +1,59 @@
 """
 상품 모니터링 API 엔드포인트 - FlareSolverr 기반 (Selenium 제거)
 """
-from fastapi import APIRouter, HTTPException, BackgroundTasks
+from fastapi import APIRouter, HTTPException, BackgroundTasks, UploadFile, File
+from fastapi.responses import StreamingResponse
 from pydantic import BaseModel
-from typing import Optional, List
-from datetime import datetime
+from typing import Optional, List, Tuple
+from datetime import datetime, timedelta
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+import asyncio
+import csv
+import io
+import json
+import os
 import re
 
 from database.db_wrapper import get_db
+from database.pagination import fetch_keyset_page
+from monitor.price_history_retention import (
+    RESOLUTIONS as PRICE_RESOLUTIONS, get_price_series, get_recent_price_points
+)
 from monitor.product_monitor import ProductMonitor
+from monitor.source_registry import get_scraper, resolve_source
 from utils.cache import async_cached
-from utils.flaresolverr import solve_cloudflare, get_flaresolverr_client
+from utils.responses import fast_json
+from utils.flaresolverr import get_flaresolverr_client
 from logger import get_logger
 
 logger = get_logger(__name__)
 
 router = APIRouter(prefix="/api/monitor", tags=["monitoring"])
 
+# 상품명을 추출하지 못했을 때 표시하는 값
+UNKNOWN_PRODUCT_NAME = "자동 감지 실패"
+
+# URL 대량 가져오기 동시성 (전체 / 도메인별 / 썸네일 다운로드)
+BULK_IMPORT_CONCURRENCY = int(os.getenv('BULK_IMPORT_CONCURRENCY', '8'))
+BULK_IMPORT_DOMAIN_CONCURRENCY = int(os.getenv('BULK_IMPORT_DOMAIN_CONCURRENCY', '2'))
+BULK_IMPORT_THUMBNAIL_CONCURRENCY = int(os.getenv('BULK_IMPORT_THUMBNAIL_CONCURRENCY', '8'))
+BULK_IMPORT_MAX_URLS = int(os.getenv('BULK_IMPORT_MAX_URLS', '1000'))
+BULK_IMPORT_FORMATS = ('ndjson', 'sse')
+
+# 대량 가져오기 추출/썸네일 전용 스레드 풀 (다른 요청의 DB 호출이 쓰는 기본 executor를 점유하지 않도록)
+_bulk_import_executor = ThreadPoolExecutor(
+    max_workers=max(1, BULK_IMPORT_CONCURRENCY + BULK_IMPORT_THUMBNAIL_CONCURRENCY),
+    thread_name_prefix='bulk-import'
+)
+
+# 중복 판단 시 무시하는 추적용 쿼리 파라미터 (utm_* 포함)
+TRACKING_PARAMS = {
+    'fbclid', 'gclid', 'igshid', 'mc_cid', 'mc_eid', 'NaPm',
+    'n_media', 'n_query', 'n_rank', 'n_ad_group', 'n_ad', 'n_keyword', 'n_keyword_id', 'n_campaign_type',
+}
+
 
 # Request 모델
 class AddMonitoringRequest(BaseModel):
@@ -33,6 +70,13 @@ class UpdateStatusRequest(BaseModel):
     is_active: bool
 
 
+class BulkImportRequest(BaseModel):
+    urls: List[str] = []
+    csv_text: Optional[str] = None  # CSV 내용 (http(s)로 시작하는 셀을 URL로 사용)
+    add_to_monitoring: bool = True
+    check_interval: int = 15  # 분
+
+
 # API 엔드포인트
 
 @router.post("/add")
@@ -69,20 +113,44 @@ async def add_monitoring_product(request: AddMonitoringRequest, background_tasks
 
 @router.get("/products")
 @async_cached(ttl=30)  # 30초 캐싱
-async def get_monitored_products(active_only: bool = True):
+async def get_monitored_products(
+    active_only: bool = True,
+    limit: int = 100,
+    cursor: Optional[str] = None,
+    paginate: bool = False
+):
     """
     모니터링 중인 상품 목록 조회
+
+    paginate=true 또는 cursor 지정 시 limit개씩 keyset 페이지네이션 (응답에 next_cursor 포함)
     """
     try:
+        if paginate or cursor:
+            products, next_cursor = fetch_keyset_page(
+                "SELECT * FROM monitored_products",
+                where=["is_active = TRUE"] if active_only else None,
+                cursor=cursor,
+                limit=limit
+            )
+            return fast_json({
+                "success": True,
+                "products": products,
+                "total": len(products),
+                "next_cursor": next_cursor,
+                "has_more": next_cursor is not None
+            })
+
         db = get_db()
         products = db.get_all_monitored_products(active_only=active_only)
 
-        return {
+        return fast_json({
             "success": True,
             "products": products,
             "total": len(products)
-        }
+        })
 
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"목록 조회 실패: {str(e)}")
 
@@ -273,13 +341,36 @@ async def get_margin_alert_products():
 
 
 @router.get("/product/{product_id}/price-history")
-async def get_product_price_history(product_id: int, limit: int = 30):
+async def get_product_price_history(product_id: int, limit: int = 30, days: Optional[int] = None,
+                                    resolution: str = "auto"):
     """
     특정 상품의 가격 변동 이력 조회 (차트용)
+
+    - days 미지정: 최근 변동 limit건 (보존 기간이 지나 삭제된 구간은 시간/일 요약 종가로 채움)
+    - days 지정: 최근 days일 OHLC 시계열 (resolution=auto면 기간에 맞춰 raw/hour/day 자동 선택)
     """
     try:
-        db = get_db()
-        history = db.get_price_history(product_id, limit=limit)
+        if days is not None:
+            if resolution != "auto" and resolution not in PRICE_RESOLUTIONS:
+                raise HTTPException(status_code=400, detail=f"지원하지 않는 단위: {resolution}")
+            series = await asyncio.to_thread(
+                get_price_series, product_id, datetime.now() - timedelta(days=days), None, resolution
+            )
+            points = series["points"]
+            return {
+                "success": True,
+                "resolution": series["resolution"],
+                "series": points,
+                "chart_data": {
+                    "labels": [point["time"] for point in points],
+                    "prices": [point["close"] for point in points],
+                    "high": [point["high"] for point in points],
+                    "low": [point["low"] for point in points]
+                },
+                "total": len(points)
+            }
+
+        history = await asyncio.to_thread(get_recent_price_points, product_id, limit)
 
         # 차트용 데이터 포맷 (시간순 정렬)
         chart_data = {
@@ -294,282 +385,226 @@ async def get_product_price_history(product_id: int, limit: int = 30):
             "total": len(history)
         }
 
+    except HTTPException:
+        raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"가격 이력 조회 실패: {str(e)}")
 
 
-@router.post("/extract-url-info")
-async def extract_url_info(request: dict):
-    """
-    URL에서 상품 정보 자동 추출 - FlareSolverr 기반
+def _extract_url_info(product_url: str, store_thumbnail: bool = True) -> dict:
     """
-    try:
-        product_url = request.get('product_url')
-        if not product_url:
-            raise HTTPException(status_code=400, detail="URL이 필요합니다.")
+    URL에서 상품 정보 추출 (동기 - FlareSolverr/requests 호출)
 
-        # URL에서 소스 감지
-        source = 'other'
-        if 'ssg.com' in product_url:
-            source = 'ssg'
-        elif 'mfront.homeplus.co.kr' in product_url:
-            source = 'homeplus'
-        elif 'homeplus.co.kr' in product_url or 'traders' in product_url:
-            source = 'traders'
-        elif '11st.co.kr' in product_url:
-            source = '11st'
-        elif 'lotteon.com' in product_url:
-            source = 'lotteon'
-        elif 'gmarket.co.kr' in product_url:
-            source = 'gmarket'
-        elif 'auction.co.kr' in product_url:
-            source = 'auction'
-        elif 'gsshop.com' in product_url:
-            source = 'gsshop'
-        elif 'cjthemarket.com' in product_url:
-            source = 'cjthemarket'
-        elif 'otokimall.com' in product_url:
-            source = 'otokimall'
-        elif 'dongwonmall.com' in product_url:
-            source = 'dongwonmall'
-        elif 'smartstore.naver.com' in product_url:
-            source = 'smartstore'
-        elif 'domeggook.com' in product_url:
-            source = 'domeggook'
-        # else: source는 이미 'other'로 설정되어 있음 - 범용 추출 시도
-
-        # 스마트스토어 경고
-        if source == 'smartstore':
-            return {
-                "success": False,
-                "error": "smartstore_captcha",
-                "message": "네이버 스마트스토어가 CAPTCHA로 자동 접근을 차단했습니다. 상품 정보를 수동으로 입력해주세요."
-            }
+    Args:
+        product_url: 상품 URL
+        store_thumbnail: 썸네일 다운로드/저장 여부 (대량 가져오기는 별도로 병렬 다운로드)
 
-        # 홈플러스 전용 스크래퍼 사용
-        if source == 'homeplus':
-            try:
-                from sourcing.homeplus import HomeplusScraper
-                scraper = HomeplusScraper()
-                result = scraper.extract_product_info(product_url)
-
-                if result.get('success'):
-                    return {
-                        "success": True,
-                        "source": "homeplus",
-                        "product_name": result.get('product_name'),
-                        "price": result.get('price'),
-                        "original_price": result.get('original_price'),
-                        "status": result.get('status'),
-                        "thumbnail": result.get('thumbnail'),
-                        "message": "홈플러스 상품 정보가 추출되었습니다."
-                    }
-                else:
-                    return {
-                        "success": False,
-                        "source": "homeplus",
-                        "error": result.get('error', '상품 정보 추출 실패'),
-                        "message": "홈플러스 상품 정보를 가져올 수 없습니다."
-                    }
-            except Exception as e:
-                print(f"[HOMEPLUS] 상품 정보 추출 실패: {e}")
-                return {
-                    "success": False,
-                    "source": "homeplus",
-                    "error": str(e),
-                    "message": "홈플러스 상품 정보 추출 중 오류가 발생했습니다."
-                }
+    Raises:
+        HTTPException: 페이지 접근 불가/차단/추출 실패
+    """
+    # URL에서 소스 감지 (알 수 없는 소싱처는 'other' - 범용 추출 시도)
+    source_info = resolve_source(product_url)
+    source = source_info.name
 
-        # 도매꾹 수동 입력 안내
-        if source == 'domeggook':
-            # 도매꾹 스크래퍼로 상품명만 추출 시도
-            try:
-                from sourcing.domeggook import DomeggookScraper
-                scraper = DomeggookScraper()
-                result = scraper.extract_product_info(product_url)
+    # 스마트스토어 경고
+    if source == 'smartstore':
+        return {
+            "success": False,
+            "error": "smartstore_captcha",
+            "message": "네이버 스마트스토어가 CAPTCHA로 자동 접근을 차단했습니다. 상품 정보를 수동으로 입력해주세요."
+        }
 
-                product_name = result.get('product_name', '')
-                thumbnail = result.get('thumbnail', '')
+    # 홈플러스 전용 스크래퍼 사용
+    if source == 'homeplus':
+        try:
+            result = get_scraper(source_info).extract_product_info(product_url)
 
+            if result.get('success'):
                 return {
                     "success": True,
-                    "manual_input_required": True,
-                    "source": "domeggook",
-                    "product_name": product_name,
-                    "thumbnail": thumbnail,
-                    "price": None,
-                    "original_price": None,
-                    "message": "도매꾹은 사업자 전용 사이트로 로그인이 필요합니다. 가격 정보를 직접 입력해주세요.",
-                    "note": "상품명과 썸네일은 자동으로 추출되었습니다. 소싱가와 판매가를 입력해주세요."
+                    "source": "homeplus",
+                    "product_name": result.get('product_name'),
+                    "price": result.get('price'),
+                    "original_price": result.get('original_price'),
+                    "status": result.get('status'),
+                    "thumbnail": result.get('thumbnail'),
+                    "message": "홈플러스 상품 정보가 추출되었습니다."
                 }
-            except Exception as e:
-                print(f"[DOMEGGOOK] 상품명 추출 실패: {e}")
+            else:
                 return {
-                    "success": True,
-                    "manual_input_required": True,
-                    "source": "domeggook",
-                    "product_name": "",
-                    "price": None,
-                    "original_price": None,
-                    "message": "도매꾹은 사업자 전용 사이트로 로그인이 필요합니다. 상품 정보를 직접 입력해주세요."
+                    "success": False,
+                    "source": "homeplus",
+                    "error": result.get('error', '상품 정보 추출 실패'),
+                    "message": "홈플러스 상품 정보를 가져올 수 없습니다."
                 }
+        except Exception as e:
+            print(f"[HOMEPLUS] 상품 정보 추출 실패: {e}")
+            return {
+                "success": False,
+                "source": "homeplus",
+                "error": str(e),
+                "message": "홈플러스 상품 정보 추출 중 오류가 발생했습니다."
+            }
 
-        print(f"[EXTRACT] URL 정보 추출 시작: {product_url}")
-        print(f"[EXTRACT] 감지된 소스: {source}")
+    # 도매꾹 수동 입력 안내
+    if source == 'domeggook':
+        # 도매꾹 스크래퍼로 상품명만 추출 시도
+        try:
+            result = get_scraper(source_info).extract_product_info(product_url)
 
-        # FlareSolverr로 HTML 가져오기
-        html = None
-        flaresolverr_result = solve_cloudflare(product_url, max_timeout=60000)
+            product_name = result.get('product_name', '')
+            thumbnail = result.get('thumbnail', '')
 
-        if flaresolverr_result and flaresolverr_result.get('html'):
-            html = flaresolverr_result.get('html', '')
-            print(f"[FLARESOLVERR] HTML 수신 완료 (길이: {len(html)})")
-        else:
-            # FlareSolverr 실패 시 requests로 시도
-            import requests as req
-            headers = {
-                'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
-                'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
-                'Accept-Language': 'ko-KR,ko;q=0.9,en-US;q=0.8,en;q=0.7',
+            return {
+                "success": True,
+                "manual_input_required": True,
+                "source": "domeggook",
+                "product_name": product_name,
+                "thumbnail": thumbnail,
+                "price": None,
+                "original_price": None,
+                "message": "도매꾹은 사업자 전용 사이트로 로그인이 필요합니다. 가격 정보를 직접 입력해주세요.",
+                "note": "상품명과 썸네일은 자동으로 추출되었습니다. 소싱가와 판매가를 입력해주세요."
+            }
+        except Exception as e:
+            print(f"[DOMEGGOOK] 상품명 추출 실패: {e}")
+            return {
+                "success": True,
+                "manual_input_required": True,
+                "source": "domeggook",
+                "product_name": "",
+                "price": None,
+                "original_price": None,
+                "message": "도매꾹은 사업자 전용 사이트로 로그인이 필요합니다. 상품 정보를 직접 입력해주세요."
             }
-            try:
-                response = req.get(product_url, headers=headers, timeout=15)
-                response.raise_for_status()
-                html = response.text
-                print(f"[REQUESTS] HTML 수신 완료 (길이: {len(html)})")
-            except Exception as e:
-                print(f"[REQUESTS] 실패: {e}")
 
-        if not html:
-            raise HTTPException(status_code=503, detail="페이지를 가져올 수 없습니다. 잠시 후 다시 시도해주세요.")
+    print(f"[EXTRACT] URL 정보 추출 시작: {product_url}")
+    print(f"[EXTRACT] 감지된 소스: {source}")
+
+    # HTML 가져오기 (도메인별로 잘 되는 가장 싼 방법부터: requests → 쿠키 재사용 → FlareSolverr)
+    monitor = ProductMonitor()
+    html = monitor.fetch_html(product_url, source_info)
+    if html:
+        print(f"[EXTRACT] HTML 수신 완료 (길이: {len(html)})")
+
+    if not html:
+        raise HTTPException(status_code=503, detail="페이지를 가져올 수 없습니다. 잠시 후 다시 시도해주세요.")
+
+    # BeautifulSoup으로 파싱
+    from bs4 import BeautifulSoup
+    soup = BeautifulSoup(html, 'html.parser')
+
+    # 페이지 차단 확인
+    page_title = soup.title.string if soup.title else ""
+    cloudflare_indicators = ['just a moment', 'checking your browser', '사용자 활동 검토', '차단', 'blocked']
+    if any(indicator in str(page_title).lower() for indicator in cloudflare_indicators):
+        raise HTTPException(
+            status_code=503,
+            detail=f"사이트 보안 시스템에 의해 접근이 차단되었습니다. 잠시 후 다시 시도해주세요."
+        )
 
-        # BeautifulSoup으로 파싱
-        from bs4 import BeautifulSoup
-        soup = BeautifulSoup(html, 'html.parser')
+    # ProductMonitor 사용하여 데이터 추출
+    extraction_method = None  # 범용 추출 시에만 사용
 
-        # 페이지 차단 확인
-        page_title = soup.title.string if soup.title else ""
-        cloudflare_indicators = ['just a moment', 'checking your browser', '사용자 활동 검토', '차단', 'blocked']
-        if any(indicator in str(page_title).lower() for indicator in cloudflare_indicators):
-            raise HTTPException(
-                status_code=503,
-                detail=f"사이트 보안 시스템에 의해 접근이 차단되었습니다. 잠시 후 다시 시도해주세요."
-            )
+    # 알려진 소스인 경우: 기존 방식으로 추출
+    if source != 'other':
+        # 상품명 추출
+        product_name = monitor._extract_product_name(soup, product_url)
+        print(f"[EXTRACT] 상품명: {product_name}")
 
-        # ProductMonitor 사용하여 데이터 추출
-        monitor = ProductMonitor()
-        extraction_method = None  # 범용 추출 시에만 사용
+        # 가격 추출
+        current_price = monitor._extract_price(soup, product_url)
+        print(f"[EXTRACT] 가격: {current_price}")
 
-        # 알려진 소스인 경우: 기존 방식으로 추출
-        if source != 'other':
-            # 상품명 추출
-            product_name = monitor._extract_product_name(soup, product_url)
+        # 썸네일 추출
+        thumbnail_url = monitor._extract_thumbnail(soup, product_url)
+        print(f"[EXTRACT] 썸네일: {thumbnail_url}")
+
+        # 상태 체크 - 소스별 전용 함수 사용
+        status = 'available'
+        status_details = '정상'
+
+        if source_info.status_checker:
+            status_result = monitor.check_status_from_soup(soup, product_url, source_info)
+            status = status_result.get('status', 'available')
+            status_details = status_result.get('details', '정상')
+            # 판매종료 상품인 경우 가격/상품명 무효화 (CJ더마켓은 종료 후에도 이전 정보가 노출됨)
+            if source == 'cjthemarket' and status == 'discontinued':
+                current_price = None
+                product_name = None
+            print(f"[EXTRACT] {source} 상태: {status} ({status_details})")
+        else:
+            # 기본 키워드 체크
+            page_text = soup.get_text().lower()
+            if '품절' in page_text or 'sold out' in page_text:
+                status = 'out_of_stock'
+            elif '판매종료' in page_text or '단종' in page_text:
+                status = 'discontinued'
+    else:
+        # 알 수 없는 소스: 범용 추출 시도 (JSON-LD → 메타태그 → Microdata → CSS패턴)
+        print(f"[EXTRACT] 범용 추출 모드 시작...")
+        generic_result = monitor.extract_generic_product_info(soup, product_url)
+
+        if generic_result:
+            product_name = generic_result.get('product_name')
+            current_price = generic_result.get('price')
+            thumbnail_url = generic_result.get('thumbnail')
+            status = generic_result.get('status', 'available')
+            extraction_method = generic_result.get('extraction_method', 'unknown')
+            print(f"[EXTRACT] 범용 추출 성공 (방법: {extraction_method})")
             print(f"[EXTRACT] 상품명: {product_name}")
-
-            # 가격 추출
-            current_price = monitor._extract_price(soup, product_url)
             print(f"[EXTRACT] 가격: {current_price}")
-
-            # 썸네일 추출
-            thumbnail_url = monitor._extract_thumbnail(soup, product_url)
             print(f"[EXTRACT] 썸네일: {thumbnail_url}")
-
-            # 상태 체크 - 소스별 전용 함수 사용
-            status = 'available'
-            status_details = '정상'
-
-            if source == 'cjthemarket':
-                status_result = monitor._check_cjthemarket_status(soup)
-                status = status_result.get('status', 'available')
-                status_details = status_result.get('details', '정상')
-                # 판매종료 상품인 경우 가격/상품명 무효화
-                if status == 'discontinued':
-                    current_price = None
-                    product_name = None
-                print(f"[EXTRACT] CJ더마켓 상태: {status} ({status_details})")
-            elif source == 'otokimall':
-                status_result = monitor._check_otokimall_status(soup)
-                status = status_result.get('status', 'available')
-                status_details = status_result.get('details', '정상')
-                print(f"[EXTRACT] 오뚜기몰 상태: {status} ({status_details})")
-            elif source == 'dongwonmall':
-                status_result = monitor._check_dongwonmall_status(soup)
-                status = status_result.get('status', 'available')
-                status_details = status_result.get('details', '정상')
-                print(f"[EXTRACT] 동원몰 상태: {status} ({status_details})")
-            elif source == 'ssg':
-                status_result = monitor._check_ssg_status(soup)
-                status = status_result.get('status', 'available')
-                status_details = status_result.get('details', '정상')
-                print(f"[EXTRACT] SSG 상태: {status} ({status_details})")
-            elif source == '11st':
-                status_result = monitor._check_11st_status(soup)
-                status = status_result.get('status', 'available')
-                status_details = status_result.get('details', '정상')
-                print(f"[EXTRACT] 11번가 상태: {status} ({status_details})")
-            elif source == 'gsshop':
-                status_result = monitor._check_gsshop_status(soup)
-                status = status_result.get('status', 'available')
-                status_details = status_result.get('details', '정상')
-                print(f"[EXTRACT] GS샵 상태: {status} ({status_details})")
-            else:
-                # 기본 키워드 체크
-                page_text = soup.get_text().lower()
-                if '품절' in page_text or 'sold out' in page_text:
-                    status = 'out_of_stock'
-                elif '판매종료' in page_text or '단종' in page_text:
-                    status = 'discontinued'
         else:
-            # 알 수 없는 소스: 범용 추출 시도 (JSON-LD → 메타태그 → Microdata → CSS패턴)
-            print(f"[EXTRACT] 범용 추출 모드 시작...")
-            generic_result = monitor.extract_generic_product_info(soup, product_url)
-
-            if generic_result:
-                product_name = generic_result.get('product_name')
-                current_price = generic_result.get('price')
-                thumbnail_url = generic_result.get('thumbnail')
-                status = generic_result.get('status', 'available')
-                extraction_method = generic_result.get('extraction_method', 'unknown')
-                print(f"[EXTRACT] 범용 추출 성공 (방법: {extraction_method})")
-                print(f"[EXTRACT] 상품명: {product_name}")
-                print(f"[EXTRACT] 가격: {current_price}")
-                print(f"[EXTRACT] 썸네일: {thumbnail_url}")
-            else:
-                # 범용 추출도 실패
-                print(f"[EXTRACT] 범용 추출 실패")
-                raise HTTPException(
-                    status_code=400,
-                    detail="상품 정보 추출 실패: 이 사이트에서 상품 정보를 자동으로 추출할 수 없습니다. 상품명과 가격을 수동으로 입력해주세요."
-                )
+            # 범용 추출도 실패
+            print(f"[EXTRACT] 범용 추출 실패")
+            raise HTTPException(
+                status_code=400,
+                detail="상품 정보 추출 실패: 이 사이트에서 상품 정보를 자동으로 추출할 수 없습니다. 상품명과 가격을 수동으로 입력해주세요."
+            )
 
-        # 썸네일 다운로드 및 저장
-        if thumbnail_url:
-            try:
-                from utils.image_downloader import download_thumbnail
-                saved_thumbnail = download_thumbnail(thumbnail_url)
-                if saved_thumbnail:
-                    thumbnail_url = saved_thumbnail
-                    print(f"[EXTRACT] 썸네일 저장 완료: {thumbnail_url}")
-            except Exception as e:
-                print(f"[EXTRACT] 썸네일 저장 실패: {e}")
+    # 썸네일 다운로드 및 저장
+    if thumbnail_url and store_thumbnail:
+        try:
+            from utils.image_downloader import download_thumbnail
+            saved_thumbnail = download_thumbnail(thumbnail_url)
+            if saved_thumbnail:
+                thumbnail_url = saved_thumbnail
+                print(f"[EXTRACT] 썸네일 저장 완료: {thumbnail_url}")
+        except Exception as e:
+            print(f"[EXTRACT] 썸네일 저장 실패: {e}")
+
+    # 추출 방법 정보 설정
+    if source == 'other':
+        details = f"범용 추출 ({extraction_method})"
+    else:
+        details = "FlareSolverr로 추출"
+
+    return {
+        "success": True,
+        "data": {
+            "source": source,
+            "product_name": product_name or UNKNOWN_PRODUCT_NAME,
+            "current_price": current_price,
+            "status": status,
+            "details": details,
+            "thumbnail_url": thumbnail_url
+        }
+    }
 
-        # 추출 방법 정보 설정
-        if source == 'other':
-            details = f"범용 추출 ({extraction_method})"
-        else:
-            details = "FlareSolverr로 추출"
 
-        return {
-            "success": True,
-            "data": {
-                "source": source,
-                "product_name": product_name or "자동 감지 실패",
-                "current_price": current_price,
-                "status": status,
-                "details": details,
-                "thumbnail_url": thumbnail_url
-            }
-        }
+@router.post("/extract-url-info")
+async def extract_url_info(request: dict):
+    """
+    URL에서 상품 정보 자동 추출 - FlareSolverr 기반
+    """
+    try:
+        product_url = request.get('product_url')
+        if not product_url:
+            raise HTTPException(status_code=400, detail="URL이 필요합니다.")
+
+        # 동기 스크래핑은 스레드에서 실행 (이벤트 루프 블로킹 방지)
+        return await asyncio.to_thread(_extract_url_info, product_url)
 
     except HTTPException:
         raise
@@ -580,6 +615,223 @@ async def extract_url_info(request: dict):
         raise HTTPException(status_code=500, detail=f"정보 추출 실패: {str(e)}")
 
 
+def parse_import_urls(urls: List[str], csv_text: Optional[str] = None) -> Tuple[List[str], List[str]]:
+    """
+    대량 가져오기 입력 정리
+
+    Returns:
+        (URL 목록 - 입력 순서 유지/정규화한 URL 기준 중복 제거, 잘못된 입력 목록)
+    """
+    candidates = list(urls)
+    if csv_text:
+        for row in csv.reader(io.StringIO(csv_text)):
+            # 헤더/상품명 등 다른 열은 무시
+            candidates.extend(cell for cell in row if cell.strip().lower().startswith(('http://', 'https://')))
+
+    valid, invalid = {}, []
+    for raw in candidates:
+        url = raw.strip().split('#', 1)[0]
+        if not url:
+            continue
+        if url.lower().startswith(('http://', 'https://')) and urlsplit(url).netloc:
+            # 같은 상품 URL의 표기 차이는 처음 입력한 URL만 사용
+            valid.setdefault(normalize_import_url(url), url)
+        else:
+            invalid.append(raw)
+    return list(valid.values()), invalid
+
+
+def normalize_import_url(url: str) -> str:
+    """중복 판단용 URL 정규화 (scheme/호스트 소문자, 끝 슬래시, 추적용 파라미터 제거)"""
+    parts = urlsplit(url.strip())
+    query = [
+        (key, value) for key, value in parse_qsl(parts.query, keep_blank_values=True)
+        if key not in TRACKING_PARAMS and not key.lower().startswith('utm_')
+    ]
+    return urlunsplit((
+        parts.scheme.lower(), parts.netloc.lower(), parts.path.rstrip('/'), urlencode(query), ''
+    ))
+
+
+def _url_domain(url: str) -> str:
+    netloc = urlsplit(url).netloc.lower()
+    return netloc[4:] if netloc.startswith('www.') else netloc
+
+
+def _extracted_product(result: dict) -> dict:
+    """_extract_url_info 결과를 공통 형태로 변환 (홈플러스/도매꾹은 평평한 구조로 반환)"""
+    if result.get('data'):
+        return dict(result['data'])
+    return {
+        "source": result.get('source'),
+        "product_name": result.get('product_name') or UNKNOWN_PRODUCT_NAME,
+        "current_price": result.get('price'),
+        "original_price": result.get('original_price'),
+        "status": result.get('status', 'available'),
+        "details": result.get('message'),
+        "thumbnail_url": result.get('thumbnail'),
+    }
+
+
+async def bulk_import_events(urls: List[str], invalid: List[str], add_to_monitoring: bool = True,
+                             check_interval: int = 15):
+    """
+    URL 대량 가져오기 진행 이벤트 생성
+
+    - 모니터링 상품 URL/판매 상품 소싱 URL에 이미 있는 URL은 제외 (입력 그대로 또는 정규화한 URL이 일치)
+    - 추출은 전체 BULK_IMPORT_CONCURRENCY개, 도메인별 BULK_IMPORT_DOMAIN_CONCURRENCY개까지 동시에 실행
+    - 썸네일은 추출이 끝나는 대로 병렬 다운로드
+    - 등록된 상품은 다음 정기 체크에서 상태가 갱신됨 (/add처럼 즉시 재체크하지 않음)
+
+    이벤트: start → item (끝나는 순서대로) → done
+    """
+    db = get_db()
+    normalized = {url: normalize_import_url(url) for url in urls}
+    registered = set()
+    if urls:
+        found = await asyncio.to_thread(db.find_registered_urls, [*urls, *normalized.values()])
+        registered = {normalize_import_url(url) for url in found}
+    targets = [url for url in urls if normalized[url] not in registered]
+    duplicates = [url for url in urls if normalized[url] in registered]
+    yield {"type": "start", "total": len(targets), "duplicates": duplicates, "invalid": invalid}
+
+    extract_slots = asyncio.Semaphore(BULK_IMPORT_CONCURRENCY)
+    thumbnail_slots = asyncio.Semaphore(BULK_IMPORT_THUMBNAIL_CONCURRENCY)
+    domain_slots = defaultdict(lambda: asyncio.Semaphore(BULK_IMPORT_DOMAIN_CONCURRENCY))
+
+    loop = asyncio.get_running_loop()
+
+    async def import_one(url: str) -> dict:
+        item = {"type": "item", "url": url, "success": False}
+        try:
+            # 도메인 슬롯을 먼저 잡아야 한 도메인 대기열이 전체 슬롯을 점유하지 않음
+            async with domain_slots[_url_domain(url)], extract_slots:
+                result = await loop.run_in_executor(_bulk_import_executor, _extract_url_info, url, False)
+        except HTTPException as e:
+            item["error"] = e.detail
+            return item
+        except Exception as e:
+            item["error"] = str(e)
+            return item
+
+        if not result.get('success'):
+            item["source"] = result.get('source')
+            item["error"] = result.get('message') or result.get('error')
+            return item
+
+        data = _extracted_product(result)
+        if data.get('thumbnail_url'):
+            from utils.image_downloader import download_thumbnail
+            async with thumbnail_slots:
+                try:
+                    saved = await loop.run_in_executor(_bulk_import_executor, download_thumbnail, data['thumbnail_url'])
+                    if saved:
+                        data['thumbnail_url'] = saved
+                except Exception as e:
+                    print(f"[BULK-IMPORT] 썸네일 저장 실패: {e}")
+
+        manual = bool(result.get('manual_input_required')) or data.get('product_name') == UNKNOWN_PRODUCT_NAME
+        item.update(success=True, data=data, manual_input_required=manual)
+
+        if add_to_monitoring and not manual:
+            try:
+                item["product_id"] = await asyncio.to_thread(
+                    db.add_monitored_product,
+                    product_url=url,
+                    product_name=data['product_name'],
+                    source=data.get('source') or 'other',
+                    current_price=data.get('current_price'),
+                    original_price=data.get('original_price'),
+                    check_interval=check_interval
+                )
+            except Exception as e:
+                item["error"] = f"모니터링 등록 실패: {str(e)}"
+        return item
+
+    tasks = [asyncio.create_task(import_one(url)) for url in targets]
+    succeeded = failed = added = 0
+    try:
+        for done, finished in enumerate(asyncio.as_completed(tasks), 1):
+            item = await finished
+            if item["success"]:
+                succeeded += 1
+            else:
+                failed += 1
+            if item.get("product_id"):
+                added += 1
+            item.update(done=done, total=len(targets))
+            yield item
+    finally:
+        # 클라이언트 연결이 끊긴 경우 남은 작업 취소
+        for task in tasks:
+            task.cancel()
+
+    print(f"[BULK-IMPORT] 완료: 대상 {len(targets)}개, 성공 {succeeded}, 실패 {failed}, 등록 {added}, 중복 {len(duplicates)}")
+    yield {
+        "type": "done",
+        "total": len(targets),
+        "succeeded": succeeded,
+        "failed": failed,
+        "added": added,
+        "duplicates": len(duplicates),
+        "invalid": len(invalid),
+    }
+
+
+def _bulk_import_response(urls: List[str], invalid: List[str], add_to_monitoring: bool,
+                          check_interval: int, format: str) -> StreamingResponse:
+    if format not in BULK_IMPORT_FORMATS:
+        raise HTTPException(status_code=400, detail=f"format은 {', '.join(BULK_IMPORT_FORMATS)} 중 하나여야 합니다")
+    if not urls and not invalid:
+        raise HTTPException(status_code=400, detail="URL이 필요합니다.")
+    if len(urls) > BULK_IMPORT_MAX_URLS:
+        raise HTTPException(status_code=400, detail=f"한 번에 최대 {BULK_IMPORT_MAX_URLS}개까지 가져올 수 있습니다.")
+
+    async def generate():
+        async for event in bulk_import_events(urls, invalid, add_to_monitoring, check_interval):
+            payload = json.dumps(event, ensure_ascii=False, default=str)
+            if format == 'sse':
+                yield f"event: {event['type']}\ndata: {payload}\n\n"
+            else:
+                yield payload + "\n"
+
+    media_type = "text/event-stream" if format == 'sse' else "application/x-ndjson"
+    return StreamingResponse(generate(), media_type=media_type, headers={"Cache-Control": "no-cache"})
+
+
+@router.post("/bulk-import")
+async def bulk_import_urls(request: BulkImportRequest, format: str = 'ndjson'):
+    """
+    소싱 URL 대량 가져오기 (진행 상황 스트리밍)
+
+    Args:
+        format: 'ndjson' (줄 단위 JSON) 또는 'sse' (text/event-stream)
+    """
+    urls, invalid = parse_import_urls(request.urls, request.csv_text)
+    return _bulk_import_response(urls, invalid, request.add_to_monitoring, request.check_interval, format)
+
+
+@router.post("/bulk-import/csv")
+async def bulk_import_csv(
+    file: UploadFile = File(...),
+    add_to_monitoring: bool = True,
+    check_interval: int = 15,
+    format: str = 'ndjson'
+):
+    """
+    CSV 파일로 소싱 URL 대량 가져오기 (http(s)로 시작하는 셀을 URL로 사용)
+    """
+    content = await file.read()
+    try:
+        csv_text = content.decode('utf-8-sig')
+    except UnicodeDecodeError:
+        # 엑셀에서 저장한 CSV (CP949)
+        csv_text = content.decode('cp949', errors='replace')
+
+    urls, invalid = parse_import_urls([], csv_text)
+    return _bulk_import_response(urls, invalid, add_to_monitoring, check_interval, format)
+
+
 @router.post("/extract-thumbnail")
 async def extract_thumbnail(request: dict):
     """
@@ -590,19 +842,17 @@ async def extract_thumbnail(request: dict):
         if not product_url:
             raise HTTPException(status_code=400, detail="URL이 필요합니다.")
 
-        # FlareSolverr로 HTML 가져오기
-        flaresolverr_result = solve_cloudflare(product_url, max_timeout=60000)
+        # HTML 가져오기 (동기 스크래핑은 스레드에서 실행)
+        monitor = ProductMonitor()
+        html = await asyncio.to_thread(monitor.fetch_html, product_url)
 
-        if not flaresolverr_result or not flaresolverr_result.get('html'):
+        if not html:
             raise HTTPException(status_code=503, detail="페이지를 가져올 수 없습니다.")
 
-        html = flaresolverr_result.get('html', '')
-
         from bs4 import BeautifulSoup
         soup = BeautifulSoup(html, 'html.parser')
 
         # 썸네일 추출
-        monitor = ProductMonitor()
         thumbnail_url = monitor._extract_thumbnail(soup, product_url)
 
         return {
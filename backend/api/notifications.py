@@ -6,11 +6,12 @@ from fastapi import APIRouter, HTTPException
 from pydantic import BaseModel, HttpUrl
 from typing import List, Optional
 from database.db_wrapper import get_db
+from database.database_manager import get_database_manager
+from database.pagination import fetch_keyset_page
+from utils.responses import fast_json
+from notifications.dispatcher import get_dispatcher, invalidate_webhook_cache, send_direct
 from notifications.notifier import (
     send_notification,
-    send_slack_notification,
-    send_discord_notification,
-    send_with_retry,
     format_margin_alert,
     format_rpa_alert,
     format_order_sync_alert,
@@ -75,6 +76,7 @@ async def save_webhook(request: WebhookSettingRequest):
             enabled=request.enabled,
             notification_types=notification_types_str
         )
+        invalidate_webhook_cache()
 
         return {
             "success": True,
@@ -169,6 +171,7 @@ async def toggle_webhook(webhook_type: str, request: WebhookToggleRequest):
 
         # 활성화/비활성화
         db.toggle_webhook(webhook_type, request.enabled)
+        invalidate_webhook_cache()
 
         return {
             "success": True,
@@ -199,6 +202,7 @@ async def delete_webhook(webhook_type: str):
 
         # 삭제
         db.delete_webhook_setting(webhook_type)
+        invalidate_webhook_cache()
 
         return {
             "success": True,
@@ -294,21 +298,18 @@ async def test_notification(request: TestNotificationRequest):
         # 특정 웹훅에 직접 발송
         msg = formatted_messages.get(request.webhook_type) if formatted_messages else "테스트 알림"
 
-        if request.webhook_type == 'slack':
-            result = send_with_retry(send_slack_notification, msg, webhook_url)
-        else:  # discord
-            result = send_with_retry(send_discord_notification, msg, webhook_url)
+        error = await send_direct(request.webhook_type, webhook_url, msg)
 
         # 로그 기록
         db.add_webhook_log(
             webhook_id=webhook['id'],
             notification_type=f"test_{request.notification_type}",
-            status='success' if result else 'failed',
+            status='failed' if error else 'success',
             message=f"테스트 알림: {request.notification_type}",
-            error_details=None if result else "Webhook 발송 실패"
+            error_details=error
         )
 
-        if result:
+        if not error:
             return {
                 "success": True,
                 "message": f"테스트 알림이 {request.webhook_type.capitalize()}으로 발송되었습니다"
@@ -322,24 +323,65 @@ async def test_notification(request: TestNotificationRequest):
         raise HTTPException(status_code=500, detail=str(e))
 
 
+@router.get("/dispatcher")
+async def get_dispatcher_status():
+    """
+    알림 디스패처 상태 (대기 건수, 발송/실패/요약/폐기 건수)
+    """
+    return {
+        "success": True,
+        "dispatcher": get_dispatcher().get_stats()
+    }
+
+
 @router.get("/logs")
-async def get_webhook_logs(limit: int = 50, webhook_type: Optional[str] = None):
+async def get_webhook_logs(
+    limit: int = 50,
+    webhook_type: Optional[str] = None,
+    cursor: Optional[str] = None,
+    paginate: bool = False
+):
     """
     Webhook 실행 로그 조회
+
+    paginate=true 또는 cursor 지정 시 keyset 페이지네이션 (응답에 next_cursor 포함)
     """
     try:
         if webhook_type and webhook_type not in ['slack', 'discord']:
             raise HTTPException(status_code=400, detail="webhook_type은 'slack' 또는 'discord'여야 합니다")
 
+        if paginate or cursor:
+            placeholder = "?" if get_database_manager().is_sqlite else "%s"
+            logs, next_cursor = fetch_keyset_page(
+                """
+                SELECT wl.*, ws.webhook_type
+                FROM webhook_logs wl
+                LEFT JOIN webhook_settings ws ON wl.webhook_id = ws.id
+                """,
+                where=[f"ws.webhook_type = {placeholder}"] if webhook_type else None,
+                params=[webhook_type] if webhook_type else None,
+                cursor=cursor,
+                limit=limit,
+                table_alias='wl'
+            )
+            return fast_json({
+                "success": True,
+                "logs": logs,
+                "next_cursor": next_cursor,
+                "has_more": next_cursor is not None
+            })
+
         db = get_db()
         logs = db.get_webhook_logs(limit=limit, webhook_type=webhook_type)
 
-        return {
+        return fast_json({
             "success": True,
             "logs": logs
-        }
+        })
 
     except HTTPException:
         raise
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
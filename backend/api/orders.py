@@ -7,7 +7,12 @@ from typing import Optional
 
 from database.db_wrapper import get_db
 from database.database_manager import get_database_manager
+from database.pagination import (
+    COUNT_MODES, count_rows, encode_cursor, fetch_keyset_page, serialize_value, stream_rows
+)
 from utils.cache import async_cached
+from utils.export import EXPORT_FORMATS, streaming_export_response
+from utils.responses import fast_json
 from logger import get_logger
 
 logger = get_logger(__name__)
@@ -168,22 +173,32 @@ async def get_orders(status: Optional[str] = None, limit: int = 100):
         db = get_db()
         orders = db.get_all_orders(status=status, limit=limit)
 
-        return {
+        return fast_json({
             "success": True,
             "orders": orders,
             "total": len(orders)
-        }
+        })
 
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"주문 조회 실패: {str(e)}")
 
 
+ORDER_LIST_COLUMNS = """
+    SELECT id, order_number, market, customer_name, customer_phone,
+           customer_address, total_amount, order_status, created_at, updated_at,
+           completed_at, notes
+    FROM orders
+"""
+
+
 @router.get("/with-items")
 @async_cached(ttl=15)  # 15초 캐싱
 async def get_orders_with_items(
     status: Optional[str] = None,
     limit: int = 50,
-    page: int = 1
+    page: int = 1,
+    cursor: Optional[str] = None,
+    count_mode: Optional[str] = None
 ):
     """
     주문 목록과 주문 상품을 한번에 조회 (N+1 쿼리 방지, 서버 사이드 페이지네이션)
@@ -191,7 +206,10 @@ async def get_orders_with_items(
     Args:
         status: 주문 상태 필터 ('pending', 'processing', 'completed', 'cancelled')
         limit: 페이지당 항목 수 (기본 50)
-        page: 페이지 번호 (1부터 시작)
+        page: 페이지 번호 (1부터 시작, cursor가 없을 때만 사용)
+        cursor: 이전 응답의 next_cursor (지정 시 OFFSET 대신 keyset 페이지네이션)
+        count_mode: 전체 개수 계산 방식 ('exact', 'approximate', 'none')
+                    미지정 시 page 방식은 exact, cursor 방식은 none (다음 페이지마다 COUNT(*)를 다시 하지 않음)
 
     Returns:
         {
@@ -200,63 +218,62 @@ async def get_orders_with_items(
             "total": 100,
             "page": 1,
             "limit": 50,
-            "total_pages": 2
+            "total_pages": 2,
+            "next_cursor": "..."
         }
     """
-    try:
-        from database.database_manager import get_database_manager
+    if count_mode is None:
+        count_mode = 'none' if cursor else 'exact'
+    if count_mode not in COUNT_MODES:
+        raise HTTPException(status_code=400, detail=f"count_mode는 {', '.join(COUNT_MODES)} 중 하나여야 합니다")
 
+    try:
         db_manager = get_database_manager()
-        conn = db_manager.engine.raw_connection()
-        cursor = conn.cursor()
 
         # Placeholder (PostgreSQL: %s, SQLite: ?)
         placeholder = "?" if db_manager.is_sqlite else "%s"
 
-        # 전체 개수 조회
+        where = []
+        params = []
         if status:
-            cursor.execute(f"SELECT COUNT(*) FROM orders WHERE order_status = {placeholder}", (status,))
-        else:
-            cursor.execute("SELECT COUNT(*) FROM orders")
-        total_count = cursor.fetchone()[0]
+            where.append(f"order_status = {placeholder}")
+            params.append(status)
 
-        # 페이지네이션 계산
-        offset = (page - 1) * limit
-        total_pages = (total_count + limit - 1) // limit  # 올림 나눗셈
+        # 전체 개수 조회 (none이면 생략)
+        total_count = count_rows("orders", where, params, mode=count_mode)
 
-        # 주문 목록 조회 (LIMIT, OFFSET 적용)
-        if status:
-            cursor.execute(f"""
-                SELECT id, order_number, market, customer_name, customer_phone,
-                       customer_address, total_amount, order_status, created_at, updated_at,
-                       completed_at, notes
-                FROM orders
-                WHERE order_status = {placeholder}
-                ORDER BY created_at DESC
-                LIMIT {placeholder} OFFSET {placeholder}
-            """, (status, limit, offset))
+        if cursor:
+            # keyset 페이지네이션: 페이지 깊이와 무관하게 인덱스에서 바로 시작
+            orders, next_cursor = fetch_keyset_page(
+                ORDER_LIST_COLUMNS, where=where, params=params, cursor=cursor, limit=limit
+            )
         else:
-            cursor.execute(f"""
-                SELECT id, order_number, market, customer_name, customer_phone,
-                       customer_address, total_amount, order_status, created_at, updated_at,
-                       completed_at, notes
-                FROM orders
-                ORDER BY created_at DESC
-                LIMIT {placeholder} OFFSET {placeholder}
-            """, (limit, offset))
-
-        # Row를 dict로 변환 (안전한 방식 - cursor.description 사용)
-        columns = [col[0] for col in cursor.description]
-        orders = []
-        for row in cursor.fetchall():
-            order_dict = {}
-            for i, col in enumerate(columns):
-                value = row[i]
-                # datetime을 문자열로 변환
-                if hasattr(value, 'isoformat'):
-                    value = value.isoformat()
-                order_dict[col] = value
-            orders.append(order_dict)
+            offset = (page - 1) * limit
+            conn = db_manager.engine.raw_connection()
+            try:
+                db_cursor = conn.cursor()
+                where_sql = f"WHERE {' AND '.join(where)}" if where else ""
+                # 동일 created_at 행의 순서가 페이지마다 바뀌지 않도록 id로 보조 정렬
+                db_cursor.execute(f"""
+                    {ORDER_LIST_COLUMNS}
+                    {where_sql}
+                    ORDER BY created_at DESC, id DESC
+                    LIMIT {placeholder} OFFSET {placeholder}
+                """, params + [limit + 1, offset])
+
+                columns = [col[0] for col in db_cursor.description]
+                rows = db_cursor.fetchall()
+            finally:
+                conn.close()
+
+            orders = [
+                {col: serialize_value(row[i]) for i, col in enumerate(columns)}
+                for row in rows[:limit]
+            ]
+            # 마지막 행에서 keyset으로 이어갈 수 있도록 커서 제공
+            next_cursor = None
+            if len(rows) > limit and orders:
+                next_cursor = encode_cursor(rows[limit - 1][columns.index('created_at')], orders[-1]['id'])
 
         # 각 주문의 상품 조회 (N+1 쿼리 방지 - 배치 조회)
         db = get_db()
@@ -265,23 +282,53 @@ async def get_orders_with_items(
         for order in orders:
             order['items'] = all_items.get(order['id'], [])
 
-        conn.close()
+        total_pages = (total_count + limit - 1) // limit if total_count is not None else None  # 올림 나눗셈
 
-        return {
+        return fast_json({
             "success": True,
             "orders": orders,
             "total": total_count,
-            "page": page,
+            "page": page if not cursor else None,
             "limit": limit,
-            "total_pages": total_pages
-        }
+            "total_pages": total_pages,
+            "next_cursor": next_cursor,
+            "has_more": next_cursor is not None
+        })
 
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
     except Exception as e:
         logger.error(f"[주문] with-items 조회 실패: {str(e)}")
         logger.exception(e)
         raise HTTPException(status_code=500, detail=f"주문 조회 실패: {str(e)}")
 
 
+@router.get("/export")
+async def export_orders(
+    status: Optional[str] = None,
+    format: str = 'ndjson'
+):
+    """
+    주문 전체 내보내기 (스트리밍, 메모리 사용량 일정)
+
+    Args:
+        status: 주문 상태 필터
+        format: 'ndjson' 또는 'csv'
+    """
+    if format not in EXPORT_FORMATS:
+        raise HTTPException(status_code=400, detail=f"format은 {', '.join(EXPORT_FORMATS)} 중 하나여야 합니다")
+
+    placeholder = "?" if get_database_manager().is_sqlite else "%s"
+    sql = ORDER_LIST_COLUMNS
+    params = []
+    if status:
+        sql += f" WHERE order_status = {placeholder}"
+        params.append(status)
+    sql += " ORDER BY created_at DESC, id DESC"
+
+    return streaming_export_response(stream_rows(sql, params), format, "orders")
+
+
 @router.get("/order/{order_id}")
 async def get_order_detail(order_id: int):
     """
@@ -11,6 +11,7 @@ from datetime import datetime
 import json
 
 from utils.cache import async_cached
+from utils.responses import fast_json
 
 from playauto.models import (
     PlayautoSettingsRequest,
@@ -35,6 +36,8 @@ from playauto.tracking import PlayautoTrackingAPI, auto_upload_tracking_from_loc
 from playauto.carriers import PlayautoCarriersAPI, get_cached_carriers
 from playauto.exceptions import PlayautoAPIError
 from database.db_wrapper import get_db
+from database.database_manager import get_database_manager
+from database.pagination import fetch_keyset_page
 
 router = APIRouter(prefix="/api/playauto", tags=["Playauto"])
 
@@ -420,18 +423,42 @@ async def get_tracking_upload_history(limit: int = 50):
 @async_cached(ttl=30)  # 30초 캐싱
 async def get_playauto_sync_logs(
     sync_type: Optional[str] = None,
-    limit: int = 100
+    limit: int = 100,
+    cursor: Optional[str] = None,
+    paginate: bool = False
 ):
-    """플레이오토 동기화 로그 조회"""
+    """
+    플레이오토 동기화 로그 조회
+
+    paginate=true 또는 cursor 지정 시 keyset 페이지네이션 (응답에 next_cursor 포함)
+    """
     try:
+        if paginate or cursor:
+            placeholder = "?" if get_database_manager().is_sqlite else "%s"
+            logs, next_cursor = fetch_keyset_page(
+                "SELECT * FROM playauto_sync_logs",
+                where=[f"sync_type = {placeholder}"] if sync_type else None,
+                params=[sync_type] if sync_type else None,
+                cursor=cursor,
+                limit=limit
+            )
+            return fast_json({
+                "success": True,
+                "logs": logs,
+                "next_cursor": next_cursor,
+                "has_more": next_cursor is not None
+            })
+
         db = get_db()
         logs = db.get_playauto_sync_logs(sync_type=sync_type, limit=limit)
 
-        return {
+        return fast_json({
             "success": True,
             "logs": logs
-        }
+        })
 
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=f"잘못된 요청: {str(e)}")
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"로그 조회 중 오류: {str(e)}")
 
@@ -1,12 +1,17 @@
 """
 내 판매 상품 관리 API
 """
+import asyncio
 import json
 from fastapi import APIRouter, HTTPException, UploadFile, File
 from pydantic import BaseModel
 from typing import Optional, List
 from database.db_wrapper import get_db
+from database.database_manager import get_database_manager
+from database.pagination import fetch_keyset_page, iter_keyset, stream_rows
 from utils.cache import async_cached, clear_all_cache
+from utils.export import EXPORT_FORMATS, streaming_export_response
+from utils.responses import fast_json
 from utils.category_mapper import get_playauto_category_code
 from logger import get_logger
 
@@ -92,23 +97,15 @@ async def create_product(request: CreateProductRequest):
         # 썸네일 자동 업로드: original_thumbnail_url이 있으면 Supabase에 업로드
         thumbnail_url = request.thumbnail_url
         if request.original_thumbnail_url and not thumbnail_url:
-            from utils.supabase_storage import upload_image_from_url
-            import time
-
-            # 고유한 파일명 생성 (타임스탬프 사용)
-            timestamp = int(time.time())
-            file_ext = request.original_thumbnail_url.split('?')[0].split('.')[-1]
-            if file_ext not in ['jpg', 'jpeg', 'png', 'webp', 'gif']:
-                file_ext = 'jpg'
-
-            storage_path = f"thumbnails/product_{timestamp}.{file_ext}"
+            from utils import image_store
 
+            # 같은 원본 URL/내용이면 기존 객체 재사용 (내용 주소 저장소)
             logger.info(f"[상품생성] 썸네일 다운로드 및 업로드 시작: {request.original_thumbnail_url[:100]}...")
-            supabase_url = upload_image_from_url(request.original_thumbnail_url, storage_path)
+            stored = image_store.store_from_url(request.original_thumbnail_url)
 
-            if supabase_url:
-                thumbnail_url = supabase_url
-                logger.info(f"[상품생성] 썸네일 업로드 성공: {storage_path}")
+            if stored:
+                thumbnail_url = stored.url
+                logger.info(f"[상품생성] 썸네일 업로드 성공: {stored.storage_path} (재사용: {stored.deduplicated})")
             else:
                 logger.warning(f"[상품생성] 썸네일 업로드 실패, 원본 URL 사용")
                 thumbnail_url = request.original_thumbnail_url
@@ -162,24 +159,120 @@ async def create_product(request: CreateProductRequest):
         raise HTTPException(status_code=500, detail=f"상품 생성 실패: {str(e)}")
 
 
+SELLING_PRODUCT_COLUMNS = """
+    SELECT
+        sp.*,
+        mp.product_name as monitored_product_name,
+        mp.product_url as monitored_product_url,
+        mp.source as monitored_source,
+        mp.current_price as monitored_price,
+        mp.current_status as monitored_status,
+        COALESCE(sp.sourcing_price, mp.current_price, 0) as effective_sourcing_price,
+        (sp.selling_price - COALESCE(sp.sourcing_price, mp.current_price, 0)) as margin,
+        CASE
+            WHEN COALESCE(sp.sourcing_price, mp.current_price, 0) > 0 THEN
+                ((sp.selling_price - COALESCE(sp.sourcing_price, mp.current_price, 0)) /
+                 COALESCE(sp.sourcing_price, mp.current_price) * 100)
+            ELSE 0
+        END as margin_rate
+    FROM my_selling_products sp
+    LEFT JOIN monitored_products mp ON sp.monitored_product_id = mp.id
+"""
+
+
+def _selling_product_filters(is_active: Optional[bool]):
+    """is_active 필터 → (WHERE 조건 목록, 파라미터)"""
+    if is_active is None:
+        return [], []
+    placeholder = "?" if get_database_manager().is_sqlite else "%s"
+    return [f"sp.is_active = {placeholder}"], [is_active]
+
+
+# 금액/비율 컬럼 (SQLite는 정수로 저장된 NUMERIC 값을 int로 반환)
+SELLING_PRODUCT_NUMERIC_COLUMNS = (
+    'selling_price', 'sourcing_price', 'target_margin_rate', 'monitored_price',
+    'effective_sourcing_price', 'margin', 'margin_rate'
+)
+
+
+def _normalize_selling_product(product: dict) -> dict:
+    # SQLite 정수형 boolean → Python boolean
+    if 'is_active' in product and product['is_active'] is not None:
+        product['is_active'] = bool(product['is_active'])
+    # 금액은 ORM 조회 결과와 같이 float로 통일
+    for col in SELLING_PRODUCT_NUMERIC_COLUMNS:
+        if isinstance(product.get(col), int):
+            product[col] = float(product[col])
+    return product
+
+
 @router.get("/list")
 @async_cached(ttl=30)  # 30초 캐싱
-async def get_products(is_active: Optional[bool] = None, limit: int = 100):
-    """판매 상품 목록 조회"""
+async def get_products(
+    is_active: Optional[bool] = None,
+    limit: int = 100,
+    cursor: Optional[str] = None,
+    paginate: bool = False
+):
+    """
+    판매 상품 목록 조회
+
+    paginate=true 또는 cursor 지정 시 keyset 페이지네이션으로 조회하고
+    응답에 next_cursor를 포함합니다 (다음 페이지는 cursor=next_cursor).
+    """
     try:
+        if paginate or cursor:
+            where, params = _selling_product_filters(is_active)
+            products, next_cursor = fetch_keyset_page(
+                SELLING_PRODUCT_COLUMNS, where=where, params=params,
+                cursor=cursor, limit=limit, table_alias='sp'
+            )
+            products = [_normalize_selling_product(p) for p in products]
+            return fast_json({
+                "success": True,
+                "data": products,
+                "total": len(products),
+                "next_cursor": next_cursor,
+                "has_more": next_cursor is not None
+            })
+
         db = get_db()
         products = db.get_selling_products(is_active=is_active, limit=limit)
 
-        return {
+        return fast_json({
             "success": True,
             "data": products,
             "total": len(products)
-        }
+        })
 
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"상품 조회 실패: {str(e)}")
 
 
+@router.get("/export")
+async def export_products(is_active: Optional[bool] = None, format: str = 'ndjson'):
+    """
+    판매 상품 전체 내보내기 (스트리밍)
+
+    Args:
+        is_active: 활성 상태 필터
+        format: 'ndjson' 또는 'csv'
+    """
+    if format not in EXPORT_FORMATS:
+        raise HTTPException(status_code=400, detail=f"format은 {', '.join(EXPORT_FORMATS)} 중 하나여야 합니다")
+
+    where, params = _selling_product_filters(is_active)
+    sql = SELLING_PRODUCT_COLUMNS
+    if where:
+        sql += " WHERE " + " AND ".join(where)
+    sql += " ORDER BY sp.created_at DESC, sp.id DESC"
+
+    rows = (_normalize_selling_product(row) for row in stream_rows(sql, params))
+    return streaming_export_response(rows, format, "selling_products")
+
+
 @router.get("/search")
 async def search_product_for_purchase(
     shop_cd: Optional[str] = None,
@@ -869,7 +962,7 @@ async def register_products_to_playauto(request: dict):
         }
 
     Returns:
-        등록 결과
+        생성된 등록 작업 ID (결과는 GET /register-to-playauto/jobs/{job_id})
     """
     try:
         product_ids = request.get("product_ids", [])
@@ -906,313 +999,15 @@ async def register_products_to_playauto(request: dict):
             for t in site_list:
                 logger.info(f"[상품등록] 템플릿 정보 - shop_cd: '{t.get('shop_cd')}', shop_id: '{t.get('shop_id')}', template_no: {t.get('template_no')}")
 
-        # 플레이오토 API 클라이언트
-        from playauto.product_registration import PlayautoProductRegistration, build_product_data_from_db
-        registration_api = PlayautoProductRegistration()
-
-        logger.info(f"[상품등록] 플레이오토 등록 시작: {len(product_ids)}개 상품")
-
-        success_count = 0
-        fail_count = 0
-        results = []
+        from playauto.registration_jobs import start_job
 
-        for product_id in product_ids:
-            try:
-                # 상품 조회
-                product = db.get_selling_product(product_id)
-                if not product:
-                    logger.warning(f"[상품등록] 상품을 찾을 수 없음: ID {product_id}")
-                    results.append({
-                        "product_id": product_id,
-                        "success": False,
-                        "error": "상품을 찾을 수 없습니다."
-                    })
-                    fail_count += 1
-                    continue
-
-                # site_list를 채널 종류별로 분리
-                # 각 shop_cd 로깅
-                logger.info(f"[상품등록] 원본 site_list: {site_list}")
-                for site in site_list:
-                    logger.info(f"[상품등록] 채널 정보 - shop_cd: {site.get('shop_cd')}, shop_id: {site.get('shop_id')}, template_no: {site.get('template_no')}")
-
-                # 단일상품으로 등록할 마켓 코드 (옵션없음 방식)
-                # 옥션: A001, AUCTION
-                # 지마켓: A006, GMK
-                single_product_codes = [
-                    "A001", "a001", "AUCTION", "auction",  # 옥션
-                    "A006", "a006", "GMK", "gmk",  # 지마켓
-                ]
-                # 쿠팡은 조합형 옵션 필요
-                # B378: 쿠팡 (실제 PlayAuto shop_cd)
-                coupang_codes = ["A027", "a027", "CPM", "cpm", "COUPANG", "coupang", "B378", "b378"]
-                esm_codes = ["ESM", "esm", "Esm"]  # ESM은 제외
-
-                # ESM 제외하고 채널 분리
-                single_product_sites = []
-                coupang_sites = []
-                smartstore_sites = []
-
-                for site in site_list:
-                    shop_cd = site.get("shop_cd", "")
-                    if shop_cd in esm_codes:
-                        continue  # ESM 제외
-
-                    if shop_cd in single_product_codes:
-                        single_product_sites.append(site)
-                        logger.info(f"[상품등록] '{shop_cd}' → 단일상품으로 분류")
-                    elif shop_cd in coupang_codes:
-                        coupang_sites.append(site)
-                        logger.info(f"[상품등록] '{shop_cd}' → 쿠팡(조합형)으로 분류")
-                    else:
-                        smartstore_sites.append(site)
-                        logger.info(f"[상품등록] '{shop_cd}' → 스마트스토어(독립형)으로 분류")
-
-                # ESM 채널 확인 및 경고
-                esm_sites = [site for site in site_list if site.get("shop_cd") in esm_codes]
-                if esm_sites:
-                    logger.warning(f"[상품등록] ESM 채널 {len(esm_sites)}개 감지 - ESM은 단일상품 제약이 있어 자동 등록에서 제외됩니다")
-
-                logger.info(f"[상품등록] 채널 분리 완료:")
-                logger.info(f"  - 단일상품(옥션/지마켓): {len(single_product_sites)}개 {[s.get('shop_cd') for s in single_product_sites]}")
-                logger.info(f"  - 쿠팡(조합형): {len(coupang_sites)}개 {[s.get('shop_cd') for s in coupang_sites]}")
-                logger.info(f"  - 스마트스토어(독립형): {len(smartstore_sites)}개 {[s.get('shop_cd') for s in smartstore_sites]}")
-                logger.info(f"  - ESM 제외: {len(esm_sites)}개 {[s.get('shop_cd') for s in esm_sites]}")
-
-                # 디버깅: 실제 전달 데이터 로그
-                logger.info(f"[상품등록] product_id={product_id}, category='{product.get('category')}', sol_cate_no={product.get('sol_cate_no')}")
-
-                # 플레이오토 등록 (채널별로 분리)
-                result = {"success": False, "error": "등록 가능한 채널이 없습니다."}
-                c_sale_cd_gmk = None
-                c_sale_cd_smart = None
-                c_sale_cd_coupang = None
-
-                # 1. 단일상품 등록 - 옥션/지마켓 (있는 경우)
-                if single_product_sites:
-                    logger.info(f"[상품등록] ===== 단일상품 등록 시작 (옥션/지마켓) =====")
-                    logger.info(f"[상품등록] 채널 수: {len(single_product_sites)}개")
-                    logger.info(f"[상품등록] 설정: std_ol_yn=Y (단일상품), opt_type=옵션없음")
-                    product_data_single = build_product_data_from_db(product, single_product_sites, channel_type="gmk_auction")
-                    result_single = await registration_api.register_product(product_data_single)
-
-                    if result_single.get("success"):
-                        c_sale_cd_gmk = result_single.get("c_sale_cd")
-                        logger.info(f"[상품등록] ✓ 단일상품 등록 성공")
-                        logger.info(f"[상품등록] c_sale_cd: {c_sale_cd_gmk}")
-                        logger.info(f"[상품등록] 등록 결과: {result_single.get('site_list')}")
-                        result = result_single
-                    else:
-                        logger.error(f"[상품등록] ✗ 단일상품 등록 실패: {result_single.get('error')}")
-                        logger.error(f"[상품등록] 전체 응답: {result_single}")
-
-                # 2. 쿠팡 등록 (있는 경우) - 조합형 옵션
-                coupang_debug_info = None
-                if coupang_sites:
-                    logger.info(f"[상품등록] ===== 쿠팡 등록 시작 =====")
-                    logger.info(f"[상품등록] 채널 수: {len(coupang_sites)}개")
-                    logger.info(f"[상품등록] 설정: std_ol_yn=N, opt_type=조합형")
-                    product_data_coupang = build_product_data_from_db(product, coupang_sites, channel_type="coupang")
-
-                    # 디버깅 정보 저장 (프론트엔드 콘솔용)
-                    coupang_debug_info = {
-                        "opt_type": product_data_coupang.get("opt_type"),
-                        "std_ol_yn": product_data_coupang.get("std_ol_yn"),
-                        "opts": product_data_coupang.get("opts"),
-                        "site_list": product_data_coupang.get("site_list")
-                    }
-                    logger.info(f"[상품등록] 쿠팡 디버그: {coupang_debug_info}")
-
-                    result_coupang = await registration_api.register_product(product_data_coupang)
-
-                    if result_coupang.get("success"):
-                        c_sale_cd_coupang = result_coupang.get("c_sale_cd")
-                        logger.info(f"[상품등록] ✓ 쿠팡 등록 성공")
-                        logger.info(f"[상품등록] c_sale_cd_coupang: {c_sale_cd_coupang}")
-                        logger.info(f"[상품등록] 등록 결과: {result_coupang.get('site_list')}")
-                        if result.get("success"):
-                            result["site_list"] = result.get("site_list", []) + result_coupang.get("site_list", [])
-                        else:
-                            result = result_coupang
-                    else:
-                        logger.error(f"[상품등록] ✗ 쿠팡 등록 실패: {result_coupang.get('error')}")
-                        logger.error(f"[상품등록] 전체 응답: {result_coupang}")
-                        coupang_debug_info["error"] = result_coupang.get("error")
-                        coupang_debug_info["api_response"] = result_coupang.get("data")
-
-                # 3. 스마트스토어 등 등록 (있는 경우) - 독립형 옵션
-                if smartstore_sites:
-                    logger.info(f"[상품등록] ===== 스마트스토어 등록 시작 =====")
-                    logger.info(f"[상품등록] 채널 수: {len(smartstore_sites)}개")
-                    logger.info(f"[상품등록] 설정: std_ol_yn=N, opt_type=독립형")
-                    product_data_smart = build_product_data_from_db(product, smartstore_sites, channel_type="smartstore")
-                    result_smart = await registration_api.register_product(product_data_smart)
-
-                    if result_smart.get("success"):
-                        c_sale_cd_smart = result_smart.get("c_sale_cd")
-                        logger.info(f"[상품등록] ✓ 스마트스토어 등록 성공")
-                        logger.info(f"[상품등록] c_sale_cd_smart: {c_sale_cd_smart}")
-                        logger.info(f"[상품등록] 등록 결과: {result_smart.get('site_list')}")
-                        if result.get("success"):
-                            result["site_list"] = result.get("site_list", []) + result_smart.get("site_list", [])
-                        else:
-                            result = result_smart
-                    else:
-                        logger.error(f"[상품등록] ✗ 스마트스토어 등록 실패: {result_smart.get('error')}")
-                        logger.error(f"[상품등록] 전체 응답: {result_smart}")
-
-                # ESM 에러 시 재시도 (ESM 채널 및 ESM 템플릿 사용 채널 제외)
-                if not result.get("success") and result.get("error"):
-                    error_msg = result.get("error", "")
-                    if "ESM" in error_msg and "단일상품" in error_msg:
-                        logger.warning(f"[상품등록] ESM 에러 감지 - 문제 채널 제외하고 재시도: {product.get('product_name')}")
-                        logger.warning(f"[상품등록] 원본 에러: {error_msg}")
-
-                        # site_list에서 ESM 채널 제외 (shop_cd가 ESM인 것 + A006 옥션도 제외)
-                        # A006 (옥션)은 ESM 템플릿을 사용할 수 있으므로 함께 제외
-                        filtered_site_list = [
-                            site for site in product_data.get("site_list", [])
-                            if site.get("shop_cd") not in ["ESM", "esm", "Esm", "A006"]
-                        ]
-
-                        if filtered_site_list:
-                            product_data["site_list"] = filtered_site_list
-                            logger.info(f"[상품등록] ESM/A006 제외 후 {len(filtered_site_list)}개 채널로 재시도")
-                            result = await registration_api.register_product(product_data)
-                        else:
-                            logger.error(f"[상품등록] 등록 가능한 채널이 없어 재시도 불가")
-
-                if result.get("success"):
-                    # 플레이오토 상품 번호 및 쇼핑몰 번호 저장
-                    site_list_result = result.get("site_list", [])
-
-                    # 디버깅: site_list 전체 구조 로깅
-                    logger.info(f"[상품등록] site_list 응답: {site_list_result}")
-
-                    # ol_shop_no를 채널별로 분리하여 저장
-                    ol_shop_no_gmk = None
-                    ol_shop_no_smart = None
-                    ol_shop_no_coupang = None
-                    ol_shop_no_fallback = None  # 하위 호환성
-
-                    if site_list_result:
-                        for site in site_list_result:
-                            logger.info(f"[상품등록] site 확인: shop_cd={site.get('shop_cd')}, shop_name={site.get('shop_name')}, ol_shop_no={site.get('ol_shop_no')}")
-
-                            # PlayAuto API 응답에서 site_list 내부에는 result 필드가 없음
-                            # ol_shop_no가 있으면 성공한 것으로 처리
-                            if site.get("ol_shop_no"):
-                                shop_cd = site.get("shop_cd", "")
-                                ol_no = site.get("ol_shop_no")
-
-                                # 첫 번째 성공한 ol_shop_no를 fallback으로 저장 (하위 호환성)
-                                if not ol_shop_no_fallback:
-                                    ol_shop_no_fallback = ol_no
-
-                                # 채널별로 분류하여 저장
-                                # GMK 채널: Z000(마스터), A001(옥션), A002(지마켓)
-                                # SmartStore 채널: A027(스마트스토어) 등
-                                # Coupang 채널: B378
-                                if shop_cd in ["Z000", "A001", "A002"] and c_sale_cd_gmk:
-                                    # GMK 등록에서 나온 ol_shop_no
-                                    if not ol_shop_no_gmk or shop_cd == "Z000":  # Z000(마스터) 우선
-                                        ol_shop_no_gmk = ol_no
-                                        logger.info(f"[상품등록] GMK ol_shop_no 발견: {ol_no} (shop_cd: {shop_cd})")
-                                elif shop_cd == "B378" and c_sale_cd_coupang:
-                                    # 쿠팡 등록에서 나온 ol_shop_no
-                                    if not ol_shop_no_coupang:
-                                        ol_shop_no_coupang = ol_no
-                                        logger.info(f"[상품등록] 쿠팡 ol_shop_no 발견: {ol_no} (shop_cd: {shop_cd})")
-                                elif c_sale_cd_smart:
-                                    # SmartStore 등록에서 나온 ol_shop_no
-                                    if not ol_shop_no_smart or shop_cd == "Z000":  # Z000(마스터) 우선
-                                        ol_shop_no_smart = ol_no
-                                        logger.info(f"[상품등록] SmartStore ol_shop_no 발견: {ol_no} (shop_cd: {shop_cd})")
-
-                    if not ol_shop_no_gmk and not ol_shop_no_smart:
-                        logger.warning(f"[상품등록] ol_shop_no를 찾지 못했습니다. site_list: {site_list_result}")
-
-                    # 등록 성공 시 is_active = True로 변경하고 PlayAuto ID 저장
-                    update_params = {"product_id": product_id, "is_active": True}
-
-                    # 채널별 c_sale_cd 저장
-                    if c_sale_cd_gmk:
-                        update_params["c_sale_cd_gmk"] = c_sale_cd_gmk
-                        update_params["playauto_product_no"] = c_sale_cd_gmk  # 하위 호환성
-                        logger.info(f"[상품등록] 지마켓/옥션 c_sale_cd 저장: {c_sale_cd_gmk}")
-                    if c_sale_cd_smart:
-                        update_params["c_sale_cd_smart"] = c_sale_cd_smart
-                        if not c_sale_cd_gmk:  # gmk가 없으면 smart를 playauto_product_no에 저장
-                            update_params["playauto_product_no"] = c_sale_cd_smart
-                        logger.info(f"[상품등록] 스마트스토어 c_sale_cd 저장: {c_sale_cd_smart}")
-                    if c_sale_cd_coupang:
-                        update_params["c_sale_cd_coupang"] = c_sale_cd_coupang
-                        if not c_sale_cd_gmk and not c_sale_cd_smart:  # 둘 다 없으면 coupang을 playauto_product_no에 저장
-                            update_params["playauto_product_no"] = c_sale_cd_coupang
-                        logger.info(f"[상품등록] 쿠팡 c_sale_cd 저장: {c_sale_cd_coupang}")
-
-                    # 채널별 ol_shop_no 저장
-                    if ol_shop_no_gmk:
-                        update_params["ol_shop_no_gmk"] = ol_shop_no_gmk
-                        logger.info(f"[상품등록] GMK 온라인 쇼핑몰 번호 저장: {ol_shop_no_gmk}")
-                    if ol_shop_no_smart:
-                        update_params["ol_shop_no_smart"] = ol_shop_no_smart
-                        logger.info(f"[상품등록] SmartStore 온라인 쇼핑몰 번호 저장: {ol_shop_no_smart}")
-                    if ol_shop_no_coupang:
-                        update_params["ol_shop_no_coupang"] = ol_shop_no_coupang
-                        logger.info(f"[상품등록] 쿠팡 온라인 쇼핑몰 번호 저장: {ol_shop_no_coupang}")
-
-                    # 하위 호환성: ol_shop_no 필드에도 저장 (우선순위: gmk > smart)
-                    if ol_shop_no_fallback:
-                        update_params["ol_shop_no"] = ol_shop_no_fallback
-                        logger.info(f"[상품등록] 온라인 쇼핑몰 번호 저장 (하위호환): {ol_shop_no_fallback}")
-
-                    db.update_selling_product(**update_params)
-
-                    success_count += 1
-                    logger.info(f"[상품등록] 성공: {product.get('product_name')}")
-                else:
-                    fail_count += 1
-                    logger.error(f"[상품등록] 실패: {product.get('product_name')} - {result.get('error')}")
-
-                results.append({
-                    "product_id": product_id,
-                    "product_name": product.get("product_name"),
-                    "success": result.get("success"),
-                    "error": result.get("error"),
-                    "c_sale_cd_gmk": c_sale_cd_gmk,
-                    "c_sale_cd_smart": c_sale_cd_smart,
-                    "c_sale_cd_coupang": c_sale_cd_coupang,
-                    "coupang_debug": coupang_debug_info,  # 쿠팡 디버깅 정보
-                    # 채널 분류 디버깅 정보
-                    "channel_debug": {
-                        "site_list_received": [s.get("shop_cd") for s in site_list],
-                        "single_product_sites": [s.get("shop_cd") for s in single_product_sites],
-                        "coupang_sites": [s.get("shop_cd") for s in coupang_sites],
-                        "smartstore_sites": [s.get("shop_cd") for s in smartstore_sites]
-                    }
-                })
-
-            except Exception as e:
-                logger.error(f"[상품등록] 상품 등록 중 오류: ID {product_id} - {str(e)}")
-                results.append({
-                    "product_id": product_id,
-                    "success": False,
-                    "error": str(e)
-                })
-                fail_count += 1
-
-        # 캐시 무효화
-        clear_all_cache()
-
-        logger.info(f"[상품등록] 완료: 성공 {success_count}개, 실패 {fail_count}개")
+        # 등록은 백그라운드 작업으로 실행 (진행 상황은 /register-to-playauto/jobs/{job_id} 로 조회)
+        job_id = start_job(product_ids, site_list)
 
         return {
             "success": True,
-            "total": len(product_ids),
-            "success_count": success_count,
-            "fail_count": fail_count,
-            "results": results
+            "job_id": job_id,
+            "total": len(product_ids)
         }
 
     except HTTPException:
@@ -1222,6 +1017,55 @@ async def register_products_to_playauto(request: dict):
         raise HTTPException(status_code=500, detail=f"플레이오토 등록 실패: {str(e)}")
 
 
+@router.get("/register-to-playauto/jobs/{job_id}")
+async def get_playauto_registration_job(job_id: int):
+    """
+    플레이오토 등록 작업 진행 상황/결과 조회
+
+    Returns:
+        status(pending/running/completed/failed), 진행률, 상품별 결과
+    """
+    try:
+        from playauto.registration_jobs import get_job
+
+        job = await asyncio.to_thread(get_job, job_id)
+        if not job:
+            raise HTTPException(status_code=404, detail="등록 작업을 찾을 수 없습니다.")
+
+        return {"success": True, **job}
+
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error(f"[상품등록] 등록 작업 조회 실패: {str(e)}")
+        raise HTTPException(status_code=500, detail=f"등록 작업 조회 실패: {str(e)}")
+
+
+@router.post("/register-to-playauto/jobs/{job_id}/retry")
+async def retry_playauto_registration_job(job_id: int):
+    """
+    등록 작업에서 실패한 상품/채널만 다시 등록 (새 작업 생성)
+    """
+    try:
+        from playauto.registration_jobs import retry_job
+
+        try:
+            new_job_id = retry_job(job_id)
+        except ValueError as e:
+            raise HTTPException(status_code=400, detail=str(e))
+
+        if new_job_id is None:
+            return {"success": True, "job_id": None, "message": "재시도할 실패 항목이 없습니다."}
+
+        return {"success": True, "job_id": new_job_id, "retry_of": job_id}
+
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error(f"[상품등록] 등록 작업 재시도 실패: {str(e)}")
+        raise HTTPException(status_code=500, detail=f"등록 작업 재시도 실패: {str(e)}")
+
+
 @router.post("/upload-image")
 async def upload_image(file: UploadFile = File(...)):
     """
@@ -1230,52 +1074,49 @@ async def upload_image(file: UploadFile = File(...)):
     Returns:
         업로드된 이미지의 공개 URL
     """
+    from utils import image_store
+    from utils.image_ingest import ImageRejected, ingest_upload
+
     try:
-        from utils.supabase_storage import upload_image_from_bytes
-        import time
-
-        # 파일 내용 읽기
-        contents = await file.read()
-
-        # 파일 확장자 추출
-        filename = file.filename or "image.jpg"
-        file_ext = filename.split('.')[-1].lower()
-        if file_ext not in ['jpg', 'jpeg', 'png', 'webp', 'gif']:
-            file_ext = 'jpg'
-
-        # 고유한 파일명 생성
-        timestamp = int(time.time())
-        import random
-        random_str = ''.join(random.choices('abcdefghijklmnopqrstuvwxyz0123456789', k=8))
-        storage_path = f"detail-pages/{timestamp}_{random_str}.{file_ext}"
-
-        # Supabase에 업로드
-        logger.info(f"[이미지업로드] 업로드 시작: {storage_path}")
-        public_url = upload_image_from_bytes(contents, storage_path, content_type=file.content_type)
-
-        if public_url:
-            logger.info(f"[이미지업로드] 성공: {public_url}")
+        # 청크 단위로 수신 (이미지가 아니거나 용량 초과면 즉시 중단)
+        logger.info(f"[이미지업로드] 업로드 시작: {file.filename}")
+        try:
+            image = await ingest_upload(file)
+        except ImageRejected as e:
+            raise HTTPException(status_code=413 if e.too_large else 400, detail=str(e))
+
+        # 내용 해시 기반 저장 (같은 이미지는 업로드 없이 기존 URL 반환)
+        with image:
+            stored = await asyncio.to_thread(image_store.store_ingested, image)
+
+        if stored:
+            logger.info(f"[이미지업로드] 성공: {stored.url} (재사용: {stored.deduplicated})")
             return {
                 "success": True,
-                "url": public_url,
-                "storage_path": storage_path
+                "url": stored.url,
+                "storage_path": stored.storage_path,
+                "deduplicated": stored.deduplicated
             }
         else:
-            logger.error(f"[이미지업로드] 실패: upload_image_from_bytes returned None")
+            logger.error(f"[이미지업로드] 실패: image_store.store_ingested returned None")
             raise HTTPException(status_code=500, detail="이미지 업로드에 실패했습니다")
 
+    except HTTPException:
+        raise
     except Exception as e:
         logger.error(f"[이미지업로드] 오류: {str(e)}")
         raise HTTPException(status_code=500, detail=f"이미지 업로드 실패: {str(e)}")
 
 
 @router.post("/{product_id}/sync-to-playauto")
-async def sync_product_to_playauto(product_id: int):
+async def sync_product_to_playauto(product_id: int, include_detail: bool = False):
     """
     상품 정보를 PlayAuto에 동기화 (수정)
 
     Args:
         product_id: 동기화할 상품 ID
+        include_detail: True면 상세페이지(detail_desc)도 다시 렌더링해 전송
+                        (하위 쇼핑몰 전체의 상세페이지를 덮어쓰므로 기본값 False)
 
     Returns:
         동기화 결과
@@ -1326,6 +1167,12 @@ async def sync_product_to_playauto(product_id: int):
             from playauto.product_registration import get_sol_cate_no_for_category
             sol_cate_no = get_sol_cate_no_for_category(product_dict['category'])
 
+        # 상세페이지 HTML (명시적으로 요청한 경우만, 등록 시 렌더링한 결과가 있으면 캐시 재사용)
+        detail_desc = None
+        if include_detail and product_dict.get('detail_page_data'):
+            from playauto.product_registration import convert_detail_page_json_to_html
+            detail_desc = convert_detail_page_json_to_html(product_dict['detail_page_data'], product_dict['product_name'])
+
         # 상품 수정 요청
         # 옵션은 수정하지 않음 (opts, opt_type 제외)
         result = await edit_playauto_product(
@@ -1336,6 +1183,7 @@ async def sync_product_to_playauto(product_id: int):
             sale_price=int(product_dict['selling_price']),
             sol_cate_no=sol_cate_no,
             edit_slave_all=True,  # 하위 쇼핑몰 상품도 함께 수정
+            detail_desc=detail_desc,
             sale_img1=product_dict.get('thumbnail_url')
         )
 
@@ -1753,22 +1601,23 @@ async def recover_ol_shop_no():
         from playauto.products import PlayautoProductAPI
         api = PlayautoProductAPI()
 
-        # 활성 상품 전체 조회
-        all_products = db.get_selling_products(is_active=True, limit=1000)
-
-        # ol_shop_no가 없지만 c_sale_cd가 있는 상품 필터링
-        products = []
-        for p in all_products:
-            c_sale_cd_gmk = p.get("c_sale_cd_gmk")
-            c_sale_cd_smart = p.get("c_sale_cd_smart")
-            ol_shop_no_gmk = p.get("ol_shop_no_gmk")
-            ol_shop_no_smart = p.get("ol_shop_no_smart")
-
-            needs_gmk = c_sale_cd_gmk and (not ol_shop_no_gmk or ol_shop_no_gmk == 0)
-            needs_smart = c_sale_cd_smart and (not ol_shop_no_smart or ol_shop_no_smart == 0)
-
-            if needs_gmk or needs_smart:
-                products.append(p)
+        # ol_shop_no가 없지만 c_sale_cd가 있는 활성 상품만 DB에서 필터링
+        # (1000개 제한 없이 keyset 배치로 전체 순회)
+        placeholder = "?" if get_database_manager().is_sqlite else "%s"
+        missing_shop_no = """(
+            (COALESCE(sp.c_sale_cd_{ch}, '') <> ''
+             AND (sp.ol_shop_no_{ch} IS NULL OR sp.ol_shop_no_{ch} IN ('', '0')))
+        )"""
+        products = list(iter_keyset(
+            "SELECT sp.id, sp.created_at, sp.c_sale_cd_gmk, sp.c_sale_cd_smart, "
+            "sp.ol_shop_no_gmk, sp.ol_shop_no_smart FROM my_selling_products sp",
+            where=[
+                f"sp.is_active = {placeholder}",
+                f"({missing_shop_no.format(ch='gmk')} OR {missing_shop_no.format(ch='smart')})"
+            ],
+            params=[True],
+            table_alias='sp'
+        ))
 
         if not products:
             return {
@@ -1,9 +1,12 @@
+import json
 from fastapi import APIRouter, HTTPException, Query
+from fastapi.responses import StreamingResponse
 from typing import Optional, List
 from datetime import datetime
 from models.product import Product, ProductCreate
 from scrapers import TradersScraper, CJTheMarketScraper
 from scrapers.ssg_scraper_selenium import SSGSeleniumScraper
+from scrapers.search_coordinator import SearchCoordinator
 
 router = APIRouter(prefix="/api/sourcing", tags=["sourcing"])
 
@@ -14,6 +17,23 @@ scrapers = {
     "cjthemarket": CJTheMarketScraper(),
 }
 
+search_coordinator = SearchCoordinator(scrapers)
+
+
+def _to_result_products(products: List[ProductCreate], start_index: int = 0) -> List[dict]:
+    """ProductCreate를 Product 응답 형식으로 변환 (ID, 타임스탬프, 기본 마진 추가)"""
+    result_products = []
+    for idx, product in enumerate(products, start=start_index):
+        product_dict = product.model_dump()
+        product_dict['id'] = f"{product.source}_{datetime.now().timestamp()}_{idx}"
+        product_dict['created_at'] = datetime.now()
+        product_dict['updated_at'] = datetime.now()
+        product_dict['margin_rate'] = 30.0  # 기본 30% 마진
+        product_dict['selling_price'] = product.price * 1.3  # 마진 포함 판매가
+
+        result_products.append(product_dict)
+    return result_products
+
 
 @router.post("/search", response_model=dict)
 async def search_products(
@@ -21,58 +41,63 @@ async def search_products(
     category: Optional[str] = Query(None, description="카테고리"),
     keyword: Optional[str] = Query(None, description="검색 키워드"),
     page: int = Query(1, ge=1, description="페이지 번호"),
-    page_size: int = Query(20, ge=1, le=100, description="페이지당 항목 수")
+    page_size: int = Query(20, ge=1, le=100, description="페이지당 항목 수"),
+    stream: bool = Query(False, description="소싱처별 결과를 완료 순서대로 NDJSON 스트리밍")
 ):
     """
     상품 검색
 
     지정된 소싱처에서 상품을 검색합니다.
+    source=all이면 모든 소싱처를 동시에 검색하고, 제한 시간을 넘긴 소싱처는 sources에 timeout으로 표시한 채
+    나머지 결과만 반환합니다.
     """
     try:
-        all_products: List[ProductCreate] = []
-
         if source == "all":
-            # 모든 소싱처에서 검색
-            for scraper in scrapers.values():
-                products = await scraper.search_products(
-                    category=category,
-                    keyword=keyword,
-                    page=page,
-                    page_size=page_size // len(scrapers)
-                )
-                all_products.extend(products)
+            sources = list(scrapers)
+            source_page_size = page_size // len(scrapers)
         elif source in scrapers:
-            # 특정 소싱처에서 검색
-            scraper = scrapers[source]
-            products = await scraper.search_products(
-                category=category,
-                keyword=keyword,
-                page=page,
-                page_size=page_size
-            )
-            all_products.extend(products)
+            sources = [source]
+            source_page_size = page_size
         else:
             raise HTTPException(status_code=400, detail=f"지원하지 않는 소싱처: {source}")
 
-        # ProductCreate를 Product로 변환 (ID, 타임스탬프 추가)
-        result_products = []
-        for idx, product in enumerate(all_products):
-            product_dict = product.model_dump()
-            product_dict['id'] = f"{product.source}_{datetime.now().timestamp()}_{idx}"
-            product_dict['created_at'] = datetime.now()
-            product_dict['updated_at'] = datetime.now()
-            product_dict['margin_rate'] = 30.0  # 기본 30% 마진
-            product_dict['selling_price'] = product.price * 1.3  # 마진 포함 판매가
+        if stream:
+            async def generate():
+                total = 0
+                async for result in search_coordinator.iter_search(
+                    sources, keyword=keyword, category=category, page=page, page_size=source_page_size
+                ):
+                    products = _to_result_products(result["products"], start_index=total)
+                    total += len(products)
+                    yield json.dumps({**result, "products": products}, ensure_ascii=False, default=str) + "\n"
+                yield json.dumps({"done": True, "total": total, "page": page, "page_size": page_size}) + "\n"
+
+            return StreamingResponse(generate(), media_type="application/x-ndjson")
+
+        results = await search_coordinator.search(
+            sources, keyword=keyword, category=category, page=page, page_size=source_page_size
+        )
 
-            result_products.append(product_dict)
+        all_products: List[ProductCreate] = []
+        for result in results:
+            all_products.extend(result["products"])
+
+        # ProductCreate를 Product로 변환 (ID, 타임스탬프 추가)
+        result_products = _to_result_products(all_products)
 
         return {
             "products": result_products,
             "total": len(result_products),
             "page": page,
-            "page_size": page_size
+            "page_size": page_size,
+            "sources": [
+                {key: result[key] for key in ("source", "status", "elapsed_ms", "error")}
+                for result in results
+            ]
         }
 
+    except HTTPException:
+        raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"상품 검색 중 오류 발생: {str(e)}")
 
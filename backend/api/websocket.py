@@ -1,74 +1,260 @@
 """
 WebSocket 실시간 알림 시스템
+
+- 토픽 구독: orders / prices / products (연결 시 ?topics=orders,prices, 이후 subscribe/unsubscribe 메시지)
+  구독 지정이 없으면 모든 토픽 수신
+- 연결별 송신 큐(최대 SEND_QUEUE_SIZE)와 송신 태스크: 느린 클라이언트가 다른 연결을 지연시키지 않음
+  큐가 가득 차면 오래된 메시지부터 버리고, 큐가 가득 찬 뒤 STALL_TIMEOUT 동안 한 건도 못 보낸 연결은 종료
+- 워커 간 전달: utils.broadcast 브로커(Redis pub/sub, 없으면 프로세스 내)로 모든 워커의 연결에 전달
 """
+import asyncio
+import json
+import time
 from fastapi import APIRouter, WebSocket, WebSocketDisconnect
-from typing import List, Dict, Any
+from typing import Dict, Any, Iterable, Optional, Set
 from datetime import datetime
-import json
 from logger import get_logger
+from utils.broadcast import InMemoryBroker, create_broker
 
 logger = get_logger(__name__)
 
 router = APIRouter(prefix="/ws", tags=["websocket"])
 
+TOPICS = {"orders", "prices", "products"}
+
+# 연결별 송신 대기 메시지 최대 수
+SEND_QUEUE_SIZE = 100
+
+# 메시지 1건 송신 제한 시간 (초)
+SEND_TIMEOUT = 10.0
+
+# 큐가 가득 찬 뒤 이 시간 동안 송신이 없으면 (느린 클라이언트) 연결 종료
+STALL_TIMEOUT = 15.0
+
+
+def _parse_topics(value: Optional[Iterable[str]]) -> Set[str]:
+    if value is None:
+        return set()
+    if isinstance(value, str):
+        value = value.split(",")
+    return {t.strip() for t in value if isinstance(t, str) and t.strip() in TOPICS}
+
+
+class _Client:
+    """WebSocket 연결 1개의 구독 토픽과 송신 큐"""
+
+    def __init__(self, websocket: WebSocket, topics: Set[str]):
+        self.websocket = websocket
+        # 연결 시 구독 지정이 없으면 전체 구독 (구독을 모두 해제한 빈 집합과 구분)
+        self.all_topics = not topics
+        self.topics = topics
+        self.queue: asyncio.Queue = asyncio.Queue(maxsize=SEND_QUEUE_SIZE)
+        self.dropped = 0
+        self.full_since: Optional[float] = None  # 큐가 가득 찬 시각 (송신하면 초기화)
+        self.sender: Optional[asyncio.Task] = None
+
+    def wants(self, topic: Optional[str]) -> bool:
+        return topic is None or self.all_topics or topic in self.topics
+
+    def subscribed(self) -> Set[str]:
+        return set(TOPICS) if self.all_topics else set(self.topics)
+
+    def offer(self, payload: str) -> bool:
+        """
+        송신 큐에 추가 (가득 차면 가장 오래된 메시지를 버림)
+
+        Returns:
+            False면 너무 많이 밀린 연결 (종료 대상)
+        """
+        if self.queue.full():
+            now = time.monotonic()
+            if self.full_since is None:
+                self.full_since = now
+            try:
+                self.queue.get_nowait()
+            except asyncio.QueueEmpty:
+                pass
+            self.dropped += 1
+            if now - self.full_since > STALL_TIMEOUT:
+                return False
+        self.queue.put_nowait(payload)
+        return True
+
 
 class ConnectionManager:
     """WebSocket 연결 관리"""
 
     def __init__(self):
-        self.active_connections: List[WebSocket] = []
+        self.active_connections: Dict[WebSocket, _Client] = {}
+        self.broker = InMemoryBroker()
+        self._started = False
 
-    async def connect(self, websocket: WebSocket):
+    async def start(self):
+        """워커 간 브로드캐스트 채널 연결 (lifespan 시작 시)"""
+        broker = create_broker()
+        try:
+            await broker.start(self._deliver)
+        except Exception as e:
+            logger.warning(f"WebSocket 브로드캐스트 채널 연결 실패, 현재 워커에만 전달: {e}")
+            broker = InMemoryBroker()
+            await broker.start(self._deliver)
+        self.broker = broker
+        self._started = True
+        logger.info(f"WebSocket 브로드캐스트 채널: {broker.name}")
+
+    async def stop(self):
+        await self.broker.stop()
+        self._started = False
+        for client in list(self.active_connections.values()):
+            await self._close(client)
+
+    async def connect(self, websocket: WebSocket, topics: Optional[Iterable[str]] = None):
         """새 WebSocket 연결"""
         await websocket.accept()
-        self.active_connections.append(websocket)
+        client = _Client(websocket, _parse_topics(topics))
+        client.sender = asyncio.create_task(self._send_loop(client))
+        self.active_connections[websocket] = client
         logger.info(f"WebSocket 연결: 총 {len(self.active_connections)}개")
 
     def disconnect(self, websocket: WebSocket):
         """WebSocket 연결 해제"""
-        self.active_connections.remove(websocket)
+        client = self.active_connections.pop(websocket, None)
+        if client is None:
+            return
+        if client.sender and client.sender is not asyncio.current_task():
+            client.sender.cancel()
         logger.info(f"WebSocket 연결 해제: 남은 {len(self.active_connections)}개")
 
-    async def broadcast(self, message: Dict[str, Any]):
-        """모든 연결에 메시지 전송"""
-        disconnected = []
-        for connection in self.active_connections:
-            try:
-                await connection.send_json(message)
-            except Exception as e:
-                logger.error(f"WebSocket 전송 실패: {e}")
-                disconnected.append(connection)
+    def subscribe(self, websocket: WebSocket, topics: Iterable[str]) -> Set[str]:
+        client = self.active_connections.get(websocket)
+        if client is None:
+            return set()
+        if client.all_topics:
+            client.all_topics = False
+            client.topics = set()
+        client.topics |= _parse_topics(topics)
+        return client.subscribed()
+
+    def unsubscribe(self, websocket: WebSocket, topics: Iterable[str]) -> Set[str]:
+        client = self.active_connections.get(websocket)
+        if client is None:
+            return set()
+        if client.all_topics:
+            client.all_topics = False
+            client.topics = set(TOPICS)
+        client.topics -= _parse_topics(topics)
+        return client.subscribed()
+
+    def send_to(self, websocket: WebSocket, message: Dict[str, Any]):
+        """특정 연결에만 전송 (송신 큐 경유)"""
+        client = self.active_connections.get(websocket)
+        if client is not None:
+            client.offer(json.dumps(message, ensure_ascii=False, default=str))
+
+    async def broadcast(self, message: Dict[str, Any], topic: Optional[str] = None):
+        """
+        구독 중인 모든 연결에 메시지 전송 (모든 워커)
+
+        직렬화는 한 번만 하고, 각 연결의 송신 큐에 넣은 뒤 바로 반환합니다.
+        """
+        payload = json.dumps(message, ensure_ascii=False, default=str)
+        if self._started:
+            await self.broker.publish(topic, payload)
+        else:
+            await self._deliver(topic, payload)
+
+    async def _deliver(self, topic: Optional[str], payload: str):
+        """이 워커의 연결에 전달 (브로커 수신 콜백)"""
+        slow = [
+            client for client in list(self.active_connections.values())
+            if client.wants(topic) and not client.offer(payload)
+        ]
+        for client in slow:
+            logger.warning(f"WebSocket 송신 지연으로 연결 종료 (버린 메시지 {client.dropped}개)")
+            await self._close(client, code=1013)
 
-        # 실패한 연결 제거
-        for connection in disconnected:
-            self.disconnect(connection)
+    async def _send_loop(self, client: _Client):
+        try:
+            while True:
+                payload = await client.queue.get()
+                await asyncio.wait_for(client.websocket.send_text(payload), timeout=SEND_TIMEOUT)
+                client.full_since = None
+        except asyncio.CancelledError:
+            pass
+        except Exception as e:
+            logger.error(f"WebSocket 전송 실패: {e}")
+            self.disconnect(client.websocket)
+
+    async def _close(self, client: _Client, code: int = 1001):
+        self.disconnect(client.websocket)
+        try:
+            await client.websocket.close(code=code)
+        except Exception:
+            pass
+
+    def get_stats(self) -> Dict[str, Any]:
+        clients = list(self.active_connections.values())
+        return {
+            "connections": len(clients),
+            "broker": self.broker.name,
+            "queued": sum(c.queue.qsize() for c in clients),
+            "dropped": sum(c.dropped for c in clients),
+            "topics": {
+                topic: sum(1 for c in clients if c.wants(topic))
+                for topic in sorted(TOPICS)
+            },
+        }
 
 
 # 전역 연결 관리자
 manager = ConnectionManager()
 
 
+@router.get("/stats")
+async def websocket_stats():
+    """현재 워커의 WebSocket 연결/구독/송신 대기 현황"""
+    return {"success": True, **manager.get_stats()}
+
+
 @router.websocket("/notifications")
-async def websocket_endpoint(websocket: WebSocket):
+async def websocket_endpoint(websocket: WebSocket, topics: Optional[str] = None):
     """
     실시간 알림 WebSocket 엔드포인트
 
-    클라이언트 연결: ws://localhost:8000/ws/notifications
+    클라이언트 연결: ws://localhost:8000/ws/notifications?topics=orders,prices
+    구독 변경: {"action": "subscribe", "topics": ["products"]} / {"action": "unsubscribe", ...}
     """
-    await manager.connect(websocket)
+    await manager.connect(websocket, topics)
 
     try:
         while True:
-            # 클라이언트로부터 메시지 수신 (연결 유지용)
+            # 클라이언트로부터 메시지 수신 (연결 유지/구독 변경)
             data = await websocket.receive_text()
             logger.debug(f"WebSocket 메시지 수신: {data}")
 
             # ping 응답
             if data == "ping":
-                await websocket.send_json({
+                manager.send_to(websocket, {
                     "type": "pong",
                     "timestamp": datetime.now().isoformat()
                 })
+                continue
+
+            try:
+                request = json.loads(data)
+            except ValueError:
+                continue
+            if not isinstance(request, dict):
+                continue
+
+            action = request.get("action")
+            if action in ("subscribe", "unsubscribe"):
+                handler = manager.subscribe if action == "subscribe" else manager.unsubscribe
+                current = handler(websocket, request.get("topics") or [])
+                manager.send_to(websocket, {
+                    "type": "subscribed",
+                    "topics": sorted(current)
+                })
 
     except WebSocketDisconnect:
         manager.disconnect(websocket)
@@ -90,7 +276,7 @@ async def notify_order_created(order_id: int, order_number: str, market: str, to
         },
         "timestamp": datetime.now().isoformat()
     }
-    await manager.broadcast(message)
+    await manager.broadcast(message, topic="orders")
     logger.info(f"[WebSocket] 주문 생성 알림: {order_number}")
 
 
@@ -105,7 +291,7 @@ async def notify_order_updated(order_id: int, order_number: str, status: str):
         },
         "timestamp": datetime.now().isoformat()
     }
-    await manager.broadcast(message)
+    await manager.broadcast(message, topic="orders")
     logger.info(f"[WebSocket] 주문 상태 변경 알림: {order_number} → {status}")
 
 
@@ -120,7 +306,7 @@ async def notify_tracking_uploaded(order_id: int, order_number: str, tracking_nu
         },
         "timestamp": datetime.now().isoformat()
     }
-    await manager.broadcast(message)
+    await manager.broadcast(message, topic="orders")
     logger.info(f"[WebSocket] 송장 업로드 알림: {order_number} → {tracking_number}")
 
 
@@ -135,7 +321,7 @@ async def notify_product_registered(product_id: int, product_name: str, market:
         },
         "timestamp": datetime.now().isoformat()
     }
-    await manager.broadcast(message)
+    await manager.broadcast(message, topic="products")
     logger.info(f"[WebSocket] 상품 등록 알림: {product_name} → {market}")
 
 
@@ -151,5 +337,5 @@ async def notify_price_alert(product_name: str, old_price: float, new_price: flo
         },
         "timestamp": datetime.now().isoformat()
     }
-    await manager.broadcast(message)
+    await manager.broadcast(message, topic="prices")
     logger.info(f"[WebSocket] 가격 알림: {product_name} {old_price:,}원 → {new_price:,}원")
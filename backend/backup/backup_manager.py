@@ -3,12 +3,35 @@
 
 매일 새벽 2시 자동 백업 및 7일 이상 된 백업 삭제
 (SQLite 전용 - PostgreSQL은 Supabase 대시보드에서 백업)
+
+- sqlite3 온라인 백업 API로 페이지 단위 복사 (단계 사이에 쓰기 작업에 양보)
+- 주기적인 전체 백업 + 그 사이에는 전체 백업 대비 변경된 페이지만 저장 (차등 증분)
+- zstd 압축 (zstandard 미설치 시 gzip)
+
+파일 구성:
+    monitoring_<ts>.full.db.zst   전체 백업 (압축된 DB 파일)
+    monitoring_<ts>.full.json     전체 백업의 페이지 해시 매니페스트
+    monitoring_<ts>.incr.zst      증분 백업 (기준 전체 백업 + 변경 페이지)
+    monitoring_*.db               이전 방식의 단순 복사본 (복원만 지원)
 """
 
+import gzip
+import hashlib
+import json
 import os
 import shutil
+import sqlite3
+import struct
+from contextlib import contextmanager
 from datetime import datetime, timedelta
 from pathlib import Path
+from typing import Dict, List, Optional
+
+try:
+    import zstandard
+    ZSTD_AVAILABLE = True
+except ImportError:
+    ZSTD_AVAILABLE = False
 
 
 # 백업 디렉토리 경로
@@ -19,11 +42,215 @@ DB_FILE = BACKEND_DIR / 'monitoring.db'
 # PostgreSQL 사용 여부 확인
 USE_POSTGRESQL = os.getenv('USE_POSTGRESQL', 'false').lower() == 'true'
 
+# 온라인 백업 단계당 복사 페이지 수 / 단계 사이 대기 (쓰기 작업에 잠금 양보)
+BACKUP_PAGES_PER_STEP = int(os.getenv('BACKUP_PAGES_PER_STEP', '1024'))
+BACKUP_STEP_SLEEP = float(os.getenv('BACKUP_STEP_SLEEP', '0.01'))
+
+# 전체 백업 주기 (이 기간 안에는 증분 백업)
+FULL_BACKUP_INTERVAL_DAYS = int(os.getenv('FULL_BACKUP_INTERVAL_DAYS', '7'))
 
-def ensure_backup_directory():
+ZSTD_LEVEL = int(os.getenv('BACKUP_ZSTD_LEVEL', '10'))
+
+INCREMENTAL_MAGIC = b'BADAINC1'
+_PAGE_INDEX = struct.Struct('>I')
+_HEADER_LENGTH = struct.Struct('>I')
+
+
+def ensure_backup_directory(backups_dir: Optional[Path] = None):
     """백업 디렉토리 생성"""
-    BACKUPS_DIR.mkdir(exist_ok=True)
-    print(f"[BACKUP] 백업 디렉토리: {BACKUPS_DIR}")
+    backups_dir = backups_dir or BACKUPS_DIR
+    backups_dir.mkdir(parents=True, exist_ok=True)
+    print(f"[BACKUP] 백업 디렉토리: {backups_dir}")
+
+
+# ========================================
+# 압축
+# ========================================
+
+def _compressed_suffix() -> str:
+    return '.zst' if ZSTD_AVAILABLE else '.gz'
+
+
+@contextmanager
+def _compressed_writer(path: Path):
+    with open(path, 'wb') as raw:
+        if path.suffix == '.zst':
+            compressor = zstandard.ZstdCompressor(level=ZSTD_LEVEL, threads=-1)
+            with compressor.stream_writer(raw, closefd=False) as writer:
+                yield writer
+        else:
+            with gzip.GzipFile(fileobj=raw, mode='wb', compresslevel=6) as writer:
+                yield writer
+
+
+@contextmanager
+def _compressed_reader(path: Path):
+    with open(path, 'rb') as raw:
+        if path.suffix == '.zst':
+            if not ZSTD_AVAILABLE:
+                raise RuntimeError("zstd 백업을 읽으려면 zstandard 패키지가 필요합니다")
+            with zstandard.ZstdDecompressor().stream_reader(raw, closefd=False) as reader:
+                yield reader
+        else:
+            with gzip.GzipFile(fileobj=raw, mode='rb') as reader:
+                yield reader
+
+
+def _read_exact(reader, size: int) -> bytes:
+    chunks = []
+    remaining = size
+    while remaining > 0:
+        chunk = reader.read(remaining)
+        if not chunk:
+            break
+        chunks.append(chunk)
+        remaining -= len(chunk)
+    return b''.join(chunks)
+
+
+# ========================================
+# 스냅샷 / 페이지 해시
+# ========================================
+
+def _online_snapshot(db_path: Path, dest_path: Path) -> int:
+    """
+    sqlite3 온라인 백업 API로 일관된 스냅샷 생성
+
+    BACKUP_PAGES_PER_STEP 페이지씩 복사하고 단계 사이에 잠금을 풀어
+    진행 중인 쓰기 작업이 막히지 않도록 합니다.
+
+    Returns:
+        페이지 크기 (bytes)
+    """
+    src = sqlite3.connect(str(db_path), timeout=30)
+    dst = sqlite3.connect(str(dest_path))
+    try:
+        src.backup(dst, pages=BACKUP_PAGES_PER_STEP, sleep=BACKUP_STEP_SLEEP)
+        # 백업 파일은 단일 파일로 보관 (WAL 헤더 제거)
+        dst.execute("PRAGMA journal_mode=DELETE")
+        page_size = dst.execute("PRAGMA page_size").fetchone()[0]
+    finally:
+        dst.close()
+        src.close()
+    return page_size
+
+
+def _page_hashes(path: Path, page_size: int) -> List[str]:
+    hashes = []
+    with open(path, 'rb') as f:
+        while True:
+            page = f.read(page_size)
+            if not page:
+                break
+            hashes.append(hashlib.blake2b(page, digest_size=16).hexdigest())
+    return hashes
+
+
+def _latest_full_manifest(backups_dir: Path) -> Optional[Dict]:
+    """전체 백업 주기 안의 가장 최근 전체 백업 매니페스트"""
+    cutoff = datetime.now() - timedelta(days=FULL_BACKUP_INTERVAL_DAYS)
+    for manifest_path in sorted(backups_dir.glob('monitoring_*.full.json'), reverse=True):
+        try:
+            manifest = json.loads(manifest_path.read_text(encoding='utf-8'))
+        except (OSError, ValueError):
+            continue
+        if datetime.fromisoformat(manifest['created_at']) < cutoff:
+            return None
+        if (backups_dir / manifest['filename']).exists():
+            return manifest
+    return None
+
+
+# ========================================
+# 백업
+# ========================================
+
+def create_backup(
+    db_path: Optional[Path] = None,
+    backups_dir: Optional[Path] = None,
+    full: Optional[bool] = None
+) -> Dict:
+    """
+    온라인 백업 생성
+
+    Args:
+        db_path: 백업할 DB 파일 (기본 monitoring.db)
+        backups_dir: 백업 디렉토리
+        full: True면 전체 백업, False면 증분 백업 강제, None이면 주기에 따라 자동 선택
+
+    Returns:
+        {"filename", "type", "size_mb", "changed_pages", "total_pages", "base"}
+    """
+    db_path = Path(db_path or DB_FILE)
+    backups_dir = Path(backups_dir or BACKUPS_DIR)
+    backups_dir.mkdir(parents=True, exist_ok=True)
+
+    if not db_path.exists():
+        raise FileNotFoundError(f"데이터베이스 파일이 없습니다: {db_path}")
+
+    # 같은 초에 생성된 백업끼리 덮어쓰지 않도록 마이크로초까지 포함
+    timestamp = datetime.now().strftime('%Y-%m-%d_%H-%M-%S-%f')
+    snapshot_path = backups_dir / f".snapshot_{timestamp}.db"
+
+    try:
+        page_size = _online_snapshot(db_path, snapshot_path)
+        hashes = _page_hashes(snapshot_path, page_size)
+
+        base = None if full else _latest_full_manifest(backups_dir)
+        if base is not None and base['page_size'] != page_size:
+            base = None
+        if full is False and base is None:
+            print("[BACKUP] 기준 전체 백업이 없어 전체 백업으로 진행")
+
+        if base is None:
+            # 전체 백업: 스냅샷 압축 + 페이지 해시 매니페스트
+            filename = f"monitoring_{timestamp}.full.db{_compressed_suffix()}"
+            with open(snapshot_path, 'rb') as src, _compressed_writer(backups_dir / filename) as writer:
+                shutil.copyfileobj(src, writer, length=1024 * 1024)
+
+            manifest = {
+                "filename": filename,
+                "created_at": datetime.now().isoformat(),
+                "page_size": page_size,
+                "page_count": len(hashes),
+                "hashes": hashes
+            }
+            (backups_dir / f"monitoring_{timestamp}.full.json").write_text(json.dumps(manifest), encoding='utf-8')
+            result = {"type": "full", "changed_pages": len(hashes), "base": None}
+        else:
+            # 증분 백업: 기준 전체 백업과 해시가 다른 페이지만 저장
+            base_hashes = base['hashes']
+            changed = [
+                i for i, h in enumerate(hashes)
+                if i >= len(base_hashes) or base_hashes[i] != h
+            ]
+            filename = f"monitoring_{timestamp}.incr{_compressed_suffix()}"
+            header = json.dumps({
+                "base": base['filename'],
+                "page_size": page_size,
+                "page_count": len(hashes),
+                "changed": len(changed),
+                "created_at": datetime.now().isoformat()
+            }).encode('utf-8')
+
+            with open(snapshot_path, 'rb') as src, _compressed_writer(backups_dir / filename) as writer:
+                writer.write(INCREMENTAL_MAGIC)
+                writer.write(_HEADER_LENGTH.pack(len(header)))
+                writer.write(header)
+                for index in changed:
+                    src.seek(index * page_size)
+                    writer.write(_PAGE_INDEX.pack(index))
+                    writer.write(src.read(page_size))
+            result = {"type": "incremental", "changed_pages": len(changed), "base": base['filename']}
+
+        result.update({
+            "filename": filename,
+            "total_pages": len(hashes),
+            "size_mb": round((backups_dir / filename).stat().st_size / (1024 * 1024), 2)
+        })
+        return result
+    finally:
+        snapshot_path.unlink(missing_ok=True)
 
 
 def backup_database():
@@ -48,18 +275,11 @@ def backup_database():
             print(f"[BACKUP] 데이터베이스 파일이 없습니다: {DB_FILE}")
             return False
 
-        # 백업 파일명 생성 (monitoring_2026-01-24_02-00-00.db)
-        timestamp = datetime.now().strftime('%Y-%m-%d_%H-%M-%S')
-        backup_filename = f"monitoring_{timestamp}.db"
-        backup_path = BACKUPS_DIR / backup_filename
-
-        # 파일 복사
-        shutil.copy2(DB_FILE, backup_path)
-
-        # 파일 크기 확인
-        file_size = backup_path.stat().st_size / (1024 * 1024)  # MB
-
-        print(f"[BACKUP] 백업 성공: {backup_filename} ({file_size:.2f} MB)")
+        result = create_backup()
+        print(
+            f"[BACKUP] 백업 성공: {result['filename']} ({result['size_mb']:.2f} MB, "
+            f"{result['type']}, 변경 페이지 {result['changed_pages']}/{result['total_pages']})"
+        )
 
         return True
 
@@ -68,10 +288,171 @@ def backup_database():
         return False
 
 
-def cleanup_old_backups(days: int = 7):
+# ========================================
+# 복원
+# ========================================
+
+def _read_incremental_header(path: Path) -> Dict:
+    with _compressed_reader(path) as reader:
+        return _read_incremental_header_from(reader, path)
+
+
+def _read_incremental_header_from(reader, path: Path) -> Dict:
+    if _read_exact(reader, len(INCREMENTAL_MAGIC)) != INCREMENTAL_MAGIC:
+        raise ValueError(f"증분 백업 파일 형식이 아닙니다: {path.name}")
+    (length,) = _HEADER_LENGTH.unpack(_read_exact(reader, _HEADER_LENGTH.size))
+    return json.loads(_read_exact(reader, length))
+
+
+def materialize_backup(filename: str, dest_path: Path, backups_dir: Optional[Path] = None):
+    """백업 파일(전체/증분/단순 복사본)을 복원 가능한 DB 파일로 풀어냄"""
+    backups_dir = Path(backups_dir or BACKUPS_DIR)
+    backup_path = backups_dir / filename
+    if not backup_path.exists():
+        raise FileNotFoundError(f"백업 파일을 찾을 수 없습니다: {filename}")
+
+    if backup_path.suffix == '.db':
+        shutil.copyfile(backup_path, dest_path)
+        return
+
+    if '.full.db' in backup_path.name:
+        with _compressed_reader(backup_path) as reader, open(dest_path, 'wb') as out:
+            shutil.copyfileobj(reader, out, length=1024 * 1024)
+        return
+
+    # 증분: 기준 전체 백업을 풀고 변경 페이지를 덮어씀
+    with _compressed_reader(backup_path) as reader:
+        header = _read_incremental_header_from(reader, backup_path)
+        materialize_backup(header['base'], dest_path, backups_dir)
+
+        page_size = header['page_size']
+        with open(dest_path, 'r+b') as out:
+            for _ in range(header['changed']):
+                (index,) = _PAGE_INDEX.unpack(_read_exact(reader, _PAGE_INDEX.size))
+                out.seek(index * page_size)
+                out.write(_read_exact(reader, page_size))
+            out.truncate(header['page_count'] * page_size)
+
+
+def _reset_connection_pools():
+    """SQLAlchemy 엔진 / 레거시 Database의 풀 커넥션을 모두 닫음 (다음 요청부터 새 커넥션)"""
+    from database.database_manager import get_database_manager
+    from database import db as legacy_db
+
+    db_manager = get_database_manager()
+    if db_manager.is_sqlite:
+        db_manager.engine.dispose()
+
+    legacy_instance = getattr(legacy_db, '_db_instance', None)
+    if legacy_instance is not None:
+        legacy_instance._pool.close_all()
+
+
+def restore_backup(
+    filename: str,
+    db_path: Optional[Path] = None,
+    backups_dir: Optional[Path] = None
+) -> Dict:
+    """
+    백업 복원
+
+    1. 백업을 임시 DB 파일로 풀고 무결성 검사
+    2. 현재 DB를 전체 백업으로 보관
+    3. 풀 커넥션을 닫은 뒤 sqlite3 백업 API로 임시 DB 내용을 운영 DB에 기록
+       (파일을 직접 덮어쓰지 않음, 기록 중 다른 쓰기는 SQLite 잠금으로 busy_timeout만큼 대기)
+
+    Returns:
+        {"restored", "current_backup"}
+    """
+    if Path(filename).name != filename:
+        raise ValueError(f"잘못된 백업 파일명입니다: {filename}")
+
+    db_path = Path(db_path or DB_FILE)
+    backups_dir = Path(backups_dir or BACKUPS_DIR)
+    restore_path = backups_dir / f".restore_{datetime.now().strftime('%Y%m%d_%H%M%S_%f')}.db"
+
+    try:
+        materialize_backup(filename, restore_path, backups_dir)
+
+        check = sqlite3.connect(str(restore_path))
+        try:
+            result = check.execute("PRAGMA quick_check").fetchone()[0]
+        finally:
+            check.close()
+        if result != 'ok':
+            raise ValueError(f"백업 파일 무결성 검사 실패: {result}")
+
+        current_backup = None
+        if db_path.exists():
+            current_backup = create_backup(db_path, backups_dir, full=True)['filename']
+
+        _reset_connection_pools()
+        src = sqlite3.connect(str(restore_path))
+        dst = sqlite3.connect(str(db_path), timeout=30)
+        try:
+            src.backup(dst)
+        finally:
+            dst.close()
+            src.close()
+        _reset_connection_pools()
+
+        print(f"[BACKUP] 복원 완료: {filename} (이전 DB: {current_backup})")
+        return {"restored": filename, "current_backup": current_backup}
+    finally:
+        restore_path.unlink(missing_ok=True)
+
+
+# ========================================
+# 보관 기간 관리
+# ========================================
+
+def _backup_files(backups_dir: Path) -> List[Path]:
+    """백업 데이터 파일 목록 (매니페스트 제외, 최신순)"""
+    files = [
+        p for p in backups_dir.glob('monitoring_*')
+        if p.is_file() and p.suffix != '.json'
+    ]
+    return sorted(files, key=lambda p: p.stat().st_mtime, reverse=True)
+
+
+def _backup_type(path: Path) -> str:
+    if '.full.db' in path.name:
+        return 'full'
+    if '.incr.' in path.name:
+        return 'incremental'
+    return 'copy'
+
+
+def list_backups(backups_dir: Optional[Path] = None) -> List[Dict]:
+    """
+    백업 파일 목록 (최신순)
+
+    Returns:
+        [{"filename", "path", "type", "size_mb", "created_at"(datetime)}]
+    """
+    backups_dir = Path(backups_dir or BACKUPS_DIR)
+    if not backups_dir.exists():
+        return []
+
+    backups = []
+    for backup_file in _backup_files(backups_dir):
+        file_stat = backup_file.stat()
+        backups.append({
+            "filename": backup_file.name,
+            "path": str(backup_file),
+            "type": _backup_type(backup_file),
+            "size_mb": round(file_stat.st_size / (1024 * 1024), 2),
+            "created_at": datetime.fromtimestamp(file_stat.st_mtime)
+        })
+    return backups
+
+
+def cleanup_old_backups(days: int = 7, backups_dir: Optional[Path] = None):
     """
     오래된 백업 파일 삭제
 
+    보관 기간 안의 증분 백업이 참조하는 전체 백업은 기간이 지나도 유지합니다.
+
     Args:
         days: 보관 기간 (일)
 
@@ -79,24 +460,40 @@ def cleanup_old_backups(days: int = 7):
         int: 삭제된 파일 수
     """
     try:
+        backups_dir = Path(backups_dir or BACKUPS_DIR)
+
         # 백업 디렉토리 확인
-        if not BACKUPS_DIR.exists():
+        if not backups_dir.exists():
             return 0
 
         # 삭제 기준 날짜
         cutoff_date = datetime.now() - timedelta(days=days)
         deleted_count = 0
 
-        # 백업 파일 조회
-        for backup_file in BACKUPS_DIR.glob('monitoring_*.db'):
-            # 파일 수정 시간 확인
-            file_mtime = datetime.fromtimestamp(backup_file.stat().st_mtime)
+        files = _backup_files(backups_dir)
+        expired = []
+        referenced = set()
 
-            # 오래된 파일 삭제
+        for backup_file in files:
+            file_mtime = datetime.fromtimestamp(backup_file.stat().st_mtime)
             if file_mtime < cutoff_date:
-                print(f"[BACKUP] 오래된 백업 삭제: {backup_file.name} (생성일: {file_mtime.strftime('%Y-%m-%d')})")
-                backup_file.unlink()
-                deleted_count += 1
+                expired.append((backup_file, file_mtime))
+            elif _backup_type(backup_file) == 'incremental':
+                try:
+                    referenced.add(_read_incremental_header(backup_file)['base'])
+                except Exception as e:
+                    print(f"[BACKUP] 증분 백업 헤더 읽기 실패: {backup_file.name} ({e})")
+
+        for backup_file, file_mtime in expired:
+            if backup_file.name in referenced:
+                continue
+
+            print(f"[BACKUP] 오래된 백업 삭제: {backup_file.name} (생성일: {file_mtime.strftime('%Y-%m-%d')})")
+            backup_file.unlink()
+            if _backup_type(backup_file) == 'full':
+                manifest = backups_dir / (backup_file.name.split('.full.db')[0] + '.full.json')
+                manifest.unlink(missing_ok=True)
+            deleted_count += 1
 
         if deleted_count > 0:
             print(f"[BACKUP] {deleted_count}개의 오래된 백업 파일 삭제 완료")
@@ -108,7 +505,7 @@ def cleanup_old_backups(days: int = 7):
         return 0
 
 
-def get_backup_status():
+def get_backup_status(backups_dir: Optional[Path] = None):
     """
     백업 상태 조회
 
@@ -116,22 +513,20 @@ def get_backup_status():
         dict: 백업 정보
     """
     try:
-        ensure_backup_directory()
+        backups_dir = Path(backups_dir or BACKUPS_DIR)
+        ensure_backup_directory(backups_dir)
 
         # 백업 파일 목록
-        backups = []
-        total_size = 0
-
-        for backup_file in sorted(BACKUPS_DIR.glob('monitoring_*.db'), reverse=True):
-            file_stat = backup_file.stat()
-            file_size = file_stat.st_size / (1024 * 1024)  # MB
-            total_size += file_size
-
-            backups.append({
-                "filename": backup_file.name,
-                "created_at": datetime.fromtimestamp(file_stat.st_mtime).strftime('%Y-%m-%d %H:%M:%S'),
-                "size_mb": round(file_size, 2)
-            })
+        backups = [
+            {
+                "filename": backup["filename"],
+                "type": backup["type"],
+                "created_at": backup["created_at"].strftime('%Y-%m-%d %H:%M:%S'),
+                "size_mb": backup["size_mb"]
+            }
+            for backup in list_backups(backups_dir)
+        ]
+        total_size = sum(backup["size_mb"] for backup in backups)
 
         return {
             "backup_count": len(backups),
@@ -154,7 +549,7 @@ def perform_daily_backup():
     """
     일일 백업 작업 (스케줄러용)
 
-    - 데이터베이스 백업
+    - 데이터베이스 백업 (전체 백업 주기에 따라 전체/증분)
     - 7일 이상 된 백업 삭제
     """
     print(f"\n[BACKUP] ===== 일일 백업 시작: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')} =====")
@@ -2,20 +2,58 @@
 백업 스케줄러
 
 매일 새벽 2시 자동 백업
+스토리지 카탈로그 주기적 재동기화 (기본 6시간마다)
+참조 없는 내용 주소 이미지 정리 (매일 새벽 3시)
 """
 
+import asyncio
+import os
+
 from apscheduler.schedulers.asyncio import AsyncIOScheduler
 from apscheduler.triggers.cron import CronTrigger
+from apscheduler.triggers.interval import IntervalTrigger
 from backup.backup_manager import perform_daily_backup
+from utils.metrics import timed_job
 
 
 # 스케줄러 인스턴스
 scheduler = AsyncIOScheduler()
 
 
+@timed_job('daily_backup')
 async def daily_backup_job():
-    """일일 백업 작업"""
-    perform_daily_backup()
+    """일일 백업 작업 (백업 중 이벤트 루프가 멈추지 않도록 스레드에서 실행)"""
+    await asyncio.to_thread(perform_daily_backup)
+
+
+# 스토리지 카탈로그 재동기화 주기 (시간)
+STORAGE_CATALOG_RECONCILE_HOURS = int(os.getenv('STORAGE_CATALOG_RECONCILE_HOURS', '6'))
+
+
+@timed_job('storage_catalog_reconcile')
+async def storage_catalog_reconcile_job():
+    """스토리지 카탈로그 재동기화 (앱 밖에서 바뀐 Storage 객체 반영)"""
+    try:
+        from utils import storage_catalog
+        from utils.supabase_storage import supabase
+        if not supabase:
+            return
+        await asyncio.to_thread(storage_catalog.reconcile)
+    except Exception as e:
+        print(f"[STORAGE ERROR] 카탈로그 재동기화 실패: {e}")
+
+
+@timed_job('image_blob_sweep')
+async def image_blob_sweep_job():
+    """참조가 0인 채로 유예 기간이 지난 내용 주소 이미지 삭제"""
+    try:
+        from utils import image_store
+        from utils.supabase_storage import supabase
+        if not supabase:
+            return
+        await asyncio.to_thread(image_store.sweep_unreferenced)
+    except Exception as e:
+        print(f"[STORAGE ERROR] 참조 없는 이미지 정리 실패: {e}")
 
 
 def start_scheduler():
@@ -31,6 +69,26 @@ def start_scheduler():
             misfire_grace_time=3600  # 1시간
         )
 
+        # 스토리지 카탈로그 재동기화
+        scheduler.add_job(
+            storage_catalog_reconcile_job,
+            trigger=IntervalTrigger(hours=STORAGE_CATALOG_RECONCILE_HOURS),
+            id="storage_catalog_reconcile",
+            name="스토리지 카탈로그 재동기화",
+            replace_existing=True,
+            misfire_grace_time=3600
+        )
+
+        # 참조 없는 이미지 정리
+        scheduler.add_job(
+            image_blob_sweep_job,
+            trigger=CronTrigger(hour=3, minute=0),
+            id="image_blob_sweep",
+            name="참조 없는 이미지 정리",
+            replace_existing=True,
+            misfire_grace_time=3600
+        )
+
         scheduler.start()
         print("[BACKUP] 백업 스케줄러 시작 완료 (매일 새벽 2시)")
 
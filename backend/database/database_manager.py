@@ -5,12 +5,15 @@ Supports both PostgreSQL (production) and SQLite (development)
 
 import os
 from typing import Optional
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, event
 from sqlalchemy.orm import sessionmaker, Session
-from sqlalchemy.pool import StaticPool
+from sqlalchemy.pool import SingletonThreadPool, StaticPool
 from contextlib import contextmanager
 
 from .models import Base
+from .sqlite_tuning import apply_pragmas, connect_args, get_sqlite_profile
+from . import query_profiler
+from utils.metrics import instrument_engine
 
 
 class DatabaseManager:
@@ -50,10 +53,19 @@ class DatabaseManager:
         # Create engine with appropriate settings
         engine_kwargs = {}
 
-        if self.is_sqlite:
-            # SQLite-specific settings
+        self.is_memory_sqlite = self.is_sqlite and (':memory:' in database_url or database_url.rstrip('/') == 'sqlite:')
+
+        if self.is_memory_sqlite:
+            # In-memory SQLite: 커넥션마다 별도 DB이므로 단일 커넥션 공유
             engine_kwargs['connect_args'] = {'check_same_thread': False}
             engine_kwargs['poolclass'] = StaticPool
+        elif self.is_sqlite:
+            # File SQLite: WAL + 스레드별 커넥션 + BEGIN IMMEDIATE (database/sqlite_tuning.py)
+            # 같은 스레드의 중첩 세션은 커넥션을 공유하므로 바깥 세션의 쓰기 잠금을 기다리지 않음
+            profile = get_sqlite_profile()
+            engine_kwargs['connect_args'] = connect_args(profile)
+            engine_kwargs['poolclass'] = SingletonThreadPool
+            engine_kwargs['pool_size'] = profile.thread_connections
         else:
             # PostgreSQL settings
             engine_kwargs['pool_size'] = 10
@@ -61,6 +73,11 @@ class DatabaseManager:
             engine_kwargs['pool_pre_ping'] = True  # Verify connections before using
 
         self.engine = create_engine(database_url, **engine_kwargs)
+
+        if self.is_sqlite and not self.is_memory_sqlite:
+            event.listen(self.engine, 'connect', lambda dbapi_conn, _record: apply_pragmas(dbapi_conn))
+        instrument_engine(self.engine)
+        query_profiler.install(self.engine)
         self.SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=self.engine)
 
     def create_all_tables(self):
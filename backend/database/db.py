@@ -7,6 +7,8 @@ from pathlib import Path
 from datetime import datetime
 from typing import Optional, List, Dict, Any
 
+from .sqlite_tuning import SQLiteConnectionPool, connect
+
 
 class Database:
     """SQLite 데이터베이스 관리 클래스"""
@@ -14,6 +16,8 @@ class Database:
     def __init__(self, db_path: str = "monitoring.db"):
         self.db_path = db_path
         self.init_db()
+        # WAL/캐시 PRAGMA가 적용된 커넥션 재사용 (호출마다 새로 connect하지 않음)
+        self._pool = SQLiteConnectionPool(self.db_path)
 
     def init_db(self):
         """데이터베이스 초기화"""
@@ -29,6 +33,9 @@ class Database:
             # 플레이오토 관련 컬럼 마이그레이션
             self._migrate_playauto_columns(conn)
 
+            # keyset 페이지네이션 대상 테이블의 created_at NULL 채우기
+            self._backfill_created_at(conn)
+
             # 성능 최적화 인덱스 생성
             self._create_performance_indexes(conn)
 
@@ -61,6 +68,21 @@ class Database:
         except Exception as e:
             print(f"[WARN] 플레이오토 컬럼 마이그레이션 실패: {e}")
 
+    def _backfill_created_at(self, conn):
+        """
+        created_at이 NULL인 행을 1970-01-01로 채움 (마이그레이션)
+
+        keyset 페이지네이션은 created_at NOT NULL을 전제로 (created_at, id) 행 값 비교를 사용
+        (SQLite는 기존 컬럼에 NOT NULL을 추가할 수 없어 시작 시 채움)
+        """
+        from .pagination import KEYSET_TABLES, NULL_CREATED_AT
+        try:
+            for table in KEYSET_TABLES:
+                conn.execute(f"UPDATE {table} SET created_at = ? WHERE created_at IS NULL", (NULL_CREATED_AT,))
+            conn.commit()
+        except Exception as e:
+            print(f"[WARN] created_at 채우기 실패: {e}")
+
     def _create_performance_indexes(self, conn):
         """성능 최적화를 위한 인덱스 생성 (마이그레이션)"""
         try:
@@ -87,7 +109,14 @@ class Database:
 
                 # 카테고리 매핑 조회 최적화
                 "CREATE INDEX IF NOT EXISTS idx_category_mappings_my ON category_mappings(my_category_id)",
-                "CREATE INDEX IF NOT EXISTS idx_category_mappings_playauto ON category_mappings(playauto_category_id)"
+                "CREATE INDEX IF NOT EXISTS idx_category_mappings_playauto ON category_mappings(playauto_category_id)",
+
+                # keyset 페이지네이션 (created_at DESC, id DESC)
+                "CREATE INDEX IF NOT EXISTS idx_orders_keyset ON orders(created_at DESC, id DESC)",
+                "CREATE INDEX IF NOT EXISTS idx_my_selling_products_keyset ON my_selling_products(created_at DESC, id DESC)",
+                "CREATE INDEX IF NOT EXISTS idx_monitored_products_keyset ON monitored_products(created_at DESC, id DESC)",
+                "CREATE INDEX IF NOT EXISTS idx_webhook_logs_keyset ON webhook_logs(created_at DESC, id DESC)",
+                "CREATE INDEX IF NOT EXISTS idx_playauto_sync_logs_keyset ON playauto_sync_logs(created_at DESC, id DESC)"
             ]
 
             index_count = 0
@@ -105,11 +134,25 @@ class Database:
             print(f"[WARN] 인덱스 생성 실패: {e}")
 
     def get_connection(self):
-        """데이터베이스 연결 생성"""
-        conn = sqlite3.connect(self.db_path)
+        """
+        데이터베이스 연결 생성 (호출자가 commit/close 책임)
+
+        튜닝 PRAGMA와 BEGIN IMMEDIATE 트랜잭션이 적용된 독립 커넥션을 반환합니다.
+        풀을 쓰려면 with self.connection() as conn: 형태를 사용하세요.
+        """
+        conn = connect(self.db_path)
         conn.row_factory = sqlite3.Row  # 딕셔너리 형태로 결과 반환
         return conn
 
+    def connection(self):
+        """
+        풀에서 데이터베이스 연결 가져오기 (with 문으로 사용)
+
+        블록 종료 시 commit (예외 시 rollback) 후 연결을 풀로 반환합니다.
+        row_factory는 sqlite3.Row (딕셔너리 형태로 결과 반환)
+        """
+        return self._pool.connection()
+
     # 모니터링 상품 관련 메서드
 
     def add_monitored_product(
@@ -123,7 +166,7 @@ class Database:
         notes: Optional[str] = None
     ) -> int:
         """모니터링 상품 추가"""
-        with self.get_connection() as conn:
+        with self.connection() as conn:
             cursor = conn.execute("""
                 INSERT INTO monitored_products
                 (product_url, product_name, source, current_price, original_price, check_interval, notes, last_checked_at)
@@ -134,7 +177,7 @@ class Database:
 
     def get_monitored_product(self, product_id: int) -> Optional[Dict]:
         """특정 모니터링 상품 조회"""
-        with self.get_connection() as conn:
+        with self.connection() as conn:
             cursor = conn.execute("""
                 SELECT * FROM monitored_products WHERE id = ?
             """, (product_id,))
@@ -143,7 +186,7 @@ class Database:
 
     def get_all_monitored_products(self, active_only: bool = True) -> List[Dict]:
         """모든 모니터링 상품 조회"""
-        with self.get_connection() as conn:
+        with self.connection() as conn:
             query = "SELECT * FROM monitored_products"
             if active_only:
                 query += " WHERE is_active = TRUE"
@@ -152,6 +195,22 @@ class Database:
             cursor = conn.execute(query)
             return [dict(row) for row in cursor.fetchall()]
 
+    def find_registered_urls(self, urls: List[str]) -> set:
+        """이미 등록된 URL 조회 (모니터링 상품 URL + 판매 상품 소싱 URL)"""
+        urls = list(dict.fromkeys(urls))
+        found = set()
+        with self.connection() as conn:
+            for start in range(0, len(urls), 500):
+                chunk = urls[start:start + 500]
+                placeholders = ",".join("?" * len(chunk))
+                cursor = conn.execute(f"""
+                    SELECT product_url FROM monitored_products WHERE product_url IN ({placeholders})
+                    UNION
+                    SELECT sourcing_url FROM my_selling_products WHERE sourcing_url IN ({placeholders})
+                """, (*chunk, *chunk))
+                found.update(row[0] for row in cursor.fetchall())
+        return found
+
     def update_product_status(
         self,
         product_id: int,
@@ -160,7 +219,7 @@ class Database:
         details: Optional[str] = None
     ):
         """상품 상태 업데이트 및 역마진 방어"""
-        with self.get_connection() as conn:
+        with self.connection() as conn:
             # 현재 상태 가져오기
             cursor = conn.execute(
                 "SELECT current_status, current_price, notes, product_name FROM monitored_products WHERE id = ?",
@@ -327,7 +386,7 @@ class Database:
 
     def get_status_history(self, product_id: int, limit: int = 50) -> List[Dict]:
         """상태 변경 이력 조회"""
-        with self.get_connection() as conn:
+        with self.connection() as conn:
             cursor = conn.execute("""
                 SELECT * FROM status_changes
                 WHERE product_id = ?
@@ -338,7 +397,7 @@ class Database:
 
     def get_price_history(self, product_id: int, limit: int = 100) -> List[Dict]:
         """가격 변동 이력 조회"""
-        with self.get_connection() as conn:
+        with self.connection() as conn:
             cursor = conn.execute("""
                 SELECT * FROM price_history
                 WHERE product_id = ?
@@ -349,7 +408,7 @@ class Database:
 
     def get_unread_notifications(self, limit: int = 50) -> List[Dict]:
         """읽지 않은 알림 조회"""
-        with self.get_connection() as conn:
+        with self.connection() as conn:
             cursor = conn.execute("""
                 SELECT n.*, p.product_name, p.product_url
                 FROM notifications n
@@ -362,7 +421,7 @@ class Database:
 
     def mark_notification_as_read(self, notification_id: int):
         """알림을 읽음으로 표시"""
-        with self.get_connection() as conn:
+        with self.connection() as conn:
             conn.execute("""
                 UPDATE notifications SET is_read = TRUE WHERE id = ?
             """, (notification_id,))
@@ -370,13 +429,13 @@ class Database:
 
     def delete_monitored_product(self, product_id: int):
         """모니터링 상품 삭제"""
-        with self.get_connection() as conn:
+        with self.connection() as conn:
             conn.execute("DELETE FROM monitored_products WHERE id = ?", (product_id,))
             conn.commit()
 
     def toggle_monitoring(self, product_id: int, is_active: bool):
         """모니터링 활성화/비활성화"""
-        with self.get_connection() as conn:
+        with self.connection() as conn:
             conn.execute("""
                 UPDATE monitored_products SET is_active = ?, updated_at = ?
                 WHERE id = ?
@@ -385,7 +444,7 @@ class Database:
 
     def get_dashboard_stats(self) -> Dict:
         """대시보드 통계 조회"""
-        with self.get_connection() as conn:
+        with self.connection() as conn:
             # 상품 통계
             cursor = conn.execute("""
                 SELECT
@@ -423,7 +482,7 @@ class Database:
 
     def get_margin_alert_products(self) -> List[Dict]:
         """역마진 발생 상품 목록 조회"""
-        with self.get_connection() as conn:
+        with self.connection() as conn:
             cursor = conn.execute("""
                 SELECT DISTINCT p.*, n.message, n.created_at as alert_time
                 FROM monitored_products p
@@ -451,7 +510,7 @@ class Database:
         notes: Optional[str] = None
     ) -> int:
         """주문 추가"""
-        with self.get_connection() as conn:
+        with self.connection() as conn:
             cursor = conn.execute("""
                 INSERT INTO orders
                 (order_number, market, customer_name, customer_phone, customer_address,
@@ -476,7 +535,7 @@ class Database:
         """주문 상품 추가"""
         profit = (selling_price - sourcing_price) * quantity
 
-        with self.get_connection() as conn:
+        with self.connection() as conn:
             cursor = conn.execute("""
                 INSERT INTO order_items
                 (order_id, monitored_product_id, product_name, product_url, source,
@@ -489,14 +548,14 @@ class Database:
 
     def get_order(self, order_id: int) -> Optional[Dict]:
         """주문 조회"""
-        with self.get_connection() as conn:
+        with self.connection() as conn:
             cursor = conn.execute("SELECT * FROM orders WHERE id = ?", (order_id,))
             row = cursor.fetchone()
             return dict(row) if row else None
 
     def get_all_orders(self, status: Optional[str] = None, limit: int = 100) -> List[Dict]:
         """주문 목록 조회"""
-        with self.get_connection() as conn:
+        with self.connection() as conn:
             query = "SELECT * FROM orders"
             params = []
 
@@ -512,7 +571,7 @@ class Database:
 
     def get_order_items(self, order_id: int) -> List[Dict]:
         """주문 상품 목록 조회"""
-        with self.get_connection() as conn:
+        with self.connection() as conn:
             cursor = conn.execute("""
                 SELECT * FROM order_items WHERE order_id = ?
             """, (order_id,))
@@ -520,7 +579,7 @@ class Database:
 
     def get_pending_order_items(self, limit: int = 50) -> List[Dict]:
         """자동 발주 대기 중인 상품 목록 조회 (진행 중인 모든 상품 포함)"""
-        with self.get_connection() as conn:
+        with self.connection() as conn:
             cursor = conn.execute("""
                 SELECT oi.*, o.customer_name, o.customer_phone, o.customer_address,
                        o.customer_zipcode, o.market
@@ -534,7 +593,7 @@ class Database:
 
     def update_order_status(self, order_id: int, status: str):
         """주문 상태 업데이트"""
-        with self.get_connection() as conn:
+        with self.connection() as conn:
             conn.execute("""
                 UPDATE orders
                 SET order_status = ?, updated_at = ?
@@ -557,7 +616,7 @@ class Database:
         tracking_number: Optional[str] = None
     ):
         """주문 상품 RPA 상태 업데이트"""
-        with self.get_connection() as conn:
+        with self.connection() as conn:
             update_query = """
                 UPDATE order_items
                 SET rpa_status = ?, updated_at = ?
@@ -586,7 +645,7 @@ class Database:
         execution_time: Optional[float] = None
     ):
         """RPA 실행 로그 추가"""
-        with self.get_connection() as conn:
+        with self.connection() as conn:
             conn.execute("""
                 INSERT INTO auto_order_logs
                 (order_item_id, source, action, status, message, error_details,
@@ -598,7 +657,7 @@ class Database:
 
     def get_auto_order_logs(self, order_item_id: int) -> List[Dict]:
         """RPA 실행 로그 조회"""
-        with self.get_connection() as conn:
+        with self.connection() as conn:
             cursor = conn.execute("""
                 SELECT * FROM auto_order_logs
                 WHERE order_item_id = ?
@@ -622,7 +681,7 @@ class Database:
         crypto = get_crypto()
         encrypted_password = crypto.encrypt(account_password)
 
-        with self.get_connection() as conn:
+        with self.connection() as conn:
             cursor = conn.execute("""
                 INSERT OR REPLACE INTO sourcing_accounts
                 (source, account_id, account_password, payment_method, payment_info, notes, updated_at)
@@ -635,7 +694,7 @@ class Database:
         """소싱처 계정 조회 (비밀번호 자동 복호화)"""
         from playauto.crypto import get_crypto
 
-        with self.get_connection() as conn:
+        with self.connection() as conn:
             cursor = conn.execute("""
                 SELECT * FROM sourcing_accounts WHERE source = ? AND is_active = TRUE
             """, (source,))
@@ -657,7 +716,7 @@ class Database:
         """모든 소싱처 계정 조회 (비밀번호 자동 복호화)"""
         from playauto.crypto import get_crypto
 
-        with self.get_connection() as conn:
+        with self.connection() as conn:
             cursor = conn.execute("""
                 SELECT * FROM sourcing_accounts WHERE is_active = TRUE
             """)
@@ -680,7 +739,7 @@ class Database:
 
     def save_playauto_setting(self, key: str, value: str, encrypted: bool = False, notes: Optional[str] = None):
         """플레이오토 설정 저장"""
-        with self.get_connection() as conn:
+        with self.connection() as conn:
             conn.execute("""
                 INSERT OR REPLACE INTO playauto_settings
                 (setting_key, setting_value, encrypted, updated_at, notes)
@@ -690,7 +749,7 @@ class Database:
 
     def get_playauto_setting(self, key: str) -> Optional[str]:
         """플레이오토 설정 조회"""
-        with self.get_connection() as conn:
+        with self.connection() as conn:
             cursor = conn.execute("""
                 SELECT setting_value FROM playauto_settings WHERE setting_key = ?
             """, (key,))
@@ -699,7 +758,7 @@ class Database:
 
     def get_all_playauto_settings(self) -> List[Dict]:
         """모든 플레이오토 설정 조회"""
-        with self.get_connection() as conn:
+        with self.connection() as conn:
             cursor = conn.execute("""
                 SELECT * FROM playauto_settings ORDER BY setting_key
             """)
@@ -714,7 +773,7 @@ class Database:
         order_date: Optional[datetime] = None
     ) -> int:
         """마켓 주문 원본 저장"""
-        with self.get_connection() as conn:
+        with self.connection() as conn:
             cursor = conn.execute("""
                 INSERT OR REPLACE INTO market_orders_raw
                 (playauto_order_id, market, order_number, raw_data, order_date, updated_at)
@@ -725,7 +784,7 @@ class Database:
 
     def get_unsynced_market_orders(self, limit: int = 100) -> List[Dict]:
         """미동기화 마켓 주문 조회"""
-        with self.get_connection() as conn:
+        with self.connection() as conn:
             cursor = conn.execute("""
                 SELECT * FROM market_orders_raw
                 WHERE synced_to_local = FALSE
@@ -736,7 +795,7 @@ class Database:
 
     def mark_market_order_synced(self, playauto_order_id: str, local_order_id: int):
         """마켓 주문 동기화 완료 표시"""
-        with self.get_connection() as conn:
+        with self.connection() as conn:
             conn.execute("""
                 UPDATE market_orders_raw
                 SET synced_to_local = TRUE, local_order_id = ?, updated_at = ?
@@ -759,7 +818,7 @@ class Database:
         total_amount = playauto_order_data.get('total_amount', 0)
         order_date = playauto_order_data.get('order_date')
 
-        with self.get_connection() as conn:
+        with self.connection() as conn:
             # 1. 마켓 주문 원본 저장
             conn.execute("""
                 INSERT OR REPLACE INTO market_orders_raw
@@ -806,7 +865,7 @@ class Database:
 
     def get_completed_orders_with_tracking(self, days: int = 7) -> List[Dict]:
         """송장번호가 있는 완료 주문 조회 (최근 N일)"""
-        with self.get_connection() as conn:
+        with self.connection() as conn:
             cursor = conn.execute("""
                 SELECT o.*, oi.tracking_number
                 FROM orders o
@@ -822,7 +881,7 @@ class Database:
 
     def mark_tracking_uploaded(self, order_id: int):
         """송장 업로드 완료 표시"""
-        with self.get_connection() as conn:
+        with self.connection() as conn:
             conn.execute("""
                 UPDATE orders
                 SET tracking_uploaded_at = ?, synced_to_playauto = TRUE, updated_at = ?
@@ -830,6 +889,24 @@ class Database:
             """, (datetime.now(), datetime.now(), order_id))
             conn.commit()
 
+    def mark_tracking_uploaded_bulk(self, order_ids: List[int]) -> int:
+        """송장 업로드 완료 일괄 표시 (SQLite 변수 개수 제한 내에서 나눠 실행)"""
+        order_ids = list(dict.fromkeys(order_ids))
+        now = datetime.now()
+        updated = 0
+        with self.connection() as conn:
+            for start in range(0, len(order_ids), 500):
+                chunk = order_ids[start:start + 500]
+                placeholders = ",".join("?" * len(chunk))
+                cursor = conn.execute(f"""
+                    UPDATE orders
+                    SET tracking_uploaded_at = ?, synced_to_playauto = TRUE, updated_at = ?
+                    WHERE id IN ({placeholders})
+                """, (now, now, *chunk))
+                updated += cursor.rowcount
+            conn.commit()
+        return updated
+
     def add_playauto_sync_log(
         self,
         sync_type: str,
@@ -843,7 +920,7 @@ class Database:
         execution_time: Optional[float] = None
     ) -> int:
         """플레이오토 동기화 로그 추가"""
-        with self.get_connection() as conn:
+        with self.connection() as conn:
             cursor = conn.execute("""
                 INSERT INTO playauto_sync_logs
                 (sync_type, status, request_data, response_data, items_count,
@@ -856,7 +933,7 @@ class Database:
 
     def get_playauto_sync_logs(self, sync_type: Optional[str] = None, limit: int = 100) -> List[Dict]:
         """플레이오토 동기화 로그 조회"""
-        with self.get_connection() as conn:
+        with self.connection() as conn:
             query = "SELECT * FROM playauto_sync_logs"
             params = []
 
@@ -872,7 +949,7 @@ class Database:
 
     def get_playauto_stats(self) -> Dict:
         """플레이오토 통계 조회"""
-        with self.get_connection() as conn:
+        with self.connection() as conn:
             # 총 수집 주문 수
             cursor = conn.execute("""
                 SELECT COUNT(*) as total_orders FROM market_orders_raw
@@ -930,7 +1007,7 @@ class Database:
         notification_types: str = 'all'
     ) -> int:
         """Webhook 설정 저장 (INSERT or UPDATE)"""
-        with self.get_connection() as conn:
+        with self.connection() as conn:
             # 기존 설정이 있는지 확인
             cursor = conn.execute("""
                 SELECT id FROM webhook_settings WHERE webhook_type = ?
@@ -957,7 +1034,7 @@ class Database:
 
     def get_webhook_setting(self, webhook_type: str) -> Optional[Dict]:
         """특정 Webhook 설정 조회"""
-        with self.get_connection() as conn:
+        with self.connection() as conn:
             cursor = conn.execute("""
                 SELECT * FROM webhook_settings WHERE webhook_type = ?
             """, (webhook_type,))
@@ -966,7 +1043,7 @@ class Database:
 
     def get_all_webhook_settings(self, enabled_only: bool = False) -> List[Dict]:
         """모든 Webhook 설정 조회"""
-        with self.get_connection() as conn:
+        with self.connection() as conn:
             query = "SELECT * FROM webhook_settings"
             if enabled_only:
                 query += " WHERE enabled = TRUE"
@@ -977,7 +1054,7 @@ class Database:
 
     def toggle_webhook(self, webhook_type: str, enabled: bool):
         """Webhook 활성화/비활성화"""
-        with self.get_connection() as conn:
+        with self.connection() as conn:
             conn.execute("""
                 UPDATE webhook_settings
                 SET enabled = ?, updated_at = ?
@@ -987,7 +1064,7 @@ class Database:
 
     def delete_webhook_setting(self, webhook_type: str):
         """Webhook 설정 삭제"""
-        with self.get_connection() as conn:
+        with self.connection() as conn:
             conn.execute("""
                 DELETE FROM webhook_settings WHERE webhook_type = ?
             """, (webhook_type,))
@@ -1004,7 +1081,7 @@ class Database:
         error_details: Optional[str] = None
     ) -> int:
         """Webhook 실행 로그 추가"""
-        with self.get_connection() as conn:
+        with self.connection() as conn:
             cursor = conn.execute("""
                 INSERT INTO webhook_logs
                 (webhook_id, notification_type, status, message, error_details)
@@ -1013,9 +1090,25 @@ class Database:
             conn.commit()
             return cursor.lastrowid
 
+    def add_webhook_logs(self, logs: List[Dict]):
+        """Webhook 실행 로그 일괄 추가 (알림 디스패처가 모아서 기록)"""
+        if not logs:
+            return
+        with self.connection() as conn:
+            conn.executemany("""
+                INSERT INTO webhook_logs
+                (webhook_id, notification_type, status, message, error_details)
+                VALUES (?, ?, ?, ?, ?)
+            """, [
+                (log.get('webhook_id'), log['notification_type'], log['status'],
+                 log.get('message'), log.get('error_details'))
+                for log in logs
+            ])
+            conn.commit()
+
     def get_webhook_logs(self, limit: int = 50, webhook_type: Optional[str] = None) -> List[Dict]:
         """Webhook 로그 조회"""
-        with self.get_connection() as conn:
+        with self.connection() as conn:
             if webhook_type:
                 cursor = conn.execute("""
                     SELECT wl.*, ws.webhook_type
@@ -1047,7 +1140,7 @@ class Database:
         is_active_after: Optional[bool] = None
     ) -> int:
         """자동 재고 관리 로그 추가"""
-        with self.get_connection() as conn:
+        with self.connection() as conn:
             cursor = conn.execute("""
                 INSERT INTO inventory_auto_logs
                 (product_id, action, old_status, new_status, is_active_before, is_active_after)
@@ -1058,7 +1151,7 @@ class Database:
 
     def get_inventory_auto_logs(self, product_id: Optional[int] = None, limit: int = 50) -> List[Dict]:
         """자동 재고 관리 로그 조회"""
-        with self.get_connection() as conn:
+        with self.connection() as conn:
             if product_id:
                 cursor = conn.execute("""
                     SELECT ial.*, mp.product_name
@@ -1080,7 +1173,7 @@ class Database:
 
     def update_product_active_status(self, product_id: int, is_active: bool):
         """상품 모니터링 활성화 상태 변경"""
-        with self.get_connection() as conn:
+        with self.connection() as conn:
             conn.execute("""
                 UPDATE monitored_products
                 SET is_active = ?, updated_at = ?
@@ -1111,7 +1204,7 @@ class Database:
         notes: Optional[str] = None
     ) -> int:
         """판매 상품 추가"""
-        with self.get_connection() as conn:
+        with self.connection() as conn:
             cursor = conn.execute("""
                 INSERT INTO my_selling_products
                 (product_name, selling_price, monitored_product_id, sourcing_url, sourcing_product_name,
@@ -1126,7 +1219,7 @@ class Database:
 
     def get_selling_products(self, is_active: Optional[bool] = None, limit: int = 100) -> List[Dict]:
         """판매 상품 목록 조회 (소싱 정보 포함)"""
-        with self.get_connection() as conn:
+        with self.connection() as conn:
             query = """
                 SELECT
                     sp.*,
@@ -1167,7 +1260,7 @@ class Database:
 
     def get_selling_product(self, product_id: int) -> Optional[Dict]:
         """판매 상품 상세 조회"""
-        with self.get_connection() as conn:
+        with self.connection() as conn:
             cursor = conn.execute("""
                 SELECT
                     sp.*,
@@ -1222,7 +1315,7 @@ class Database:
         if not old_product:
             return
 
-        with self.get_connection() as conn:
+        with self.connection() as conn:
             updates = []
             params = []
 
@@ -1303,7 +1396,7 @@ class Database:
 
     def delete_selling_product(self, product_id: int):
         """판매 상품 삭제"""
-        with self.get_connection() as conn:
+        with self.connection() as conn:
             conn.execute("DELETE FROM my_selling_products WHERE id = ?", (product_id,))
             conn.commit()
 
@@ -1319,7 +1412,7 @@ class Database:
         transmitted_at: Optional[datetime] = None
     ) -> int:
         """마켓별 상품번호 저장/업데이트"""
-        with self.get_connection() as conn:
+        with self.connection() as conn:
             # 기존 레코드 확인
             cursor = conn.execute("""
                 SELECT id FROM product_marketplace_codes
@@ -1353,7 +1446,7 @@ class Database:
 
     def get_marketplace_codes_by_product(self, product_id: int) -> List[Dict]:
         """상품의 모든 마켓 코드 조회"""
-        with self.get_connection() as conn:
+        with self.connection() as conn:
             cursor = conn.execute("""
                 SELECT * FROM product_marketplace_codes
                 WHERE product_id = ?
@@ -1363,7 +1456,7 @@ class Database:
 
     def get_product_by_marketplace_code(self, shop_cd: str, shop_sale_no: str) -> Optional[Dict]:
         """마켓 코드로 상품 조회 (주문 매칭용)"""
-        with self.get_connection() as conn:
+        with self.connection() as conn:
             cursor = conn.execute("""
                 SELECT sp.*, pmc.shop_cd, pmc.shop_sale_no
                 FROM my_selling_products sp
@@ -1376,7 +1469,7 @@ class Database:
 
     def get_products_without_marketplace_codes(self, limit: int = 100) -> List[Dict]:
         """마켓 코드가 없는 상품 조회 (동기화 대상)"""
-        with self.get_connection() as conn:
+        with self.connection() as conn:
             cursor = conn.execute("""
                 SELECT sp.*
                 FROM my_selling_products sp
@@ -1393,7 +1486,7 @@ class Database:
 
     def get_products_for_marketplace_sync(self, hours: int = 24, limit: int = 100) -> List[Dict]:
         """마켓 코드 동기화가 필요한 상품 조회 (주기적 업데이트)"""
-        with self.get_connection() as conn:
+        with self.connection() as conn:
             cursor = conn.execute("""
                 SELECT DISTINCT sp.*
                 FROM my_selling_products sp
@@ -1430,7 +1523,7 @@ class Database:
         new_sourcing_price: Optional[float] = None
     ) -> int:
         """마진 변동 기록"""
-        with self.get_connection() as conn:
+        with self.connection() as conn:
             cursor = conn.execute("""
                 INSERT INTO margin_change_logs
                 (selling_product_id, old_margin, new_margin, old_margin_rate, new_margin_rate,
@@ -1443,7 +1536,7 @@ class Database:
 
     def get_margin_change_logs(self, selling_product_id: Optional[int] = None, limit: int = 50) -> List[Dict]:
         """마진 변동 이력 조회"""
-        with self.get_connection() as conn:
+        with self.connection() as conn:
             if selling_product_id:
                 cursor = conn.execute("""
                     SELECT mcl.*, sp.product_name
@@ -1465,7 +1558,7 @@ class Database:
 
     def update_margin_notification_status(self, log_id: int, sent: bool = True):
         """마진 변동 알림 발송 상태 업데이트"""
-        with self.get_connection() as conn:
+        with self.connection() as conn:
             conn.execute("""
                 UPDATE margin_change_logs
                 SET notification_sent = ?
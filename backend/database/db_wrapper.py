@@ -6,9 +6,11 @@ Database Wrapper - SQLAlchemy 기반으로 기존 db.py 인터페이스 구현
 import os
 from typing import Optional, List, Dict, Any
 from datetime import datetime
+from sqlalchemy import insert, select
 from sqlalchemy.orm import Session
 
 from .database_manager import get_database_manager
+from .serializers import fetch_dicts, model_to_dict
 from .models import (
     MonitoredProduct, PriceHistory, StatusChange, Notification,
     Order, OrderItem, AutoOrderLog, SourcingAccount,
@@ -77,12 +79,24 @@ class DatabaseWrapper:
     def get_all_monitored_products(self, active_only: bool = True) -> List[Dict]:
         """모든 모니터링 상품 조회"""
         with self.db_manager.get_session() as session:
-            query = session.query(MonitoredProduct)
+            stmt = select(*MonitoredProduct.__table__.columns)
             if active_only:
-                query = query.filter_by(is_active=True)
-            query = query.order_by(MonitoredProduct.created_at.desc())
-            products = query.all()
-            return [self._model_to_dict(p) for p in products]
+                stmt = stmt.where(MonitoredProduct.is_active == True)
+            stmt = stmt.order_by(MonitoredProduct.created_at.desc())
+            return fetch_dicts(session, stmt)
+
+    def find_registered_urls(self, urls: List[str]) -> set:
+        """이미 등록된 URL 조회 (모니터링 상품 URL + 판매 상품 소싱 URL)"""
+        urls = list(dict.fromkeys(urls))
+        found = set()
+        with self.db_manager.get_session() as session:
+            for start in range(0, len(urls), 500):
+                chunk = urls[start:start + 500]
+                found.update(url for (url,) in session.query(MonitoredProduct.product_url)
+                             .filter(MonitoredProduct.product_url.in_(chunk)))
+                found.update(url for (url,) in session.query(MySellingProduct.sourcing_url)
+                             .filter(MySellingProduct.sourcing_url.in_(chunk)))
+        return found
 
     def update_product_status(
         self,
@@ -356,10 +370,11 @@ class DatabaseWrapper:
     def get_selling_products(self, is_active: Optional[bool] = None, limit: int = 100) -> List[Dict]:
         """판매 상품 목록 조회 (소싱 정보 포함)"""
         with self.db_manager.get_session() as session:
-            from sqlalchemy import case, func
+            from sqlalchemy import func
 
-            query = session.query(
-                MySellingProduct,
+            # ORM 객체 대신 필요한 컬럼만 Core SELECT로 조회
+            stmt = select(
+                *MySellingProduct.__table__.columns,
                 MonitoredProduct.product_name.label('monitored_product_name'),
                 MonitoredProduct.product_url.label('monitored_product_url'),
                 MonitoredProduct.source.label('monitored_source'),
@@ -369,23 +384,18 @@ class DatabaseWrapper:
             ).outerjoin(MonitoredProduct, MySellingProduct.monitored_product_id == MonitoredProduct.id)
 
             if is_active is not None:
-                query = query.filter(MySellingProduct.is_active == is_active)
+                stmt = stmt.where(MySellingProduct.is_active == is_active)
 
-            query = query.order_by(MySellingProduct.created_at.desc()).limit(limit)
+            stmt = stmt.order_by(MySellingProduct.created_at.desc()).limit(limit)
 
-            results = []
-            for row in query.all():
-                product_dict = self._model_to_dict(row[0])
-                product_dict['monitored_product_name'] = row[1]
-                product_dict['monitored_product_url'] = row[2]
-                product_dict['monitored_source'] = row[3]
-                product_dict['monitored_price'] = float(row[4]) if row[4] else None
-                product_dict['monitored_status'] = row[5]
-                product_dict['effective_sourcing_price'] = float(row[6])
+            results = fetch_dicts(session, stmt)
+            for product_dict in results:
+                if not product_dict['monitored_price']:
+                    product_dict['monitored_price'] = None
 
                 # 마진 계산
                 sourcing_price = product_dict['effective_sourcing_price']
-                selling_price = float(product_dict['selling_price'])
+                selling_price = product_dict['selling_price']
                 if sourcing_price > 0:
                     product_dict['margin'] = selling_price - sourcing_price
                     product_dict['margin_rate'] = ((selling_price - sourcing_price) / sourcing_price) * 100
@@ -393,8 +403,6 @@ class DatabaseWrapper:
                     product_dict['margin'] = 0
                     product_dict['margin_rate'] = 0
 
-                results.append(product_dict)
-
             return results
 
     def search_selling_products_by_name(self, query: str, limit: int = 10) -> List[Dict]:
@@ -739,15 +747,13 @@ class DatabaseWrapper:
     def get_all_orders(self, status: Optional[str] = None, limit: int = 100) -> List[Dict]:
         """주문 목록 조회"""
         with self.db_manager.get_session() as session:
-            query = session.query(Order)
+            stmt = select(*Order.__table__.columns)
 
             if status:
-                query = query.filter_by(order_status=status)
+                stmt = stmt.where(Order.order_status == status)
 
-            query = query.order_by(Order.created_at.desc()).limit(limit)
-
-            orders = query.all()
-            return [self._model_to_dict(o) for o in orders]
+            stmt = stmt.order_by(Order.created_at.desc()).limit(limit)
+            return fetch_dicts(session, stmt)
 
     def get_order_items(self, order_id: int) -> List[Dict]:
         """주문 상품 목록 조회"""
@@ -769,14 +775,12 @@ class DatabaseWrapper:
             return {}
 
         with self.db_manager.get_session() as session:
-            items = session.query(OrderItem)\
-                .filter(OrderItem.order_id.in_(order_ids))\
-                .all()
+            stmt = select(*OrderItem.__table__.columns).where(OrderItem.order_id.in_(order_ids))
 
             # order_id별로 그룹화
             result = {order_id: [] for order_id in order_ids}
-            for item in items:
-                result[item.order_id].append(self._model_to_dict(item))
+            for item in fetch_dicts(session, stmt):
+                result[item['order_id']].append(item)
 
             return result
 
@@ -873,20 +877,14 @@ class DatabaseWrapper:
     def get_webhook_logs(self, limit: int = 50, webhook_type: Optional[str] = None) -> List[Dict]:
         """Webhook 로그 조회"""
         with self.db_manager.get_session() as session:
-            query = session.query(WebhookLog, WebhookSetting.webhook_type)\
+            stmt = select(*WebhookLog.__table__.columns, WebhookSetting.webhook_type)\
                 .outerjoin(WebhookSetting, WebhookLog.webhook_id == WebhookSetting.id)
 
             if webhook_type:
-                query = query.filter(WebhookSetting.webhook_type == webhook_type)
+                stmt = stmt.where(WebhookSetting.webhook_type == webhook_type)
 
-            query = query.order_by(WebhookLog.created_at.desc()).limit(limit)
-
-            results = []
-            for log, wh_type in query.all():
-                log_dict = self._model_to_dict(log)
-                log_dict['webhook_type'] = wh_type
-                results.append(log_dict)
-            return results
+            stmt = stmt.order_by(WebhookLog.created_at.desc()).limit(limit)
+            return fetch_dicts(session, stmt)
 
     def add_webhook_log(
         self,
@@ -907,6 +905,22 @@ class DatabaseWrapper:
             )
             session.add(log)
 
+    def add_webhook_logs(self, logs: List[Dict]):
+        """Webhook 로그 일괄 추가 (알림 디스패처가 모아서 기록)"""
+        if not logs:
+            return
+        with self.db_manager.get_session() as session:
+            session.execute(insert(WebhookLog), [
+                {
+                    'webhook_id': log.get('webhook_id'),
+                    'notification_type': log['notification_type'],
+                    'status': log['status'],
+                    'message': log.get('message'),
+                    'error_details': log.get('error_details'),
+                }
+                for log in logs
+            ])
+
     # ========================================
     # 소싱 계정 관리
     # ========================================
@@ -971,6 +985,44 @@ class DatabaseWrapper:
     # Playauto 추가 메서드
     # ========================================
 
+    def get_completed_orders_with_tracking(self, days: int = 7) -> List[Dict]:
+        """송장번호가 있는 완료 주문 조회 (최근 N일)"""
+        from datetime import timedelta
+        from sqlalchemy import or_
+
+        with self.db_manager.get_session() as session:
+            stmt = (
+                select(*Order.__table__.columns, OrderItem.tracking_number)
+                .join(OrderItem, OrderItem.order_id == Order.id)
+                .where(
+                    Order.order_status == 'completed',
+                    OrderItem.tracking_number.isnot(None),
+                    OrderItem.tracking_number != '',
+                    or_(Order.tracking_uploaded_at.is_(None), Order.synced_to_playauto.is_(False)),
+                    Order.created_at > datetime.now() - timedelta(days=days)
+                )
+                .order_by(Order.created_at.desc())
+            )
+            return fetch_dicts(session, stmt)
+
+    def mark_tracking_uploaded_bulk(self, order_ids: List[int]) -> int:
+        """송장 업로드 완료 일괄 표시 (IN 목록이 너무 길어지지 않도록 나눠 실행)"""
+        order_ids = list(dict.fromkeys(order_ids))
+        now = datetime.now()
+        updated = 0
+        with self.db_manager.get_session() as session:
+            for start in range(0, len(order_ids), 500):
+                chunk = order_ids[start:start + 500]
+                updated += session.query(Order).filter(Order.id.in_(chunk)).update(
+                    {
+                        Order.tracking_uploaded_at: now,
+                        Order.synced_to_playauto: True,
+                        Order.updated_at: now
+                    },
+                    synchronize_session=False
+                )
+        return updated
+
     def add_playauto_sync_log(
         self,
         sync_type: str,
@@ -1003,15 +1055,13 @@ class DatabaseWrapper:
     def get_playauto_sync_logs(self, sync_type: Optional[str] = None, limit: int = 100) -> List[Dict]:
         """플레이오토 동기화 로그 조회"""
         with self.db_manager.get_session() as session:
-            query = session.query(PlayautoSyncLog)
+            stmt = select(*PlayautoSyncLog.__table__.columns)
 
             if sync_type:
-                query = query.filter_by(sync_type=sync_type)
-
-            query = query.order_by(PlayautoSyncLog.created_at.desc()).limit(limit)
+                stmt = stmt.where(PlayautoSyncLog.sync_type == sync_type)
 
-            logs = query.all()
-            return [self._model_to_dict(log) for log in logs]
+            stmt = stmt.order_by(PlayautoSyncLog.created_at.desc()).limit(limit)
+            return fetch_dicts(session, stmt)
 
     def get_playauto_stats(self) -> Dict:
         """플레이오토 통계 조회"""
@@ -1680,20 +1730,8 @@ class DatabaseWrapper:
     # ========================================
 
     def _model_to_dict(self, model) -> Dict:
-        """SQLAlchemy 모델을 딕셔너리로 변환"""
-        from decimal import Decimal
-        result = {}
-        for column in model.__table__.columns:
-            value = getattr(model, column.name)
-            # datetime을 문자열로 변환
-            if isinstance(value, datetime):
-                result[column.name] = value.isoformat()
-            # Decimal을 float로 변환 (JSON 직렬화 호환)
-            elif isinstance(value, Decimal):
-                result[column.name] = float(value)
-            else:
-                result[column.name] = value
-        return result
+        """SQLAlchemy 모델을 딕셔너리로 변환 (모델별로 캐시된 변환기 사용)"""
+        return model_to_dict(model)
 
 
 # 싱글톤 인스턴스
@@ -0,0 +1,36 @@
+-- keyset 페이지네이션 인덱스 추가 마이그레이션
+-- 목록/내보내기 쿼리의 ORDER BY created_at DESC, id DESC 정렬을 인덱스로 처리
+-- (운영 중 테이블 잠금을 피하려면 CONCURRENTLY로 실행)
+
+-- created_at NOT NULL: keyset 조건을 (created_at, id) < (?, ?) 하나로 인덱스 탐색
+-- (기존 NULL 행은 1970-01-01로 채워 목록 맨 뒤에 유지)
+UPDATE orders SET created_at = '1970-01-01 00:00:00' WHERE created_at IS NULL;
+UPDATE my_selling_products SET created_at = '1970-01-01 00:00:00' WHERE created_at IS NULL;
+UPDATE monitored_products SET created_at = '1970-01-01 00:00:00' WHERE created_at IS NULL;
+UPDATE webhook_logs SET created_at = '1970-01-01 00:00:00' WHERE created_at IS NULL;
+UPDATE playauto_sync_logs SET created_at = '1970-01-01 00:00:00' WHERE created_at IS NULL;
+
+ALTER TABLE orders ALTER COLUMN created_at SET NOT NULL;
+ALTER TABLE my_selling_products ALTER COLUMN created_at SET NOT NULL;
+ALTER TABLE monitored_products ALTER COLUMN created_at SET NOT NULL;
+ALTER TABLE webhook_logs ALTER COLUMN created_at SET NOT NULL;
+ALTER TABLE playauto_sync_logs ALTER COLUMN created_at SET NOT NULL;
+
+CREATE INDEX IF NOT EXISTS idx_orders_keyset ON orders(created_at DESC, id DESC);
+CREATE INDEX IF NOT EXISTS idx_my_selling_products_keyset ON my_selling_products(created_at DESC, id DESC);
+CREATE INDEX IF NOT EXISTS idx_monitored_products_keyset ON monitored_products(created_at DESC, id DESC);
+CREATE INDEX IF NOT EXISTS idx_webhook_logs_keyset ON webhook_logs(created_at DESC, id DESC);
+CREATE INDEX IF NOT EXISTS idx_playauto_sync_logs_keyset ON playauto_sync_logs(created_at DESC, id DESC);
+
+-- 인덱스 생성 확인
+SELECT
+    tablename,
+    indexname,
+    indexdef
+FROM
+    pg_indexes
+WHERE
+    schemaname = 'public'
+    AND indexname LIKE '%_keyset'
+ORDER BY
+    tablename, indexname;
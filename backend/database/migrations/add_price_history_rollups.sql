@@ -0,0 +1,37 @@
+-- 가격 이력 요약(OHLC) 테이블 및 보존 기간 인덱스 추가 마이그레이션
+-- 보존 기간이 지난 price_history는 시간/일 단위 요약으로 대체 (monitor/price_history_retention.py)
+-- (운영 중 테이블 잠금을 피하려면 CONCURRENTLY로 실행)
+
+CREATE TABLE IF NOT EXISTS price_history_rollups (
+    id BIGSERIAL PRIMARY KEY,
+    product_id BIGINT NOT NULL,
+    resolution TEXT NOT NULL,  -- 'hour', 'day'
+    bucket_start TIMESTAMP NOT NULL,
+    open_price NUMERIC(10,2) NOT NULL,
+    high_price NUMERIC(10,2) NOT NULL,
+    low_price NUMERIC(10,2) NOT NULL,
+    close_price NUMERIC(10,2) NOT NULL,
+    sample_count INTEGER NOT NULL DEFAULT 0,
+    FOREIGN KEY (product_id) REFERENCES monitored_products (id) ON DELETE CASCADE
+);
+
+-- 차트 조회는 인덱스만 읽음 (covering index)
+CREATE UNIQUE INDEX IF NOT EXISTS uq_price_history_rollups ON price_history_rollups(product_id, resolution, bucket_start)
+    INCLUDE (open_price, high_price, low_price, close_price, sample_count);
+CREATE INDEX IF NOT EXISTS idx_price_history_rollups_age ON price_history_rollups(resolution, bucket_start);
+
+-- 대시보드 최근 24시간 변동 상품 수 / 보존 기간 삭제
+CREATE INDEX IF NOT EXISTS idx_price_history_checked ON price_history(checked_at, product_id);
+
+-- 인덱스 생성 확인
+SELECT
+    tablename,
+    indexname,
+    indexdef
+FROM
+    pg_indexes
+WHERE
+    schemaname = 'public'
+    AND tablename IN ('price_history', 'price_history_rollups')
+ORDER BY
+    tablename, indexname;
@@ -4,7 +4,7 @@ Database-agnostic models (works with both SQLite and PostgreSQL)
 """
 
 from sqlalchemy import (
-    Column, Integer, BigInteger, String, Text, Numeric, Boolean,
+    Column, Integer, BigInteger, String, Text, Numeric, Boolean, Float,
     DateTime, Date, ForeignKey, UniqueConstraint, Index
 )
 from sqlalchemy.ext.declarative import declarative_base
@@ -29,7 +29,7 @@ class MonitoredProduct(Base):
     original_price = Column(Numeric(10, 2))
     current_status = Column(Text, default='available')
     last_checked_at = Column(DateTime)
-    created_at = Column(DateTime, default=func.current_timestamp())
+    created_at = Column(DateTime, nullable=False, default=func.current_timestamp())
     updated_at = Column(DateTime, default=func.current_timestamp(), onupdate=func.current_timestamp())
     check_interval = Column(Integer, default=15)
     is_active = Column(Boolean, default=True)
@@ -45,6 +45,7 @@ class MonitoredProduct(Base):
 
     __table_args__ = (
         Index('idx_monitored_products_active', 'is_active', 'last_checked_at'),
+        Index('idx_monitored_products_keyset', 'created_at', 'id'),
     )
 
 
@@ -62,6 +63,31 @@ class PriceHistory(Base):
 
     __table_args__ = (
         Index('idx_price_history_product', 'product_id', 'checked_at'),
+        Index('idx_price_history_checked', 'checked_at', 'product_id'),  # 최근 변동 집계/보존 기간 삭제
+    )
+
+
+class PriceHistoryRollup(Base):
+    """가격 이력 시간/일 단위 요약 (OHLC) - 보존 기간이 지난 원본 price_history를 대체"""
+    __tablename__ = 'price_history_rollups'
+
+    id = Column(BigInteger().with_variant(Integer, 'sqlite'), primary_key=True, autoincrement=True)
+    product_id = Column(BigInteger, ForeignKey('monitored_products.id', ondelete='CASCADE'), nullable=False)
+    resolution = Column(Text, nullable=False)  # 'hour', 'day'
+    bucket_start = Column(DateTime, nullable=False)
+    open_price = Column(Numeric(10, 2), nullable=False)
+    high_price = Column(Numeric(10, 2), nullable=False)
+    low_price = Column(Numeric(10, 2), nullable=False)
+    close_price = Column(Numeric(10, 2), nullable=False)
+    sample_count = Column(Integer, nullable=False, default=0)
+
+    __table_args__ = (
+        # 차트 조회는 인덱스만 읽음 (PostgreSQL INCLUDE)
+        Index(
+            'uq_price_history_rollups', 'product_id', 'resolution', 'bucket_start', unique=True,
+            postgresql_include=['open_price', 'high_price', 'low_price', 'close_price', 'sample_count']
+        ),
+        Index('idx_price_history_rollups_age', 'resolution', 'bucket_start'),
     )
 
 
@@ -120,10 +146,13 @@ class Order(Base):
     total_amount = Column(Numeric(10, 2), nullable=False)
     total_profit = Column(Numeric(10, 2))
     payment_method = Column(Text)
-    created_at = Column(DateTime, default=func.current_timestamp())
+    created_at = Column(DateTime, nullable=False, default=func.current_timestamp())
     updated_at = Column(DateTime, default=func.current_timestamp(), onupdate=func.current_timestamp())
     completed_at = Column(DateTime)
     notes = Column(Text)
+    playauto_order_id = Column(Text)  # 플레이오토 묶음번호
+    synced_to_playauto = Column(Boolean, default=False)
+    tracking_uploaded_at = Column(DateTime)  # 플레이오토 송장 업로드 완료 시각
 
     # Relationships
     order_items = relationship("OrderItem", back_populates="order", cascade="all, delete-orphan")
@@ -133,6 +162,7 @@ class Order(Base):
         Index('idx_orders_status', 'order_status', 'created_at'),
         Index('idx_orders_market', 'market', 'created_at'),
         Index('idx_orders_order_number', 'order_number'),
+        Index('idx_orders_keyset', 'created_at', 'id'),
     )
 
 
@@ -237,10 +267,11 @@ class PlayautoSyncLog(Base):
     fail_count = Column(Integer, default=0)
     error_message = Column(Text)
     execution_time = Column(Numeric(10, 2))
-    created_at = Column(DateTime, default=func.current_timestamp())
+    created_at = Column(DateTime, nullable=False, default=func.current_timestamp())
 
     __table_args__ = (
         Index('idx_playauto_sync_logs_type', 'sync_type', 'created_at'),
+        Index('idx_playauto_sync_logs_keyset', 'created_at', 'id'),
     )
 
 
@@ -267,6 +298,32 @@ class MarketOrderRaw(Base):
     )
 
 
+class PlayautoRegistrationJob(Base):
+    """플레이오토 상품 등록 작업 (백그라운드 실행, 진행률/상품별 결과 보관)"""
+    __tablename__ = 'playauto_registration_jobs'
+
+    id = Column(BigInteger().with_variant(Integer, 'sqlite'), primary_key=True, autoincrement=True)
+    status = Column(Text, nullable=False, default='pending')  # 'pending', 'running', 'completed', 'failed'
+    total_count = Column(Integer, nullable=False, default=0)
+    processed_count = Column(Integer, nullable=False, default=0)
+    success_count = Column(Integer, nullable=False, default=0)
+    failed_count = Column(Integer, nullable=False, default=0)
+    progress_percent = Column(Numeric(5, 2), default=0)
+    product_ids = Column(Text)  # JSON 배열
+    site_list = Column(Text)  # JSON 배열
+    results = Column(Text)  # JSON 배열 (상품별 채널 결과)
+    error_message = Column(Text)
+    retry_of = Column(BigInteger)  # 재시도 원본 작업 ID
+    started_at = Column(DateTime)
+    completed_at = Column(DateTime)
+    heartbeat_at = Column(DateTime)  # 실행 중인 워커가 주기적으로 갱신 (오래 끊기면 중단된 작업으로 처리)
+    created_at = Column(DateTime, default=func.current_timestamp())
+
+    __table_args__ = (
+        Index('idx_playauto_registration_jobs_created_at', 'created_at'),
+    )
+
+
 # ==========================================
 # Notification System
 # ==========================================
@@ -299,7 +356,7 @@ class WebhookLog(Base):
     status = Column(Text, nullable=False)
     message = Column(Text)
     error_details = Column(Text)
-    created_at = Column(DateTime, default=func.current_timestamp())
+    created_at = Column(DateTime, nullable=False, default=func.current_timestamp())
 
     # Relationships
     webhook_setting = relationship("WebhookSetting", back_populates="webhook_logs")
@@ -307,6 +364,7 @@ class WebhookLog(Base):
     __table_args__ = (
         Index('idx_webhook_logs_webhook', 'webhook_id', 'created_at'),
         Index('idx_webhook_logs_type', 'notification_type', 'created_at'),
+        Index('idx_webhook_logs_keyset', 'created_at', 'id'),
     )
 
 
@@ -348,7 +406,7 @@ class MySellingProduct(Base):
     coupang_opts = Column(Text)  # 쿠팡 옵션 (JSON 배열, 최대 3개)
     smart_opts = Column(Text)  # 스마트스토어 옵션 (JSON 배열, 최대 3개)
     is_active = Column(Boolean, default=False)  # 기본값: 중단 (상세페이지 생성기에서 추가된 상품은 중단 상태로 시작)
-    created_at = Column(DateTime, default=func.current_timestamp())
+    created_at = Column(DateTime, nullable=False, default=func.current_timestamp())
     updated_at = Column(DateTime, default=func.current_timestamp(), onupdate=func.current_timestamp())
     notes = Column(Text)
 
@@ -360,6 +418,7 @@ class MySellingProduct(Base):
     __table_args__ = (
         Index('idx_my_selling_products_active', 'is_active', 'created_at'),
         Index('idx_my_selling_products_monitored', 'monitored_product_id'),
+        Index('idx_my_selling_products_keyset', 'created_at', 'id'),
     )
 
 
@@ -460,6 +519,107 @@ class Category(Base):
     )
 
 
+# ==========================================
+# Storage Catalog
+# ==========================================
+
+class StorageObject(Base):
+    """Supabase Storage 객체 메타데이터 인덱스 (관리자 갤러리/통계용)"""
+    __tablename__ = 'storage_objects'
+
+    # SQLite에서는 INTEGER PRIMARY KEY여야 rowid 자동 증가
+    id = Column(BigInteger().with_variant(Integer, 'sqlite'), primary_key=True, autoincrement=True)
+    path = Column(Text, nullable=False, unique=True)  # cat-1/image.jpg
+    folder = Column(Text, nullable=False)
+    filename = Column(Text, nullable=False)
+    size = Column(BigInteger, default=0)
+    content_type = Column(Text)
+    width = Column(Integer)
+    height = Column(Integer)
+    content_hash = Column(Text)  # sha256 (write-through 업로드 시 기록)
+    etag = Column(Text)
+    has_thumbnail = Column(Boolean, default=False)
+    modified_at = Column(Text)  # Storage updated_at (ISO 문자열 그대로)
+    synced_at = Column(DateTime, default=func.current_timestamp())
+
+    __table_args__ = (
+        Index('idx_storage_objects_folder', 'folder', 'filename'),
+        Index('idx_storage_objects_hash', 'content_hash'),
+    )
+
+
+class ImageBlob(Base):
+    """내용 주소 기반(sha256) 이미지 저장소 - 같은 이미지는 한 번만 업로드하고 참조 수로 관리"""
+    __tablename__ = 'image_blobs'
+
+    id = Column(BigInteger().with_variant(Integer, 'sqlite'), primary_key=True, autoincrement=True)
+    content_hash = Column(Text, nullable=False, unique=True)
+    storage_path = Column(Text, nullable=False)  # blobs/{sha256}.{ext}
+    size = Column(BigInteger, default=0)
+    content_type = Column(Text)
+    ref_count = Column(Integer, default=0, nullable=False)
+    created_at = Column(DateTime, default=func.current_timestamp())
+    last_referenced_at = Column(DateTime, default=func.current_timestamp())
+
+    __table_args__ = (
+        Index('idx_image_blobs_unreferenced', 'ref_count', 'last_referenced_at'),
+    )
+
+
+class ImageSource(Base):
+    """원본 이미지 URL → 내용 해시 (같은 소싱 이미지를 다시 다운로드하지 않기 위함)"""
+    __tablename__ = 'image_sources'
+
+    id = Column(BigInteger().with_variant(Integer, 'sqlite'), primary_key=True, autoincrement=True)
+    url_hash = Column(Text, nullable=False, unique=True)  # sha1(source_url)
+    source_url = Column(Text, nullable=False)
+    content_hash = Column(Text, nullable=False)
+    created_at = Column(DateTime, default=func.current_timestamp())
+
+
+class AlertState(Base):
+    """상품별 알림 상태 (같은 문제로 알림이 반복 발송되지 않도록 상태 전이 시에만 발송)"""
+    __tablename__ = 'alert_states'
+
+    id = Column(BigInteger().with_variant(Integer, 'sqlite'), primary_key=True, autoincrement=True)
+    product_id = Column(BigInteger, nullable=False)
+    alert_type = Column(Text, nullable=False)  # 'product_unavailable', 'price_fetch_fail'
+    state = Column(Text, nullable=False, default='ok')  # 'ok' 또는 문제 상태 ('out_of_stock', 'failing' 등)
+    fail_count = Column(Integer, nullable=False, default=0)  # 연속 문제 감지 횟수
+    detail = Column(Text)
+    first_seen_at = Column(DateTime)  # 현재 문제 구간 시작
+    last_seen_at = Column(DateTime)
+    resolved_at = Column(DateTime)
+    notified_state = Column(Text)  # 마지막으로 알림을 보낸 상태
+    last_notified_at = Column(DateTime)
+    suppressed_count = Column(Integer, nullable=False, default=0)  # 마지막 알림 이후 억제된 감지 횟수
+
+    __table_args__ = (
+        UniqueConstraint('product_id', 'alert_type', name='uq_alert_state'),
+        Index('idx_alert_states_active', 'state', 'last_notified_at'),
+    )
+
+
+class FetchStrategyStat(Base):
+    """도메인·가져오기 전략별 성공률/지연 시간 (utils.fetch_strategy 통계를 재시작 후에도 유지)"""
+    __tablename__ = 'fetch_strategy_stats'
+
+    id = Column(BigInteger().with_variant(Integer, 'sqlite'), primary_key=True, autoincrement=True)
+    domain = Column(Text, nullable=False)
+    strategy = Column(Text, nullable=False)  # 'direct', 'cookie_replay', 'flaresolverr'
+    attempts = Column(Integer, nullable=False, default=0)
+    successes = Column(Integer, nullable=False, default=0)
+    success_rate = Column(Float, nullable=False, default=1.0)  # EWMA
+    latency = Column(Float)  # 성공 요청 지연 시간 EWMA (초)
+    last_success_at = Column(DateTime)
+    updated_at = Column(DateTime, default=func.current_timestamp())
+
+    __table_args__ = (
+        UniqueConstraint('domain', 'strategy', name='uq_fetch_strategy_stat'),
+        Index('idx_fetch_strategy_stats_updated_at', 'updated_at'),
+    )
+
+
 # ==========================================
 # Accounting System
 # ==========================================
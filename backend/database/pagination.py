@@ -0,0 +1,258 @@
+"""
+Keyset(커서) 페이지네이션 및 스트리밍 조회 유틸리티
+
+LIMIT/OFFSET 방식은 깊은 페이지일수록 앞의 행을 모두 건너뛰어야 하므로
+(created_at, id) 기준 keyset 조건으로 다음 페이지를 인덱스에서 바로 찾습니다.
+대량 내보내기는 서버 사이드 커서로 행을 조금씩 읽어 메모리를 일정하게 유지합니다.
+
+PostgreSQL/SQLite 모두 raw DBAPI 커서를 사용합니다 (placeholder: %s / ?).
+keyset 대상 테이블의 created_at은 NOT NULL (KEYSET_TABLES, 기존 NULL은 시작 시 1970-01-01로 채움)이므로
+(created_at, id) 행 값 비교 하나로 (created_at DESC, id DESC) 인덱스를 바로 탐색합니다.
+"""
+
+import base64
+import json
+import uuid
+from datetime import date, datetime
+from decimal import Decimal
+from typing import Any, Dict, Iterator, List, Optional, Sequence, Tuple
+
+from .database_manager import get_database_manager
+
+
+# 정확한 COUNT(*) 대신 사용할 필터 조건부 카운트 상한
+APPROXIMATE_COUNT_CAP = 10000
+
+COUNT_MODES = ('exact', 'approximate', 'none')
+
+# (created_at DESC, id DESC) 인덱스로 keyset 페이지네이션하는 테이블
+KEYSET_TABLES = ('orders', 'my_selling_products', 'monitored_products', 'webhook_logs', 'playauto_sync_logs')
+
+# created_at이 NULL이던 기존 행의 대체값 (목록 맨 뒤에 유지)
+NULL_CREATED_AT = '1970-01-01 00:00:00'
+
+
+def encode_cursor(created_at: Any, row_id: int) -> str:
+    """(created_at, id)를 불투명한 커서 문자열로 인코딩"""
+    if isinstance(created_at, datetime):
+        created_at = created_at.isoformat(sep=' ')
+    payload = json.dumps([created_at, row_id], separators=(',', ':'))
+    return base64.urlsafe_b64encode(payload.encode('utf-8')).decode('ascii').rstrip('=')
+
+
+def decode_cursor(cursor: str) -> Tuple[str, int]:
+    """
+    커서 문자열을 (created_at, id)로 디코딩
+
+    Raises:
+        ValueError: 잘못된 커서
+    """
+    try:
+        padded = cursor + '=' * (-len(cursor) % 4)
+        created_at, row_id = json.loads(base64.urlsafe_b64decode(padded.encode('ascii')))
+        if created_at is None:
+            raise ValueError("created_at 없음")
+        return created_at, int(row_id)
+    except Exception as e:
+        raise ValueError(f"잘못된 커서입니다: {cursor}") from e
+
+
+def _placeholder() -> str:
+    return "?" if get_database_manager().is_sqlite else "%s"
+
+
+def keyset_condition(
+    cursor: Optional[str],
+    created_col: str = 'created_at',
+    id_col: str = 'id'
+) -> Tuple[Optional[str], List[Any]]:
+    """
+    created_at DESC, id DESC 정렬 기준으로 커서 이후 행을 고르는 WHERE 조건 생성
+
+    Returns:
+        (SQL 조건 또는 None, 바인딩 파라미터)
+    """
+    if not cursor:
+        return None, []
+
+    created_at, row_id = decode_cursor(cursor)
+    ph = _placeholder()
+
+    # 행 값 비교는 PostgreSQL/SQLite 모두 인덱스 탐색 조건으로 사용됨 (OR 조건은 매 페이지 전체 스캔)
+    return f"({created_col}, {id_col}) < ({ph}, {ph})", [created_at, row_id]
+
+
+def serialize_value(value: Any) -> Any:
+    """JSON 직렬화 가능한 값으로 변환 (datetime → ISO 문자열, Decimal → float)"""
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    if isinstance(value, Decimal):
+        return float(value)
+    return value
+
+
+def _row_to_dict(columns: Sequence[str], row: Sequence[Any]) -> Dict[str, Any]:
+    return {col: serialize_value(row[i]) for i, col in enumerate(columns)}
+
+
+def fetch_keyset_page(
+    select_sql: str,
+    where: Optional[List[str]] = None,
+    params: Optional[List[Any]] = None,
+    cursor: Optional[str] = None,
+    limit: int = 50,
+    table_alias: str = ''
+) -> Tuple[List[Dict[str, Any]], Optional[str]]:
+    """
+    keyset 방식으로 한 페이지 조회
+
+    Args:
+        select_sql: "SELECT ... FROM ... [JOIN ...]" (WHERE/ORDER BY/LIMIT 제외)
+        where: 추가 WHERE 조건 목록 (AND로 결합)
+        params: where 조건의 바인딩 파라미터
+        cursor: 이전 페이지의 next_cursor (없으면 첫 페이지)
+        limit: 페이지 크기
+        table_alias: created_at/id가 속한 테이블 별칭 (예: 'sp')
+
+    Returns:
+        (행 목록, next_cursor 또는 None)
+        select 목록에 created_at, id 컬럼이 포함되어 있어야 합니다.
+
+    Raises:
+        ValueError: 잘못된 커서
+    """
+    prefix = f"{table_alias}." if table_alias else ''
+    created_col = f"{prefix}created_at"
+    id_col = f"{prefix}id"
+
+    conditions = list(where or [])
+    bind = list(params or [])
+
+    keyset_sql, keyset_params = keyset_condition(cursor, created_col, id_col)
+    if keyset_sql:
+        conditions.append(keyset_sql)
+        bind.extend(keyset_params)
+
+    ph = _placeholder()
+    sql = select_sql
+    if conditions:
+        sql += " WHERE " + " AND ".join(conditions)
+    # limit + 1개를 읽어 다음 페이지 존재 여부 판단
+    sql += f" ORDER BY {created_col} DESC, {id_col} DESC LIMIT {ph}"
+    bind.append(limit + 1)
+
+    conn = get_database_manager().engine.raw_connection()
+    try:
+        db_cursor = conn.cursor()
+        db_cursor.execute(sql, bind)
+        columns = [col[0] for col in db_cursor.description]
+        raw_rows = db_cursor.fetchall()
+    finally:
+        conn.close()
+
+    has_more = len(raw_rows) > limit
+    raw_rows = raw_rows[:limit]
+
+    next_cursor = None
+    if has_more and raw_rows:
+        last = raw_rows[-1]
+        next_cursor = encode_cursor(last[columns.index('created_at')], last[columns.index('id')])
+
+    return [_row_to_dict(columns, row) for row in raw_rows], next_cursor
+
+
+def iter_keyset(
+    select_sql: str,
+    where: Optional[List[str]] = None,
+    params: Optional[List[Any]] = None,
+    batch_size: int = 500,
+    table_alias: str = ''
+) -> Iterator[Dict[str, Any]]:
+    """fetch_keyset_page를 반복하여 조건에 맞는 모든 행을 배치 단위로 순회"""
+    cursor = None
+    while True:
+        rows, cursor = fetch_keyset_page(
+            select_sql, where=where, params=params, cursor=cursor,
+            limit=batch_size, table_alias=table_alias
+        )
+        yield from rows
+        if not cursor:
+            return
+
+
+def count_rows(table: str, where: Optional[List[str]] = None, params: Optional[List[Any]] = None,
+               mode: str = 'exact') -> Optional[int]:
+    """
+    행 개수 조회
+
+    Args:
+        mode:
+            - exact: COUNT(*)
+            - approximate: 필터가 없으면 통계 기반 추정치 (PostgreSQL reltuples / SQLite rowid 범위),
+              필터가 있으면 APPROXIMATE_COUNT_CAP에서 멈추는 제한 카운트
+            - none: 카운트 생략 (None 반환)
+    """
+    if mode == 'none':
+        return None
+
+    db_manager = get_database_manager()
+    conn = db_manager.engine.raw_connection()
+    try:
+        db_cursor = conn.cursor()
+        where_sql = f" WHERE {' AND '.join(where)}" if where else ''
+        bind = list(params or [])
+
+        if mode == 'approximate':
+            if not where:
+                if db_manager.is_postgresql:
+                    db_cursor.execute("SELECT reltuples::bigint FROM pg_class WHERE oid = to_regclass(%s)", (table,))
+                    row = db_cursor.fetchone()
+                    # 한 번도 ANALYZE되지 않은 테이블은 -1/0 → 정확한 카운트로 폴백
+                    if row and row[0] and row[0] > 0:
+                        return int(row[0])
+                else:
+                    db_cursor.execute(f"SELECT COALESCE(MAX(rowid) - MIN(rowid) + 1, 0) FROM {table}")
+                    return int(db_cursor.fetchone()[0])
+            else:
+                ph = "?" if db_manager.is_sqlite else "%s"
+                db_cursor.execute(
+                    f"SELECT COUNT(*) FROM (SELECT 1 FROM {table}{where_sql} LIMIT {ph}) capped",
+                    bind + [APPROXIMATE_COUNT_CAP]
+                )
+                return int(db_cursor.fetchone()[0])
+
+        db_cursor.execute(f"SELECT COUNT(*) FROM {table}{where_sql}", bind)
+        return int(db_cursor.fetchone()[0])
+    finally:
+        conn.close()
+
+
+def stream_rows(sql: str, params: Optional[List[Any]] = None, batch_size: int = 1000) -> Iterator[Dict[str, Any]]:
+    """
+    서버 사이드 커서로 행을 스트리밍 (메모리 사용량 일정)
+
+    PostgreSQL: 이름 있는 커서(DECLARE CURSOR)로 batch_size씩 서버에서 가져옴
+    SQLite: fetchmany로 batch_size씩 읽음
+    """
+    db_manager = get_database_manager()
+    conn = db_manager.engine.raw_connection()
+    try:
+        if db_manager.is_postgresql:
+            db_cursor = conn.cursor(name=f"export_{uuid.uuid4().hex[:12]}")
+            db_cursor.itersize = batch_size
+        else:
+            db_cursor = conn.cursor()
+        db_cursor.execute(sql, list(params or []))
+
+        columns = None
+        while True:
+            batch = db_cursor.fetchmany(batch_size)
+            if columns is None and db_cursor.description:
+                columns = [col[0] for col in db_cursor.description]
+            if not batch:
+                break
+            for row in batch:
+                yield _row_to_dict(columns, row)
+        db_cursor.close()
+    finally:
+        conn.close()
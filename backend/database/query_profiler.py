@@ -0,0 +1,344 @@
+"""
+느린 쿼리 로그 / 실행 계획 수집
+
+DatabaseManager 엔진의 before/after_cursor_execute 이벤트로 모든 쿼리를 측정합니다.
+
+- 정규화: 리터럴/바인드 파라미터/IN 목록을 ?로 치환해 같은 모양의 쿼리를 묶음
+- 통계: 정규화된 쿼리별 호출 수, 총/평균/최대/p95 시간
+- N+1 감지: 요청 1건 안에서 같은 SELECT가 N_PLUS_ONE_THRESHOLD회 이상 실행되면 기록
+- 실행 계획: SLOW_QUERY_MS를 넘은 쿼리는 별도 스레드/커넥션에서 EXPLAIN (PostgreSQL SELECT는 ANALYZE) 수집
+  (같은 쿼리는 EXPLAIN_INTERVAL 동안 한 번만)
+
+통계는 워커 프로세스별로 보관됩니다.
+"""
+
+import os
+import re
+import threading
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from contextvars import ContextVar
+from datetime import datetime
+from functools import lru_cache
+from typing import Dict, List, Optional
+
+from logger import get_logger
+
+logger = get_logger(__name__)
+
+# 느린 쿼리 기준 (ms)
+SLOW_QUERY_MS = float(os.getenv('SLOW_QUERY_MS', '500'))
+
+# 요청 1건 안에서 같은 SELECT가 이 횟수 이상이면 N+1 의심
+N_PLUS_ONE_THRESHOLD = int(os.getenv('N_PLUS_ONE_THRESHOLD', '10'))
+
+# 같은 쿼리의 실행 계획 재수집 간격 (초)
+EXPLAIN_INTERVAL = int(os.getenv('EXPLAIN_INTERVAL', '3600'))
+
+# PostgreSQL SELECT에 EXPLAIN ANALYZE 사용 (쿼리를 실제로 한 번 더 실행)
+EXPLAIN_ANALYZE = os.getenv('EXPLAIN_ANALYZE', 'true').lower() == 'true'
+
+# 보관할 정규화 쿼리 최대 수 (초과 시 총 시간이 가장 작은 항목 제거)
+MAX_STATEMENTS = 500
+
+# p95 계산용 최근 실행 시간 보관 수
+SAMPLE_SIZE = 200
+
+# 최근 느린 쿼리 보관 수
+RECENT_SLOW_SIZE = 50
+
+_STRING_LITERAL = re.compile(r"'(?:[^']|'')*'")
+_NUMBER = re.compile(r'(?<![\w.$])-?\d+(?:\.\d+)?\b')
+_PLACEHOLDER = re.compile(r'%\(\w+\)s|%s|\$\d+|(?<!:):\w+|\?')
+_IN_LIST = re.compile(r'\bIN\s*\((?:\s*\?\s*,)*\s*\?\s*\)', re.IGNORECASE)
+_VALUES_LIST = re.compile(r'\bVALUES\s*(\((?:\s*\?\s*,)*\s*\?\s*\))(?:\s*,\s*\1)+', re.IGNORECASE)
+_WHITESPACE = re.compile(r'\s+')
+
+
+@lru_cache(maxsize=4096)
+def normalize(statement: str) -> str:
+    """쿼리 정규화 (리터럴/파라미터 → ?, IN/VALUES 목록 축약)"""
+    sql = _STRING_LITERAL.sub('?', statement)
+    sql = _PLACEHOLDER.sub('?', sql)
+    sql = _NUMBER.sub('?', sql)
+    sql = _IN_LIST.sub('IN (?)', sql)
+    sql = _VALUES_LIST.sub(r'VALUES \1', sql)
+    return _WHITESPACE.sub(' ', sql).strip()
+
+
+def _percentile(samples, q: float) -> Optional[float]:
+    if not samples:
+        return None
+    ordered = sorted(samples)
+    return ordered[min(len(ordered) - 1, int(q * len(ordered)))]
+
+
+class _StatementStats:
+    __slots__ = ('calls', 'total', 'max', 'samples', 'slow_calls', 'last_seen', 'plan', 'plan_at')
+
+    def __init__(self):
+        self.calls = 0
+        self.total = 0.0
+        self.max = 0.0
+        self.samples = deque(maxlen=SAMPLE_SIZE)
+        self.slow_calls = 0
+        self.last_seen = None
+        self.plan: Optional[str] = None
+        self.plan_at: Optional[float] = None
+
+
+class QueryProfiler:
+    """쿼리 통계 수집기 (엔진당 1개)"""
+
+    def __init__(self, engine):
+        self.engine = engine
+        self.dialect = engine.dialect.name
+        self._stats: Dict[str, _StatementStats] = {}
+        self._n_plus_one: Dict[str, Dict] = {}
+        self._recent_slow = deque(maxlen=RECENT_SLOW_SIZE)
+        self._lock = threading.Lock()
+        self._explainer = ThreadPoolExecutor(max_workers=1, thread_name_prefix='explain')
+        self._explaining = set()
+        self.started_at = datetime.now()
+
+    # ---------- 이벤트 ----------
+
+    def before_cursor_execute(self, conn, cursor, statement, parameters, context, executemany):
+        conn.info.setdefault('_profiler_started', []).append(time.perf_counter())
+
+    def after_cursor_execute(self, conn, cursor, statement, parameters, context, executemany):
+        stack = conn.info.get('_profiler_started')
+        if not stack:
+            return
+        elapsed = time.perf_counter() - stack.pop()
+        key = normalize(statement)
+
+        with self._lock:
+            stats = self._stats.get(key)
+            if stats is None:
+                if len(self._stats) >= MAX_STATEMENTS:
+                    del self._stats[min(self._stats, key=lambda k: self._stats[k].total)]
+                stats = self._stats[key] = _StatementStats()
+            stats.calls += 1
+            stats.total += elapsed
+            stats.max = max(stats.max, elapsed)
+            stats.samples.append(elapsed)
+            stats.last_seen = time.time()
+            slow = elapsed * 1000 >= SLOW_QUERY_MS
+            if slow:
+                stats.slow_calls += 1
+                self._recent_slow.append({
+                    'statement': key,
+                    'duration_ms': round(elapsed * 1000, 2),
+                    'route': _current_route(),
+                    'at': datetime.now().isoformat(),
+                })
+            need_plan = (
+                slow and not executemany and key not in self._explaining
+                and (stats.plan_at is None or time.time() - stats.plan_at >= EXPLAIN_INTERVAL)
+            )
+            if need_plan:
+                self._explaining.add(key)
+
+        request_counts = _request_queries.get()
+        if request_counts is not None:
+            request_counts[key] = request_counts.get(key, 0) + 1
+
+        if slow:
+            logger.warning(f"느린 쿼리 {elapsed * 1000:.0f}ms: {key[:300]}")
+        if need_plan:
+            self._explainer.submit(self._capture_plan, key, statement, parameters)
+
+    def handle_error(self, exception_context):
+        conn = exception_context.connection
+        if conn is not None and conn.info.get('_profiler_started'):
+            conn.info['_profiler_started'].pop()
+
+    # ---------- 실행 계획 ----------
+
+    def _explain_prefix(self, statement: str) -> Optional[str]:
+        verb = statement.lstrip().split(None, 1)[0].upper() if statement.strip() else ''
+        if self.dialect == 'postgresql':
+            if verb in ('SELECT', 'WITH') and EXPLAIN_ANALYZE:
+                return 'EXPLAIN (ANALYZE, BUFFERS) '
+            if verb in ('SELECT', 'WITH', 'INSERT', 'UPDATE', 'DELETE'):
+                return 'EXPLAIN '
+            return None
+        if self.dialect == 'sqlite' and verb in ('SELECT', 'WITH', 'INSERT', 'UPDATE', 'DELETE'):
+            return 'EXPLAIN QUERY PLAN '
+        return None
+
+    def _capture_plan(self, key: str, statement: str, parameters):
+        try:
+            prefix = self._explain_prefix(statement)
+            if prefix is None:
+                return
+            with self.engine.connect() as conn:
+                # info는 풀링된 DBAPI 커넥션에 붙어 있으므로 반드시 되돌림
+                conn.info['_profiler_skip'] = True
+                try:
+                    if self.dialect == 'postgresql':
+                        # ANALYZE는 쿼리를 실제 실행하므로 시간 제한
+                        conn.exec_driver_sql("SET LOCAL statement_timeout = '10s'")
+                    rows = conn.exec_driver_sql(prefix + statement, parameters or ()).fetchall()
+                    conn.rollback()
+                finally:
+                    conn.info.pop('_profiler_skip', None)
+            if self.dialect == 'sqlite':
+                plan = '\n'.join(str(row[-1]) for row in rows)
+            else:
+                plan = '\n'.join(str(row[0]) for row in rows)
+            with self._lock:
+                stats = self._stats.get(key)
+                if stats is not None:
+                    stats.plan = plan
+                    stats.plan_at = time.time()
+        except Exception as e:
+            logger.warning(f"실행 계획 수집 실패: {e}")
+            with self._lock:
+                stats = self._stats.get(key)
+                if stats is not None:
+                    stats.plan_at = time.time()  # 실패해도 간격 동안 재시도하지 않음
+        finally:
+            with self._lock:
+                self._explaining.discard(key)
+
+    # ---------- N+1 ----------
+
+    def record_request(self, route: str, counts: Dict[str, int]):
+        """요청 종료 시 같은 SELECT 반복 실행 기록"""
+        for key, count in counts.items():
+            if count < N_PLUS_ONE_THRESHOLD or key.split(None, 1)[0].upper() not in ('SELECT', 'WITH'):
+                continue
+            with self._lock:
+                entry = self._n_plus_one.get(key)
+                if entry is None:
+                    if len(self._n_plus_one) >= MAX_STATEMENTS:
+                        continue
+                    entry = self._n_plus_one[key] = {'requests': 0, 'max_repeats': 0, 'routes': set()}
+                entry['requests'] += 1
+                entry['max_repeats'] = max(entry['max_repeats'], count)
+                entry['routes'].add(route)
+                entry['last_seen'] = datetime.now().isoformat()
+            logger.warning(f"N+1 의심: {route} 에서 같은 쿼리 {count}회 실행: {key[:200]}")
+
+    # ---------- 조회 ----------
+
+    def top(self, limit: int = 20, sort: str = 'total') -> List[Dict]:
+        """쿼리별 통계 상위 목록 (sort: total | avg | p95 | calls | max)"""
+        with self._lock:
+            rows = []
+            for key, stats in self._stats.items():
+                p95 = _percentile(stats.samples, 0.95)
+                rows.append({
+                    'statement': key,
+                    'calls': stats.calls,
+                    'total_ms': round(stats.total * 1000, 2),
+                    'avg_ms': round(stats.total / stats.calls * 1000, 2),
+                    'p95_ms': round(p95 * 1000, 2) if p95 is not None else None,
+                    'max_ms': round(stats.max * 1000, 2),
+                    'slow_calls': stats.slow_calls,
+                    'last_seen': datetime.fromtimestamp(stats.last_seen).isoformat() if stats.last_seen else None,
+                    'plan': stats.plan,
+                })
+        sort_key = {
+            'total': 'total_ms', 'avg': 'avg_ms', 'p95': 'p95_ms', 'calls': 'calls', 'max': 'max_ms'
+        }.get(sort, 'total_ms')
+        rows.sort(key=lambda r: r[sort_key] or 0, reverse=True)
+        return rows[:limit]
+
+    def n_plus_one(self) -> List[Dict]:
+        with self._lock:
+            rows = [
+                {'statement': key, **{k: v for k, v in entry.items() if k != 'routes'},
+                 'routes': sorted(entry['routes'])}
+                for key, entry in self._n_plus_one.items()
+            ]
+        rows.sort(key=lambda r: r['requests'], reverse=True)
+        return rows
+
+    def recent_slow(self) -> List[Dict]:
+        with self._lock:
+            return list(reversed(self._recent_slow))
+
+    def reset(self):
+        with self._lock:
+            self._stats.clear()
+            self._n_plus_one.clear()
+            self._recent_slow.clear()
+        self.started_at = datetime.now()
+
+
+# ========================================
+# 요청 단위 추적
+# ========================================
+
+# 현재 요청에서 실행된 정규화 쿼리별 횟수 (요청 밖에서는 None)
+_request_queries: ContextVar[Optional[Dict[str, int]]] = ContextVar('request_queries', default=None)
+_request_route: ContextVar[Optional[str]] = ContextVar('request_route', default=None)
+
+
+def _current_route() -> Optional[str]:
+    return _request_route.get()
+
+
+class QueryProfilerMiddleware:
+    """
+    요청 단위 쿼리 집계 (ASGI) - N+1 감지용
+
+    동기 엔드포인트는 스레드풀에서 실행되지만 컨텍스트가 복사되므로 같은 집계 dict를 공유합니다.
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope['type'] != 'http' or _profiler is None:
+            await self.app(scope, receive, send)
+            return
+
+        counts: Dict[str, int] = {}
+        queries_token = _request_queries.set(counts)
+        route_token = _request_route.set(scope.get('path'))
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            _request_queries.reset(queries_token)
+            _request_route.reset(route_token)
+            if counts:
+                route = getattr(scope.get('route'), 'path', None) or scope.get('path', '')
+                _profiler.record_request(f"{scope.get('method', '')} {route}", counts)
+
+
+# ========================================
+# 설치
+# ========================================
+
+_profiler: Optional[QueryProfiler] = None
+
+
+def install(engine) -> QueryProfiler:
+    """엔진에 쿼리 프로파일러 등록 (DatabaseManager 생성 시)"""
+    global _profiler
+    from sqlalchemy import event
+
+    profiler = QueryProfiler(engine)
+
+    def before(conn, cursor, statement, parameters, context, executemany):
+        if not conn.info.get('_profiler_skip'):
+            profiler.before_cursor_execute(conn, cursor, statement, parameters, context, executemany)
+
+    def after(conn, cursor, statement, parameters, context, executemany):
+        if not conn.info.get('_profiler_skip'):
+            profiler.after_cursor_execute(conn, cursor, statement, parameters, context, executemany)
+
+    event.listen(engine, 'before_cursor_execute', before)
+    event.listen(engine, 'after_cursor_execute', after)
+    event.listen(engine, 'handle_error', profiler.handle_error)
+    _profiler = profiler
+    return profiler
+
+
+def get_profiler() -> Optional[QueryProfiler]:
+    return _profiler
@@ -14,7 +14,7 @@ CREATE TABLE IF NOT EXISTS monitored_products (
     original_price REAL,
     current_status TEXT DEFAULT 'available',  -- 'available', 'out_of_stock', 'discontinued'
     last_checked_at DATETIME,
-    created_at DATETIME DEFAULT CURRENT_TIMESTAMP,
+    created_at DATETIME NOT NULL DEFAULT CURRENT_TIMESTAMP,
     updated_at DATETIME DEFAULT CURRENT_TIMESTAMP,
     check_interval INTEGER DEFAULT 15,  -- 체크 주기 (분)
     is_active BOOLEAN DEFAULT TRUE,  -- 모니터링 활성화 여부
@@ -31,6 +31,20 @@ CREATE TABLE IF NOT EXISTS price_history (
     FOREIGN KEY (product_id) REFERENCES monitored_products (id) ON DELETE CASCADE
 );
 
+-- 가격 이력 시간/일 단위 요약 (OHLC, 보존 기간이 지난 price_history 대체)
+CREATE TABLE IF NOT EXISTS price_history_rollups (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    product_id INTEGER NOT NULL,
+    resolution TEXT NOT NULL,  -- 'hour', 'day'
+    bucket_start DATETIME NOT NULL,
+    open_price REAL NOT NULL,
+    high_price REAL NOT NULL,
+    low_price REAL NOT NULL,
+    close_price REAL NOT NULL,
+    sample_count INTEGER NOT NULL DEFAULT 0,
+    FOREIGN KEY (product_id) REFERENCES monitored_products (id) ON DELETE CASCADE
+);
+
 -- 상태 변경 이력
 CREATE TABLE IF NOT EXISTS status_changes (
     id INTEGER PRIMARY KEY AUTOINCREMENT,
@@ -56,6 +70,9 @@ CREATE TABLE IF NOT EXISTS notifications (
 -- 인덱스 생성
 CREATE INDEX IF NOT EXISTS idx_monitored_products_active ON monitored_products(is_active, last_checked_at);
 CREATE INDEX IF NOT EXISTS idx_price_history_product ON price_history(product_id, checked_at DESC);
+CREATE INDEX IF NOT EXISTS idx_price_history_checked ON price_history(checked_at, product_id);
+CREATE UNIQUE INDEX IF NOT EXISTS uq_price_history_rollups ON price_history_rollups(product_id, resolution, bucket_start);
+CREATE INDEX IF NOT EXISTS idx_price_history_rollups_age ON price_history_rollups(resolution, bucket_start);
 CREATE INDEX IF NOT EXISTS idx_status_changes_product ON status_changes(product_id, changed_at DESC);
 CREATE INDEX IF NOT EXISTS idx_notifications_unread ON notifications(is_read, created_at DESC);
 CREATE INDEX IF NOT EXISTS idx_notifications_product_type ON notifications(product_id, notification_type, created_at DESC);  -- 복합 조회 최적화
@@ -87,7 +104,7 @@ CREATE TABLE IF NOT EXISTS orders (
     total_amount REAL NOT NULL,
     total_profit REAL,  -- 예상 순이익
     payment_method TEXT,
-    created_at DATETIME DEFAULT CURRENT_TIMESTAMP,
+    created_at DATETIME NOT NULL DEFAULT CURRENT_TIMESTAMP,
     updated_at DATETIME DEFAULT CURRENT_TIMESTAMP,
     completed_at DATETIME,  -- RPA 완료 시각
     notes TEXT
@@ -183,7 +200,7 @@ CREATE TABLE IF NOT EXISTS playauto_sync_logs (
     fail_count INTEGER DEFAULT 0,
     error_message TEXT,
     execution_time REAL,
-    created_at DATETIME DEFAULT CURRENT_TIMESTAMP
+    created_at DATETIME NOT NULL DEFAULT CURRENT_TIMESTAMP
 );
 
 -- 마켓 주문 원본 데이터
@@ -230,7 +247,7 @@ CREATE TABLE IF NOT EXISTS webhook_logs (
     status TEXT NOT NULL,  -- 'success', 'failed'
     message TEXT,
     error_details TEXT,
-    created_at DATETIME DEFAULT CURRENT_TIMESTAMP,
+    created_at DATETIME NOT NULL DEFAULT CURRENT_TIMESTAMP,
     FOREIGN KEY (webhook_id) REFERENCES webhook_settings (id) ON DELETE SET NULL
 );
 
@@ -264,7 +281,7 @@ CREATE TABLE IF NOT EXISTS my_selling_products (
     weight TEXT,  -- 상품 중량 (쿠팡 옵션용, 예: "500g", "1kg")
     keywords TEXT,  -- 검색 키워드 (JSON 배열로 저장, 최대 40개)
     is_active BOOLEAN DEFAULT FALSE,  -- 판매 중 여부 (기본값: 중단)
-    created_at DATETIME DEFAULT CURRENT_TIMESTAMP,
+    created_at DATETIME NOT NULL DEFAULT CURRENT_TIMESTAMP,
     updated_at DATETIME DEFAULT CURRENT_TIMESTAMP,
     notes TEXT,
     FOREIGN KEY (monitored_product_id) REFERENCES monitored_products (id) ON DELETE SET NULL
@@ -598,3 +615,112 @@ CREATE TABLE IF NOT EXISTS category_playauto_mapping (
 CREATE INDEX IF NOT EXISTS idx_category_playauto_mapping_our_category
 ON category_playauto_mapping(our_category);
 
+-- ==========================================
+-- 스토리지 카탈로그 (관리자 이미지 갤러리/통계)
+-- ==========================================
+
+CREATE TABLE IF NOT EXISTS storage_objects (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    path TEXT NOT NULL UNIQUE,
+    folder TEXT NOT NULL,
+    filename TEXT NOT NULL,
+    size INTEGER DEFAULT 0,
+    content_type TEXT,
+    width INTEGER,
+    height INTEGER,
+    content_hash TEXT,
+    etag TEXT,
+    has_thumbnail BOOLEAN DEFAULT FALSE,
+    modified_at TEXT,
+    synced_at DATETIME DEFAULT CURRENT_TIMESTAMP
+);
+
+CREATE INDEX IF NOT EXISTS idx_storage_objects_folder ON storage_objects(folder, filename);
+CREATE INDEX IF NOT EXISTS idx_storage_objects_hash ON storage_objects(content_hash);
+
+CREATE TABLE IF NOT EXISTS image_blobs (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    content_hash TEXT NOT NULL UNIQUE,
+    storage_path TEXT NOT NULL,
+    size INTEGER DEFAULT 0,
+    content_type TEXT,
+    ref_count INTEGER NOT NULL DEFAULT 0,
+    created_at DATETIME DEFAULT CURRENT_TIMESTAMP,
+    last_referenced_at DATETIME DEFAULT CURRENT_TIMESTAMP
+);
+
+CREATE INDEX IF NOT EXISTS idx_image_blobs_unreferenced ON image_blobs(ref_count, last_referenced_at);
+
+CREATE TABLE IF NOT EXISTS image_sources (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    url_hash TEXT NOT NULL UNIQUE,
+    source_url TEXT NOT NULL,
+    content_hash TEXT NOT NULL,
+    created_at DATETIME DEFAULT CURRENT_TIMESTAMP
+);
+
+-- ==========================================
+-- 알림 상태 (모니터링 알림 중복 방지/요약)
+-- ==========================================
+
+CREATE TABLE IF NOT EXISTS alert_states (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    product_id INTEGER NOT NULL,
+    alert_type TEXT NOT NULL,
+    state TEXT NOT NULL DEFAULT 'ok',
+    fail_count INTEGER NOT NULL DEFAULT 0,
+    detail TEXT,
+    first_seen_at DATETIME,
+    last_seen_at DATETIME,
+    resolved_at DATETIME,
+    notified_state TEXT,
+    last_notified_at DATETIME,
+    suppressed_count INTEGER NOT NULL DEFAULT 0,
+    CONSTRAINT uq_alert_state UNIQUE (product_id, alert_type)
+);
+
+CREATE INDEX IF NOT EXISTS idx_alert_states_active ON alert_states(state, last_notified_at);
+
+-- ==========================================
+-- 페이지 가져오기 전략 통계 (도메인·전략별 성공률/지연 시간)
+-- ==========================================
+
+CREATE TABLE IF NOT EXISTS fetch_strategy_stats (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    domain TEXT NOT NULL,
+    strategy TEXT NOT NULL,
+    attempts INTEGER NOT NULL DEFAULT 0,
+    successes INTEGER NOT NULL DEFAULT 0,
+    success_rate REAL NOT NULL DEFAULT 1.0,
+    latency REAL,
+    last_success_at DATETIME,
+    updated_at DATETIME DEFAULT CURRENT_TIMESTAMP,
+    CONSTRAINT uq_fetch_strategy_stat UNIQUE (domain, strategy)
+);
+
+CREATE INDEX IF NOT EXISTS idx_fetch_strategy_stats_updated_at ON fetch_strategy_stats(updated_at);
+
+-- ==========================================
+-- 플레이오토 상품 등록 작업 (백그라운드 일괄 등록)
+-- ==========================================
+
+CREATE TABLE IF NOT EXISTS playauto_registration_jobs (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    status TEXT NOT NULL DEFAULT 'pending',
+    total_count INTEGER NOT NULL DEFAULT 0,
+    processed_count INTEGER NOT NULL DEFAULT 0,
+    success_count INTEGER NOT NULL DEFAULT 0,
+    failed_count INTEGER NOT NULL DEFAULT 0,
+    progress_percent REAL DEFAULT 0,
+    product_ids TEXT,
+    site_list TEXT,
+    results TEXT,
+    error_message TEXT,
+    retry_of INTEGER,
+    started_at DATETIME,
+    completed_at DATETIME,
+    heartbeat_at DATETIME,
+    created_at DATETIME DEFAULT CURRENT_TIMESTAMP
+);
+
+CREATE INDEX IF NOT EXISTS idx_playauto_registration_jobs_created_at ON playauto_registration_jobs(created_at);
@@ -15,7 +15,7 @@ CREATE TABLE IF NOT EXISTS monitored_products (
     original_price NUMERIC(10,2),
     current_status TEXT DEFAULT 'available',
     last_checked_at TIMESTAMP,
-    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    created_at TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP,
     updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
     check_interval INTEGER DEFAULT 15,
     is_active BOOLEAN DEFAULT TRUE,
@@ -32,6 +32,20 @@ CREATE TABLE IF NOT EXISTS price_history (
     FOREIGN KEY (product_id) REFERENCES monitored_products (id) ON DELETE CASCADE
 );
 
+-- 가격 이력 시간/일 단위 요약 (OHLC, 보존 기간이 지난 price_history 대체)
+CREATE TABLE IF NOT EXISTS price_history_rollups (
+    id BIGSERIAL PRIMARY KEY,
+    product_id BIGINT NOT NULL,
+    resolution TEXT NOT NULL,  -- 'hour', 'day'
+    bucket_start TIMESTAMP NOT NULL,
+    open_price NUMERIC(10,2) NOT NULL,
+    high_price NUMERIC(10,2) NOT NULL,
+    low_price NUMERIC(10,2) NOT NULL,
+    close_price NUMERIC(10,2) NOT NULL,
+    sample_count INTEGER NOT NULL DEFAULT 0,
+    FOREIGN KEY (product_id) REFERENCES monitored_products (id) ON DELETE CASCADE
+);
+
 -- 상태 변경 이력
 CREATE TABLE IF NOT EXISTS status_changes (
     id BIGSERIAL PRIMARY KEY,
@@ -58,6 +72,9 @@ CREATE TABLE IF NOT EXISTS notifications (
 CREATE INDEX IF NOT EXISTS idx_monitored_products_active ON monitored_products(is_active, last_checked_at);
 CREATE INDEX IF NOT EXISTS idx_monitored_products_source ON monitored_products(source);
 CREATE INDEX IF NOT EXISTS idx_price_history_product ON price_history(product_id, checked_at DESC);
+CREATE INDEX IF NOT EXISTS idx_price_history_checked ON price_history(checked_at, product_id);
+CREATE UNIQUE INDEX IF NOT EXISTS uq_price_history_rollups ON price_history_rollups(product_id, resolution, bucket_start) INCLUDE (open_price, high_price, low_price, close_price, sample_count);
+CREATE INDEX IF NOT EXISTS idx_price_history_rollups_age ON price_history_rollups(resolution, bucket_start);
 CREATE INDEX IF NOT EXISTS idx_status_changes_product ON status_changes(product_id, changed_at DESC);
 CREATE INDEX IF NOT EXISTS idx_notifications_unread ON notifications(is_read, created_at DESC);
 CREATE INDEX IF NOT EXISTS idx_notifications_product_type ON notifications(product_id, notification_type, created_at DESC);
@@ -77,10 +94,13 @@ CREATE TABLE IF NOT EXISTS orders (
     total_amount NUMERIC(10,2) NOT NULL,
     total_profit NUMERIC(10,2),
     payment_method TEXT,
-    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    created_at TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP,
     updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
     completed_at TIMESTAMP,
-    notes TEXT
+    notes TEXT,
+    playauto_order_id TEXT,  -- 플레이오토 묶음번호
+    synced_to_playauto BOOLEAN DEFAULT FALSE,
+    tracking_uploaded_at TIMESTAMP  -- 플레이오토 송장 업로드 완료 시각
 );
 
 -- ==========================================
@@ -172,7 +192,7 @@ CREATE TABLE IF NOT EXISTS playauto_sync_logs (
     fail_count INTEGER DEFAULT 0,
     error_message TEXT,
     execution_time NUMERIC(10,2),
-    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+    created_at TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP
 );
 
 -- 마켓 주문 원본 데이터
@@ -219,7 +239,7 @@ CREATE TABLE IF NOT EXISTS webhook_logs (
     status TEXT NOT NULL,
     message TEXT,
     error_details TEXT,
-    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    created_at TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP,
     FOREIGN KEY (webhook_id) REFERENCES webhook_settings (id) ON DELETE SET NULL
 );
 
@@ -253,7 +273,7 @@ CREATE TABLE IF NOT EXISTS my_selling_products (
     weight TEXT,  -- 상품 중량 (쿠팡 옵션용, 예: "500g", "1kg")
     keywords TEXT,  -- 검색 키워드 (JSON 배열로 저장, 최대 40개)
     is_active BOOLEAN DEFAULT FALSE,  -- 기본값: 중단 (상세페이지 생성기에서 추가된 상품은 중단 상태로 시작)
-    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    created_at TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP,
     updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
     notes TEXT,
     FOREIGN KEY (monitored_product_id) REFERENCES monitored_products (id) ON DELETE SET NULL
@@ -452,6 +472,116 @@ CREATE INDEX IF NOT EXISTS idx_tracking_upload_jobs_created_at ON tracking_uploa
 CREATE INDEX IF NOT EXISTS idx_tracking_upload_details_job_id ON tracking_upload_details(job_id);
 CREATE INDEX IF NOT EXISTS idx_tracking_upload_details_status ON tracking_upload_details(status);
 
+-- ==========================================
+-- 스토리지 카탈로그 (관리자 이미지 갤러리/통계)
+-- ==========================================
+
+CREATE TABLE IF NOT EXISTS storage_objects (
+    id BIGSERIAL PRIMARY KEY,
+    path TEXT NOT NULL UNIQUE,
+    folder TEXT NOT NULL,
+    filename TEXT NOT NULL,
+    size BIGINT DEFAULT 0,
+    content_type TEXT,
+    width INTEGER,
+    height INTEGER,
+    content_hash TEXT,
+    etag TEXT,
+    has_thumbnail BOOLEAN DEFAULT FALSE,
+    modified_at TEXT,
+    synced_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+);
+
+CREATE INDEX IF NOT EXISTS idx_storage_objects_folder ON storage_objects(folder, filename);
+CREATE INDEX IF NOT EXISTS idx_storage_objects_hash ON storage_objects(content_hash);
+
+CREATE TABLE IF NOT EXISTS image_blobs (
+    id BIGSERIAL PRIMARY KEY,
+    content_hash TEXT NOT NULL UNIQUE,
+    storage_path TEXT NOT NULL,
+    size BIGINT DEFAULT 0,
+    content_type TEXT,
+    ref_count INTEGER NOT NULL DEFAULT 0,
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    last_referenced_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+);
+
+CREATE INDEX IF NOT EXISTS idx_image_blobs_unreferenced ON image_blobs(ref_count, last_referenced_at);
+
+CREATE TABLE IF NOT EXISTS image_sources (
+    id BIGSERIAL PRIMARY KEY,
+    url_hash TEXT NOT NULL UNIQUE,
+    source_url TEXT NOT NULL,
+    content_hash TEXT NOT NULL,
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+);
+
+-- ==========================================
+-- 알림 상태 (모니터링 알림 중복 방지/요약)
+-- ==========================================
+
+CREATE TABLE IF NOT EXISTS alert_states (
+    id BIGSERIAL PRIMARY KEY,
+    product_id BIGINT NOT NULL,
+    alert_type TEXT NOT NULL,
+    state TEXT NOT NULL DEFAULT 'ok',
+    fail_count INTEGER NOT NULL DEFAULT 0,
+    detail TEXT,
+    first_seen_at TIMESTAMP,
+    last_seen_at TIMESTAMP,
+    resolved_at TIMESTAMP,
+    notified_state TEXT,
+    last_notified_at TIMESTAMP,
+    suppressed_count INTEGER NOT NULL DEFAULT 0,
+    CONSTRAINT uq_alert_state UNIQUE (product_id, alert_type)
+);
+
+CREATE INDEX IF NOT EXISTS idx_alert_states_active ON alert_states(state, last_notified_at);
+
+-- ==========================================
+-- 페이지 가져오기 전략 통계 (도메인·전략별 성공률/지연 시간)
+-- ==========================================
+
+CREATE TABLE IF NOT EXISTS fetch_strategy_stats (
+    id BIGSERIAL PRIMARY KEY,
+    domain TEXT NOT NULL,
+    strategy TEXT NOT NULL,
+    attempts INTEGER NOT NULL DEFAULT 0,
+    successes INTEGER NOT NULL DEFAULT 0,
+    success_rate DOUBLE PRECISION NOT NULL DEFAULT 1.0,
+    latency DOUBLE PRECISION,
+    last_success_at TIMESTAMP,
+    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    CONSTRAINT uq_fetch_strategy_stat UNIQUE (domain, strategy)
+);
+
+CREATE INDEX IF NOT EXISTS idx_fetch_strategy_stats_updated_at ON fetch_strategy_stats(updated_at);
+
+-- ==========================================
+-- 플레이오토 상품 등록 작업 (백그라운드 일괄 등록)
+-- ==========================================
+
+CREATE TABLE IF NOT EXISTS playauto_registration_jobs (
+    id BIGSERIAL PRIMARY KEY,
+    status TEXT NOT NULL DEFAULT 'pending',
+    total_count INTEGER NOT NULL DEFAULT 0,
+    processed_count INTEGER NOT NULL DEFAULT 0,
+    success_count INTEGER NOT NULL DEFAULT 0,
+    failed_count INTEGER NOT NULL DEFAULT 0,
+    progress_percent NUMERIC(5, 2) DEFAULT 0,
+    product_ids TEXT,
+    site_list TEXT,
+    results TEXT,
+    error_message TEXT,
+    retry_of BIGINT,
+    started_at TIMESTAMP,
+    completed_at TIMESTAMP,
+    heartbeat_at TIMESTAMP,
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+);
+
+CREATE INDEX IF NOT EXISTS idx_playauto_registration_jobs_created_at ON playauto_registration_jobs(created_at);
+
 -- ==========================================
 -- updated_at 자동 업데이트 트리거 (PostgreSQL)
 -- ==========================================
@@ -0,0 +1,122 @@
+"""
+행 직렬화 유틸리티
+
+ORM 객체를 dict로 바꿀 때 셀마다 getattr/isinstance를 반복하지 않도록
+모델(또는 SELECT 컬럼 목록)별로 한 번만 변환 규칙을 만들어 재사용합니다.
+
+- DateTime/Date/Time 컬럼 → ISO 문자열
+- Numeric 컬럼 (Decimal) → float
+- 그 외 → 그대로
+"""
+
+from datetime import date, datetime, time
+from functools import lru_cache
+from operator import attrgetter, itemgetter
+from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence, Tuple
+
+from sqlalchemy import Date, DateTime, Float, Numeric, Time
+
+
+def _to_iso(value: Any) -> Any:
+    # SQLite에서 문자열로 저장된 값은 그대로 둠
+    return value.isoformat() if isinstance(value, (datetime, date, time)) else value
+
+
+def _to_float(value: Any) -> Any:
+    return float(value)
+
+
+def _converter_for(sa_type: Any) -> Optional[Callable[[Any], Any]]:
+    """컬럼 타입별 변환 함수 (변환이 필요 없으면 None)"""
+    if isinstance(sa_type, (DateTime, Date, Time)):
+        return _to_iso
+    if isinstance(sa_type, Numeric) and not isinstance(sa_type, Float):
+        return _to_float
+    return None
+
+
+class RowSerializer:
+    """
+    컬럼 목록으로 미리 만들어 둔 행 → dict 변환기
+
+    변환이 필요한 컬럼 위치만 기억해 두므로 행마다 타입 검사를 하지 않습니다.
+    """
+
+    __slots__ = ('keys', 'converters')
+
+    def __init__(self, fields: Iterable[Tuple[str, Any]]):
+        fields = list(fields)
+        self.keys: Tuple[str, ...] = tuple(name for name, _ in fields)
+        self.converters: Tuple[Tuple[int, Callable], ...] = tuple(
+            (i, conv) for i, (_, sa_type) in enumerate(fields)
+            if (conv := _converter_for(sa_type)) is not None
+        )
+
+    def __call__(self, values: Sequence[Any]) -> Dict[str, Any]:
+        if self.converters:
+            values = list(values)
+            for i, conv in self.converters:
+                value = values[i]
+                if value is not None:
+                    values[i] = conv(value)
+        return dict(zip(self.keys, values))
+
+
+class ModelSerializer(RowSerializer):
+    """
+    ORM 모델 인스턴스용 변환기
+
+    로드된 컬럼 값은 인스턴스 __dict__에서 한 번에 꺼내고 (descriptor 호출 생략),
+    만료/지연 로딩된 컬럼이 있으면 getattr 경로로 폴백합니다.
+    """
+
+    __slots__ = ('_from_dict', '_from_attrs')
+
+    def __init__(self, model_cls: Any):
+        columns = list(model_cls.__table__.columns)
+        super().__init__((c.name, c.type) for c in columns)
+        from_dict = itemgetter(*self.keys)
+        from_attrs = attrgetter(*self.keys)
+        if len(self.keys) == 1:
+            # 컬럼이 하나면 getter가 튜플이 아닌 값을 반환
+            self._from_dict = lambda d: (from_dict(d),)
+            self._from_attrs = lambda obj: (from_attrs(obj),)
+        else:
+            self._from_dict = from_dict
+            self._from_attrs = from_attrs
+
+    def __call__(self, obj: Any) -> Dict[str, Any]:
+        try:
+            values = self._from_dict(obj.__dict__)
+        except KeyError:
+            values = self._from_attrs(obj)
+        return RowSerializer.__call__(self, values)
+
+
+@lru_cache(maxsize=None)
+def get_model_serializer(model_cls: Any) -> ModelSerializer:
+    """모델 클래스별 변환기 (최초 1회 생성 후 캐시)"""
+    return ModelSerializer(model_cls)
+
+
+def model_to_dict(obj: Any) -> Dict[str, Any]:
+    """SQLAlchemy 모델을 딕셔너리로 변환"""
+    if obj is None:
+        return {}
+    return get_model_serializer(type(obj))(obj)
+
+
+def fetch_dicts(session: Any, stmt: Any) -> List[Dict[str, Any]]:
+    """
+    Core SELECT를 실행하여 dict 목록으로 반환
+
+    ORM 객체를 만들지 않고 선택한 컬럼만 바로 직렬화합니다.
+
+    Usage:
+        rows = fetch_dicts(session, select(Order.id, Order.created_at).limit(100))
+    """
+    result = session.execute(stmt)
+    serializer = RowSerializer(
+        (key, col.type) for key, col in zip(result.keys(), stmt.selected_columns)
+    )
+    return [serializer(row) for row in result]
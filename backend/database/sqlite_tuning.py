@@ -0,0 +1,202 @@
+"""
+SQLite 성능 프로파일
+
+로컬/단일 노드 배포에서 스케줄러 쓰기와 API 읽기가 동시에 일어날 때
+"database is locked" 대기를 줄이기 위한 설정 모음입니다.
+
+- WAL 저널: 읽기가 쓰기를 막지 않음
+- synchronous=NORMAL: WAL 모드에서 안전한 수준으로 fsync 감소
+- cache_size / mmap_size: 페이지 캐시 확대 및 메모리 맵 I/O
+- busy_timeout: 잠금 충돌 시 즉시 실패하지 않고 대기
+- BEGIN IMMEDIATE: 쓰기 트랜잭션은 시작할 때 쓰기 잠금을 잡아 (busy_timeout으로 대기)
+  읽기 → 쓰기 승격 중 교착으로 즉시 SQLITE_BUSY가 나는 일을 막음
+- 스레드별 커넥션(SQLAlchemy) / 읽기 커넥션 풀(레거시 Database) + sqlite3 statement 캐시
+
+환경 변수:
+    SQLITE_JOURNAL_MODE     (기본 WAL)
+    SQLITE_SYNCHRONOUS      (기본 NORMAL)
+    SQLITE_CACHE_SIZE_MB    (기본 64)
+    SQLITE_MMAP_SIZE_MB     (기본 256, 0이면 비활성화)
+    SQLITE_BUSY_TIMEOUT_MS  (기본 5000)
+    SQLITE_POOL_SIZE        (기본 5, 레거시 Database 커넥션 풀 크기)
+    SQLITE_THREAD_CONNECTIONS (기본 128, SQLAlchemy 엔진이 유지하는 스레드별 커넥션 수)
+    SQLITE_STATEMENT_CACHE  (기본 256, 커넥션당 prepared statement 캐시 수)
+"""
+
+import os
+import queue
+import sqlite3
+from contextlib import contextmanager
+from typing import Iterator, Optional
+
+
+class SQLiteProfile:
+    """SQLite PRAGMA 및 풀 설정"""
+
+    def __init__(
+        self,
+        journal_mode: str = 'WAL',
+        synchronous: str = 'NORMAL',
+        cache_size_mb: int = 64,
+        mmap_size_mb: int = 256,
+        busy_timeout_ms: int = 5000,
+        pool_size: int = 5,
+        statement_cache: int = 256,
+        thread_connections: int = 128
+    ):
+        self.journal_mode = journal_mode
+        self.synchronous = synchronous
+        self.cache_size_mb = cache_size_mb
+        self.mmap_size_mb = mmap_size_mb
+        self.busy_timeout_ms = busy_timeout_ms
+        self.pool_size = pool_size
+        self.statement_cache = statement_cache
+        self.thread_connections = thread_connections
+
+    @classmethod
+    def from_env(cls) -> 'SQLiteProfile':
+        return cls(
+            journal_mode=os.getenv('SQLITE_JOURNAL_MODE', 'WAL').upper(),
+            synchronous=os.getenv('SQLITE_SYNCHRONOUS', 'NORMAL').upper(),
+            cache_size_mb=int(os.getenv('SQLITE_CACHE_SIZE_MB', '64')),
+            mmap_size_mb=int(os.getenv('SQLITE_MMAP_SIZE_MB', '256')),
+            busy_timeout_ms=int(os.getenv('SQLITE_BUSY_TIMEOUT_MS', '5000')),
+            pool_size=int(os.getenv('SQLITE_POOL_SIZE', '5')),
+            statement_cache=int(os.getenv('SQLITE_STATEMENT_CACHE', '256')),
+            thread_connections=int(os.getenv('SQLITE_THREAD_CONNECTIONS', '128'))
+        )
+
+    @property
+    def busy_timeout_seconds(self) -> float:
+        return self.busy_timeout_ms / 1000
+
+    def pragmas(self):
+        """커넥션마다 실행할 PRAGMA 목록"""
+        return [
+            f"PRAGMA journal_mode={self.journal_mode}",
+            f"PRAGMA synchronous={self.synchronous}",
+            # 음수 값은 KiB 단위
+            f"PRAGMA cache_size=-{self.cache_size_mb * 1024}",
+            f"PRAGMA mmap_size={self.mmap_size_mb * 1024 * 1024}",
+            f"PRAGMA busy_timeout={self.busy_timeout_ms}",
+            "PRAGMA temp_store=MEMORY",
+        ]
+
+    def to_dict(self):
+        return dict(self.__dict__)
+
+
+_profile: Optional[SQLiteProfile] = None
+
+
+def get_sqlite_profile() -> SQLiteProfile:
+    """환경 변수 기반 프로파일 (싱글톤)"""
+    global _profile
+    if _profile is None:
+        _profile = SQLiteProfile.from_env()
+    return _profile
+
+
+def apply_pragmas(conn, profile: Optional[SQLiteProfile] = None):
+    """DBAPI 커넥션에 성능 PRAGMA 적용"""
+    profile = profile or get_sqlite_profile()
+    cursor = conn.cursor()
+    try:
+        for pragma in profile.pragmas():
+            cursor.execute(pragma)
+    finally:
+        cursor.close()
+
+
+# 암묵적 트랜잭션을 BEGIN IMMEDIATE로 시작 (INSERT/UPDATE/DELETE/REPLACE 직전)
+WRITE_ISOLATION_LEVEL = 'IMMEDIATE'
+
+
+def connect(db_path: str, profile: Optional[SQLiteProfile] = None, check_same_thread: bool = False) -> sqlite3.Connection:
+    """튜닝된 sqlite3 커넥션 생성"""
+    profile = profile or get_sqlite_profile()
+    conn = sqlite3.connect(
+        db_path,
+        timeout=profile.busy_timeout_seconds,
+        cached_statements=profile.statement_cache,
+        check_same_thread=check_same_thread,
+        isolation_level=WRITE_ISOLATION_LEVEL
+    )
+    apply_pragmas(conn, profile)
+    return conn
+
+
+def connect_args(profile: Optional[SQLiteProfile] = None) -> dict:
+    """SQLAlchemy create_engine(connect_args=...)용 인자"""
+    profile = profile or get_sqlite_profile()
+    return {
+        'check_same_thread': False,
+        'timeout': profile.busy_timeout_seconds,
+        'cached_statements': profile.statement_cache,
+        'isolation_level': WRITE_ISOLATION_LEVEL,
+    }
+
+
+# ========================================
+# 레거시 Database용 커넥션 풀
+# ========================================
+
+class SQLiteConnectionPool:
+    """
+    sqlite3 커넥션 풀
+
+    with pool.connection() as conn: 형태로 사용하며,
+    블록이 정상 종료되면 commit, 예외 시 rollback 후 커넥션을 풀로 돌려놓습니다.
+    (sqlite3 커넥션의 with 문과 동일한 트랜잭션 동작)
+    """
+
+    def __init__(self, db_path: str, profile: Optional[SQLiteProfile] = None, row_factory=sqlite3.Row):
+        self.db_path = db_path
+        self.profile = profile or get_sqlite_profile()
+        self.row_factory = row_factory
+        self._idle: queue.LifoQueue = queue.LifoQueue(maxsize=max(self.profile.pool_size, 1))
+
+    def _create(self) -> sqlite3.Connection:
+        conn = connect(self.db_path, self.profile)
+        conn.row_factory = self.row_factory
+        return conn
+
+    def _acquire(self) -> sqlite3.Connection:
+        try:
+            return self._idle.get_nowait()
+        except queue.Empty:
+            # 풀이 비어 있으면 새로 생성 (반환 시 풀이 가득 차 있으면 닫음)
+            return self._create()
+
+    def _release(self, conn: sqlite3.Connection):
+        try:
+            self._idle.put_nowait(conn)
+        except queue.Full:
+            conn.close()
+
+    @contextmanager
+    def connection(self) -> Iterator[sqlite3.Connection]:
+        conn = self._acquire()
+        try:
+            yield conn
+            conn.commit()
+        except BaseException:
+            try:
+                conn.rollback()
+            except sqlite3.Error:
+                pass
+            raise
+        finally:
+            self._release(conn)
+
+    def close_all(self):
+        """풀의 모든 커넥션 종료"""
+        while True:
+            try:
+                conn = self._idle.get_nowait()
+            except queue.Empty:
+                break
+            try:
+                conn.close()
+            except sqlite3.Error:
+                pass
@@ -3,9 +3,17 @@
 기존 이미지에 대한 썸네일 일괄 생성 스크립트
 
 Supabase Storage의 모든 이미지에 대해 썸네일을 생성합니다.
+처리 결과는 매니페스트(thumbnail_manifest.json)에 기록되어 재실행 시 완료된 이미지는 건너뜁니다.
+
+Usage:
+    python generate_thumbnails.py --auto
+    python generate_thumbnails.py --auto --sizes 200:jpeg,400:webp,400:avif --concurrency 16
+    python generate_thumbnails.py --auto --folders cat-1 cat-2 --force
 """
-import os
+import argparse
+import asyncio
 import sys
+import time
 from pathlib import Path
 from dotenv import load_dotenv
 
@@ -20,133 +28,103 @@ else:
 # 프로젝트 경로 추가
 sys.path.insert(0, str(Path(__file__).parent))
 
-from utils.supabase_storage import supabase, BUCKET_NAME, create_thumbnail, upload_image_from_bytes, get_public_url
 
-def generate_all_thumbnails():
+def generate_all_thumbnails(
+    sizes: str = "200:jpeg",
+    concurrency: int = 8,
+    workers: int = None,
+    folders: list = None,
+    force: bool = False,
+    manifest_path: str = None
+):
     """모든 이미지에 대해 썸네일 생성"""
+    # 프로세스 풀 워커(spawn)가 이 모듈을 다시 import할 때 Supabase 클라이언트를 만들지 않도록 지연 import
+    from utils.supabase_storage import supabase, BUCKET_NAME
+    from utils.thumbnails import ThumbnailManifest, ThumbnailPipeline, parse_variants
+
     if not supabase:
         print("[ERROR] Supabase client not initialized")
         print("Check SUPABASE_URL and SUPABASE_SERVICE_ROLE_KEY environment variables")
         return
 
+    variants = parse_variants(sizes)
+    if not variants:
+        print("[ERROR] No thumbnail variants to generate")
+        return
+
     print(f"[INFO] Starting thumbnail generation for bucket: {BUCKET_NAME}")
     print()
 
-    # 모든 폴더 조회
+    manifest = ThumbnailManifest(Path(manifest_path)).load() if manifest_path else None
+    pipeline = ThumbnailPipeline(
+        variants,
+        io_concurrency=concurrency,
+        cpu_workers=workers,
+        manifest=manifest,
+        force=force,
+        folders=folders
+    )
+
+    started = time.time()
     try:
-        folders = supabase.storage.from_(BUCKET_NAME).list()
-        print(f"[INFO] Found {len(folders)} folders")
-    except Exception as e:
-        print(f"[ERROR] Failed to list folders: {e}")
+        stats = asyncio.run(pipeline.run())
+    except KeyboardInterrupt:
+        # 매니페스트는 파이프라인 종료 시 저장되므로 다시 실행하면 이어서 처리
+        print("\n[CANCELLED] Interrupted - progress saved to manifest")
         return
 
-    total_processed = 0
-    total_created = 0
-    total_skipped = 0
-    total_failed = 0
-
-    for folder_obj in folders:
-        folder_name = folder_obj.get('name')
-
-        # 폴더만 처리
-        if folder_obj.get('id') is not None:
-            continue
-
-        # thumbs 폴더는 건너뛰기
-        if folder_name == 'thumbs' or folder_name.startswith('.'):
-            continue
-
-        print(f"\n[INFO] Processing folder: {folder_name}")
-
-        # thumbs 폴더 존재 여부 확인
-        thumbs_folder = f"{folder_name}/thumbs"
-
-        # 폴더 내 모든 이미지 조회
-        try:
-            files = supabase.storage.from_(BUCKET_NAME).list(folder_name)
-            image_files = [f for f in files if f.get('id') is not None and not f.get('name', '').startswith('thumbs')]
-
-            print(f"  Found {len(image_files)} images")
-
-            for file_obj in image_files:
-                filename = file_obj.get('name')
-                total_processed += 1
-
-                # 원본 이미지 경로
-                original_path = f"{folder_name}/{filename}"
-                thumb_path = f"{folder_name}/thumbs/{filename}"
-
-                # 썸네일이 이미 존재하는지 확인
-                try:
-                    existing_thumbs = supabase.storage.from_(BUCKET_NAME).list(f"{folder_name}/thumbs")
-                    if any(t.get('name') == filename for t in existing_thumbs):
-                        print(f"  [SKIP] {filename} (thumbnail exists)")
-                        total_skipped += 1
-                        continue
-                except:
-                    pass  # thumbs 폴더가 없을 수 있음
-
-                # 원본 이미지 다운로드
-                try:
-                    response = supabase.storage.from_(BUCKET_NAME).download(original_path)
-                    if not response:
-                        print(f"  [FAIL] Failed to download {filename}")
-                        total_failed += 1
-                        continue
-
-                    # 썸네일 생성
-                    thumb_data = create_thumbnail(response)
-                    if not thumb_data:
-                        print(f"  [FAIL] Failed to create thumbnail for {filename}")
-                        total_failed += 1
-                        continue
-
-                    # 썸네일 업로드
-                    thumb_url = upload_image_from_bytes(thumb_data, thumb_path, "image/jpeg")
-                    if thumb_url:
-                        print(f"  [OK] Created thumbnail: {filename}")
-                        total_created += 1
-                    else:
-                        print(f"  [FAIL] Failed to upload thumbnail for {filename}")
-                        total_failed += 1
-
-                except Exception as e:
-                    print(f"  [ERROR] Error processing {filename}: {e}")
-                    total_failed += 1
-
-        except Exception as e:
-            print(f"  [ERROR] Failed to process folder {folder_name}: {e}")
-
     # 최종 통계
     print("\n" + "="*60)
     print("THUMBNAIL GENERATION SUMMARY")
     print("="*60)
-    print(f"Total images processed: {total_processed}")
-    print(f"Thumbnails created:     {total_created}")
-    print(f"Thumbnails skipped:     {total_skipped} (already exist)")
-    print(f"Failed:                 {total_failed}")
+    print(f"Total images processed: {stats['processed']}")
+    print(f"Thumbnails created:     {stats['created']}")
+    print(f"Thumbnails skipped:     {stats['skipped']} (already exist)")
+    print(f"Failed:                 {stats['failed']}")
+    print(f"Elapsed:                {time.time() - started:.1f}s")
     print("="*60)
 
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Supabase Storage 썸네일 일괄 생성")
+    parser.add_argument("--auto", "-y", action="store_true", help="확인 없이 바로 실행")
+    parser.add_argument("--sizes", default="200:jpeg",
+                        help="생성할 변형 목록 (크기:포맷, 쉼표 구분. 포맷: jpeg/webp/avif)")
+    parser.add_argument("--concurrency", type=int, default=8, help="동시 다운로드/업로드 수")
+    parser.add_argument("--workers", type=int, default=None, help="리사이즈 프로세스 수 (기본 CPU 수)")
+    parser.add_argument("--folders", nargs="*", default=None, help="처리할 폴더 (기본 전체)")
+    parser.add_argument("--force", action="store_true", help="기존 썸네일/매니페스트를 무시하고 다시 생성")
+    parser.add_argument("--manifest", default=None, help="매니페스트 파일 경로")
+    return parser.parse_args()
+
+
 if __name__ == "__main__":
-    import sys
+    args = parse_args()
 
     print("="*60)
     print("BATCH THUMBNAIL GENERATOR")
     print("="*60)
     print()
 
-    # --auto 플래그가 있으면 자동 실행
-    auto_confirm = "--auto" in sys.argv or "-y" in sys.argv
+    options = dict(
+        sizes=args.sizes,
+        concurrency=args.concurrency,
+        workers=args.workers,
+        folders=args.folders,
+        force=args.force,
+        manifest_path=args.manifest
+    )
 
-    if auto_confirm:
+    # --auto 플래그가 있으면 자동 실행
+    if args.auto:
         print("[AUTO] Auto-confirmation enabled. Starting thumbnail generation...")
-        generate_all_thumbnails()
+        generate_all_thumbnails(**options)
         print("\n[DONE] Thumbnail generation completed!")
     else:
         confirmation = input("This will generate thumbnails for ALL images in Supabase Storage.\nContinue? (yes/no): ")
 
         if confirmation.lower() in ['yes', 'y']:
-            generate_all_thumbnails()
+            generate_all_thumbnails(**options)
             print("\n[DONE] Thumbnail generation completed!")
         else:
             print("[CANCELLED] Operation cancelled by user")
@@ -74,3 +74,11 @@ def post_fork(server, worker):
 def worker_exit(server, worker):
     """Called just after a worker has been exited."""
     print(f"[Gunicorn] Worker exited (pid: {worker.pid})")
+
+def child_exit(server, worker):
+    """Called in the master after a worker has exited: keep its metrics in the archive."""
+    try:
+        from utils.metrics import mark_process_dead
+        mark_process_dead(worker.pid)
+    except Exception as e:
+        print(f"[Gunicorn] Failed to archive metrics (pid: {worker.pid}): {e}")
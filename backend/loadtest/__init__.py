@@ -0,0 +1,7 @@
+"""
+부하 테스트 도구 모듈
+
+- generate_data: 프로덕션 규모 합성 데이터 생성기 (SQLite/PostgreSQL)
+- stub_server: PlayAuto / FlareSolverr 스텁 서버
+- harness: API 라우트 및 스케줄러 작업 지연시간/처리량 측정
+"""
@@ -0,0 +1,412 @@
+#!/usr/bin/env python3
+"""
+합성 데이터 생성기
+
+프로덕션 규모(주문 10만건, 판매 상품 1만개, 가격 이력 수백만건)의 데이터를
+SQLite 또는 PostgreSQL에 채워 넣습니다. ORM 객체를 거치지 않고
+SQLAlchemy Core bulk insert(executemany)로 배치 단위 삽입합니다.
+
+사용법:
+    cd backend
+    python -m loadtest.generate_data --database-url sqlite:///loadtest.db
+    python -m loadtest.generate_data --orders 100000 --selling-products 10000 \\
+        --monitored-products 5000 --price-history 2000000
+"""
+
+import argparse
+import json
+import random
+import sys
+import time
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Dict, Iterator, List
+
+# backend 디렉토리를 import 경로에 추가
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from sqlalchemy import text
+
+from database.database_manager import DatabaseManager
+from database.models import (
+    MonitoredProduct, PriceHistory, MySellingProduct, ProductMarketplaceCode,
+    Order, OrderItem, Notification, WebhookLog, PlayautoSyncLog
+)
+
+
+# 소싱처 (URL 패턴은 ProductMonitor 소스 판별 로직과 일치)
+SOURCES = {
+    'gmarket': 'https://item.gmarket.co.kr/Item?goodscode={n}',
+    'auction': 'https://itempage3.auction.co.kr/DetailView.aspx?itemno={n}',
+    '11st': 'https://www.11st.co.kr/products/{n}',
+    'ssg': 'https://www.ssg.com/item/itemView.ssg?itemId={n}',
+    'homeplus': 'https://mfront.homeplus.co.kr/item?itemNo={n}&storeType=DS',
+    'traders': 'https://direct.homeplus.co.kr/item?itemNo={n}&storeType=TD',
+    'lotteon': 'https://www.lotteon.com/p/product/LO{n}',
+    'cjthemarket': 'https://www.cjthemarket.com/pc/prod/prodDetail?prdCd={n}',
+    'domeggook': 'https://domeggook.com/{n}',
+    'smartstore': 'https://smartstore.naver.com/store/products/{n}',
+}
+
+# 판매처 마켓
+MARKETS = ['gmarket', 'auction', 'coupang', 'smartstore', '11st']
+
+# PlayAuto 쇼핑몰 코드 (옥션/지마켓/스마트스토어/쿠팡)
+SHOP_CODES = [('A001', '옥션'), ('A006', '지마켓'), ('A077', '스마트스토어'), ('B378', '쿠팡')]
+
+ORDER_STATUSES = ['pending', 'pending', 'processing', 'shipped', 'shipped', 'completed', 'completed', 'cancelled']
+RPA_STATUSES = ['pending', 'processing', 'completed', 'completed', 'failed']
+
+NAME_PREFIXES = ['CJ', '오뚜기', '농심', '풀무원', '동원', '대상', '해태', '롯데', '빙그레', '삼양']
+NAME_ITEMS = ['햇반 백미밥 210g', '진라면 매운맛 5입', '비비고 왕교자 1kg', '탱탱쫄면 4입', '참치 150g 10캔',
+              '종가집 포기김치 3kg', '허니버터칩 120g', '초코파이 12입', '바나나맛우유 240ml 8입', '불닭볶음면 5입']
+CATEGORIES = ['간편식 > 밥류 > 즉석밥 > 흰밥', '간편식 > 면 > 라면 > 라면', '냉동식 > 만두 > 고기만두 > 고기만두',
+              '간편식 > 통조림 > 참치 > 일반참치', '스낵류 > 과자 > 스낵 > 감자칩', '음료 > 우유 > 가공유 > 바나나우유']
+CUSTOMER_NAMES = ['홍길동', '김철수', '이영희', '박민수', '최지우', '정하늘', '강바다', '윤서준']
+ADDRESSES = ['서울시 강남구 테헤란로 123', '서울시 서초구 서초대로 200', '경기도 성남시 분당구 정자동 100',
+             '부산시 해운대구 우동 55', '인천시 연수구 송도동 24']
+
+DEFAULT_BATCH_SIZE = 5000
+
+
+def _product_name(rng: random.Random, n: int) -> str:
+    return f"{rng.choice(NAME_PREFIXES)} {rng.choice(NAME_ITEMS)} #{n}"
+
+
+def _batched(rows: Iterator[Dict], batch_size: int) -> Iterator[List[Dict]]:
+    batch = []
+    for row in rows:
+        batch.append(row)
+        if len(batch) >= batch_size:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
+
+class SyntheticDataGenerator:
+    """프로덕션 규모 합성 데이터 생성기"""
+
+    def __init__(self, db_manager: DatabaseManager, seed: int = 42, batch_size: int = DEFAULT_BATCH_SIZE):
+        self.db_manager = db_manager
+        self.engine = db_manager.engine
+        self.rng = random.Random(seed)
+        self.batch_size = batch_size
+        self.now = datetime.now()
+
+    def _insert(self, table, rows: Iterator[Dict], total: int, label: str) -> int:
+        """Core executemany로 배치 삽입"""
+        inserted = 0
+        started = time.perf_counter()
+        # SQLite에서는 BigInteger PK가 자동 증가하지 않으므로 id를 직접 부여
+        next_id = self._max_id(table.name) + 1
+        for batch in _batched(rows, self.batch_size):
+            for row in batch:
+                if 'id' not in row:
+                    row['id'] = next_id
+                next_id = max(next_id, row['id']) + 1
+            with self.engine.begin() as conn:
+                conn.execute(table.insert(), batch)
+            inserted += len(batch)
+            print(f"\r[GEN] {label}: {inserted:,}/{total:,}", end='', flush=True)
+        elapsed = time.perf_counter() - started
+        rate = inserted / elapsed if elapsed > 0 else 0
+        print(f"\r[OK] {label}: {inserted:,}건 ({elapsed:.1f}초, {rate:,.0f} rows/s)")
+        return inserted
+
+    def _max_id(self, table_name: str) -> int:
+        with self.engine.connect() as conn:
+            return conn.execute(text(f"SELECT COALESCE(MAX(id), 0) FROM {table_name}")).scalar() or 0
+
+    def _random_past(self, max_days: int) -> datetime:
+        return self.now - timedelta(seconds=self.rng.randint(0, max_days * 86400))
+
+    # ========================================
+    # 테이블별 생성
+    # ========================================
+
+    def generate_monitored_products(self, count: int) -> List[int]:
+        start_id = self._max_id(MonitoredProduct.__tablename__) + 1
+        source_names = list(SOURCES)
+
+        def rows():
+            for i in range(count):
+                n = start_id + i
+                source = self.rng.choice(source_names)
+                price = self.rng.randrange(3000, 80000, 10)
+                created = self._random_past(365)
+                yield {
+                    'id': n,
+                    'product_url': SOURCES[source].format(n=1000000000 + n),
+                    'product_name': _product_name(self.rng, n),
+                    'source': source,
+                    'current_price': price,
+                    'original_price': int(price * 1.2),
+                    'current_status': self.rng.choices(['available', 'out_of_stock', 'discontinued'], [90, 8, 2])[0],
+                    'last_checked_at': self._random_past(1),
+                    'created_at': created,
+                    'updated_at': created,
+                    'check_interval': 15,
+                    'is_active': self.rng.random() < 0.9,
+                }
+
+        self._insert(MonitoredProduct.__table__, rows(), count, 'monitored_products')
+        return list(range(start_id, start_id + count))
+
+    def generate_price_history(self, product_ids: List[int], count: int):
+        if not product_ids:
+            print("[SKIP] price_history: 모니터링 상품 없음")
+            return
+
+        def rows():
+            for _ in range(count):
+                price = self.rng.randrange(3000, 80000, 10)
+                yield {
+                    'product_id': self.rng.choice(product_ids),
+                    'price': price,
+                    'original_price': None,
+                    'checked_at': self._random_past(180),
+                }
+
+        self._insert(PriceHistory.__table__, rows(), count, 'price_history')
+
+    def generate_notifications(self, product_ids: List[int], count: int):
+        if not product_ids:
+            return
+
+        def rows():
+            for _ in range(count):
+                notification_type = self.rng.choice(['price_change', 'status_change', 'margin_alert'])
+                yield {
+                    'product_id': self.rng.choice(product_ids),
+                    'notification_type': notification_type,
+                    'message': f"[합성] {notification_type}",
+                    'is_read': self.rng.random() < 0.7,
+                    'created_at': self._random_past(90),
+                }
+
+        self._insert(Notification.__table__, rows(), count, 'notifications')
+
+    def generate_selling_products(self, count: int, monitored_ids: List[int]) -> List[int]:
+        start_id = self._max_id(MySellingProduct.__tablename__) + 1
+        source_names = list(SOURCES)
+
+        def rows():
+            for i in range(count):
+                n = start_id + i
+                source = self.rng.choice(source_names)
+                sourcing_price = self.rng.randrange(3000, 80000, 10)
+                registered = self.rng.random() < 0.8
+                created = self._random_past(365)
+                yield {
+                    'id': n,
+                    'product_name': _product_name(self.rng, n),
+                    'selling_price': int(sourcing_price * self.rng.uniform(1.1, 1.6)) // 10 * 10,
+                    'monitored_product_id': self.rng.choice(monitored_ids) if monitored_ids and self.rng.random() < 0.3 else None,
+                    'sourcing_url': SOURCES[source].format(n=2000000000 + n),
+                    'sourcing_product_name': _product_name(self.rng, n),
+                    'sourcing_price': sourcing_price,
+                    'sourcing_source': source,
+                    'detail_page_data': json.dumps({'template': 'daily', 'images': [f"/supabase-images/{n % 138 + 1}/{n}.jpg"]}),
+                    'category': self.rng.choice(CATEGORIES),
+                    'thumbnail_url': f"/supabase-images/{n % 138 + 1}/thumbs/{n}.jpg",
+                    'playauto_product_no': f"PA{n:08d}" if registered else None,
+                    'ol_shop_no': str(900000000 + n) if registered else None,
+                    'ol_shop_no_gmk': str(900000000 + n) if registered else None,
+                    'c_sale_cd_gmk': f"GMK{n:08d}" if registered else None,
+                    'c_sale_cd_smart': f"SMT{n:08d}" if registered else None,
+                    'c_sale_cd_coupang': f"CPG{n:08d}" if registered else None,
+                    'ship_price_type': '선결제',
+                    'ship_price': 3000,
+                    'input_type': 'auto',
+                    'is_active': self.rng.random() < 0.85,
+                    'created_at': created,
+                    'updated_at': created,
+                }
+
+        self._insert(MySellingProduct.__table__, rows(), count, 'my_selling_products')
+        return list(range(start_id, start_id + count))
+
+    def generate_marketplace_codes(self, selling_ids: List[int]):
+        def rows():
+            for product_id in selling_ids:
+                if self.rng.random() >= 0.8:
+                    continue
+                for shop_cd, shop_name in SHOP_CODES:
+                    transmitted = self._random_past(180)
+                    yield {
+                        'product_id': product_id,
+                        'shop_cd': shop_cd,
+                        'shop_name': shop_name,
+                        'shop_sale_no': f"{shop_cd}-{product_id:08d}",
+                        'transmitted_at': transmitted,
+                        'last_checked_at': self._random_past(3),
+                        'created_at': transmitted,
+                        'updated_at': transmitted,
+                    }
+
+        estimated = int(len(selling_ids) * 0.8) * len(SHOP_CODES)
+        self._insert(ProductMarketplaceCode.__table__, rows(), estimated, 'product_marketplace_codes')
+
+    def generate_orders(self, count: int, selling_ids: List[int]):
+        start_id = self._max_id(Order.__tablename__) + 1
+        order_items: List[Dict] = []
+        source_names = list(SOURCES)
+
+        def order_rows():
+            for i in range(count):
+                n = start_id + i
+                created = self._random_past(365)
+                status = self.rng.choice(ORDER_STATUSES)
+                item_count = self.rng.choices([1, 2, 3], [80, 15, 5])[0]
+                total_amount = 0
+                total_profit = 0
+                for _ in range(item_count):
+                    quantity = self.rng.choices([1, 2, 3], [85, 10, 5])[0]
+                    sourcing_price = self.rng.randrange(3000, 80000, 10)
+                    selling_price = int(sourcing_price * self.rng.uniform(1.1, 1.5)) // 10 * 10
+                    profit = (selling_price - sourcing_price) * quantity
+                    total_amount += selling_price * quantity
+                    total_profit += profit
+                    source = self.rng.choice(source_names)
+                    order_items.append({
+                        'order_id': n,
+                        'product_name': _product_name(self.rng, self.rng.choice(selling_ids) if selling_ids else n),
+                        'product_url': SOURCES[source].format(n=3000000000 + n),
+                        'source': source,
+                        'quantity': quantity,
+                        'sourcing_price': sourcing_price,
+                        'selling_price': selling_price,
+                        'profit': profit,
+                        'rpa_status': self.rng.choice(RPA_STATUSES),
+                        'tracking_number': f"{self.rng.randint(10**11, 10**12 - 1)}" if status in ('shipped', 'completed') else None,
+                        'created_at': created,
+                        'updated_at': created,
+                    })
+                yield {
+                    'id': n,
+                    'order_number': f"LOADTEST-{n:09d}",
+                    'market': self.rng.choice(MARKETS),
+                    'customer_name': self.rng.choice(CUSTOMER_NAMES),
+                    'customer_phone': f"010-{self.rng.randint(1000, 9999)}-{self.rng.randint(1000, 9999)}",
+                    'customer_address': self.rng.choice(ADDRESSES),
+                    'customer_zipcode': f"{self.rng.randint(10000, 99999)}",
+                    'order_status': status,
+                    'total_amount': total_amount,
+                    'total_profit': total_profit,
+                    'payment_method': 'card',
+                    'created_at': created,
+                    'updated_at': created,
+                    'completed_at': created + timedelta(days=3) if status == 'completed' else None,
+                }
+
+        def item_rows():
+            # 주문 배치를 삽입한 직후 해당 주문의 아이템을 흘려보냄 (메모리 상한 유지)
+            for batch in _batched(order_rows(), self.batch_size):
+                with self.engine.begin() as conn:
+                    conn.execute(Order.__table__.insert(), batch)
+                print(f"\r[GEN] orders: {batch[-1]['id'] - start_id + 1:,}/{count:,}", end='', flush=True)
+                pending = order_items[:]
+                order_items.clear()
+                yield from pending
+
+        self._insert(OrderItem.__table__, item_rows(), int(count * 1.25), 'orders + order_items')
+
+    def generate_logs(self, count: int):
+        def webhook_rows():
+            for _ in range(count):
+                yield {
+                    'webhook_id': None,
+                    'notification_type': self.rng.choice(['price_change', 'margin_alert', 'product_unavailable']),
+                    'status': self.rng.choices(['success', 'failed'], [95, 5])[0],
+                    'message': '[합성] 웹훅 로그',
+                    'created_at': self._random_past(90),
+                }
+
+        def sync_rows():
+            for _ in range(count):
+                yield {
+                    'sync_type': self.rng.choice(['order_fetch', 'tracking_upload', 'marketplace_sync']),
+                    'status': self.rng.choices(['success', 'failed'], [90, 10])[0],
+                    'items_count': self.rng.randint(0, 200),
+                    'success_count': self.rng.randint(0, 200),
+                    'fail_count': self.rng.randint(0, 5),
+                    'execution_time': round(self.rng.uniform(0.2, 30.0), 2),
+                    'created_at': self._random_past(90),
+                }
+
+        self._insert(WebhookLog.__table__, webhook_rows(), count, 'webhook_logs')
+        self._insert(PlayautoSyncLog.__table__, sync_rows(), count, 'playauto_sync_logs')
+
+    def run(
+        self,
+        monitored_products: int,
+        selling_products: int,
+        orders: int,
+        price_history: int,
+        notifications: int,
+        logs: int
+    ):
+        started = time.perf_counter()
+
+        monitored_ids = self.generate_monitored_products(monitored_products)
+        self.generate_price_history(monitored_ids, price_history)
+        self.generate_notifications(monitored_ids, notifications)
+        selling_ids = self.generate_selling_products(selling_products, monitored_ids)
+        self.generate_marketplace_codes(selling_ids)
+        self.generate_orders(orders, selling_ids)
+        self.generate_logs(logs)
+
+        if self.db_manager.is_sqlite:
+            with self.engine.connect() as conn:
+                conn.execute(text("ANALYZE"))
+        elif self.db_manager.is_postgresql:
+            # id를 직접 부여했으므로 시퀀스를 MAX(id)로 맞춰야 이후 앱의 INSERT가 충돌하지 않음
+            tables = [MonitoredProduct, PriceHistory, Notification, MySellingProduct,
+                      ProductMarketplaceCode, Order, OrderItem, WebhookLog, PlayautoSyncLog]
+            with self.engine.begin() as conn:
+                for model in tables:
+                    table = model.__tablename__
+                    conn.execute(text(
+                        f"SELECT setval(pg_get_serial_sequence('{table}', 'id'), "
+                        f"(SELECT COALESCE(MAX(id), 1) FROM {table}))"
+                    ))
+            with self.engine.connect().execution_options(isolation_level="AUTOCOMMIT") as conn:
+                conn.execute(text("ANALYZE"))
+
+        print(f"\n[OK] 합성 데이터 생성 완료 ({time.perf_counter() - started:.1f}초)")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="프로덕션 규모 합성 데이터 생성기")
+    parser.add_argument('--database-url', default=None,
+                        help="대상 DB URL (기본: DATABASE_URL 환경변수 또는 backend/monitoring.db)")
+    parser.add_argument('--orders', type=int, default=100_000)
+    parser.add_argument('--selling-products', type=int, default=10_000)
+    parser.add_argument('--monitored-products', type=int, default=5_000)
+    parser.add_argument('--price-history', type=int, default=2_000_000)
+    parser.add_argument('--notifications', type=int, default=200_000)
+    parser.add_argument('--logs', type=int, default=50_000, help="webhook_logs / playauto_sync_logs 각각의 건수")
+    parser.add_argument('--batch-size', type=int, default=DEFAULT_BATCH_SIZE)
+    parser.add_argument('--seed', type=int, default=42)
+    parser.add_argument('--reset', action='store_true', help="생성 전 모든 테이블 삭제 후 재생성")
+    args = parser.parse_args()
+
+    db_manager = DatabaseManager(args.database_url)
+    if args.reset:
+        db_manager.drop_all_tables()
+    db_manager.create_all_tables()
+
+    generator = SyntheticDataGenerator(db_manager, seed=args.seed, batch_size=args.batch_size)
+    generator.run(
+        monitored_products=args.monitored_products,
+        selling_products=args.selling_products,
+        orders=args.orders,
+        price_history=args.price_history,
+        notifications=args.notifications,
+        logs=args.logs
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,277 @@
+#!/usr/bin/env python3
+"""
+부하 테스트 하네스
+
+주요 API 라우트에 가중치 기반 요청을 동시에 보내고,
+라우트별 지연시간(p50/p95/p99)과 처리량(RPS)을 리포트로 출력합니다.
+스케줄러 작업은 프로세스 내에서 직접 실행하여 소요 시간을 측정합니다.
+
+사용 순서:
+    1. python -m loadtest.generate_data --database-url sqlite:///loadtest.db
+    2. python -m loadtest.stub_server --port 8299
+    3. PLAYAUTO_API_URL=http://127.0.0.1:8299/api FLARESOLVERR_URL=http://127.0.0.1:8299/v1 \\
+       USE_POSTGRESQL=true DATABASE_URL=sqlite:///loadtest.db uvicorn main:app --port 8000
+       (USE_POSTGRESQL=true: SQLAlchemy DatabaseWrapper 경로 사용, DATABASE_URL이 SQLite여도 동작)
+    4. python -m loadtest.harness --base-url http://127.0.0.1:8000 --concurrency 20 --duration 60
+    5. (선택) 스케줄러 작업 측정 - 3번과 동일한 환경변수로:
+       python -m loadtest.harness --jobs
+"""
+
+import argparse
+import asyncio
+import json
+import random
+import sys
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Union
+
+import httpx
+
+# backend 디렉토리를 import 경로에 추가
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+
+ParamValue = Union[Any, Callable[[], Any]]
+
+
+@dataclass
+class Scenario:
+    """부하 테스트 대상 라우트"""
+    name: str
+    path: str
+    weight: int = 1
+    method: str = "GET"
+    params: Dict[str, ParamValue] = field(default_factory=dict)
+
+    def build_params(self, bust_cache: bool) -> Dict[str, Any]:
+        params = {k: (v() if callable(v) else v) for k, v in self.params.items()}
+        if bust_cache:
+            # @async_cached 키가 인자 기반이므로 limit 값을 흔들어 캐시 적중을 피함
+            if 'limit' in params:
+                params['limit'] = int(params['limit']) + random.randint(0, 9)
+        return params
+
+
+# 주요 라우트 (가중치는 프론트엔드 대시보드 호출 빈도 기준)
+DEFAULT_SCENARIOS: List[Scenario] = [
+    Scenario("dashboard.all", "/api/dashboard/all", weight=5),
+    Scenario("orders.with_items", "/api/orders/with-items", weight=6,
+             params={"limit": 50, "page": lambda: random.choice([1, 1, 1, 2, 5, 20, 200, 1000])}),
+    Scenario("orders.list", "/api/orders/list", weight=2, params={"limit": 100}),
+    Scenario("orders.rpa_stats", "/api/orders/rpa/stats", weight=1),
+    Scenario("products.list", "/api/products/list", weight=5, params={"limit": 1000}),
+    Scenario("products.stats", "/api/products/stats", weight=2),
+    Scenario("products.search", "/api/products/search", weight=2,
+             params={"query": lambda: random.choice(["햇반", "라면", "만두", "참치", "김치"])}),
+    Scenario("monitor.products", "/api/monitor/products", weight=3),
+    Scenario("monitor.dashboard_stats", "/api/monitor/dashboard/stats", weight=2),
+    Scenario("accounting.dashboard", "/api/accounting/dashboard/stats", weight=2),
+    Scenario("notifications.logs", "/api/notifications/logs", weight=1, params={"limit": 200}),
+    Scenario("playauto.sync_logs", "/api/playauto/sync-logs", weight=1, params={"limit": 200}),
+    Scenario("playauto.stats_by_market", "/api/playauto/stats/by-market", weight=1),
+    Scenario("categories.list", "/api/categories/", weight=1),
+    Scenario("health", "/health", weight=1),
+]
+
+
+class LatencyRecorder:
+    """라우트별 지연시간/상태코드 수집"""
+
+    def __init__(self):
+        self.samples: Dict[str, List[float]] = {}
+        self.errors: Dict[str, int] = {}
+        self.status_codes: Dict[str, Dict[int, int]] = {}
+
+    def record(self, name: str, elapsed_ms: float, status_code: Optional[int]):
+        self.samples.setdefault(name, []).append(elapsed_ms)
+        codes = self.status_codes.setdefault(name, {})
+        key = status_code if status_code is not None else 0
+        codes[key] = codes.get(key, 0) + 1
+        if status_code is None or status_code >= 400:
+            self.errors[name] = self.errors.get(name, 0) + 1
+
+    @staticmethod
+    def _percentile(sorted_values: List[float], pct: float) -> float:
+        if not sorted_values:
+            return 0.0
+        k = (len(sorted_values) - 1) * pct / 100
+        lo = int(k)
+        hi = min(lo + 1, len(sorted_values) - 1)
+        return sorted_values[lo] + (sorted_values[hi] - sorted_values[lo]) * (k - lo)
+
+    def summary(self, wall_seconds: float) -> Dict[str, Any]:
+        routes = {}
+        total = 0
+        for name, values in sorted(self.samples.items()):
+            ordered = sorted(values)
+            total += len(ordered)
+            routes[name] = {
+                "count": len(ordered),
+                "errors": self.errors.get(name, 0),
+                "rps": round(len(ordered) / wall_seconds, 2) if wall_seconds else 0,
+                "mean_ms": round(sum(ordered) / len(ordered), 2),
+                "p50_ms": round(self._percentile(ordered, 50), 2),
+                "p95_ms": round(self._percentile(ordered, 95), 2),
+                "p99_ms": round(self._percentile(ordered, 99), 2),
+                "max_ms": round(ordered[-1], 2),
+                "status_codes": self.status_codes.get(name, {}),
+            }
+        return {
+            "duration_seconds": round(wall_seconds, 2),
+            "total_requests": total,
+            "total_errors": sum(self.errors.values()),
+            "throughput_rps": round(total / wall_seconds, 2) if wall_seconds else 0,
+            "routes": routes,
+        }
+
+
+async def run_load(
+    base_url: str,
+    scenarios: List[Scenario],
+    concurrency: int,
+    duration: float,
+    max_requests: Optional[int],
+    bust_cache: bool,
+    timeout: float
+) -> Dict[str, Any]:
+    """closed-loop 방식 부하 생성 (워커 N개가 응답을 받는 즉시 다음 요청)"""
+    recorder = LatencyRecorder()
+    weights = [s.weight for s in scenarios]
+    deadline = time.perf_counter() + duration
+    issued = 0
+
+    limits = httpx.Limits(max_connections=concurrency, max_keepalive_connections=concurrency)
+    async with httpx.AsyncClient(base_url=base_url, timeout=timeout, limits=limits) as client:
+
+        async def worker():
+            nonlocal issued
+            while time.perf_counter() < deadline:
+                if max_requests is not None and issued >= max_requests:
+                    return
+                issued += 1
+                scenario = random.choices(scenarios, weights)[0]
+                params = scenario.build_params(bust_cache)
+                started = time.perf_counter()
+                status_code = None
+                try:
+                    response = await client.request(scenario.method, scenario.path, params=params)
+                    await response.aread()
+                    status_code = response.status_code
+                except httpx.HTTPError:
+                    pass
+                recorder.record(scenario.name, (time.perf_counter() - started) * 1000, status_code)
+
+        started = time.perf_counter()
+        await asyncio.gather(*(worker() for _ in range(concurrency)))
+        wall = time.perf_counter() - started
+
+    return recorder.summary(wall)
+
+
+# ========================================
+# 스케줄러 작업 측정
+# ========================================
+
+def _scheduler_jobs() -> Dict[str, Callable]:
+    """측정 대상 스케줄러 작업 (프로세스 내 직접 실행)"""
+    from monitor.scheduler import update_selling_products_sourcing_price
+    from playauto.scheduler import auto_fetch_orders_job, sync_marketplace_codes_job
+
+    return {
+        "monitor.selling_products_sourcing": update_selling_products_sourcing_price,
+        "playauto.auto_fetch_orders": auto_fetch_orders_job,
+        "playauto.sync_marketplace_codes": sync_marketplace_codes_job,
+    }
+
+
+async def run_jobs(repeat: int, only: Optional[List[str]] = None) -> Dict[str, Any]:
+    recorder = LatencyRecorder()
+    jobs = _scheduler_jobs()
+    if only:
+        jobs = {name: job for name, job in jobs.items() if name in only}
+
+    started = time.perf_counter()
+    for name, job in jobs.items():
+        for i in range(repeat):
+            print(f"[JOB] {name} ({i + 1}/{repeat}) 실행 중...")
+            job_started = time.perf_counter()
+            ok = True
+            try:
+                await job()
+            except Exception as e:
+                ok = False
+                print(f"[ERROR] {name} 실패: {e}")
+            recorder.record(name, (time.perf_counter() - job_started) * 1000, 200 if ok else None)
+    return recorder.summary(time.perf_counter() - started)
+
+
+# ========================================
+# 리포트
+# ========================================
+
+def format_report(title: str, summary: Dict[str, Any]) -> str:
+    lines = [
+        f"## {title}",
+        "",
+        f"- 소요 시간: {summary['duration_seconds']}s",
+        f"- 총 요청: {summary['total_requests']:,} (오류 {summary['total_errors']:,})",
+        f"- 처리량: {summary['throughput_rps']} req/s",
+        "",
+        "| route | count | err | rps | mean ms | p50 ms | p95 ms | p99 ms | max ms |",
+        "|---|---:|---:|---:|---:|---:|---:|---:|---:|",
+    ]
+    for name, r in summary["routes"].items():
+        lines.append(
+            f"| {name} | {r['count']} | {r['errors']} | {r['rps']} | {r['mean_ms']} | "
+            f"{r['p50_ms']} | {r['p95_ms']} | {r['p99_ms']} | {r['max_ms']} |"
+        )
+    return "\n".join(lines)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="API 부하 테스트 하네스")
+    parser.add_argument('--base-url', default='http://127.0.0.1:8000')
+    parser.add_argument('--concurrency', type=int, default=10)
+    parser.add_argument('--duration', type=float, default=30.0, help="측정 시간 (초)")
+    parser.add_argument('--max-requests', type=int, default=None)
+    parser.add_argument('--timeout', type=float, default=60.0)
+    parser.add_argument('--routes', nargs='*', help="측정할 시나리오 이름 (기본: 전체)")
+    parser.add_argument('--bust-cache', action='store_true', help="응답 캐시를 우회하도록 limit 값을 흔듦")
+    parser.add_argument('--jobs', action='store_true', help="HTTP 대신 스케줄러 작업 소요 시간 측정")
+    parser.add_argument('--job-repeat', type=int, default=3)
+    parser.add_argument('--seed', type=int, default=None)
+    parser.add_argument('--output', default=None, help="JSON 리포트 저장 경로")
+    args = parser.parse_args()
+
+    if args.seed is not None:
+        random.seed(args.seed)
+
+    if args.jobs:
+        summary = asyncio.run(run_jobs(args.job_repeat, args.routes))
+        title = "Scheduler jobs"
+    else:
+        scenarios = DEFAULT_SCENARIOS
+        if args.routes:
+            scenarios = [s for s in scenarios if s.name in args.routes]
+            if not scenarios:
+                parser.error(f"일치하는 시나리오가 없습니다: {args.routes}")
+        print(f"[LOAD] {args.base_url} | 동시성 {args.concurrency} | {args.duration}초 | 시나리오 {len(scenarios)}개")
+        summary = asyncio.run(run_load(
+            args.base_url, scenarios, args.concurrency, args.duration,
+            args.max_requests, args.bust_cache, args.timeout
+        ))
+        title = f"HTTP load ({args.base_url}, concurrency={args.concurrency})"
+
+    print()
+    print(format_report(title, summary))
+
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump(summary, f, ensure_ascii=False, indent=2)
+        print(f"\n[OK] 리포트 저장: {args.output}")
+
+
+if __name__ == "__main__":
+    main()
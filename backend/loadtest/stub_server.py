@@ -0,0 +1,220 @@
+#!/usr/bin/env python3
+"""
+PlayAuto / FlareSolverr 스텁 서버
+
+부하 테스트 중 외부 API를 호출하지 않도록 두 서비스를 흉내냅니다.
+지연시간(고정 + 지터)과 오류율을 설정할 수 있어 외부 장애 상황도 재현 가능합니다.
+
+백엔드 연결:
+    PLAYAUTO_API_URL=http://localhost:8299/api
+    FLARESOLVERR_URL=http://localhost:8299/v1
+
+사용법:
+    cd backend
+    python -m loadtest.stub_server --port 8299 --latency-ms 150 --jitter-ms 100 --error-rate 0.02
+"""
+
+import argparse
+import asyncio
+import random
+import time
+from datetime import datetime, timedelta
+from typing import Any, Dict, Optional
+
+from fastapi import FastAPI, Request
+from fastapi.responses import JSONResponse
+
+
+class StubConfig:
+    """스텁 동작 설정 (실행 중 /stub/config로 변경 가능)"""
+
+    def __init__(self, latency_ms: int = 100, jitter_ms: int = 50, error_rate: float = 0.0,
+                 flaresolverr_latency_ms: int = 1500, orders_per_page: int = 100):
+        self.latency_ms = latency_ms
+        self.jitter_ms = jitter_ms
+        self.error_rate = error_rate
+        self.flaresolverr_latency_ms = flaresolverr_latency_ms
+        self.orders_per_page = orders_per_page
+
+    def to_dict(self) -> Dict[str, Any]:
+        return dict(self.__dict__)
+
+
+config = StubConfig()
+call_counts: Dict[str, int] = {}
+
+app = FastAPI(title="PlayAuto/FlareSolverr Stub")
+
+
+async def _simulate(endpoint: str, base_latency_ms: Optional[int] = None) -> Optional[JSONResponse]:
+    """지연 및 오류 주입. 오류를 주입하는 경우 응답을 반환"""
+    call_counts[endpoint] = call_counts.get(endpoint, 0) + 1
+    latency = base_latency_ms if base_latency_ms is not None else config.latency_ms
+    latency += random.randint(0, config.jitter_ms) if config.jitter_ms > 0 else 0
+    await asyncio.sleep(latency / 1000)
+
+    if config.error_rate > 0 and random.random() < config.error_rate:
+        return JSONResponse(status_code=503, content={"message": "stub injected error"})
+    return None
+
+
+def _fake_order(index: int) -> Dict[str, Any]:
+    ordered_at = datetime.now() - timedelta(minutes=index * 7)
+    return {
+        "uniq": f"STUB{index:010d}",
+        "bundle_no": f"B{index:010d}",
+        "shop_cd": random.choice(["A001", "A006", "A077", "B378"]),
+        "shop_name": "스텁마켓",
+        "shop_ord_no": f"SO{index:010d}",
+        "shop_sale_no": f"SS{index % 10000:08d}",
+        "shop_sale_name": f"스텁 상품 {index % 10000}",
+        "ord_status": random.choice(["신규주문", "출고대기", "배송중"]),
+        "sale_cnt": 1,
+        "sales": random.randrange(5000, 90000, 100),
+        "wdate": ordered_at.strftime("%Y-%m-%d %H:%M:%S"),
+        "to_name": "홍길동",
+        "to_htel": "010-0000-0000",
+        "to_addr1": "서울시 강남구 테헤란로 123",
+        "to_zipcd": "06142",
+    }
+
+
+# ========================================
+# PlayAuto API
+# ========================================
+
+@app.post("/api/auth")
+async def playauto_auth():
+    error = await _simulate("playauto.auth")
+    if error:
+        return error
+    return [{"token": "stub-token", "sol_no": 1}]
+
+
+@app.post("/api/orders")
+async def playauto_orders(request: Request):
+    error = await _simulate("playauto.orders")
+    if error:
+        return error
+    body = await request.json()
+    start = int(body.get("start", 0))
+    length = min(int(body.get("length", config.orders_per_page)), config.orders_per_page)
+    orders = [_fake_order(start + i) for i in range(length)]
+    return {"data": {"orders": orders, "recordsTotal": start + length * 3}}
+
+
+@app.get("/api/order/{uniq}")
+async def playauto_order_detail(uniq: str):
+    error = await _simulate("playauto.order_detail")
+    if error:
+        return error
+    return {"data": _fake_order(abs(hash(uniq)) % 100000)}
+
+
+@app.put("/api/order/setnotice")
+@app.put("/api/order/setInvoice")
+async def playauto_set_invoice(request: Request):
+    error = await _simulate("playauto.invoice")
+    if error:
+        return error
+    body = await request.json()
+    orders = body.get("orders", [])
+    return [{"bundle_no": o.get("bundle_no"), "result": "성공"} for o in orders]
+
+
+@app.api_route("/api/{path:path}", methods=["GET", "POST", "PUT", "PATCH", "DELETE"])
+async def playauto_catch_all(path: str):
+    error = await _simulate(f"playauto.{path.split('/')[0]}")
+    if error:
+        return error
+    return {"result": "success", "data": [], "message": "stub"}
+
+
+# ========================================
+# FlareSolverr API
+# ========================================
+
+@app.get("/health")
+async def flaresolverr_health():
+    return {"status": "ok"}
+
+
+@app.post("/v1")
+async def flaresolverr_v1(request: Request):
+    body = await request.json()
+    cmd = body.get("cmd", "")
+
+    if cmd == "sessions.create":
+        return {"status": "ok", "session": f"stub-session-{int(time.time() * 1000)}"}
+    if cmd == "sessions.destroy":
+        return {"status": "ok"}
+
+    error = await _simulate("flaresolverr.request", config.flaresolverr_latency_ms)
+    if error:
+        return {"status": "error", "message": "stub injected error"}
+
+    price = random.randrange(3000, 80000, 10)
+    html = (
+        "<html><head>"
+        f'<meta property="og:title" content="스텁 상품 {price}">'
+        f'<meta property="og:image" content="https://example.com/stub/{price}.jpg">'
+        f'<meta property="product:price:amount" content="{price}">'
+        "</head><body>"
+        f'<span class="price">{price:,}원</span>'
+        "</body></html>"
+    )
+    return {
+        "status": "ok",
+        "message": "",
+        "solution": {
+            "url": body.get("url"),
+            "status": 200,
+            "headers": {},
+            "cookies": [{"name": "cf_clearance", "value": "stub", "domain": "", "path": "/"}],
+            "userAgent": "Mozilla/5.0 (stub)",
+            "response": html,
+        },
+    }
+
+
+# ========================================
+# 스텁 제어
+# ========================================
+
+@app.get("/stub/config")
+async def get_stub_config():
+    return {"config": config.to_dict(), "calls": call_counts}
+
+
+@app.post("/stub/config")
+async def update_stub_config(request: Request):
+    updates = await request.json()
+    for key, value in updates.items():
+        if hasattr(config, key):
+            setattr(config, key, type(getattr(config, key))(value))
+    return {"config": config.to_dict()}
+
+
+def main():
+    parser = argparse.ArgumentParser(description="PlayAuto/FlareSolverr 스텁 서버")
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8299)
+    parser.add_argument('--latency-ms', type=int, default=100)
+    parser.add_argument('--jitter-ms', type=int, default=50)
+    parser.add_argument('--error-rate', type=float, default=0.0)
+    parser.add_argument('--flaresolverr-latency-ms', type=int, default=1500)
+    args = parser.parse_args()
+
+    config.latency_ms = args.latency_ms
+    config.jitter_ms = args.jitter_ms
+    config.error_rate = args.error_rate
+    config.flaresolverr_latency_ms = args.flaresolverr_latency_ms
+
+    import uvicorn
+    print(f"[STUB] PlayAuto:     PLAYAUTO_API_URL=http://{args.host}:{args.port}/api")
+    print(f"[STUB] FlareSolverr: FLARESOLVERR_URL=http://{args.host}:{args.port}/v1")
+    uvicorn.run(app, host=args.host, port=args.port, log_level="warning")
+
+
+if __name__ == "__main__":
+    main()
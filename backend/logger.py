@@ -2,13 +2,25 @@
 로깅 시스템 설정
 
 애플리케이션 전체에서 사용할 로거 설정
+
+- 비동기 출력: 로거에는 QueueHandler만 달고, 실제 출력(stdout/stderr/파일)은
+  QueueListener 스레드가 처리 → 요청/스크래핑 경로가 I/O로 블로킹되지 않음
+- JSON 출력: LOG_JSON=true (프로덕션 기본값) 이면 한 줄 JSON, 아니면 기존 텍스트 포맷
+- 모듈별 레벨: LOG_LEVELS="monitor=DEBUG,playauto.orders=WARNING" (get_logger 이름 기준)
+- 샘플링: DEBUG 로그만 호출 위치별로 LOG_SAMPLE_WINDOW초당 LOG_SAMPLE_BURST건까지만 출력,
+  나머지는 버리고 다음 출력 시 생략 건수를 붙임
 """
 
+import atexit
+import json
 import logging
 import os
+import queue
 import sys
+import threading
+import time
 from datetime import datetime
-from logging.handlers import RotatingFileHandler
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
 
 # 환경 변수 체크 (production vs development)
 ENVIRONMENT = os.getenv('ENVIRONMENT', 'development')
@@ -17,34 +29,130 @@ ENVIRONMENT = os.getenv('ENVIRONMENT', 'development')
 LOG_FORMAT = '[%(asctime)s] [%(levelname)s] [%(name)s:%(lineno)d] - %(message)s'
 DATE_FORMAT = '%Y-%m-%d %H:%M:%S'
 
+# 기본 레벨 (프로덕션: WARNING 이상만, 개발: INFO 이상)
+LOG_LEVEL = os.getenv('LOG_LEVEL', 'WARNING' if ENVIRONMENT == 'production' else 'INFO').upper()
+
+# JSON 한 줄 출력 (로그 수집기용)
+LOG_JSON = os.getenv('LOG_JSON', 'true' if ENVIRONMENT == 'production' else 'false').lower() == 'true'
+
+# 모듈별 레벨 (예: "monitor=DEBUG,playauto.orders=WARNING")
+LOG_LEVELS = os.getenv('LOG_LEVELS', '')
+
+# 샘플링: DEBUG 로그를 호출 위치별 WINDOW초 동안 BURST건까지 출력 (0이면 비활성화)
+LOG_SAMPLE_WINDOW = float(os.getenv('LOG_SAMPLE_WINDOW', '10'))
+LOG_SAMPLE_BURST = int(os.getenv('LOG_SAMPLE_BURST', '20'))
+
+# LogRecord 기본 속성 (JSON 출력 시 extra 필드만 골라내기 위함)
+_RECORD_ATTRS = set(vars(logging.LogRecord('', 0, '', 0, '', None, None))) | {'message', 'asctime', 'taskName'}
+
+
+class JsonFormatter(logging.Formatter):
+    """한 줄 JSON 포맷 (extra로 넘긴 필드 포함)"""
+
+    def format(self, record: logging.LogRecord) -> str:
+        entry = {
+            'ts': datetime.fromtimestamp(record.created).isoformat(timespec='milliseconds'),
+            'level': record.levelname,
+            'logger': record.name,
+            'line': record.lineno,
+            'msg': record.getMessage(),
+        }
+        for key, value in vars(record).items():
+            if key not in _RECORD_ATTRS and not key.startswith('_'):
+                entry[key] = value
+        if record.exc_info:
+            entry['exc'] = self.formatException(record.exc_info)
+        return json.dumps(entry, ensure_ascii=False, default=str)
+
+
+class SamplingFilter(logging.Filter):
+    """
+    DEBUG 로그의 호출 위치(로거, 줄 번호)별 출력 제한
+
+    상품마다 찍히는 디버그 로그가 스윕 중 폭증하지 않도록 윈도우당 burst건만 통과시킴
+    (INFO 이상은 감사/운영 로그이므로 항상 통과)
+    """
+
+    def __init__(self, window: float = LOG_SAMPLE_WINDOW, burst: int = LOG_SAMPLE_BURST):
+        super().__init__()
+        self.window = window
+        self.burst = burst
+        self._lock = threading.Lock()
+        self._sites = {}  # (name, lineno) -> [window_start, count, suppressed]
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        if record.levelno > logging.DEBUG or self.burst <= 0:
+            return True
+
+        key = (record.name, record.lineno)
+        now = time.monotonic()
+        with self._lock:
+            site = self._sites.get(key)
+            if site is None or now - site[0] >= self.window:
+                suppressed = site[2] if site else 0
+                self._sites[key] = [now, 1, 0]
+            elif site[1] < self.burst:
+                site[1] += 1
+                return True
+            else:
+                site[2] += 1
+                return False
+
+        if suppressed:
+            record.msg = f"{record.getMessage()} (직전 {self.window:g}초간 {suppressed}건 생략)"
+            record.args = None
+        return True
+
+
+def _parse_levels(spec: str):
+    levels = {}
+    for item in spec.split(','):
+        name, _, level = item.partition('=')
+        name, level = name.strip(), level.strip().upper()
+        if name and isinstance(logging.getLevelName(level), int):
+            levels[name] = level
+    return levels
+
+
+def set_module_level(name: str, level):
+    """모듈(get_logger 이름 기준) 로그 레벨 변경 (하위 모듈에도 적용)"""
+    logging.getLogger(f"onbaek-ai.{name}").setLevel(level)
+
+
+def _build_formatter() -> logging.Formatter:
+    if LOG_JSON:
+        return JsonFormatter()
+    return logging.Formatter(LOG_FORMAT, datefmt=DATE_FORMAT)
+
+
 # 메인 로거 설정
 logger = logging.getLogger("onbaek-ai")
-# 프로덕션: WARNING 이상만, 개발: INFO 이상
-if ENVIRONMENT == 'production':
-    logger.setLevel(logging.WARNING)
-else:
-    logger.setLevel(logging.INFO)
+logger.setLevel(LOG_LEVEL)
 
 # 기존 핸들러 제거 (중복 방지)
 if logger.hasHandlers():
     logger.handlers.clear()
 
-# 콘솔 핸들러 (stdout) - 모든 환경에서 사용
+for _module, _level in _parse_levels(LOG_LEVELS).items():
+    set_module_level(_module, _level)
+
+formatter = _build_formatter()
+output_handlers = []
+
+# 콘솔 핸들러 (stdout) - 모든 환경에서 사용 (레벨은 로거에서 결정)
 console_handler = logging.StreamHandler(sys.stdout)
-# 프로덕션: WARNING 이상만, 개발: INFO 이상
-console_handler.setLevel(logging.WARNING if ENVIRONMENT == 'production' else logging.INFO)
-console_formatter = logging.Formatter(LOG_FORMAT, datefmt=DATE_FORMAT)
-console_handler.setFormatter(console_formatter)
-logger.addHandler(console_handler)
+console_handler.setLevel(logging.DEBUG)
+console_handler.setFormatter(formatter)
+output_handlers.append(console_handler)
 
 # 에러 핸들러 (stderr) - 모든 환경에서 사용
 error_console_handler = logging.StreamHandler(sys.stderr)
 error_console_handler.setLevel(logging.ERROR)
-error_console_formatter = logging.Formatter(LOG_FORMAT, datefmt=DATE_FORMAT)
-error_console_handler.setFormatter(error_console_formatter)
-logger.addHandler(error_console_handler)
+error_console_handler.setFormatter(formatter)
+output_handlers.append(error_console_handler)
 
 # 로컬 개발 환경에서만 파일 핸들러 사용
+_file_handler_error = None
 if ENVIRONMENT != 'production':
     try:
         # logs 디렉토리 생성 (개발 환경에서만)
@@ -63,9 +171,8 @@ if ENVIRONMENT != 'production':
             encoding='utf-8'
         )
         file_handler.setLevel(logging.INFO)
-        file_formatter = logging.Formatter(LOG_FORMAT, datefmt=DATE_FORMAT)
-        file_handler.setFormatter(file_formatter)
-        logger.addHandler(file_handler)
+        file_handler.setFormatter(formatter)
+        output_handlers.append(file_handler)
 
         # 에러 로그 파일 핸들러 (ERROR 이상만)
         error_handler = RotatingFileHandler(
@@ -75,14 +182,48 @@ if ENVIRONMENT != 'production':
             encoding='utf-8'
         )
         error_handler.setLevel(logging.ERROR)
-        error_formatter = logging.Formatter(LOG_FORMAT, datefmt=DATE_FORMAT)
-        error_handler.setFormatter(error_formatter)
-        logger.addHandler(error_handler)
-
-        logger.info(f"로컬 개발 환경: 파일 로깅 활성화 ({LOG_FILE})")
+        error_handler.setFormatter(formatter)
+        output_handlers.append(error_handler)
     except Exception as e:
         # 파일 생성 실패시 stdout만 사용 (에러 무시)
-        logger.warning(f"파일 핸들러 생성 실패 (stdout만 사용): {e}")
+        _file_handler_error = e
+
+# 로거 → 큐 (호출 스레드는 큐에 넣기만 함), 큐 → 출력 핸들러 (리스너 스레드)
+log_queue = queue.Queue(-1)
+queue_handler = QueueHandler(log_queue)
+queue_handler.addFilter(SamplingFilter())
+logger.addHandler(queue_handler)
+
+listener = QueueListener(log_queue, *output_handlers, respect_handler_level=True)
+listener.start()
+
+
+def _flush_listener():
+    """종료 시 큐에 남은 로그 모두 출력"""
+    try:
+        listener.stop()
+    except Exception:
+        pass
+
+
+def _restart_listener_after_fork():
+    """fork된 워커에서는 리스너 스레드가 없으므로 새 큐/스레드로 다시 시작"""
+    global log_queue
+    log_queue = queue.Queue(-1)
+    queue_handler.queue = log_queue
+    listener.queue = log_queue
+    listener._thread = None
+    listener.start()
+
+
+atexit.register(_flush_listener)
+if hasattr(os, 'register_at_fork'):
+    os.register_at_fork(after_in_child=_restart_listener_after_fork)
+
+if _file_handler_error is not None:
+    logger.warning(f"파일 핸들러 생성 실패 (stdout만 사용): {_file_handler_error}")
+elif ENVIRONMENT != 'production':
+    logger.info(f"로컬 개발 환경: 파일 로깅 활성화 ({LOG_FILE})")
 else:
     logger.info("프로덕션 환경: stdout/stderr 로깅 사용 (Railway 자동 수집)")
 
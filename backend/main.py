@@ -49,6 +49,9 @@ import os
 from pathlib import Path
 from dotenv import load_dotenv
 from logger import get_logger
+from utils.responses import FastJSONResponse
+from utils import metrics
+from database.query_profiler import QueryProfilerMiddleware
 
 # 로거 초기화
 logger = get_logger(__name__)
@@ -291,11 +294,220 @@ async def lifespan(app: FastAPI):
                 print(f"[WARN] product_marketplace_codes 테이블 생성 중 오류: {e}")
                 conn.rollback()
 
+            # 6. keyset 페이지네이션 인덱스 (created_at DESC, id DESC) + created_at NOT NULL
+            try:
+                from database.pagination import KEYSET_TABLES, NULL_CREATED_AT
+                for table in KEYSET_TABLES:
+                    cursor.execute(f"UPDATE {table} SET created_at = %s WHERE created_at IS NULL", (NULL_CREATED_AT,))
+                    cursor.execute(f"ALTER TABLE {table} ALTER COLUMN created_at SET NOT NULL")
+                    cursor.execute(f"""
+                        CREATE INDEX IF NOT EXISTS idx_{table}_keyset
+                        ON {table}(created_at DESC, id DESC)
+                    """)
+                conn.commit()
+            except Exception as e:
+                print(f"[WARN] keyset 인덱스 생성 중 오류: {e}")
+                conn.rollback()
+
+            # 7. storage_objects 테이블 (스토리지 카탈로그)
+            try:
+                cursor.execute("""
+                    CREATE TABLE IF NOT EXISTS storage_objects (
+                        id BIGSERIAL PRIMARY KEY,
+                        path TEXT NOT NULL UNIQUE,
+                        folder TEXT NOT NULL,
+                        filename TEXT NOT NULL,
+                        size BIGINT DEFAULT 0,
+                        content_type TEXT,
+                        width INTEGER,
+                        height INTEGER,
+                        content_hash TEXT,
+                        etag TEXT,
+                        has_thumbnail BOOLEAN DEFAULT FALSE,
+                        modified_at TEXT,
+                        synced_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+                    )
+                """)
+                cursor.execute("""
+                    CREATE INDEX IF NOT EXISTS idx_storage_objects_folder
+                    ON storage_objects(folder, filename)
+                """)
+                cursor.execute("""
+                    CREATE INDEX IF NOT EXISTS idx_storage_objects_hash
+                    ON storage_objects(content_hash)
+                """)
+                conn.commit()
+            except Exception as e:
+                print(f"[WARN] storage_objects 테이블 생성 중 오류: {e}")
+                conn.rollback()
+
+            # 8. image_blobs / image_sources 테이블 (내용 주소 기반 이미지 중복 제거)
+            try:
+                cursor.execute("""
+                    CREATE TABLE IF NOT EXISTS image_blobs (
+                        id BIGSERIAL PRIMARY KEY,
+                        content_hash TEXT NOT NULL UNIQUE,
+                        storage_path TEXT NOT NULL,
+                        size BIGINT DEFAULT 0,
+                        content_type TEXT,
+                        ref_count INTEGER NOT NULL DEFAULT 0,
+                        created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                        last_referenced_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+                    )
+                """)
+                cursor.execute("""
+                    CREATE INDEX IF NOT EXISTS idx_image_blobs_unreferenced
+                    ON image_blobs(ref_count, last_referenced_at)
+                """)
+                cursor.execute("""
+                    CREATE TABLE IF NOT EXISTS image_sources (
+                        id BIGSERIAL PRIMARY KEY,
+                        url_hash TEXT NOT NULL UNIQUE,
+                        source_url TEXT NOT NULL,
+                        content_hash TEXT NOT NULL,
+                        created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+                    )
+                """)
+                conn.commit()
+            except Exception as e:
+                print(f"[WARN] image_blobs 테이블 생성 중 오류: {e}")
+                conn.rollback()
+
+            # 9. alert_states 테이블 (모니터링 알림 중복 방지/요약)
+            try:
+                cursor.execute("""
+                    CREATE TABLE IF NOT EXISTS alert_states (
+                        id BIGSERIAL PRIMARY KEY,
+                        product_id BIGINT NOT NULL,
+                        alert_type TEXT NOT NULL,
+                        state TEXT NOT NULL DEFAULT 'ok',
+                        fail_count INTEGER NOT NULL DEFAULT 0,
+                        detail TEXT,
+                        first_seen_at TIMESTAMP,
+                        last_seen_at TIMESTAMP,
+                        resolved_at TIMESTAMP,
+                        notified_state TEXT,
+                        last_notified_at TIMESTAMP,
+                        suppressed_count INTEGER NOT NULL DEFAULT 0,
+                        CONSTRAINT uq_alert_state UNIQUE (product_id, alert_type)
+                    )
+                """)
+                cursor.execute("""
+                    CREATE INDEX IF NOT EXISTS idx_alert_states_active
+                    ON alert_states(state, last_notified_at)
+                """)
+                conn.commit()
+            except Exception as e:
+                print(f"[WARN] alert_states 테이블 생성 중 오류: {e}")
+                conn.rollback()
+
+            # 10. playauto_registration_jobs 테이블 (백그라운드 상품 등록 작업)
+            try:
+                cursor.execute("""
+                    CREATE TABLE IF NOT EXISTS playauto_registration_jobs (
+                        id BIGSERIAL PRIMARY KEY,
+                        status TEXT NOT NULL DEFAULT 'pending',
+                        total_count INTEGER NOT NULL DEFAULT 0,
+                        processed_count INTEGER NOT NULL DEFAULT 0,
+                        success_count INTEGER NOT NULL DEFAULT 0,
+                        failed_count INTEGER NOT NULL DEFAULT 0,
+                        progress_percent NUMERIC(5, 2) DEFAULT 0,
+                        product_ids TEXT,
+                        site_list TEXT,
+                        results TEXT,
+                        error_message TEXT,
+                        retry_of BIGINT,
+                        started_at TIMESTAMP,
+                        completed_at TIMESTAMP,
+                        heartbeat_at TIMESTAMP,
+                        created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+                    )
+                """)
+                cursor.execute("ALTER TABLE playauto_registration_jobs ADD COLUMN IF NOT EXISTS heartbeat_at TIMESTAMP")
+                cursor.execute("""
+                    CREATE INDEX IF NOT EXISTS idx_playauto_registration_jobs_created_at
+                    ON playauto_registration_jobs(created_at)
+                """)
+                conn.commit()
+            except Exception as e:
+                print(f"[WARN] playauto_registration_jobs 테이블 생성 중 오류: {e}")
+                conn.rollback()
+
+            # 11. fetch_strategy_stats 테이블 (도메인별 페이지 가져오기 전략 통계)
+            try:
+                cursor.execute("""
+                    CREATE TABLE IF NOT EXISTS fetch_strategy_stats (
+                        id BIGSERIAL PRIMARY KEY,
+                        domain TEXT NOT NULL,
+                        strategy TEXT NOT NULL,
+                        attempts INTEGER NOT NULL DEFAULT 0,
+                        successes INTEGER NOT NULL DEFAULT 0,
+                        success_rate DOUBLE PRECISION NOT NULL DEFAULT 1.0,
+                        latency DOUBLE PRECISION,
+                        last_success_at TIMESTAMP,
+                        updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                        CONSTRAINT uq_fetch_strategy_stat UNIQUE (domain, strategy)
+                    )
+                """)
+                cursor.execute("""
+                    CREATE INDEX IF NOT EXISTS idx_fetch_strategy_stats_updated_at
+                    ON fetch_strategy_stats(updated_at)
+                """)
+                conn.commit()
+            except Exception as e:
+                print(f"[WARN] fetch_strategy_stats 테이블 생성 중 오류: {e}")
+                conn.rollback()
+
+            # 12. orders 플레이오토 송장 업로드 컬럼 (SQLite는 Database._migrate_playauto_columns)
+            try:
+                cursor.execute("ALTER TABLE orders ADD COLUMN IF NOT EXISTS playauto_order_id TEXT")
+                cursor.execute("ALTER TABLE orders ADD COLUMN IF NOT EXISTS synced_to_playauto BOOLEAN DEFAULT FALSE")
+                cursor.execute("ALTER TABLE orders ADD COLUMN IF NOT EXISTS tracking_uploaded_at TIMESTAMP")
+                conn.commit()
+            except Exception as e:
+                print(f"[WARN] orders 송장 업로드 컬럼 추가 중 오류: {e}")
+                conn.rollback()
+
             cursor.close()
             conn.close()
     except Exception as e:
         print(f"[WARN] 데이터베이스 마이그레이션 실패 (계속 진행): {e}")
 
+    # 메트릭 스냅샷 기록 시작 (워커별 파일, /metrics에서 합산)
+    metrics.registry.start_writer()
+
+    # 알림 디스패처 시작 (스케줄러 작업의 알림을 비동기 발송)
+    try:
+        from notifications.dispatcher import start_notification_dispatcher
+        await start_notification_dispatcher()
+        print("[INFO] 알림 디스패처 시작 완료")
+    except Exception as e:
+        print(f"[WARN] 알림 디스패처 시작 실패 (동기 발송 사용): {e}")
+
+    # WebSocket 워커 간 브로드캐스트 채널 연결
+    try:
+        from api.websocket import manager as websocket_manager
+        await websocket_manager.start()
+    except Exception as e:
+        print(f"[WARN] WebSocket 브로드캐스트 채널 시작 실패: {e}")
+
+    # 실행하던 워커가 중단되어 멈춘 상품 등록 작업 정리
+    try:
+        from playauto.registration_jobs import fail_stale_jobs
+        stale_jobs = await asyncio.to_thread(fail_stale_jobs)
+        if stale_jobs:
+            print(f"[INFO] 중단된 상품 등록 작업 {stale_jobs}개를 실패 처리")
+    except Exception as e:
+        print(f"[WARN] 중단된 상품 등록 작업 정리 실패: {e}")
+
+    # 도메인별 페이지 가져오기 전략 통계 불러오기
+    try:
+        from utils.fetch_strategy import load_persisted_stats
+        loaded = await asyncio.to_thread(load_persisted_stats)
+        print(f"[INFO] 가져오기 전략 통계 {loaded}건 불러옴")
+    except Exception as e:
+        print(f"[WARN] 가져오기 전략 통계 불러오기 실패: {e}")
+
     # 플레이오토 스케줄러 시작
     try:
         start_playauto_scheduler()
@@ -348,6 +560,13 @@ async def lifespan(app: FastAPI):
     except Exception as e:
         print(f"[WARN] 상품 모니터링 스케줄러 중지 실패: {e}")
 
+    # 가져오기 전략 통계 마지막 저장
+    try:
+        from utils.fetch_strategy import flush_stats
+        await asyncio.to_thread(flush_stats)
+    except Exception as e:
+        print(f"[WARN] 가져오기 전략 통계 저장 실패: {e}")
+
     # 데이터베이스 백업 스케줄러 중지
     if BACKUP_AVAILABLE:
         try:
@@ -363,12 +582,31 @@ async def lifespan(app: FastAPI):
     except Exception as e:
         print(f"[WARN] 송장 업로드 스케줄러 중지 실패: {e}")
 
+    # WebSocket 연결 종료 및 브로드캐스트 채널 해제
+    try:
+        from api.websocket import manager as websocket_manager
+        await websocket_manager.stop()
+    except Exception as e:
+        print(f"[WARN] WebSocket 브로드캐스트 채널 중지 실패: {e}")
+
+    # 알림 디스패처 중지 (남은 알림 발송 후)
+    try:
+        from notifications.dispatcher import stop_notification_dispatcher
+        await stop_notification_dispatcher()
+        print("[INFO] 알림 디스패처 중지 완료")
+    except Exception as e:
+        print(f"[WARN] 알림 디스패처 중지 실패: {e}")
+
+    # 메트릭 마지막 스냅샷 기록
+    metrics.registry.stop_writer()
+
 # FastAPI 앱 생성
 app = FastAPI(
     title="물바다AI 통합 자동화 API",
     description="상품 수집, 모니터링, RPA 자동 발주를 제공하는 통합 API",
     version="2.0.0",
-    lifespan=lifespan
+    lifespan=lifespan,
+    default_response_class=FastJSONResponse  # orjson 직렬화 (미설치 시 표준 json)
 )
 
 # CORS 설정 (Next.js 프론트엔드와 통신 허용)
@@ -413,6 +651,12 @@ app.add_middleware(
     allow_origin_regex=r"https://.*\.vercel\.app",
 )
 
+# 요청 단위 쿼리 집계 (N+1 감지)
+app.add_middleware(QueryProfilerMiddleware)
+
+# 라우트별 요청 수/처리 시간 (가장 바깥 미들웨어)
+app.add_middleware(metrics.MetricsMiddleware)
+
 # Static 파일 서빙 설정 (개발 환경에서만 필요)
 import os
 from pathlib import Path
@@ -566,15 +810,21 @@ async def health_check():
     """Health check endpoint for Railway deployment"""
     from datetime import datetime
     from fastapi.responses import JSONResponse
+    from utils.circuit_breaker import breaker_states
 
     try:
         # Test database connection
         db = get_db()
         db.get_dashboard_stats()  # Simple query to verify DB connection
 
+        # 외부 서비스 서킷이 열려 있으면 degraded (DB는 정상이므로 200 유지)
+        circuits = breaker_states()
+        degraded = any(circuit["state"] == "open" for circuit in circuits.values())
+
         return {
-            "status": "healthy",
+            "status": "degraded" if degraded else "healthy",
             "database": "connected",
+            "circuits": circuits,
             "environment": os.getenv("USE_POSTGRESQL", "false"),
             "timestamp": datetime.now().isoformat()
         }
@@ -590,6 +840,15 @@ async def health_check():
         )
 
 
+@app.get("/metrics", include_in_schema=False)
+async def metrics_endpoint():
+    """Prometheus 메트릭 (모든 워커 합산)"""
+    from fastapi.responses import PlainTextResponse
+
+    body = await asyncio.to_thread(metrics.render)
+    return PlainTextResponse(body, media_type="text/plain; version=0.0.4; charset=utf-8")
+
+
 if __name__ == "__main__":
     import uvicorn
     uvicorn.run("main:app", host="0.0.0.0", port=8000, reload=True)
@@ -37,6 +37,7 @@ else:
 
 # Supabase Storage import (환경 변수 로드 후)
 from utils.supabase_storage import upload_image, ensure_bucket_exists, supabase
+import hashlib
 
 # 이미지 디렉토리
 IMAGES_DIR = project_root / "supabase-images"
@@ -115,9 +116,18 @@ def migrate_images():
     print("-" * 60)
 
     success_count = 0
+    skip_count = 0
     fail_count = 0
     errors = []
 
+    # 이미 같은 내용으로 업로드된 경로는 건너뜀 (스토리지 카탈로그의 sha256 비교)
+    try:
+        from utils import storage_catalog
+        uploaded_hashes = storage_catalog.get_content_hashes(path for _, path in images)
+    except Exception as e:
+        print(f"[WARN] 스토리지 카탈로그 조회 실패 - 전체 업로드: {e}")
+        uploaded_hashes = {}
+
     start_time = time.time()
 
     for idx, (file_path, storage_path) in enumerate(images, 1):
@@ -127,6 +137,13 @@ def migrate_images():
 
         # 업로드
         try:
+            if uploaded_hashes.get(storage_path):
+                file_hash = hashlib.sha256(file_path.read_bytes()).hexdigest()
+                if uploaded_hashes[storage_path] == file_hash:
+                    print("SKIP (same content)")
+                    skip_count += 1
+                    continue
+
             public_url = upload_image(file_path, storage_path)
 
             if public_url:
@@ -157,6 +174,7 @@ def migrate_images():
     print("=" * 60)
     print(f"총 이미지: {len(images)}개")
     print(f"성공: {success_count}개 (✓)")
+    print(f"건너뜀: {skip_count}개 (이미 같은 내용)")
     print(f"실패: {fail_count}개 (✗)")
     print(f"소요 시간: {elapsed_time:.1f}초")
     print(f"평균 속도: {len(images) / elapsed_time:.1f}개/초")
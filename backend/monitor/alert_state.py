@@ -0,0 +1,269 @@
+"""
+모니터링 알림 상태 저장소
+
+(상품, 알림 유형)별 상태를 alert_states 테이블에 보관하여
+- 상태 전이 시에만 알림 발송 (품절이 계속되는 동안 매 점검마다 발송하지 않음)
+- 해제 후 억제 기간 안에 같은 상태로 다시 들어가면 발송하지 않음 (상태가 오락가락하는 경우)
+- 문제 상태끼리 바뀌는 경우(품절 ↔ 판매종료)는 상품별 쿨다운이 지나야 다시 발송
+- 서버 재시작/다중 워커에서도 상태 유지 (발송 권한은 조건부 UPDATE로 한 워커만 획득)
+- 진행 중인 문제는 주기적으로 요약 1건으로 발송
+
+Usage:
+    decision = record_problem(product_id, 'product_unavailable', 'out_of_stock')
+    if decision.notify:
+        send_notification(...)
+    resolve(product_id, 'product_unavailable')
+"""
+
+import os
+from datetime import datetime, timedelta
+from typing import Dict, List, NamedTuple, Optional
+
+from sqlalchemy import and_, case, or_, select, update
+from sqlalchemy.exc import IntegrityError
+
+from database.database_manager import get_database_manager
+from database.models import AlertState
+
+OK = 'ok'
+
+# 해제 후 같은 상태로 다시 들어갔을 때 알림을 보내지 않는 기간 (시간)
+SUPPRESSION_HOURS = int(os.getenv('ALERT_SUPPRESSION_HOURS', '24'))
+
+# 문제 상태가 바뀌었을 때(품절 ↔ 판매종료) 다시 알리기까지의 최소 간격 (시간)
+STATE_CHANGE_COOLDOWN_HOURS = int(os.getenv('ALERT_STATE_CHANGE_COOLDOWN_HOURS', '6'))
+
+# 진행 중인 알림 요약 발송 주기 (시간)
+DIGEST_HOURS = int(os.getenv('ALERT_DIGEST_HOURS', '24'))
+
+# 요약 발송 권한을 기록하는 예약 행
+_DIGEST_KEY = (0, '__digest__')
+
+# 요약 메시지에 나열할 최대 건수
+DIGEST_MAX_ITEMS = 30
+
+ALERT_LABELS = {
+    'product_unavailable': '판매 불가',
+    'price_fetch_fail': '가격 추출 실패',
+}
+
+_table_ready = False
+
+
+class AlertDecision(NamedTuple):
+    notify: bool
+    fail_count: int
+
+
+def _get_manager():
+    global _table_ready
+    db_manager = get_database_manager()
+    if not _table_ready:
+        AlertState.__table__.create(bind=db_manager.engine, checkfirst=True)
+        _table_ready = True
+    return db_manager
+
+
+def _key(product_id: int, alert_type: str):
+    return and_(AlertState.product_id == product_id, AlertState.alert_type == alert_type)
+
+
+def record_problem(
+    product_id: int,
+    alert_type: str,
+    state: str,
+    detail: Optional[str] = None,
+    threshold: int = 1,
+    suppression_hours: int = SUPPRESSION_HOURS,
+    cooldown_hours: int = STATE_CHANGE_COOLDOWN_HOURS
+) -> AlertDecision:
+    """
+    문제 감지 기록
+
+    Args:
+        state: 문제 상태 ('out_of_stock', 'discontinued', 'failing' 등)
+        threshold: 연속 감지 횟수가 이 값에 도달해야 알림
+        cooldown_hours: 알림 후 다른 문제 상태로 바뀌어도 다시 알리지 않는 기간
+
+    Returns:
+        AlertDecision(notify=이번에 알림을 보내야 하는지, fail_count=연속 감지 횟수)
+    """
+    now = datetime.now()
+    db_manager = _get_manager()
+
+    with db_manager.get_session() as session:
+        # UPDATE의 SET 우변은 갱신 전 값으로 계산됨 (SQLite/PostgreSQL)
+        updated = session.execute(
+            update(AlertState)
+            .where(_key(product_id, alert_type))
+            .values(
+                fail_count=case((AlertState.state == OK, 1), else_=AlertState.fail_count + 1),
+                first_seen_at=case((AlertState.state == OK, now), else_=AlertState.first_seen_at),
+                state=state,
+                detail=detail,
+                last_seen_at=now
+            )
+        ).rowcount
+    if not updated:
+        try:
+            with db_manager.get_session() as session:
+                session.add(AlertState(
+                    product_id=product_id, alert_type=alert_type, state=state, detail=detail,
+                    fail_count=1, first_seen_at=now, last_seen_at=now, suppressed_count=0
+                ))
+        except IntegrityError:
+            # 다른 워커가 먼저 생성 → 다시 갱신
+            return record_problem(product_id, alert_type, state, detail, threshold, suppression_hours, cooldown_hours)
+
+    cutoff = now - timedelta(hours=suppression_hours)
+    cooldown_cutoff = now - timedelta(hours=cooldown_hours)
+    with db_manager.get_session() as session:
+        # 발송 권한 획득: 이번 문제 구간에서 아직 알리지 않았거나 상태가 바뀐 경우
+        # (같은 상태로 억제 기간 안에 다시 들어온 경우, 쿨다운 안에 상태만 바뀐 경우는 제외)
+        claimed = session.execute(
+            update(AlertState)
+            .where(
+                _key(product_id, alert_type),
+                AlertState.state == state,
+                AlertState.fail_count >= threshold,
+                or_(
+                    AlertState.last_notified_at.is_(None),
+                    and_(
+                        AlertState.notified_state != state,
+                        AlertState.last_notified_at < cooldown_cutoff
+                    ),
+                    and_(
+                        AlertState.last_notified_at < AlertState.first_seen_at,
+                        AlertState.last_notified_at < cutoff
+                    )
+                )
+            )
+            .values(notified_state=state, last_notified_at=now, suppressed_count=0)
+        ).rowcount
+        if not claimed:
+            session.execute(
+                update(AlertState)
+                .where(_key(product_id, alert_type), AlertState.fail_count >= threshold)
+                .values(suppressed_count=AlertState.suppressed_count + 1)
+            )
+        fail_count = session.execute(
+            select(AlertState.fail_count).where(_key(product_id, alert_type))
+        ).scalar() or 1
+
+    return AlertDecision(bool(claimed), fail_count)
+
+
+def resolve(product_id: int, alert_type: str) -> bool:
+    """
+    문제 해제 (정상 감지)
+
+    Returns:
+        문제 상태였다가 해제되었으면 True
+    """
+    with _get_manager().get_session() as session:
+        return bool(session.execute(
+            update(AlertState)
+            .where(_key(product_id, alert_type), AlertState.state != OK)
+            .values(state=OK, fail_count=0, resolved_at=datetime.now())
+        ).rowcount)
+
+
+def get_fail_count(product_id: int, alert_type: str) -> int:
+    with _get_manager().get_session() as session:
+        return session.execute(
+            select(AlertState.fail_count).where(_key(product_id, alert_type))
+        ).scalar() or 0
+
+
+def list_active(alert_type: Optional[str] = None) -> List[Dict]:
+    """알림을 보낸 뒤 아직 해제되지 않은 문제 목록"""
+    stmt = (
+        select(
+            AlertState.product_id, AlertState.alert_type, AlertState.state,
+            AlertState.fail_count, AlertState.detail, AlertState.first_seen_at,
+            AlertState.last_notified_at, AlertState.suppressed_count
+        )
+        .where(
+            AlertState.state != OK,
+            AlertState.alert_type != _DIGEST_KEY[1],
+            AlertState.last_notified_at >= AlertState.first_seen_at
+        )
+        .order_by(AlertState.alert_type, AlertState.first_seen_at)
+    )
+    if alert_type:
+        stmt = stmt.where(AlertState.alert_type == alert_type)
+    with _get_manager().get_session() as session:
+        return [dict(row._mapping) for row in session.execute(stmt)]
+
+
+# ========================================
+# 요약
+# ========================================
+
+def _claim_digest(now: datetime, interval_hours: int) -> bool:
+    """요약 발송 권한 (주기당 한 워커만)"""
+    product_id, alert_type = _DIGEST_KEY
+    # 스케줄 실행 시각이 조금씩 흔들려도 주기를 건너뛰지 않도록 여유를 둠
+    cutoff = now - timedelta(hours=interval_hours) + timedelta(minutes=5)
+    db_manager = _get_manager()
+    with db_manager.get_session() as session:
+        claimed = session.execute(
+            update(AlertState)
+            .where(
+                _key(product_id, alert_type),
+                or_(AlertState.last_notified_at.is_(None), AlertState.last_notified_at < cutoff)
+            )
+            .values(last_notified_at=now)
+        ).rowcount
+        if claimed:
+            return True
+        exists = session.execute(
+            select(AlertState.id).where(_key(product_id, alert_type))
+        ).first()
+    if exists:
+        return False
+    try:
+        with db_manager.get_session() as session:
+            session.add(AlertState(
+                product_id=product_id, alert_type=alert_type, state=OK,
+                fail_count=0, suppressed_count=0, last_notified_at=now
+            ))
+        return True
+    except IntegrityError:
+        return False
+
+
+def build_digest(interval_hours: int = DIGEST_HOURS) -> Optional[str]:
+    """
+    진행 중인 문제 요약 메시지 (요약할 것이 없거나 이번 주기에 다른 워커가 보냈으면 None)
+    """
+    now = datetime.now()
+    active = list_active()
+    if not active or not _claim_digest(now, interval_hours):
+        return None
+
+    from database.models import MySellingProduct
+    product_ids = {row['product_id'] for row in active}
+    with _get_manager().get_session() as session:
+        names = dict(session.execute(
+            select(MySellingProduct.id, MySellingProduct.product_name)
+            .where(MySellingProduct.id.in_(product_ids))
+        ).all())
+        session.execute(update(AlertState).where(AlertState.state != OK).values(suppressed_count=0))
+
+    counts: Dict[str, int] = {}
+    for row in active:
+        counts[row['alert_type']] = counts.get(row['alert_type'], 0) + 1
+    summary = ", ".join(f"{ALERT_LABELS.get(t, t)} {c}건" for t, c in counts.items())
+
+    lines = [f"🔔 진행 중인 모니터링 알림: {summary}"]
+    for row in active[:DIGEST_MAX_ITEMS]:
+        hours = int((now - row['first_seen_at']).total_seconds() // 3600) if row['first_seen_at'] else 0
+        label = f"#{row['product_id']} {names.get(row['product_id']) or ''}".strip()[:50]
+        lines.append(
+            f"• [{ALERT_LABELS.get(row['alert_type'], row['alert_type'])}] "
+            f"{label} - {row['state']} ({hours}시간째, 감지 {row['fail_count']}회)"
+        )
+    if len(active) > DIGEST_MAX_ITEMS:
+        lines.append(f"… 외 {len(active) - DIGEST_MAX_ITEMS}건")
+    return "\n".join(lines)[:1900]  # Discord content 2000자 제한
@@ -0,0 +1,380 @@
+"""
+가격 이력 압축/보존
+
+price_history는 가격이 바뀔 때마다 1행씩, notifications는 알림마다 1행씩 계속 쌓이므로
+주기적으로 오래된 데이터를 요약하고 삭제합니다.
+
+- 압축: price_history → 시간 단위 OHLC (price_history_rollups, resolution='hour') → 일 단위 OHLC ('day')
+  마지막으로 요약한 구간(워터마크)부터 이어서 계산하므로 매 실행은 새로 쌓인 행만 읽음
+- 삭제: 원본은 PRICE_HISTORY_RAW_DAYS일 (기본 30), 시간 요약은 PRICE_HISTORY_HOURLY_DAYS일 (기본 180) 보관,
+  일 요약은 영구 보관. 상위 단계로 이미 요약된 행만 PRICE_HISTORY_PURGE_BATCH개씩 나눠 삭제 (긴 잠금 방지)
+- 읽은 알림은 NOTIFICATION_RETENTION_DAYS일 (기본 90) 후 삭제 (읽지 않은 알림은 유지)
+- 조회: get_price_series()가 기간에 맞는 단계(raw/hour/day)를 자동 선택하고,
+  아직 요약되지 않은 최근 구간은 하위 단계에서 채움
+
+Usage:
+    result = compact_price_history()   # 스케줄러 (1시간마다)
+    series = get_price_series(product_id, since=datetime.now() - timedelta(days=90))
+"""
+
+import os
+import time
+from datetime import datetime, timedelta
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from sqlalchemy import delete, func, insert, select
+from sqlalchemy.exc import IntegrityError
+
+from database.database_manager import get_database_manager
+from database.models import Notification, PriceHistory, PriceHistoryRollup
+from logger import get_logger
+
+logger = get_logger(__name__)
+
+# 원본 price_history 보관 기간 (일)
+RAW_DAYS = int(os.getenv('PRICE_HISTORY_RAW_DAYS', '30'))
+
+# 시간 단위 요약 보관 기간 (일, 일 단위 요약은 영구 보관)
+HOURLY_DAYS = int(os.getenv('PRICE_HISTORY_HOURLY_DAYS', '180'))
+
+# 읽은 알림 보관 기간 (일)
+NOTIFICATION_RETENTION_DAYS = int(os.getenv('NOTIFICATION_RETENTION_DAYS', '90'))
+
+# 삭제 1회(트랜잭션)당 최대 행 수
+PURGE_BATCH = int(os.getenv('PRICE_HISTORY_PURGE_BATCH', '5000'))
+
+# 삭제 배치 사이 대기 (다른 쓰기 작업에 잠금 양보, 초)
+PURGE_PAUSE = 0.05
+
+# 차트 기본 조회 기간 (일)
+CHART_DEFAULT_DAYS = 30
+
+# 자동 선택 시 단계별 최대 조회 기간 (이보다 길면 더 거친 단계)
+RAW_MAX_SPAN = timedelta(days=7)
+HOURLY_MAX_SPAN = timedelta(days=60)
+
+RESOLUTIONS = ('raw', 'hour', 'day')
+
+# 압축 1회(트랜잭션)에서 처리하는 구간 길이
+_COMPACT_WINDOWS = {'hour': timedelta(days=1), 'day': timedelta(days=31)}
+
+# SQLite는 날짜를 문자열로 비교해 소수점 초 유무에 따라 경계값이 어긋나므로
+# 조회 범위를 넓게 잡고 구간 판정은 Python에서 함
+_PAD = timedelta(seconds=1)
+
+_table_ready = False
+
+
+def _get_manager():
+    global _table_ready
+    db_manager = get_database_manager()
+    if not _table_ready:
+        PriceHistoryRollup.__table__.create(bind=db_manager.engine, checkfirst=True)
+        for index in PriceHistory.__table__.indexes:
+            if index.name == 'idx_price_history_checked':
+                index.create(bind=db_manager.engine, checkfirst=True)
+        _table_ready = True
+    return db_manager
+
+
+def _truncate(ts: datetime, resolution: str) -> datetime:
+    ts = ts.replace(minute=0, second=0, microsecond=0)
+    return ts.replace(hour=0) if resolution == 'day' else ts
+
+
+def _watermark(session, resolution: str) -> Optional[datetime]:
+    """마지막으로 요약한 구간 시작 (이 구간은 다음 압축 때 다시 계산)"""
+    return session.execute(
+        select(func.max(PriceHistoryRollup.bucket_start)).where(PriceHistoryRollup.resolution == resolution)
+    ).scalar()
+
+
+def _raw_points(session, start: datetime, stop: datetime, product_id: Optional[int] = None) -> Iterable[Tuple]:
+    """원본 가격 → (product_id, 시각, open, high, low, close, 건수)"""
+    query = select(PriceHistory.product_id, PriceHistory.checked_at, PriceHistory.price).where(
+        PriceHistory.checked_at >= start - _PAD, PriceHistory.checked_at < stop + _PAD
+    )
+    if product_id is not None:
+        query = query.where(PriceHistory.product_id == product_id)
+    for pid, checked_at, price in session.execute(query.order_by(PriceHistory.product_id, PriceHistory.checked_at)):
+        if start <= checked_at < stop:
+            price = float(price)
+            yield pid, checked_at, price, price, price, price, 1
+
+
+def _rollup_points(session, resolution: str, start: datetime, stop: datetime,
+                   product_id: Optional[int] = None) -> Iterable[Tuple]:
+    """요약 행 → (product_id, 구간 시작, open, high, low, close, 건수)"""
+    r = PriceHistoryRollup
+    query = select(
+        r.product_id, r.bucket_start, r.open_price, r.high_price, r.low_price, r.close_price, r.sample_count
+    ).where(r.resolution == resolution, r.bucket_start >= start, r.bucket_start < stop)
+    if product_id is not None:
+        query = query.where(r.product_id == product_id)
+    for pid, bucket_start, open_, high, low, close, count in session.execute(
+            query.order_by(r.product_id, r.bucket_start)):
+        yield pid, bucket_start, float(open_), float(high), float(low), float(close), count
+
+
+def _rollup(points: Iterable[Tuple], resolution: str, start: datetime, stop: datetime) -> Dict[Tuple, List]:
+    """(product_id, 구간 시작)별 OHLC (points는 상품별 시간순)"""
+    buckets: Dict[Tuple, List] = {}
+    for product_id, ts, open_, high, low, close, count in points:
+        bucket_start = _truncate(ts, resolution)
+        if not start <= bucket_start < stop:
+            continue
+        bucket = buckets.get((product_id, bucket_start))
+        if bucket is None:
+            buckets[(product_id, bucket_start)] = [open_, high, low, close, count]
+        else:
+            bucket[1] = max(bucket[1], high)
+            bucket[2] = min(bucket[2], low)
+            bucket[3] = close
+            bucket[4] += count
+    return buckets
+
+
+def _compact_window(db_manager, resolution: str, start: datetime, stop: datetime) -> int:
+    """[start, stop) 구간 요약 다시 계산 (기존 요약 행은 교체)"""
+    with db_manager.get_session() as session:
+        if resolution == 'hour':
+            points = _raw_points(session, start, stop)
+        else:
+            points = _rollup_points(session, 'hour', start, stop)
+        buckets = _rollup(points, resolution, start, stop)
+
+        session.execute(
+            delete(PriceHistoryRollup).where(
+                PriceHistoryRollup.resolution == resolution,
+                PriceHistoryRollup.bucket_start >= start,
+                PriceHistoryRollup.bucket_start < stop
+            )
+        )
+        if buckets:
+            session.execute(insert(PriceHistoryRollup), [
+                {
+                    'product_id': product_id, 'resolution': resolution, 'bucket_start': bucket_start,
+                    'open_price': open_, 'high_price': high, 'low_price': low, 'close_price': close,
+                    'sample_count': count
+                }
+                for (product_id, bucket_start), (open_, high, low, close, count) in buckets.items()
+            ])
+    return len(buckets)
+
+
+def _compact(db_manager, resolution: str, now: datetime) -> int:
+    """워터마크부터 완료된 구간까지 요약 (hour: 원본 → 시간, day: 시간 → 일)"""
+    with db_manager.get_session() as session:
+        start = _watermark(session, resolution)
+        if start is None:
+            if resolution == 'hour':
+                start = session.execute(select(func.min(PriceHistory.checked_at))).scalar()
+            else:
+                start = session.execute(
+                    select(func.min(PriceHistoryRollup.bucket_start)).where(PriceHistoryRollup.resolution == 'hour')
+                ).scalar()
+    if start is None:
+        return 0
+
+    start = _truncate(start, resolution)
+    end = _truncate(now, resolution)
+    written = 0
+    while start < end:
+        stop = min(start + _COMPACT_WINDOWS[resolution], end)
+        written += _compact_window(db_manager, resolution, start, stop)
+        start = stop
+    return written
+
+
+def _purge(db_manager, model, *conditions) -> int:
+    """조건에 맞는 행을 PURGE_BATCH개씩 나눠 삭제"""
+    deleted = 0
+    while True:
+        with db_manager.get_session() as session:
+            ids = session.execute(select(model.id).where(*conditions).limit(PURGE_BATCH)).scalars().all()
+            if ids:
+                session.execute(
+                    delete(model).where(model.id.in_(ids)).execution_options(synchronize_session=False)
+                )
+        deleted += len(ids)
+        if len(ids) < PURGE_BATCH:
+            return deleted
+        time.sleep(PURGE_PAUSE)
+
+
+def compact_price_history(now: Optional[datetime] = None) -> Dict:
+    """
+    가격 이력 압축 + 보존 기간 지난 데이터 삭제
+
+    Returns:
+        {"hourly_buckets", "daily_buckets", "raw_deleted", "hourly_deleted", "notifications_deleted", "elapsed_ms"}
+    """
+    started = time.perf_counter()
+    now = now or datetime.now()
+    db_manager = _get_manager()
+    result = {'hourly_buckets': 0, 'daily_buckets': 0, 'raw_deleted': 0, 'hourly_deleted': 0,
+              'notifications_deleted': 0}
+
+    try:
+        result['hourly_buckets'] = _compact(db_manager, 'hour', now)
+        result['daily_buckets'] = _compact(db_manager, 'day', now)
+    except IntegrityError:
+        # 다른 워커가 같은 구간을 동시에 압축 → 이번 실행은 삭제만 진행
+        logger.warning("[가격이력] 다른 워커가 압축 중 - 압축 건너뜀")
+
+    with db_manager.get_session() as session:
+        hour_watermark = _watermark(session, 'hour')
+        day_watermark = _watermark(session, 'day')
+
+    # 상위 단계로 요약이 끝난 구간만 삭제 (경계는 구간 단위로 맞춰 부분 삭제된 구간이 없도록)
+    if hour_watermark is not None:
+        cutoff = min(_truncate(now - timedelta(days=RAW_DAYS), 'hour'), hour_watermark)
+        result['raw_deleted'] = _purge(db_manager, PriceHistory, PriceHistory.checked_at < cutoff - _PAD)
+    if day_watermark is not None:
+        cutoff = min(_truncate(now - timedelta(days=HOURLY_DAYS), 'day'), day_watermark)
+        result['hourly_deleted'] = _purge(
+            db_manager, PriceHistoryRollup,
+            PriceHistoryRollup.resolution == 'hour', PriceHistoryRollup.bucket_start < cutoff
+        )
+    result['notifications_deleted'] = _purge(
+        db_manager, Notification,
+        Notification.is_read == True,
+        Notification.created_at < now - timedelta(days=NOTIFICATION_RETENTION_DAYS)
+    )
+
+    result['elapsed_ms'] = round((time.perf_counter() - started) * 1000)
+    return result
+
+
+def retention_stats() -> Dict:
+    """단계별 행 수/워터마크/보존 설정"""
+    db_manager = _get_manager()
+    with db_manager.get_session() as session:
+        raw_count, oldest_raw = session.execute(
+            select(func.count(PriceHistory.id), func.min(PriceHistory.checked_at))
+        ).one()
+        rollups = dict(session.execute(
+            select(PriceHistoryRollup.resolution, func.count(PriceHistoryRollup.id))
+            .group_by(PriceHistoryRollup.resolution)
+        ).all())
+        watermarks = {resolution: _watermark(session, resolution) for resolution in RESOLUTIONS[1:]}
+        notification_count = session.execute(select(func.count(Notification.id))).scalar()
+
+    return {
+        "raw_rows": raw_count or 0,
+        "oldest_raw": oldest_raw.isoformat() if oldest_raw else None,
+        "hourly_rows": rollups.get('hour', 0),
+        "daily_rows": rollups.get('day', 0),
+        "watermarks": {k: v.isoformat() if v else None for k, v in watermarks.items()},
+        "notifications": notification_count or 0,
+        "retention_days": {
+            "raw": RAW_DAYS, "hourly": HOURLY_DAYS, "read_notifications": NOTIFICATION_RETENTION_DAYS
+        },
+    }
+
+
+def choose_resolution(since: datetime, until: datetime, now: Optional[datetime] = None) -> str:
+    """조회 기간에 맞는 단계 (원본이 남아 있는 짧은 기간 → raw, 시간 요약 보관 기간 내 → hour, 그 외 → day)"""
+    now = now or datetime.now()
+    span = until - since
+    if since >= now - timedelta(days=RAW_DAYS) and span <= RAW_MAX_SPAN:
+        return 'raw'
+    if since >= now - timedelta(days=HOURLY_DAYS) and span <= HOURLY_MAX_SPAN:
+        return 'hour'
+    return 'day'
+
+
+def _point(ts: datetime, open_: float, high: float, low: float, close: float, count: int) -> Dict:
+    return {"time": ts.isoformat(), "open": open_, "high": high, "low": low, "close": close, "samples": count}
+
+
+def get_price_series(product_id: int, since: Optional[datetime] = None, until: Optional[datetime] = None,
+                     resolution: str = 'auto') -> Dict:
+    """
+    차트용 가격 시계열
+
+    hour/day 단계는 요약이 끝난 구간은 요약 테이블에서, 워터마크 이후 최근 구간은
+    하위 단계(시간 요약/원본)를 같은 단위로 합쳐서 채웁니다.
+
+    Args:
+        resolution: 'auto' | 'raw' | 'hour' | 'day'
+
+    Returns:
+        {"resolution", "since", "until", "points": [{"time", "open", "high", "low", "close", "samples"}]}
+    """
+    now = datetime.now()
+    until = until or now
+    since = since or until - timedelta(days=CHART_DEFAULT_DAYS)
+    if resolution == 'auto':
+        resolution = choose_resolution(since, until, now)
+    if resolution not in RESOLUTIONS:
+        raise ValueError(f"지원하지 않는 단위: {resolution}")
+
+    db_manager = _get_manager()
+    with db_manager.get_session() as session:
+        if resolution == 'raw':
+            points = [_point(*point[1:]) for point in _raw_points(session, since, until, product_id)]
+        else:
+            since = _truncate(since, resolution)
+            sources = []
+            covered = since
+            # 거친 단계부터: 요약이 끝난 구간 [covered, 워터마크)는 요약 행, 나머지는 다음 단계에서
+            for level in RESOLUTIONS[RESOLUTIONS.index(resolution):0:-1]:
+                watermark = _watermark(session, level)
+                if watermark is not None and watermark > covered:
+                    stop = min(watermark, until)
+                    sources.extend(_rollup_points(session, level, covered, stop, product_id))
+                    covered = stop
+            if covered < until:
+                sources.extend(_raw_points(session, covered, until, product_id))
+            buckets = _rollup(sources, resolution, since, until)
+            points = [_point(bucket_start, *values) for (_, bucket_start), values in sorted(buckets.items())]
+
+    return {"resolution": resolution, "since": since.isoformat(), "until": until.isoformat(), "points": points}
+
+
+def get_recent_price_points(product_id: int, limit: int = 30) -> List[Dict]:
+    """
+    최근 가격 변동 limit건 (최신순)
+
+    원본이 보존 기간 지나 삭제된 상품은 그 이전 구간을 요약 행(종가)으로 채웁니다.
+    요약 행은 "resolution" 키가 있음.
+    """
+    db_manager = _get_manager()
+    with db_manager.get_session() as session:
+        rows = session.execute(
+            select(PriceHistory).where(PriceHistory.product_id == product_id)
+            .order_by(PriceHistory.checked_at.desc()).limit(limit)
+        ).scalars().all()
+        history = [
+            {
+                "id": row.id, "product_id": row.product_id,
+                "price": float(row.price) if row.price is not None else None,
+                "original_price": float(row.original_price) if row.original_price is not None else None,
+                "checked_at": row.checked_at.isoformat() if row.checked_at else None,
+            }
+            for row in rows
+        ]
+        if len(history) >= limit:
+            return history
+
+        # 원본이 limit건보다 적으면 가장 오래된 원본 이전 구간은 모두 삭제된 상태 (삭제는 구간 단위)
+        before = rows[-1].checked_at if rows else datetime.now()
+        for level in ('hour', 'day'):
+            before = _truncate(before, level)
+            r = PriceHistoryRollup
+            buckets = session.execute(
+                select(r.bucket_start, r.close_price).where(
+                    r.product_id == product_id, r.resolution == level, r.bucket_start < before
+                ).order_by(r.bucket_start.desc()).limit(limit - len(history))
+            ).all()
+            history.extend(
+                {"product_id": product_id, "price": float(close), "original_price": None,
+                 "checked_at": bucket_start.isoformat(), "resolution": level}
+                for bucket_start, close in buckets
+            )
+            if len(history) >= limit:
+                break
+            if buckets:
+                before = buckets[-1][0]
+    return history
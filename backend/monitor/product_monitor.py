@@ -2,11 +2,15 @@
 상품 모니터링 로직 - FlareSolverr 기반 (Selenium 제거)
 """
 import re
-from typing import Dict, Optional
+import time
+from typing import Dict, Optional, Tuple
 import requests
 from bs4 import BeautifulSoup
 from urllib.parse import urljoin
 from logger import get_logger
+from monitor.source_registry import SourceDescriptor, get_scraper, resolve_source, wait_turn
+from utils import metrics
+from utils.fetch_strategy import domain_of, get_fetch_tracker, is_blocked_html
 
 # FlareSolverr 클라이언트 임포트
 try:
@@ -35,12 +39,15 @@ class ProductMonitor:
             return None
 
         try:
-            logger.info(f"[FLARESOLVERR] 페이지 요청: {url}")
+            wait_turn(resolve_source(url))
+            logger.debug(f"[FLARESOLVERR] 페이지 요청: {url}")
             result = solve_cloudflare(url, max_timeout=60000)
 
             if result and result.get('html'):
                 html = result.get('html', '')
-                logger.info(f"[FLARESOLVERR] HTML 수신 완료 (길이: {len(html)})")
+                logger.debug(f"[FLARESOLVERR] HTML 수신 완료 (길이: {len(html)})")
+                # 통과 쿠키는 이후 cookie_replay 전략에서 재사용
+                get_fetch_tracker().store_cookies(domain_of(url), result.get('cookies'), result.get('user_agent'))
                 return html
             else:
                 logger.warning("[FLARESOLVERR] 실패 또는 빈 응답")
@@ -52,6 +59,7 @@ class ProductMonitor:
     def _get_html_with_requests(self, url: str) -> Optional[str]:
         """requests로 HTML 가져오기 (빠른 추출용)"""
         try:
+            wait_turn(resolve_source(url))
             response = requests.get(url, headers=self.headers, timeout=15)
             response.raise_for_status()
             return response.text
@@ -59,33 +67,63 @@ class ProductMonitor:
             logger.warning(f"[REQUESTS] 실패: {e}")
             return None
 
+    def _get_html_with_cookies(self, url: str) -> Optional[str]:
+        """FlareSolverr가 받아온 쿠키/User-Agent로 requests 요청 (브라우저 없이 Cloudflare 통과)"""
+        saved = get_fetch_tracker().get_cookies(domain_of(url))
+        if not saved:
+            return None
+        cookies, user_agent = saved
+        try:
+            wait_turn(resolve_source(url))
+            headers = {**self.headers, 'User-Agent': user_agent or self.headers['User-Agent']}
+            response = requests.get(url, headers=headers, cookies=cookies, timeout=15)
+            response.raise_for_status()
+            return response.text
+        except Exception as e:
+            logger.warning(f"[COOKIE_REPLAY] 실패: {e}")
+            return None
+
+    def fetch_html(self, url: str, source: Optional[SourceDescriptor] = None) -> Optional[str]:
+        """
+        도메인별로 잘 되는 가장 싼 전략부터 시도해 HTML 가져오기 (utils.fetch_strategy)
+
+        Returns:
+            정상 HTML, 모든 전략이 차단 페이지만 받았으면 마지막 차단 페이지 (호출부에서 차단 안내), 실패 시 None
+        """
+        source = source or resolve_source(url)
+        tracker = get_fetch_tracker()
+        domain = domain_of(url)
+        fetchers = {
+            'direct': self._get_html_with_requests,
+            'cookie_replay': self._get_html_with_cookies,
+            'flaresolverr': self._get_html_with_flaresolverr,
+        }
+
+        blocked_html = None
+        for strategy in tracker.plan(domain, needs_js=source.needs_js):
+            started = time.perf_counter()
+            html = fetchers[strategy](url)
+            ok = not is_blocked_html(html)
+            tracker.record(domain, strategy, ok, time.perf_counter() - started)
+            if ok:
+                logger.debug(f"[FETCH] {domain} - {strategy} 성공 (길이: {len(html)})")
+                return html
+            blocked_html = html or blocked_html
+        return blocked_html
+
     def extract_info_fast(self, product_url: str) -> Dict[str, Optional[str]]:
         """
         requests + BeautifulSoup으로 빠르게 상품 정보 추출
         JavaScript 렌더링이 필요한 사이트는 FlareSolverr 사용
         """
         try:
-            print(f"[FAST] 빠른 추출 시도: {product_url}")
-
-            # JavaScript 렌더링이 필요한 사이트 목록
-            js_required_sites = ['ssg.com', '11st.co.kr', 'lotteon.com', 'gsshop.com', 'cjthemarket.com', 'otokimall.com', 'dongwonmall.com']
-            needs_js = any(site in product_url for site in js_required_sites)
-
-            if needs_js:
-                # FlareSolverr 사용
-                html = self._get_html_with_flaresolverr(product_url)
-                if not html:
-                    print(f"[FAST] FlareSolverr 실패")
-                    return None
-            else:
-                # requests 사용 (빠름)
-                html = self._get_html_with_requests(product_url)
-                if not html:
-                    # requests 실패 시 FlareSolverr 폴백
-                    html = self._get_html_with_flaresolverr(product_url)
-                    if not html:
-                        print(f"[FAST] 모든 방법 실패")
-                        return None
+            logger.debug(f"[FAST] 빠른 추출 시도: {product_url}")
+
+            # 도메인별로 잘 되는 가장 싼 방법부터 (JavaScript 렌더링이 필요한 사이트는 FlareSolverr 우선)
+            html = self.fetch_html(product_url)
+            if not html:
+                logger.warning(f"[FAST] 모든 방법 실패")
+                return None
 
             soup = BeautifulSoup(html, 'html.parser')
 
@@ -100,25 +138,25 @@ class ProductMonitor:
 
             if product_name and len(product_name) > 3:
                 if price and price > 0:
-                    print(f"[FAST] SUCCESS: {product_name}, Price: {price}")
+                    logger.debug(f"[FAST] SUCCESS: {product_name}, Price: {price}")
                     return {
                         'product_name': product_name,
                         'price': price,
                         'thumbnail': thumbnail,
                     }
                 else:
-                    print(f"[FAST] 상품명은 있지만 가격 없음: {product_name}")
+                    logger.debug(f"[FAST] 상품명은 있지만 가격 없음: {product_name}")
                     return {
                         'product_name': product_name,
                         'price': None,
                         'thumbnail': thumbnail,
                     }
             else:
-                print(f"[FAST] FAIL: 상품명 없음")
+                logger.debug(f"[FAST] FAIL: 상품명 없음")
                 return None
 
         except Exception as e:
-            print(f"[FAST] FAIL: {str(e)}")
+            logger.warning(f"[FAST] FAIL: {str(e)}")
             return None
 
     def _extract_product_name(self, soup: BeautifulSoup, url: str) -> Optional[str]:
@@ -150,26 +188,7 @@ class ProductMonitor:
 
         # 3. 사이트별 선택자
         if not product_name or len(product_name) < 5:
-            selectors = []
-            if '11st.co.kr' in url:
-                selectors = ['.c_product_info_title h1', '.l_product_title h1', 'h1.title']
-            elif 'ssg.com' in url:
-                selectors = ['.cdtl_info_tit', '.product_title']
-            elif 'gmarket.co.kr' in url or 'auction.co.kr' in url:
-                selectors = ['.itemtit', 'h1']
-            elif 'gsshop.com' in url:
-                selectors = ['.prd-btns h2', '.goods-header h2', 'h1']
-            elif 'cjthemarket.com' in url:
-                selectors = ['.prd-name', '.product-name', 'h1']
-            elif 'homeplus.co.kr' in url:
-                selectors = ['.prodNameBox', 'h1']
-            elif 'lotteon.com' in url:
-                selectors = ['h1', '.product-name']
-            elif 'otokimall.com' in url:
-                selectors = ['.prd_name', '.product-name', 'h1', 'h2']
-            elif 'dongwonmall.com' in url:
-                selectors = ['h1', 'input[name="product_nm"]', '.product-name', '.prd-name']
-
+            selectors = resolve_source(url).name_selectors
             for selector in selectors:
                 elem = soup.select_one(selector)
                 if elem and elem.get_text(strip=True):
@@ -195,119 +214,30 @@ class ProductMonitor:
             except:
                 pass
 
-        # 2. 사이트별 가격 선택자
-        if '11st.co.kr' in url:
-            # 11번가: .price 클래스 또는 가격 패턴
-            selectors = ['.price', '.c_product_price .price strong', '.l_product_price strong']
-            for selector in selectors:
-                elem = soup.select_one(selector)
-                if elem:
-                    text = elem.get_text(strip=True)
-                    price = self._parse_price(text)
-                    if price:
-                        return price
-
-        elif 'ssg.com' in url:
-            # SSG
-            selectors = ['.cdtl_price .ssg_price', '.ssg_price']
-            for selector in selectors:
-                elems = soup.select(selector)
-                for elem in elems:
-                    # 정가 영역 제외
-                    if elem.find_parent(class_='cdtl_old_price'):
-                        continue
-                    text = elem.get_text(strip=True)
-                    price = self._parse_price(text)
-                    if price and price > 1000:
-                        return price
-
-        elif 'gmarket.co.kr' in url or 'auction.co.kr' in url:
-            selectors = ['.price_sect .price strong', '.item_price strong', '.price strong']
-            for selector in selectors:
-                elem = soup.select_one(selector)
-                if elem:
-                    text = elem.get_text(strip=True)
-                    price = self._parse_price(text)
-                    if price and price > 1000:
-                        return price
-
-        elif 'gsshop.com' in url:
-            selectors = ['.price-definition__amount', '.price-amount', '.price strong']
-            for selector in selectors:
-                elem = soup.select_one(selector)
-                if elem:
-                    text = elem.get_text(strip=True)
-                    price = self._parse_price(text)
-                    if price:
-                        return price
-
-        elif 'cjthemarket.com' in url:
-            selectors = ['.prd-price strong', '.price-area .sale-price', '.final-price']
-            for selector in selectors:
-                elem = soup.select_one(selector)
-                if elem:
-                    text = elem.get_text(strip=True)
-                    price = self._parse_price(text)
-                    if price:
-                        return price
-
-        elif 'homeplus.co.kr' in url:
-            selectors = ['.price', '.sale-price']
-            for selector in selectors:
-                elem = soup.select_one(selector)
-                if elem:
-                    text = elem.get_text(strip=True)
-                    price = self._parse_price(text)
-                    if price:
-                        return price
-
-        elif 'lotteon.com' in url:
-            selectors = ['.price', '[class*="price"]']
-            for selector in selectors:
-                elem = soup.select_one(selector)
-                if elem:
-                    text = elem.get_text(strip=True)
-                    price = self._parse_price(text)
-                    if price and price > 1000:
-                        return price
-
-        elif 'otokimall.com' in url:
-            # 오뚜기몰: hidden input의 data-finalprice 또는 .price 영역
-            price_input = soup.find('input', id='pdPrice')
-            if price_input and price_input.get('data-finalprice'):
+        # 2. 사이트별 가격 (hidden input → 가격 선택자)
+        source = resolve_source(url)
+        if source.price_input:
+            input_id, attr = source.price_input
+            price_input = soup.find('input', id=input_id)
+            if price_input and price_input.get(attr):
                 try:
-                    price = float(price_input['data-finalprice'])
+                    price = float(price_input[attr].replace(',', ''))
                     if price > 100:
                         return price
                 except:
                     pass
-            selectors = ['.price', '.sale_price', '.prd_price']
-            for selector in selectors:
-                elem = soup.select_one(selector)
-                if elem:
-                    text = elem.get_text(strip=True)
-                    price = self._parse_price(text)
-                    if price and price > 100:
-                        return price
 
-        elif 'dongwonmall.com' in url:
-            # 동원몰: userPrice input 또는 .userPriceText
-            price_input = soup.find('input', id='userPrice')
-            if price_input and price_input.get('value'):
-                try:
-                    price = float(price_input['value'].replace(',', ''))
-                    if price > 100:
-                        return price
-                except:
-                    pass
-            selectors = ['.userPriceText', '.sale-price', '.price']
-            for selector in selectors:
-                elem = soup.select_one(selector)
-                if elem:
-                    text = elem.get_text(strip=True)
-                    price = self._parse_price(text)
-                    if price and price > 100:
-                        return price
+        for selector in source.price_selectors:
+            # 제외 영역이 있으면 (SSG 정가 등) 일치하는 요소를 모두 확인
+            elems = soup.select(selector) if source.price_exclude_parent else [soup.select_one(selector)]
+            for elem in elems:
+                if elem is None:
+                    continue
+                if source.price_exclude_parent and elem.find_parent(class_=source.price_exclude_parent):
+                    continue
+                price = self._parse_price(elem.get_text(strip=True))
+                if price and price > source.min_price:
+                    return price
 
         # 3. 페이지에서 가격 패턴 찾기 (폴백)
         if not price:
@@ -346,23 +276,16 @@ class ProductMonitor:
         thumbnail = None
 
         # 0. 사이트별 특수 선택자 (og:image가 로고인 경우 대비)
-        site_specific_selectors = {
-            'dongwonmall.com': ['#mainImg img', '.product_image img', '.photo img'],
-            'otokimall.com': ['#prdImage img', '.product-image img', '.prd-img img'],
-        }
-
-        for site, selectors in site_specific_selectors.items():
-            if site in url:
-                for selector in selectors:
-                    img = soup.select_one(selector)
-                    if img:
-                        src = img.get('src') or img.get('data-src')
-                        if src:
-                            if src.startswith('//'):
-                                src = 'https:' + src
-                            elif not src.startswith('http'):
-                                src = urljoin(url, src)
-                            return src
+        for selector in resolve_source(url).thumbnail_selectors:
+            img = soup.select_one(selector)
+            if img:
+                src = img.get('src') or img.get('data-src')
+                if src:
+                    if src.startswith('//'):
+                        src = 'https:' + src
+                    elif not src.startswith('http'):
+                        src = urljoin(url, src)
+                    return src
 
         # 1. og:image 메타 태그
         og_image = soup.find('meta', property='og:image')
@@ -390,67 +313,80 @@ class ProductMonitor:
     def extract_product_name(self, product_url: str, source: str) -> Optional[str]:
         """URL에서 상품명 추출"""
         try:
-            html = self._get_html_with_flaresolverr(product_url)
-            if not html:
-                html = self._get_html_with_requests(product_url)
+            html = self.fetch_html(product_url)
 
             if html:
                 soup = BeautifulSoup(html, 'html.parser')
                 return self._extract_product_name(soup, product_url)
             return None
         except Exception as e:
-            print(f"[DEBUG] 상품명 추출 오류: {str(e)}")
+            logger.debug(f"[DEBUG] 상품명 추출 오류: {str(e)}")
             return None
 
     def check_product_status(self, product_url: str, source: str) -> Dict:
         """
         상품 페이지를 체크하여 상태 및 가격 정보 반환
         """
+        started = time.perf_counter()
+        result = self._check_product_status(product_url)
+        metrics.SCRAPE_DURATION.observe(
+            time.perf_counter() - started, source=source or 'unknown', status=result.get('status')
+        )
+        return result
+
+    def _check_with_scraper(self, source: SourceDescriptor, product_url: str) -> Tuple[Optional[Dict], Optional[str]]:
+        """전용 스크래퍼로 상태/가격 추출 → (결과, 실패 사유)"""
+        tag = source.name.upper()
         try:
-            print(f"모니터링: {product_url}")
+            logger.debug(f"[{tag}] 전용 스크래퍼 사용: {product_url}")
+            scraper_result = get_scraper(source).extract_product_info(product_url)
+        except Exception as e:
+            logger.warning(f"[{tag}] 전용 스크래퍼 오류: {e}")
+            return None, f"{source.scraper.partition(':')[2]} 오류: {str(e)}"
 
-            # 홈플러스 일반몰(mfront)은 HomeplusScraper 사용 (HTML 가져오기 불필요)
-            if 'mfront.homeplus.co.kr' in product_url:
-                try:
-                    from sourcing.homeplus import HomeplusScraper
-                    logger.info(f"[HOMEPLUS] HomeplusScraper 사용: {product_url}")
-
-                    scraper = HomeplusScraper()
-                    scraper_result = scraper.extract_product_info(product_url)
-
-                    if scraper_result.get('success'):
-                        result = {
-                            'status': scraper_result.get('status', 'available'),
-                            'price': scraper_result.get('price'),
-                            'original_price': scraper_result.get('original_price'),
-                            'details': '정상' if scraper_result.get('status') == 'available' else scraper_result.get('status')
-                        }
-                        logger.info(f"[HOMEPLUS] 추출 성공 - 상태: {result['status']}, 가격: {result['price']}")
-                        return result
-                    else:
-                        logger.error(f"[HOMEPLUS] 추출 실패: {scraper_result.get('error')}")
-                        return {
-                            'status': 'error',
-                            'price': None,
-                            'original_price': None,
-                            'details': scraper_result.get('error', '홈플러스 정보 추출 실패')
-                        }
-                except Exception as e:
-                    logger.error(f"[HOMEPLUS] HomeplusScraper 오류: {e}")
+        if not scraper_result.get('success'):
+            logger.warning(f"[{tag}] 추출 실패: {scraper_result.get('error')}")
+            return None, scraper_result.get('error', f'{source.name} 정보 추출 실패')
+
+        result = {
+            'status': scraper_result.get('status', 'available'),
+            'price': scraper_result.get('price'),
+            'original_price': scraper_result.get('original_price'),
+            'details': '정상' if scraper_result.get('status') == 'available' else scraper_result.get('status')
+        }
+        logger.debug(f"[{tag}] 추출 성공 - 상태: {result['status']}, 가격: {result['price']}")
+        return result, None
+
+    def check_status_from_soup(self, soup: BeautifulSoup, product_url: str,
+                               source: Optional[SourceDescriptor] = None) -> Dict:
+        """소싱처 전용 상태 체크 (알 수 없는 소싱처는 범용 추출)"""
+        source = source or resolve_source(product_url)
+        if not source.status_checker:
+            return self._check_generic_status(soup, product_url)
+        checker = getattr(self, source.status_checker)
+        return checker(soup, product_url) if source.checker_needs_url else checker(soup)
+
+    def _check_product_status(self, product_url: str) -> Dict:
+        try:
+            logger.debug(f"모니터링: {product_url}")
+            source = resolve_source(product_url)
+
+            # 전용 스크래퍼 우선 (홈플러스 일반몰 - 스크래퍼만 사용, G마켓 - 실패 시 HTML 파싱으로 폴백)
+            if source.scraper_checks:
+                wait_turn(source)
+                result, error = self._check_with_scraper(source, product_url)
+                if result is not None:
+                    return result
+                if source.scraper_only:
                     return {
                         'status': 'error',
                         'price': None,
                         'original_price': None,
-                        'details': f'HomeplusScraper 오류: {str(e)}'
+                        'details': error
                     }
 
-            # 나머지 사이트는 HTML 가져오기
-            # FlareSolverr로 HTML 가져오기
-            html = self._get_html_with_flaresolverr(product_url)
-
-            if not html:
-                # FlareSolverr 실패 시 requests 시도
-                html = self._get_html_with_requests(product_url)
+            # 나머지 사이트는 HTML 가져오기 (도메인별로 잘 되는 가장 싼 방법부터)
+            html = self.fetch_html(product_url, source)
 
             if not html:
                 return {
@@ -462,57 +398,11 @@ class ProductMonitor:
 
             soup = BeautifulSoup(html, 'html.parser')
 
-            # 사이트별 상태 체크
-            if 'ssg.com' in product_url:
-                result = self._check_ssg_status(soup)
-            elif 'homeplus.co.kr' in product_url or 'traders' in product_url:
-                # Traders → 기존 HTML 파싱 사용
-                result = self._check_homeplus_status(soup)
-            elif 'gmarket.co.kr' in product_url:
-                # G마켓 → GmarketScraper 사용 (정확도 향상)
-                try:
-                    from sourcing.gmarket import GmarketScraper
-                    logger.info(f"[GMARKET] GmarketScraper 사용: {product_url}")
-
-                    scraper = GmarketScraper()
-                    scraper_result = scraper.extract_product_info(product_url)
-
-                    if scraper_result.get('success'):
-                        result = {
-                            'status': scraper_result.get('status', 'available'),
-                            'price': scraper_result.get('price'),
-                            'original_price': scraper_result.get('original_price'),
-                            'details': '정상' if scraper_result.get('status') == 'available' else scraper_result.get('status')
-                        }
-                        logger.info(f"[GMARKET] 추출 성공 - 상태: {result['status']}, 가격: {result['price']}")
-                    else:
-                        logger.warning(f"[GMARKET] 추출 실패, HTML 파싱으로 폴백")
-                        result = self._check_gmarket_status(soup, product_url)
-                except Exception as e:
-                    logger.warning(f"[GMARKET] GmarketScraper 오류, HTML 파싱으로 폴백: {e}")
-                    result = self._check_gmarket_status(soup, product_url)
-            elif '11st.co.kr' in product_url:
-                result = self._check_11st_status(soup)
-            elif 'lotteon.com' in product_url:
-                result = self._check_lotteon_status(soup)
-            elif 'auction.co.kr' in product_url:
-                result = self._check_auction_status(soup, product_url)
-            elif 'gsshop.com' in product_url:
-                result = self._check_gsshop_status(soup)
-            elif 'cjthemarket.com' in product_url:
-                result = self._check_cjthemarket_status(soup)
-            elif 'otokimall.com' in product_url:
-                result = self._check_otokimall_status(soup)
-            elif 'dongwonmall.com' in product_url:
-                result = self._check_dongwonmall_status(soup)
-            else:
-                # 알 수 없는 소싱처: 범용 추출 사용
-                result = self._check_generic_status(soup, product_url)
-
-            return result
+            # 사이트별 상태 체크 (알 수 없는 소싱처: 범용 추출)
+            return self.check_status_from_soup(soup, product_url, source)
 
         except Exception as e:
-            print(f"모니터링 오류: {str(e)}")
+            logger.error(f"모니터링 오류: {str(e)}")
             return {
                 'status': 'error',
                 'price': None,
@@ -573,7 +463,7 @@ class ProductMonitor:
                 buy_btn = soup.select_one('.btn_buy, .cdtl_btn_buy')
                 if buy_btn and '품절' not in buy_btn.get_text().lower():
                     status = 'available'
-                    print(f"[SSG] 가격 있고 구매버튼 정상 → 판매중으로 판정")
+                    logger.debug(f"[SSG] 가격 있고 구매버튼 정상 → 판매중으로 판정")
 
             return {
                 'status': status,
@@ -619,7 +509,7 @@ class ProductMonitor:
                 buy_btn = soup.select_one('.btn-buy, [class*="btn-buy"]')
                 if buy_btn and '품절' not in buy_btn.get_text().lower():
                     status = 'available'
-                    print(f"[HOMEPLUS] 가격 있고 구매버튼 정상 → 판매중으로 판정")
+                    logger.debug(f"[HOMEPLUS] 가격 있고 구매버튼 정상 → 판매중으로 판정")
 
             return {
                 'status': status,
@@ -687,7 +577,7 @@ class ProductMonitor:
                     btn_text = buy_btn.get_text().lower()
                     if '품절' not in btn_text and '일시품절' not in btn_text:
                         status = 'available'
-                        print(f"[11ST] 가격 있고 구매버튼 정상 → 판매중으로 판정")
+                        logger.debug(f"[11ST] 가격 있고 구매버튼 정상 → 판매중으로 판정")
 
             return {
                 'status': status,
@@ -733,7 +623,7 @@ class ProductMonitor:
                 buy_btn = soup.select_one('[class*="btn_buy"], [class*="buy"]')
                 if buy_btn and '품절' not in buy_btn.get_text().lower():
                     status = 'available'
-                    print(f"[LOTTEON] 가격 있고 구매버튼 정상 → 판매중으로 판정")
+                    logger.debug(f"[LOTTEON] 가격 있고 구매버튼 정상 → 판매중으로 판정")
 
             return {
                 'status': status,
@@ -780,7 +670,7 @@ class ProductMonitor:
                 buy_btn = soup.select_one('.btn_buy, [class*="btn_buy"]')
                 if buy_btn and '품절' not in buy_btn.get_text().lower():
                     status = 'available'
-                    print(f"[GMARKET] 가격 있고 구매버튼 정상 → 판매중으로 판정")
+                    logger.debug(f"[GMARKET] 가격 있고 구매버튼 정상 → 판매중으로 판정")
 
             return {
                 'status': status,
@@ -827,7 +717,7 @@ class ProductMonitor:
                 buy_btn = soup.select_one('.btn_buy, [class*="btn_buy"]')
                 if buy_btn and '품절' not in buy_btn.get_text().lower():
                     status = 'available'
-                    print(f"[AUCTION] 가격 있고 구매버튼 정상 → 판매중으로 판정")
+                    logger.debug(f"[AUCTION] 가격 있고 구매버튼 정상 → 판매중으로 판정")
 
             return {
                 'status': status,
@@ -881,7 +771,7 @@ class ProductMonitor:
                 buy_btn = soup.select_one('.btn-buy, [class*="btn-buy"]')
                 if buy_btn and '품절' not in buy_btn.get_text().lower():
                     status = 'available'
-                    print(f"[GSSHOP] 가격 있고 구매버튼 정상 → 판매중으로 판정")
+                    logger.debug(f"[GSSHOP] 가격 있고 구매버튼 정상 → 판매중으로 판정")
 
             return {
                 'status': status,
@@ -908,7 +798,7 @@ class ProductMonitor:
             # 1. 삭제된 상품 확인 - 여러 패턴 체크
             # 1-1. alert 메시지
             if '구매할 수 있는 상품이 존재하지 않아요' in page_text:
-                print(f"[CJTHEMARKET] 상품 삭제됨 감지 (alert 메시지)")
+                logger.debug(f"[CJTHEMARKET] 상품 삭제됨 감지 (alert 메시지)")
                 return {
                     'status': 'discontinued',
                     'price': None,
@@ -926,7 +816,7 @@ class ProductMonitor:
                 ]
                 if any(title_content == invalid or title_content.lower() == invalid.lower()
                        for invalid in invalid_titles):
-                    print(f"[CJTHEMARKET] 상품 삭제됨 감지 (og:title이 사이트명: {title_content})")
+                    logger.debug(f"[CJTHEMARKET] 상품 삭제됨 감지 (og:title이 사이트명: {title_content})")
                     return {
                         'status': 'discontinued',
                         'price': None,
@@ -937,7 +827,7 @@ class ProductMonitor:
             # 2. 재입고 알림 버튼 확인 → 일시품절
             restock_btn = soup.select_one('.btn__restock')
             if restock_btn:
-                print(f"[CJTHEMARKET] 재입고 알림 버튼 감지 → 일시품절")
+                logger.debug(f"[CJTHEMARKET] 재입고 알림 버튼 감지 → 일시품절")
                 return {
                     'status': 'out_of_stock',
                     'price': price,
@@ -1005,7 +895,7 @@ class ProductMonitor:
             # 2. soldout 클래스 확인 (명시적 품절 표시)
             soldout_elem = soup.select_one('[class*="soldout"], [class*="sold_out"], .품절')
             if soldout_elem:
-                print(f"[OTOKIMALL] soldout 클래스 감지 → 일시품절")
+                logger.debug(f"[OTOKIMALL] soldout 클래스 감지 → 일시품절")
                 return {
                     'status': 'out_of_stock',
                     'price': price,
@@ -1018,14 +908,14 @@ class ProductMonitor:
             for btn in buy_buttons:
                 btn_text = btn.get_text().lower()
                 if '품절' in btn_text or 'sold out' in btn_text:
-                    print(f"[OTOKIMALL] 버튼 텍스트에서 품절 감지")
+                    logger.debug(f"[OTOKIMALL] 버튼 텍스트에서 품절 감지")
                     status = 'out_of_stock'
                     break
 
             # 4. 가격이 정상 추출되면 판매 중으로 판정
             # (stock="0" 속성은 무시 - 실제로는 판매 가능한 경우가 많음)
             if price and price > 100:
-                print(f"[OTOKIMALL] 가격 {price}원, 판매중으로 판정")
+                logger.debug(f"[OTOKIMALL] 가격 {price}원, 판매중으로 판정")
 
             return {
                 'status': status,
@@ -1065,10 +955,10 @@ class ProductMonitor:
                 try:
                     stock_count = int(stock_value)
                     if stock_count == 0:
-                        print(f"[DONGWONMALL] 재고 0 감지")
+                        logger.debug(f"[DONGWONMALL] 재고 0 감지")
                         has_zero_stock = True
                     elif stock_count > 0:
-                        print(f"[DONGWONMALL] 재고 {stock_count}개 확인 → 판매중")
+                        logger.debug(f"[DONGWONMALL] 재고 {stock_count}개 확인 → 판매중")
                         # 재고가 있으면 확실히 판매중
                         return {
                             'status': 'available',
@@ -1077,14 +967,14 @@ class ProductMonitor:
                             'details': '정상'
                         }
                 except (ValueError, TypeError):
-                    print(f"[DONGWONMALL] leftCnt 파싱 실패: {stock_value}")
+                    logger.debug(f"[DONGWONMALL] leftCnt 파싱 실패: {stock_value}")
 
             # 2. 판매상태 코드 확인 (PB_COM_CD: 01=판매중)
             status_input = soup.find('input', id='PB_COM_CD')
             if status_input:
                 status_code = status_input.get('value', '01')
                 if status_code != '01':
-                    print(f"[DONGWONMALL] 판매상태 코드 {status_code}")
+                    logger.debug(f"[DONGWONMALL] 판매상태 코드 {status_code}")
                     has_invalid_status_code = True
 
             # 3. 상품 상세 영역 내의 구매 버튼만 확인 (관련 상품 제외)
@@ -1099,7 +989,7 @@ class ProductMonitor:
             for btn in buy_buttons:
                 btn_text = btn.get_text(strip=True).lower()
                 if '품절' in btn_text or 'sold out' in btn_text:
-                    print(f"[DONGWONMALL] 구매 버튼에서 품절 감지: '{btn_text}'")
+                    logger.debug(f"[DONGWONMALL] 구매 버튼에서 품절 감지: '{btn_text}'")
                     has_soldout_button = True
                     break
 
@@ -1108,7 +998,7 @@ class ProductMonitor:
             for script in scripts:
                 script_text = script.string or ''
                 if "sold_out = 'out of stock'" in script_text:
-                    print(f"[DONGWONMALL] JavaScript sold_out 변수 감지")
+                    logger.debug(f"[DONGWONMALL] JavaScript sold_out 변수 감지")
                     has_soldout_button = True
                     break
 
@@ -1117,7 +1007,7 @@ class ProductMonitor:
             if price and price > 100:
                 # 가격이 정상이고 명시적 품절 표시가 없으면 판매중
                 if not has_soldout_button:
-                    print(f"[DONGWONMALL] 가격 {price}원, 품절 표시 없음 → 판매중")
+                    logger.debug(f"[DONGWONMALL] 가격 {price}원, 품절 표시 없음 → 판매중")
                     return {
                         'status': 'available',
                         'price': price,
@@ -1204,7 +1094,7 @@ class ProductMonitor:
         if json_ld_result.get('product_name') and json_ld_result.get('price'):
             result.update(json_ld_result)
             result['extraction_method'] = 'json-ld'
-            print(f"[GENERIC] JSON-LD 추출 성공: {result['product_name']}, {result['price']}원")
+            logger.debug(f"[GENERIC] JSON-LD 추출 성공: {result['product_name']}, {result['price']}원")
             return result
 
         # 2단계: 표준 메타 태그 시도
@@ -1212,7 +1102,7 @@ class ProductMonitor:
         if meta_result.get('product_name') and meta_result.get('price'):
             result.update(meta_result)
             result['extraction_method'] = 'meta-tags'
-            print(f"[GENERIC] 메타 태그 추출 성공: {result['product_name']}, {result['price']}원")
+            logger.debug(f"[GENERIC] 메타 태그 추출 성공: {result['product_name']}, {result['price']}원")
             return result
 
         # 3단계: Microdata 시도
@@ -1220,7 +1110,7 @@ class ProductMonitor:
         if microdata_result.get('product_name') and microdata_result.get('price'):
             result.update(microdata_result)
             result['extraction_method'] = 'microdata'
-            print(f"[GENERIC] Microdata 추출 성공: {result['product_name']}, {result['price']}원")
+            logger.debug(f"[GENERIC] Microdata 추출 성공: {result['product_name']}, {result['price']}원")
             return result
 
         # 4단계: 공통 CSS 패턴 시도
@@ -1228,7 +1118,7 @@ class ProductMonitor:
         if css_result.get('product_name') and css_result.get('price'):
             result.update(css_result)
             result['extraction_method'] = 'css-patterns'
-            print(f"[GENERIC] CSS 패턴 추출 성공: {result['product_name']}, {result['price']}원")
+            logger.debug(f"[GENERIC] CSS 패턴 추출 성공: {result['product_name']}, {result['price']}원")
             return result
 
         # 부분적 결과라도 병합 (이름만 있거나 가격만 있는 경우)
@@ -1242,10 +1132,10 @@ class ProductMonitor:
 
         if result['product_name'] or result['price']:
             result['extraction_method'] = 'partial'
-            print(f"[GENERIC] 부분 추출: 이름={result['product_name']}, 가격={result['price']}")
+            logger.debug(f"[GENERIC] 부분 추출: 이름={result['product_name']}, 가격={result['price']}")
             return result
 
-        print("[GENERIC] 모든 추출 방법 실패")
+        logger.debug("[GENERIC] 모든 추출 방법 실패")
         return None
 
     def _extract_from_json_ld(self, soup: BeautifulSoup) -> Dict:
@@ -1311,11 +1201,11 @@ class ProductMonitor:
                 except json.JSONDecodeError:
                     continue
                 except Exception as e:
-                    print(f"[JSON-LD] 파싱 오류: {e}")
+                    logger.debug(f"[JSON-LD] 파싱 오류: {e}")
                     continue
 
         except Exception as e:
-            print(f"[JSON-LD] 전체 오류: {e}")
+            logger.debug(f"[JSON-LD] 전체 오류: {e}")
 
         return result
 
@@ -1361,7 +1251,7 @@ class ProductMonitor:
                     result['status'] = 'out_of_stock'
 
         except Exception as e:
-            print(f"[META] 오류: {e}")
+            logger.debug(f"[META] 오류: {e}")
 
         return result
 
@@ -1403,7 +1293,7 @@ class ProductMonitor:
                         result['status'] = 'out_of_stock'
 
         except Exception as e:
-            print(f"[MICRODATA] 오류: {e}")
+            logger.debug(f"[MICRODATA] 오류: {e}")
 
         return result
 
@@ -1517,6 +1407,6 @@ class ProductMonitor:
                     break
 
         except Exception as e:
-            print(f"[CSS] 오류: {e}")
+            logger.debug(f"[CSS] 오류: {e}")
 
         return result
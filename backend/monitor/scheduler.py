@@ -10,19 +10,22 @@ from apscheduler.schedulers.asyncio import AsyncIOScheduler
 from apscheduler.triggers.interval import IntervalTrigger
 from datetime import datetime
 from database.db_wrapper import get_db
+from monitor import alert_state
+from monitor.price_history_retention import compact_price_history
 from monitor.product_monitor import ProductMonitor
+from utils import fetch_strategy
+from utils.metrics import timed_job
 
 
 # 스케줄러 인스턴스
 scheduler = AsyncIOScheduler()
 
-# 상품별 연속 가격 추출 실패 횟수 추적
-price_fetch_fail_counts: dict[int, int] = {}
-
 # 연속 실패 알림 임계값 (20회 = 30분 × 20 = 10시간 연속 실패 시 알림)
+# 연속 실패 횟수는 alert_states 테이블에 저장 (재시작/다중 워커에서도 유지)
 CONSECUTIVE_FAIL_THRESHOLD = 20
 
 
+@timed_job('update_selling_products_sourcing_price')
 async def update_selling_products_sourcing_price():
     """
     판매 상품의 소싱가를 자동으로 업데이트하고 판매가를 자동 조정
@@ -95,28 +98,40 @@ async def update_selling_products_sourcing_price():
                 new_price = result.get('price')
                 details = result.get('details', '')
 
-                # 판매종료/품절 상태 감지 시 알림
+                # 판매종료/품절 상태 감지 시 알림 (상태가 바뀔 때만, 같은 상태가 계속되면 요약으로)
                 if status in ['discontinued', 'out_of_stock']:
                     print(f"[ALERT] ID#{product_id}: 상품 상태 이상 - {status} ({details})")
                     try:
-                        from notifications.notifier import send_notification
-                        send_notification(
-                            notification_type='product_unavailable',
-                            message=f"소싱 상품 상태 이상: {product_name}",
-                            product_id=product_id,
-                            product_name=product_name,
-                            sourcing_url=sourcing_url,
-                            status=status,
-                            details=details
+                        decision = await asyncio.to_thread(
+                            alert_state.record_problem, product_id, 'product_unavailable', status, details
                         )
-                        print(f"[ALERT] ID#{product_id}: 상품 상태 알림 발송됨")
+                        if decision.notify:
+                            from notifications.notifier import send_notification
+                            send_notification(
+                                notification_type='product_unavailable',
+                                message=f"소싱 상품 상태 이상: {product_name}",
+                                product_id=product_id,
+                                product_name=product_name,
+                                sourcing_url=sourcing_url,
+                                status=status,
+                                details=details
+                            )
+                            print(f"[ALERT] ID#{product_id}: 상품 상태 알림 발송됨")
                     except Exception as notify_err:
                         print(f"[WARN] 알림 발송 실패: {notify_err}")
+                elif status == 'available':
+                    try:
+                        if await asyncio.to_thread(alert_state.resolve, product_id, 'product_unavailable'):
+                            print(f"[ALERT] ID#{product_id}: 상품 상태 정상화")
+                    except Exception as state_err:
+                        print(f"[WARN] 알림 상태 갱신 실패: {state_err}")
 
                 if new_price and new_price > 0:
                     # 가격 추출 성공 - 실패 카운트 초기화
-                    if product_id in price_fetch_fail_counts:
-                        del price_fetch_fail_counts[product_id]
+                    try:
+                        await asyncio.to_thread(alert_state.resolve, product_id, 'price_fetch_fail')
+                    except Exception as state_err:
+                        print(f"[WARN] 알림 상태 갱신 실패: {state_err}")
 
                     # 가격이 변경되었으면 업데이트
                     if old_price != new_price:
@@ -155,13 +170,16 @@ async def update_selling_products_sourcing_price():
                     success_count += 1
                 else:
                     # 가격 추출 실패 - 실패 카운트 증가
-                    price_fetch_fail_counts[product_id] = price_fetch_fail_counts.get(product_id, 0) + 1
-                    fail_count = price_fetch_fail_counts[product_id]
+                    decision = await asyncio.to_thread(
+                        alert_state.record_problem, product_id, 'price_fetch_fail', 'failing',
+                        threshold=CONSECUTIVE_FAIL_THRESHOLD
+                    )
+                    fail_count = decision.fail_count
 
                     print(f"[WARN] ID#{product_id}: 가격 정보를 가져올 수 없습니다 (연속 {fail_count}회 실패)")
 
-                    # 연속 5회 실패 시 디스코드 알림
-                    if fail_count == CONSECUTIVE_FAIL_THRESHOLD:
+                    # 연속 실패가 임계값에 도달하면 알림 (해제 전까지 한 번만)
+                    if decision.notify:
                         try:
                             from notifications.notifier import send_notification
                             send_notification(
@@ -209,6 +227,41 @@ async def update_selling_products_sourcing_price():
         traceback.print_exc()
 
 
+@timed_job('monitor_alert_digest')
+async def monitor_alert_digest_job():
+    """해제되지 않은 모니터링 알림 요약 발송"""
+    try:
+        message = await asyncio.to_thread(alert_state.build_digest)
+        if message:
+            from notifications.notifier import send_notification
+            send_notification('monitor_alert_digest', message)
+            print("[MONITOR] 진행 중인 알림 요약 발송")
+    except Exception as e:
+        print(f"[ERROR] 알림 요약 발송 실패: {e}")
+
+
+@timed_job('fetch_strategy_flush')
+async def fetch_strategy_flush_job():
+    """도메인별 페이지 가져오기 전략 통계 저장 (바뀐 항목만)"""
+    try:
+        await asyncio.to_thread(fetch_strategy.flush_stats)
+    except Exception as e:
+        print(f"[ERROR] 가져오기 전략 통계 저장 실패: {e}")
+
+
+@timed_job('price_history_compaction')
+async def price_history_compaction_job():
+    """가격 이력 시간/일 단위 요약 + 보존 기간 지난 이력/읽은 알림 삭제"""
+    try:
+        result = await asyncio.to_thread(compact_price_history)
+        print(f"[MONITOR] 가격 이력 압축 완료: 요약 {result['hourly_buckets']}/{result['daily_buckets']}건, "
+              f"삭제 원본 {result['raw_deleted']}건/시간 요약 {result['hourly_deleted']}건/알림 {result['notifications_deleted']}건 "
+              f"({result['elapsed_ms']}ms)")
+    except Exception as e:
+        print(f"[ERROR] 가격 이력 압축 실패: {e}")
+
+
+@timed_job('auto_check_products')
 async def auto_check_products_job():
     """활성화된 모든 모니터링 상품 자동 체크"""
     print(f"\n[MONITOR] ===== 자동 상품 체크 시작: {datetime.now()} =====")
@@ -324,6 +377,39 @@ def start_scheduler():
         )
         print(f"[MONITOR] 판매 상품 자동가격조정 작업 등록 ({selling_product_interval}분마다)")
 
+        # 진행 중인 알림 요약 (개별 알림은 상태가 바뀔 때만 발송)
+        scheduler.add_job(
+            monitor_alert_digest_job,
+            trigger=IntervalTrigger(hours=alert_state.DIGEST_HOURS),
+            id="monitor_alert_digest",
+            name="모니터링 알림 요약",
+            replace_existing=True,
+            misfire_grace_time=600
+        )
+        print(f"[MONITOR] 알림 요약 작업 등록 ({alert_state.DIGEST_HOURS}시간마다)")
+
+        # 가격 이력 압축/보존 (DB 크기 유지)
+        scheduler.add_job(
+            price_history_compaction_job,
+            trigger=IntervalTrigger(hours=1),
+            id="monitor_price_history_compaction",
+            name="가격 이력 압축/보존",
+            replace_existing=True,
+            misfire_grace_time=600
+        )
+        print("[MONITOR] 가격 이력 압축 작업 등록 (1시간마다)")
+
+        # 가져오기 전략 통계 저장 (재시작 후에도 도메인별 전략 유지)
+        scheduler.add_job(
+            fetch_strategy_flush_job,
+            trigger=IntervalTrigger(seconds=fetch_strategy.FETCH_STATS_FLUSH_SECONDS),
+            id="monitor_fetch_strategy_flush",
+            name="가져오기 전략 통계 저장",
+            replace_existing=True,
+            misfire_grace_time=60
+        )
+        print(f"[MONITOR] 가져오기 전략 통계 저장 작업 등록 ({fetch_strategy.FETCH_STATS_FLUSH_SECONDS}초마다)")
+
         # 스케줄러 시작
         scheduler.start()
         print("[MONITOR] 스케줄러 시작 완료")
@@ -0,0 +1,214 @@
+"""
+소싱처 레지스트리
+
+URL의 호스트를 한 번 파싱해 소싱처 설명자(SourceDescriptor)로 변환합니다.
+ProductMonitor / URL 정보 추출 API가 모두 이 레지스트리로 소싱처를 판별합니다.
+
+- 판별: 호스트의 도메인 접미사를 긴 것부터 dict에서 조회 (mfront.homeplus.co.kr → homeplus.co.kr → co.kr)
+- 새 소싱처 추가: SOURCES에 SourceDescriptor 하나만 추가
+- 전용 스크래퍼 인스턴스는 소싱처별로 한 번만 생성해 재사용
+- 요청 간격 제한: SOURCE_MIN_INTERVALS="gmarket=0.5,ssg=1" (초, 기본 제한 없음)
+"""
+
+import importlib
+import os
+import threading
+import time
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Dict, Optional, Tuple
+from urllib.parse import urlsplit
+
+from logger import get_logger
+
+logger = get_logger(__name__)
+
+SOURCE_MIN_INTERVALS = os.getenv('SOURCE_MIN_INTERVALS', '')
+
+
+@dataclass(frozen=True)
+class SourceDescriptor:
+    name: str
+    domains: Tuple[str, ...] = ()
+    needs_js: bool = False  # JavaScript 렌더링 필요 (FlareSolverr로만 가져옴)
+    scraper: Optional[str] = None  # 전용 스크래퍼 "모듈:클래스"
+    scraper_checks: bool = False  # 상태 체크에 전용 스크래퍼 우선 사용
+    scraper_only: bool = False  # 전용 스크래퍼만 사용 (HTML 가져오기 생략)
+    status_checker: Optional[str] = None  # ProductMonitor 상태 체크 메서드 이름 (없으면 범용 체크)
+    checker_needs_url: bool = False
+    name_selectors: Tuple[str, ...] = ()
+    price_selectors: Tuple[str, ...] = ()
+    min_price: float = 0  # 선택자 가격이 이 값보다 커야 채택
+    price_input: Optional[Tuple[str, str]] = None  # 가격이 담긴 hidden input (id, 속성)
+    price_exclude_parent: Optional[str] = None  # 이 클래스 안의 가격(정가 영역 등)은 제외
+    thumbnail_selectors: Tuple[str, ...] = ()
+    min_interval: float = 0.0  # 같은 소싱처 요청 최소 간격(초)
+
+    @property
+    def fetch_strategy(self) -> str:
+        """'scraper' | 'flaresolverr' | 'requests'"""
+        if self.scraper_only:
+            return 'scraper'
+        return 'flaresolverr' if self.needs_js else 'requests'
+
+
+# 알 수 없는 소싱처 (범용 추출)
+GENERIC_SOURCE = SourceDescriptor(name='other')
+
+SOURCES = (
+    SourceDescriptor(
+        name='ssg', domains=('ssg.com',), needs_js=True,
+        status_checker='_check_ssg_status',
+        name_selectors=('.cdtl_info_tit', '.product_title'),
+        price_selectors=('.cdtl_price .ssg_price', '.ssg_price'), min_price=1000,
+        price_exclude_parent='cdtl_old_price',
+    ),
+    # 홈플러스 일반몰(mfront)은 전용 스크래퍼 사용, 나머지 홈플러스 도메인은 트레이더스
+    SourceDescriptor(
+        name='homeplus', domains=('mfront.homeplus.co.kr',),
+        scraper='sourcing.homeplus:HomeplusScraper', scraper_checks=True, scraper_only=True,
+        name_selectors=('.prodNameBox', 'h1'),
+        price_selectors=('.price', '.sale-price'),
+    ),
+    SourceDescriptor(
+        name='traders', domains=('homeplus.co.kr',),
+        status_checker='_check_homeplus_status',
+        name_selectors=('.prodNameBox', 'h1'),
+        price_selectors=('.price', '.sale-price'),
+    ),
+    SourceDescriptor(
+        name='11st', domains=('11st.co.kr',), needs_js=True,
+        status_checker='_check_11st_status',
+        name_selectors=('.c_product_info_title h1', '.l_product_title h1', 'h1.title'),
+        price_selectors=('.price', '.c_product_price .price strong', '.l_product_price strong'),
+    ),
+    SourceDescriptor(
+        name='lotteon', domains=('lotteon.com',), needs_js=True,
+        status_checker='_check_lotteon_status',
+        name_selectors=('h1', '.product-name'),
+        price_selectors=('.price', '[class*="price"]'), min_price=1000,
+    ),
+    # G마켓은 전용 스크래퍼 우선, 실패 시 HTML 파싱
+    SourceDescriptor(
+        name='gmarket', domains=('gmarket.co.kr',),
+        scraper='sourcing.gmarket:GmarketScraper', scraper_checks=True,
+        status_checker='_check_gmarket_status', checker_needs_url=True,
+        name_selectors=('.itemtit', 'h1'),
+        price_selectors=('.price_sect .price strong', '.item_price strong', '.price strong'), min_price=1000,
+    ),
+    SourceDescriptor(
+        name='auction', domains=('auction.co.kr',),
+        status_checker='_check_auction_status', checker_needs_url=True,
+        name_selectors=('.itemtit', 'h1'),
+        price_selectors=('.price_sect .price strong', '.item_price strong', '.price strong'), min_price=1000,
+    ),
+    SourceDescriptor(
+        name='gsshop', domains=('gsshop.com',), needs_js=True,
+        status_checker='_check_gsshop_status',
+        name_selectors=('.prd-btns h2', '.goods-header h2', 'h1'),
+        price_selectors=('.price-definition__amount', '.price-amount', '.price strong'),
+    ),
+    SourceDescriptor(
+        name='cjthemarket', domains=('cjthemarket.com',), needs_js=True,
+        status_checker='_check_cjthemarket_status',
+        name_selectors=('.prd-name', '.product-name', 'h1'),
+        price_selectors=('.prd-price strong', '.price-area .sale-price', '.final-price'),
+    ),
+    SourceDescriptor(
+        name='otokimall', domains=('otokimall.com',), needs_js=True,
+        status_checker='_check_otokimall_status',
+        name_selectors=('.prd_name', '.product-name', 'h1', 'h2'),
+        price_selectors=('.price', '.sale_price', '.prd_price'), min_price=100,
+        price_input=('pdPrice', 'data-finalprice'),
+        thumbnail_selectors=('#prdImage img', '.product-image img', '.prd-img img'),
+    ),
+    SourceDescriptor(
+        name='dongwonmall', domains=('dongwonmall.com',), needs_js=True,
+        status_checker='_check_dongwonmall_status',
+        name_selectors=('h1', 'input[name="product_nm"]', '.product-name', '.prd-name'),
+        price_selectors=('.userPriceText', '.sale-price', '.price'), min_price=100,
+        price_input=('userPrice', 'value'),
+        thumbnail_selectors=('#mainImg img', '.product_image img', '.photo img'),
+    ),
+    # 스마트스토어는 CAPTCHA로 자동 접근 차단, 도매꾹은 가격 수동 입력 (URL 정보 추출 API에서 처리)
+    SourceDescriptor(name='smartstore', domains=('smartstore.naver.com',)),
+    SourceDescriptor(name='domeggook', domains=('domeggook.com',), scraper='sourcing.domeggook:DomeggookScraper'),
+)
+
+_BY_NAME: Dict[str, SourceDescriptor] = {source.name: source for source in SOURCES}
+_BY_DOMAIN: Dict[str, SourceDescriptor] = {domain: source for source in SOURCES for domain in source.domains}
+
+
+def _parse_intervals(spec: str) -> Dict[str, float]:
+    intervals = {}
+    for item in spec.split(','):
+        name, _, value = item.partition('=')
+        try:
+            if name.strip():
+                intervals[name.strip()] = float(value)
+        except ValueError:
+            logger.warning(f"[소싱처] 잘못된 요청 간격 설정 무시: {item}")
+    return intervals
+
+
+_min_intervals = _parse_intervals(SOURCE_MIN_INTERVALS)
+
+
+@lru_cache(maxsize=4096)
+def resolve_host(host: str) -> SourceDescriptor:
+    """호스트 → 소싱처 (가장 긴 도메인 접미사 일치)"""
+    labels = host.lower().rstrip('.').split('.')
+    for i in range(len(labels) - 1):
+        source = _BY_DOMAIN.get('.'.join(labels[i:]))
+        if source is not None:
+            return source
+    return GENERIC_SOURCE
+
+
+def resolve_source(url: str) -> SourceDescriptor:
+    """URL → 소싱처 (스킴 없는 URL도 허용)"""
+    if not url:
+        return GENERIC_SOURCE
+    host = urlsplit(url if '//' in url else '//' + url).hostname
+    return resolve_host(host) if host else GENERIC_SOURCE
+
+
+def get_source(name: str) -> SourceDescriptor:
+    """소싱처 이름 → 설명자 (알 수 없으면 범용)"""
+    return _BY_NAME.get(name, GENERIC_SOURCE)
+
+
+_scrapers: Dict[str, object] = {}
+_scrapers_lock = threading.Lock()
+
+
+def get_scraper(source: SourceDescriptor):
+    """소싱처 전용 스크래퍼 (소싱처별 인스턴스 1개 재사용, 없으면 None)"""
+    if not source.scraper:
+        return None
+    scraper = _scrapers.get(source.name)
+    if scraper is None:
+        with _scrapers_lock:
+            scraper = _scrapers.get(source.name)
+            if scraper is None:
+                module_name, _, class_name = source.scraper.partition(':')
+                scraper = getattr(importlib.import_module(module_name), class_name)()
+                _scrapers[source.name] = scraper
+    return scraper
+
+
+_last_request: Dict[str, float] = {}
+_throttle_lock = threading.Lock()
+
+
+def wait_turn(source: SourceDescriptor):
+    """같은 소싱처 요청이 최소 간격을 지키도록 대기 (간격 미설정 시 즉시 반환)"""
+    interval = _min_intervals.get(source.name, source.min_interval)
+    if interval <= 0:
+        return
+    with _throttle_lock:
+        now = time.monotonic()
+        scheduled = max(now, _last_request.get(source.name, 0.0) + interval)
+        _last_request[source.name] = scheduled
+    if scheduled > now:
+        time.sleep(scheduled - now)
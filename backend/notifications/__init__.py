@@ -11,6 +11,11 @@ from .notifier import (
     format_order_sync_alert,
     format_inventory_alert
 )
+from .dispatcher import (
+    get_dispatcher,
+    start_notification_dispatcher,
+    stop_notification_dispatcher
+)
 
 __all__ = [
     'send_notification',
@@ -19,5 +24,8 @@ __all__ = [
     'format_margin_alert',
     'format_rpa_alert',
     'format_order_sync_alert',
-    'format_inventory_alert'
+    'format_inventory_alert',
+    'get_dispatcher',
+    'start_notification_dispatcher',
+    'stop_notification_dispatcher'
 ]
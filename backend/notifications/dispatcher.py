@@ -0,0 +1,436 @@
+"""
+비동기 알림 디스패처
+
+send_notification()이 이벤트 루프를 막지 않도록 알림을 큐에 넣고
+백그라운드 태스크가 httpx.AsyncClient로 발송합니다.
+
+- Webhook별 큐/워커: 한 Webhook이 느리거나 속도 제한에 걸려도 다른 Webhook은 영향 없음
+- 속도 제한 대응: 429 응답의 Retry-After/retry_after, Discord X-RateLimit-* 헤더를 지켜 대기
+- 요약 발송: 짧은 시간에 같은 유형 알림이 몰리면 (예: 가격 변동 30건) 요약 1건으로 발송
+- Webhook 설정 캐시: 매 알림마다 DB를 조회하지 않음 (설정 변경 시 invalidate_webhook_cache)
+- 로그 일괄 기록: webhook_logs를 모아서 한 번에 INSERT
+- 서킷 브레이커: Webhook 호스트가 연속으로 5xx/연결 실패면 재시도 없이 바로 실패 처리
+
+Usage:
+    await start_notification_dispatcher()   # lifespan 시작 시
+    send_notification('price_change', ...)  # 어디서든 (스레드 포함) 즉시 반환
+    await stop_notification_dispatcher()    # 종료 시 남은 알림 발송 후 중지
+"""
+
+import asyncio
+import json
+import os
+import threading
+import time
+from typing import Dict, List, Optional
+from urllib.parse import urlsplit
+
+import httpx
+
+from utils.circuit_breaker import get_breaker
+
+
+# Webhook 설정 캐시 유효 시간 (초)
+WEBHOOK_CONFIG_TTL = int(os.getenv('WEBHOOK_CONFIG_TTL', '60'))
+
+# 요약 대상 알림을 모으는 시간 (초)
+COALESCE_WINDOW = float(os.getenv('NOTIFICATION_COALESCE_WINDOW', '5'))
+
+# 같은 유형이 이 건수 이상 모이면 요약 1건으로 발송
+COALESCE_THRESHOLD = int(os.getenv('NOTIFICATION_COALESCE_THRESHOLD', '3'))
+
+# 큐 최대 길이 (넘치면 버림)
+QUEUE_SIZE = 1000
+
+# 발송 실패 시 최대 시도 횟수 (429 대기는 포함하지 않음)
+MAX_ATTEMPTS = 3
+
+# 1건 발송 중 429로 기다릴 수 있는 총 시간 (초, 넘으면 실패 처리)
+RATE_LIMIT_MAX_WAIT = float(os.getenv('NOTIFICATION_RATE_LIMIT_MAX_WAIT', '60'))
+
+# 로그 일괄 기록 주기(초)/크기
+LOG_FLUSH_INTERVAL = 2.0
+LOG_BATCH_SIZE = 100
+
+# 종료 시 남은 알림 발송 대기 시간 (초)
+DRAIN_TIMEOUT = 10.0
+
+REQUEST_TIMEOUT = 5.0
+
+
+# ========================================
+# Webhook 설정 캐시
+# ========================================
+
+_webhook_cache: Optional[List[Dict]] = None
+_webhook_cache_at = 0.0
+_webhook_cache_lock = threading.Lock()
+
+
+def get_webhook_targets() -> List[Dict]:
+    """활성화된 Webhook 설정 (TTL 캐시)"""
+    global _webhook_cache, _webhook_cache_at
+    with _webhook_cache_lock:
+        if _webhook_cache is not None and time.monotonic() - _webhook_cache_at < WEBHOOK_CONFIG_TTL:
+            return _webhook_cache
+
+    from database.db_wrapper import get_db
+    webhooks = get_db().get_all_webhook_settings(enabled_only=True)
+
+    with _webhook_cache_lock:
+        _webhook_cache = webhooks
+        _webhook_cache_at = time.monotonic()
+    return webhooks
+
+
+def invalidate_webhook_cache():
+    """Webhook 설정 저장/토글/삭제 후 호출"""
+    global _webhook_cache
+    with _webhook_cache_lock:
+        _webhook_cache = None
+
+
+# ========================================
+# 발송
+# ========================================
+
+def _payload(webhook_type: str, message) -> Dict:
+    if isinstance(message, str):
+        return {"text": message} if webhook_type == 'slack' else {"content": message}
+    return message
+
+
+def _retry_after(response: httpx.Response) -> float:
+    """429 응답의 대기 시간 (Discord는 본문 retry_after, Slack은 Retry-After 헤더)"""
+    try:
+        body = response.json()
+        if isinstance(body, dict) and body.get('retry_after') is not None:
+            return float(body['retry_after'])
+    except ValueError:
+        pass
+    try:
+        return float(response.headers.get('Retry-After', 1))
+    except ValueError:
+        return 1.0
+
+
+class _WebhookChannel:
+    """Webhook 1개의 큐와 속도 제한 상태"""
+
+    def __init__(self, webhook: Dict):
+        self.webhook = webhook
+        self.queue: asyncio.Queue = asyncio.Queue(maxsize=QUEUE_SIZE)
+        self.blocked_until = 0.0
+        self.task: Optional[asyncio.Task] = None
+
+    @property
+    def webhook_type(self) -> str:
+        return self.webhook['webhook_type']
+
+    async def wait_rate_limit(self):
+        delay = self.blocked_until - time.monotonic()
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+    def update_rate_limit(self, response: httpx.Response):
+        # Discord: 남은 요청이 0이면 리셋까지 대기
+        remaining = response.headers.get('X-RateLimit-Remaining')
+        reset_after = response.headers.get('X-RateLimit-Reset-After')
+        if remaining == '0' and reset_after:
+            try:
+                self.blocked_until = max(self.blocked_until, time.monotonic() + float(reset_after))
+            except ValueError:
+                pass
+
+
+async def deliver(
+    client: httpx.AsyncClient,
+    webhook_type: str,
+    webhook_url: str,
+    message,
+    channel: Optional[_WebhookChannel] = None
+) -> Optional[str]:
+    """
+    Webhook 1건 발송 (429는 지정 시간만큼 대기 후 재시도, 그 외 실패는 지수 백오프)
+
+    429 대기는 시도 횟수에 넣지 않는 대신 총 대기 시간이 RATE_LIMIT_MAX_WAIT를
+    넘으면 실패로 처리합니다. (계속 429를 주는 서버에서 무한히 재시도하지 않도록)
+
+    Returns:
+        None이면 성공, 실패 시 오류 내용
+    """
+    payload = _payload(webhook_type, message)
+    breaker = get_breaker(f"webhook:{urlsplit(webhook_url).hostname}")
+    error = None
+    attempt = 0
+    rate_limit_waited = 0.0
+    while attempt < MAX_ATTEMPTS:
+        if channel:
+            await channel.wait_rate_limit()
+        if not breaker.allow():
+            error = f"Webhook 서버 장애로 발송 일시 차단 ({breaker.retry_after():.0f}초 후 재시도)"
+            break
+        try:
+            response = await client.post(webhook_url, json=payload, timeout=REQUEST_TIMEOUT)
+            if channel:
+                channel.update_rate_limit(response)
+
+            # 응답이 온 이상(4xx/429 포함) 서버는 살아 있음
+            if response.status_code >= 500:
+                breaker.record_failure(f"Status: {response.status_code}")
+            else:
+                breaker.record_success()
+
+            if response.status_code in (200, 204):
+                return None
+            if response.status_code == 429:
+                delay = _retry_after(response)
+                if rate_limit_waited + delay > RATE_LIMIT_MAX_WAIT:
+                    error = f"Status: 429, 속도 제한 대기 한도 초과 ({rate_limit_waited + delay:.1f}초 > {RATE_LIMIT_MAX_WAIT:.1f}초)"
+                    break
+                rate_limit_waited += delay
+                print(f"[Webhook RateLimit] {webhook_type}: {delay:.1f}초 대기")
+                if channel:
+                    channel.blocked_until = time.monotonic() + delay
+                else:
+                    await asyncio.sleep(delay)
+                continue
+            error = f"Status: {response.status_code}, Response: {response.text[:200]}"
+            if 400 <= response.status_code < 500:
+                # 잘못된 URL/페이로드는 재시도해도 실패
+                break
+        except httpx.HTTPError as e:
+            error = f"{type(e).__name__}: {e}"
+            breaker.record_failure(error)
+
+        attempt += 1
+        if attempt < MAX_ATTEMPTS:
+            await asyncio.sleep(2 ** (attempt - 1))  # 1초, 2초
+
+    print(f"[Webhook Error] {webhook_type} 발송 실패: {error}")
+    return error or "Webhook 발송 실패"
+
+
+class NotificationDispatcher:
+    """알림 큐 → Webhook별 워커 → 로그 일괄 기록"""
+
+    def __init__(self):
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._client: Optional[httpx.AsyncClient] = None
+        self._intake: Optional[asyncio.Queue] = None
+        self._channels: Dict[int, _WebhookChannel] = {}
+        self._router_task: Optional[asyncio.Task] = None
+        self._log_task: Optional[asyncio.Task] = None
+        self._logs: List[Dict] = []
+        self._stats = {'queued': 0, 'sent': 0, 'failed': 0, 'coalesced': 0, 'dropped': 0}
+
+    @property
+    def running(self) -> bool:
+        return self._loop is not None and not self._loop.is_closed()
+
+    async def start(self):
+        if self.running:
+            return
+        self._loop = asyncio.get_running_loop()
+        self._client = httpx.AsyncClient(timeout=REQUEST_TIMEOUT)
+        self._intake = asyncio.Queue(maxsize=QUEUE_SIZE)
+        self._router_task = asyncio.create_task(self._route())
+        self._log_task = asyncio.create_task(self._flush_logs_periodically())
+
+    async def stop(self):
+        """남은 알림을 DRAIN_TIMEOUT 안에서 발송한 뒤 중지"""
+        if not self.running:
+            return
+        try:
+            await asyncio.wait_for(self._drain(), timeout=DRAIN_TIMEOUT)
+        except asyncio.TimeoutError:
+            print("[Notification] 종료 대기 시간 초과 - 남은 알림 폐기")
+
+        tasks = [self._router_task, self._log_task] + [c.task for c in self._channels.values()]
+        for task in tasks:
+            if task:
+                task.cancel()
+        await asyncio.gather(*[t for t in tasks if t], return_exceptions=True)
+        await self._flush_logs()
+        await self._client.aclose()
+        self._loop = None
+        self._channels.clear()
+
+    async def _drain(self):
+        await self._intake.join()
+        for channel in self._channels.values():
+            await channel.queue.join()
+
+    # ---------- 등록 ----------
+
+    def submit(self, notification_type: str, message: str, **kwargs) -> bool:
+        """알림 큐 등록 (어느 스레드에서 호출해도 안전, 즉시 반환)"""
+        if not self.running:
+            return False
+        item = {
+            'notification_type': notification_type,
+            'message': message,
+            'kwargs': kwargs,
+        }
+        try:
+            self._loop.call_soon_threadsafe(self._enqueue, item)
+        except RuntimeError:
+            # 루프 종료 중
+            return False
+        return True
+
+    def _enqueue(self, item: Dict):
+        try:
+            self._intake.put_nowait(item)
+            self._stats['queued'] += 1
+        except asyncio.QueueFull:
+            self._stats['dropped'] += 1
+            print(f"[Notification] 큐가 가득 차 알림 폐기: {item['notification_type']}")
+
+    # ---------- 분배 ----------
+
+    async def _route(self):
+        from notifications.notifier import webhook_accepts
+
+        while True:
+            item = await self._intake.get()
+            try:
+                webhooks = await asyncio.to_thread(get_webhook_targets)
+                for webhook in webhooks:
+                    if not webhook_accepts(webhook, item['notification_type']):
+                        continue
+                    channel = self._channel_for(webhook)
+                    try:
+                        channel.queue.put_nowait(item)
+                    except asyncio.QueueFull:
+                        self._stats['dropped'] += 1
+            except Exception as e:
+                print(f"[Notification Error] 알림 분배 실패: {e}")
+            finally:
+                self._intake.task_done()
+
+    def _channel_for(self, webhook: Dict) -> _WebhookChannel:
+        channel = self._channels.get(webhook['id'])
+        if channel is None:
+            channel = _WebhookChannel(webhook)
+            channel.task = asyncio.create_task(self._run_channel(channel))
+            self._channels[webhook['id']] = channel
+        else:
+            # URL 변경 등 최신 설정 반영
+            channel.webhook = webhook
+        return channel
+
+    async def _collect(self, channel: _WebhookChannel) -> List[Dict]:
+        """
+        큐에서 알림을 꺼냄
+
+        요약 대상 유형이 있으면 COALESCE_WINDOW 동안 더 모으고, 아니면 이미 쌓인 것만 가져옴
+        """
+        from notifications.notifier import DIGEST_TYPES
+
+        batch = [await channel.queue.get()]
+        deadline = time.monotonic() + COALESCE_WINDOW
+        while True:
+            try:
+                batch.append(channel.queue.get_nowait())
+                continue
+            except asyncio.QueueEmpty:
+                pass
+            remaining = deadline - time.monotonic()
+            if remaining <= 0 or not any(i['notification_type'] in DIGEST_TYPES for i in batch):
+                return batch
+            try:
+                batch.append(await asyncio.wait_for(channel.queue.get(), timeout=remaining))
+            except asyncio.TimeoutError:
+                return batch
+
+    async def _run_channel(self, channel: _WebhookChannel):
+        from notifications.notifier import DIGEST_TYPES, format_notification, format_notification_digest
+
+        while True:
+            batch = await self._collect(channel)
+            try:
+                # 유형별로 묶되 먼저 들어온 순서 유지
+                groups: Dict[str, List[Dict]] = {}
+                for item in batch:
+                    groups.setdefault(item['notification_type'], []).append(item)
+
+                for notification_type, items in groups.items():
+                    if notification_type in DIGEST_TYPES and len(items) >= COALESCE_THRESHOLD:
+                        formatted = format_notification_digest(notification_type, items)
+                        self._stats['coalesced'] += len(items) - 1
+                        await self._send(channel, notification_type, f"{len(items)}건 요약", formatted)
+                        continue
+                    for item in items:
+                        formatted = format_notification(notification_type, item['message'], **item['kwargs'])
+                        await self._send(channel, notification_type, item['message'], formatted)
+            except Exception as e:
+                print(f"[Notification Error] {channel.webhook_type} 발송 중 오류: {e}")
+            finally:
+                for _ in batch:
+                    channel.queue.task_done()
+
+    async def _send(self, channel: _WebhookChannel, notification_type: str, message: str, formatted: Optional[Dict]):
+        webhook = channel.webhook
+        msg = formatted.get(webhook['webhook_type'], message) if formatted else message
+        error = await deliver(self._client, webhook['webhook_type'], webhook['webhook_url'], msg, channel)
+
+        self._stats['failed' if error else 'sent'] += 1
+        self._logs.append({
+            'webhook_id': webhook['id'],
+            'notification_type': notification_type,
+            'status': 'failed' if error else 'success',
+            'message': json.dumps(formatted, ensure_ascii=False) if formatted else message,
+            'error_details': error,
+        })
+        if len(self._logs) >= LOG_BATCH_SIZE:
+            await self._flush_logs()
+
+    # ---------- 로그 ----------
+
+    async def _flush_logs_periodically(self):
+        while True:
+            await asyncio.sleep(LOG_FLUSH_INTERVAL)
+            await self._flush_logs()
+
+    async def _flush_logs(self):
+        if not self._logs:
+            return
+        logs, self._logs = self._logs, []
+        try:
+            from database.db_wrapper import get_db
+            await asyncio.to_thread(get_db().add_webhook_logs, logs)
+        except Exception as e:
+            print(f"[Notification Error] Webhook 로그 기록 실패 ({len(logs)}건): {e}")
+
+    def get_stats(self) -> Dict:
+        return {
+            'running': self.running,
+            'pending': (self._intake.qsize() if self._intake else 0)
+                       + sum(c.queue.qsize() for c in self._channels.values()),
+            'webhooks': len(self._channels),
+            **self._stats,
+        }
+
+
+_dispatcher = NotificationDispatcher()
+
+
+def get_dispatcher() -> NotificationDispatcher:
+    return _dispatcher
+
+
+async def start_notification_dispatcher():
+    await _dispatcher.start()
+
+
+async def stop_notification_dispatcher():
+    await _dispatcher.stop()
+
+
+async def send_direct(webhook_type: str, webhook_url: str, message) -> Optional[str]:
+    """큐를 거치지 않고 즉시 발송 (테스트 알림용). None이면 성공, 실패 시 오류 내용"""
+    if _dispatcher.running:
+        return await deliver(_dispatcher._client, webhook_type, webhook_url, message)
+    async with httpx.AsyncClient(timeout=REQUEST_TIMEOUT) as client:
+        return await deliver(client, webhook_type, webhook_url, message)
@@ -987,6 +987,199 @@ def format_new_order_alert(
     return {"slack": slack_message, "discord": discord_message}
 
 
+# 여러 건이 짧은 시간에 몰리면 요약 1건으로 합쳐 보낼 수 있는 알림 유형
+DIGEST_TYPES = {
+    'margin_alert',
+    'price_change',
+    'price_adjustment',
+    'price_fetch_fail',
+    'product_unavailable',
+    'inventory_out_of_stock',
+    'inventory_restock',
+    'new_order',
+}
+
+# 요약 메시지에 개별 항목을 나열할 최대 건수
+DIGEST_MAX_LINES = 20
+
+DIGEST_TITLES = {
+    'margin_alert': "⚠️ 역마진 발생",
+    'price_change': "💱 가격 변동 감지",
+    'price_adjustment': "💰 자동 가격 조정",
+    'price_fetch_fail': "⚠️ 가격 추출 연속 실패",
+    'product_unavailable': "🚫 상품 판매 불가",
+    'inventory_out_of_stock': "📦 품절",
+    'inventory_restock': "✅ 재입고",
+    'new_order': "🛒 신규 주문",
+}
+
+
+def format_notification(notification_type: str, message: str = '', **kwargs) -> Optional[Dict]:
+    """
+    알림 유형별 Slack/Discord 메시지 포맷팅
+
+    Returns:
+        {"slack": ..., "discord": ...} 또는 지원하지 않는 유형이면 None
+    """
+    formatted_messages = None
+
+    if notification_type == 'margin_alert':
+        formatted_messages = format_margin_alert(
+            product_name=kwargs.get('product_name', ''),
+            sourcing_price=kwargs.get('sourcing_price', 0),
+            selling_price=kwargs.get('selling_price', 0),
+            loss=kwargs.get('loss', 0)
+        )
+    elif notification_type in ['rpa_success', 'rpa_failure']:
+        status = 'success' if notification_type == 'rpa_success' else 'failed'
+        formatted_messages = format_rpa_alert(
+            order_number=kwargs.get('order_number', ''),
+            source=kwargs.get('source', ''),
+            status=status,
+            execution_time=kwargs.get('execution_time', 0),
+            product_name=kwargs.get('product_name'),
+            error=kwargs.get('error')
+        )
+    elif notification_type == 'order_sync':
+        formatted_messages = format_order_sync_alert(
+            market=kwargs.get('market', '전체'),
+            collected_count=kwargs.get('collected_count', 0),
+            success_count=kwargs.get('success_count', 0),
+            fail_count=kwargs.get('fail_count', 0)
+        )
+    elif notification_type in ['inventory_out_of_stock', 'inventory_restock']:
+        alert_type = 'restock' if notification_type == 'inventory_restock' else 'out_of_stock'
+        formatted_messages = format_inventory_alert(
+            product_name=kwargs.get('product_name', ''),
+            alert_type=alert_type,
+            current_price=kwargs.get('current_price')
+        )
+    elif notification_type == 'price_change':
+        formatted_messages = format_price_change_alert(
+            product_name=kwargs.get('product_name', ''),
+            old_price=kwargs.get('old_price', 0),
+            new_price=kwargs.get('new_price', 0),
+            change_percent=kwargs.get('change_percent', 0)
+        )
+    elif notification_type == 'price_adjustment':
+        formatted_messages = format_price_adjustment_alert(
+            product_name=kwargs.get('product_name', ''),
+            old_price=kwargs.get('old_price', 0),
+            new_price=kwargs.get('new_price', 0),
+            margin_rate=kwargs.get('margin_rate', 0),
+            sourcing_price=kwargs.get('sourcing_price', 0),
+            playauto_updated=kwargs.get('playauto_updated', False)
+        )
+    elif notification_type == 'bulk_price_adjustment':
+        formatted_messages = format_bulk_price_adjustment_alert(
+            adjusted_count=kwargs.get('adjusted_count', 0),
+            target_margin=kwargs.get('target_margin', 30.0)
+        )
+    elif notification_type == 'new_order':
+        formatted_messages = format_new_order_alert(
+            order_number=kwargs.get('order_number', ''),
+            market=kwargs.get('market', ''),
+            customer_name=kwargs.get('customer_name', ''),
+            total_amount=kwargs.get('total_amount', 0),
+            items=kwargs.get('items', [])
+        )
+    elif notification_type == 'price_fetch_fail':
+        formatted_messages = format_price_fetch_fail_alert(
+            product_id=kwargs.get('product_id', 0),
+            product_name=kwargs.get('product_name', ''),
+            sourcing_url=kwargs.get('sourcing_url', ''),
+            fail_count=kwargs.get('fail_count', 0)
+        )
+    elif notification_type == 'product_unavailable':
+        formatted_messages = format_product_unavailable_alert(
+            product_id=kwargs.get('product_id', 0),
+            product_name=kwargs.get('product_name', ''),
+            sourcing_url=kwargs.get('sourcing_url', ''),
+            status=kwargs.get('status', 'discontinued'),
+            details=kwargs.get('details', '')
+        )
+
+    return formatted_messages
+
+
+def _digest_line(notification_type: str, message: str, kwargs: Dict) -> str:
+    name = kwargs.get('product_name') or kwargs.get('order_number') or ''
+    if notification_type in ('price_change', 'price_adjustment') and 'new_price' in kwargs:
+        line = f"{name}: {int(kwargs.get('old_price') or 0):,}원 → {int(kwargs['new_price'] or 0):,}원"
+        if notification_type == 'price_change':
+            line += f" ({kwargs.get('change_percent', 0):+.1f}%)"
+        return line
+    if notification_type == 'margin_alert':
+        return f"{name}: 손실 {int(kwargs.get('loss') or 0):,}원"
+    if notification_type == 'price_fetch_fail':
+        return f"#{kwargs.get('product_id', 0)} {name}: {kwargs.get('fail_count', 0)}회 연속 실패"
+    if notification_type == 'new_order':
+        return f"{kwargs.get('market', '')} {name}: {int(kwargs.get('total_amount') or 0):,}원"
+    return name or message
+
+
+def format_notification_digest(notification_type: str, items: List[Dict]) -> Dict:
+    """
+    같은 유형의 알림 여러 건을 요약 메시지 1건으로 포맷팅
+
+    Args:
+        items: [{"message": str, "kwargs": dict}, ...]
+    """
+    title = f"{DIGEST_TITLES.get(notification_type, '🔔 알림')} {len(items)}건"
+    lines = [
+        f"• {_digest_line(notification_type, item['message'], item['kwargs'])}"
+        for item in items[:DIGEST_MAX_LINES]
+    ]
+    if len(items) > DIGEST_MAX_LINES:
+        lines.append(f"… 외 {len(items) - DIGEST_MAX_LINES}건")
+    body = "\n".join(lines)
+
+    slack_message = {
+        "text": title,
+        "blocks": [
+            {"type": "header", "text": {"type": "plain_text", "text": title}},
+            {"type": "section", "text": {"type": "mrkdwn", "text": body[:2900]}},
+            {
+                "type": "context",
+                "elements": [
+                    {"type": "mrkdwn", "text": f"요약 시각: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}"}
+                ]
+            }
+        ]
+    }
+
+    discord_message = {
+        "embeds": [{
+            "title": title,
+            "description": body[:4000],
+            "color": 3447003,  # Blue
+            "timestamp": datetime.now().isoformat()
+        }]
+    }
+
+    return {"slack": slack_message, "discord": discord_message}
+
+
+# 여러 유형을 묶어 보내는 알림 → 원래 유형 (그중 하나라도 구독하면 수신)
+NOTIFICATION_TYPE_SOURCES = {
+    'monitor_alert_digest': ('product_unavailable', 'price_fetch_fail'),
+}
+
+
+def webhook_accepts(webhook: Dict, notification_type: str) -> bool:
+    """Webhook의 notification_types 설정이 이 알림 유형(또는 묶인 원래 유형)을 받는지"""
+    notification_types = webhook.get('notification_types', 'all')
+    if not notification_types or notification_types == 'all':
+        return True
+    try:
+        types_list = json.loads(notification_types) if isinstance(notification_types, str) else notification_types
+    except (TypeError, ValueError):
+        return True
+    if 'all' in types_list or notification_type in types_list:
+        return True
+    return any(source in types_list for source in NOTIFICATION_TYPE_SOURCES.get(notification_type, ()))
+
+
 def send_notification(
     notification_type: str,
     message: str,
@@ -995,6 +1188,10 @@ def send_notification(
     """
     범용 알림 발송 함수
 
+    서버 실행 중(디스패처 동작 중)에는 비동기 디스패처 큐에 넣고 바로 반환합니다.
+    (Webhook별 큐, 속도 제한 대응, 같은 유형 알림 요약, 로그 일괄 기록)
+    디스패처가 없는 스크립트 환경에서는 기존처럼 동기 발송합니다.
+
     Args:
         notification_type: 알림 유형 ('margin_alert', 'rpa_success', 'rpa_failure',
                           'order_sync', 'inventory_out_of_stock', 'inventory_restock')
@@ -1002,96 +1199,24 @@ def send_notification(
         **kwargs: 메시지 포맷팅에 필요한 추가 파라미터
 
     Returns:
-        bool: 최소 하나의 Webhook 발송 성공 여부
+        bool: 큐 등록 성공 여부 (동기 발송 시 최소 하나의 Webhook 발송 성공 여부)
     """
     try:
-        # DB에서 활성화된 Webhook 설정 조회
+        from notifications.dispatcher import get_dispatcher, get_webhook_targets
+        dispatcher = get_dispatcher()
+        if dispatcher.running:
+            return dispatcher.submit(notification_type, message, **kwargs)
+
+        # DB에서 활성화된 Webhook 설정 조회 (짧은 TTL 캐시)
         from database.db_wrapper import get_db
         db = get_db()
-        webhooks = db.get_all_webhook_settings(enabled_only=True)
+        webhooks = get_webhook_targets()
 
         if not webhooks:
             # Webhook 설정이 없으면 조용히 반환
             return False
 
-        # 알림 유형별 메시지 포맷팅
-        formatted_messages = None
-
-        if notification_type == 'margin_alert':
-            formatted_messages = format_margin_alert(
-                product_name=kwargs.get('product_name', ''),
-                sourcing_price=kwargs.get('sourcing_price', 0),
-                selling_price=kwargs.get('selling_price', 0),
-                loss=kwargs.get('loss', 0)
-            )
-        elif notification_type in ['rpa_success', 'rpa_failure']:
-            status = 'success' if notification_type == 'rpa_success' else 'failed'
-            formatted_messages = format_rpa_alert(
-                order_number=kwargs.get('order_number', ''),
-                source=kwargs.get('source', ''),
-                status=status,
-                execution_time=kwargs.get('execution_time', 0),
-                product_name=kwargs.get('product_name'),
-                error=kwargs.get('error')
-            )
-        elif notification_type == 'order_sync':
-            formatted_messages = format_order_sync_alert(
-                market=kwargs.get('market', '전체'),
-                collected_count=kwargs.get('collected_count', 0),
-                success_count=kwargs.get('success_count', 0),
-                fail_count=kwargs.get('fail_count', 0)
-            )
-        elif notification_type in ['inventory_out_of_stock', 'inventory_restock']:
-            alert_type = 'restock' if notification_type == 'inventory_restock' else 'out_of_stock'
-            formatted_messages = format_inventory_alert(
-                product_name=kwargs.get('product_name', ''),
-                alert_type=alert_type,
-                current_price=kwargs.get('current_price')
-            )
-        elif notification_type == 'price_change':
-            formatted_messages = format_price_change_alert(
-                product_name=kwargs.get('product_name', ''),
-                old_price=kwargs.get('old_price', 0),
-                new_price=kwargs.get('new_price', 0),
-                change_percent=kwargs.get('change_percent', 0)
-            )
-        elif notification_type == 'price_adjustment':
-            formatted_messages = format_price_adjustment_alert(
-                product_name=kwargs.get('product_name', ''),
-                old_price=kwargs.get('old_price', 0),
-                new_price=kwargs.get('new_price', 0),
-                margin_rate=kwargs.get('margin_rate', 0),
-                sourcing_price=kwargs.get('sourcing_price', 0),
-                playauto_updated=kwargs.get('playauto_updated', False)
-            )
-        elif notification_type == 'bulk_price_adjustment':
-            formatted_messages = format_bulk_price_adjustment_alert(
-                adjusted_count=kwargs.get('adjusted_count', 0),
-                target_margin=kwargs.get('target_margin', 30.0)
-            )
-        elif notification_type == 'new_order':
-            formatted_messages = format_new_order_alert(
-                order_number=kwargs.get('order_number', ''),
-                market=kwargs.get('market', ''),
-                customer_name=kwargs.get('customer_name', ''),
-                total_amount=kwargs.get('total_amount', 0),
-                items=kwargs.get('items', [])
-            )
-        elif notification_type == 'price_fetch_fail':
-            formatted_messages = format_price_fetch_fail_alert(
-                product_id=kwargs.get('product_id', 0),
-                product_name=kwargs.get('product_name', ''),
-                sourcing_url=kwargs.get('sourcing_url', ''),
-                fail_count=kwargs.get('fail_count', 0)
-            )
-        elif notification_type == 'product_unavailable':
-            formatted_messages = format_product_unavailable_alert(
-                product_id=kwargs.get('product_id', 0),
-                product_name=kwargs.get('product_name', ''),
-                sourcing_url=kwargs.get('sourcing_url', ''),
-                status=kwargs.get('status', 'discontinued'),
-                details=kwargs.get('details', '')
-            )
+        formatted_messages = format_notification(notification_type, message, **kwargs)
 
         # Webhook 발송
         success_count = 0
@@ -1099,16 +1224,9 @@ def send_notification(
         for webhook in webhooks:
             webhook_type = webhook['webhook_type']
             webhook_url = webhook['webhook_url']
-            notification_types = webhook.get('notification_types', 'all')
-
-            # 알림 타입 필터링
-            if notification_types != 'all':
-                try:
-                    types_list = json.loads(notification_types) if isinstance(notification_types, str) else notification_types
-                    if notification_type not in types_list and 'all' not in types_list:
-                        continue
-                except:
-                    pass
+
+            if not webhook_accepts(webhook, notification_type):
+                continue
 
             # 메시지 발송 (지수 백오프 재시도 포함)
             try:
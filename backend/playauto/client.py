@@ -16,6 +16,11 @@ from .exceptions import (
     PlayautoTimeoutError,
     handle_http_error
 )
+from logger import get_logger
+from utils import metrics
+from utils.circuit_breaker import CircuitOpenError, get_breaker
+
+logger = get_logger(__name__)
 
 
 class PlayautoClient:
@@ -102,6 +107,12 @@ class PlayautoClient:
                 headers=self._auth_headers
             )
 
+        # PlayAuto 장애 시 타임아웃 × 재시도를 반복하지 않도록 즉시 실패
+        breaker = get_breaker("playauto")
+        if not breaker.allow():
+            raise PlayautoNetworkError("PlayAuto API 장애로 호출 일시 차단", original_error=CircuitOpenError(breaker))
+
+        started = time.perf_counter()
         try:
             # 요청 실행
             if method.upper() == "GET":
@@ -116,6 +127,12 @@ class PlayautoClient:
                 response = await self.client.delete(endpoint, json=data)
             else:
                 raise PlayautoAPIError(f"지원하지 않는 HTTP 메서드: {method}")
+            self._record_metrics(method, endpoint, str(response.status_code), started)
+            # 4xx는 요청 문제이므로 서비스 장애로 보지 않음
+            if response.status_code >= 500:
+                breaker.record_failure(f"HTTP {response.status_code}")
+            else:
+                breaker.record_success()
 
             # 응답 처리
             if response.status_code == 200 or response.status_code == 201:
@@ -131,9 +148,11 @@ class PlayautoClient:
 
         except httpx.TimeoutException as e:
             # 타임아웃 에러
+            self._record_metrics(method, endpoint, "timeout", started)
+            breaker.record_failure(f"timeout: {e}")
             if retry_count < self.max_retries:
                 # 재시도
-                print(f"[WARN] 요청 타임아웃, 재시도 {retry_count + 1}/{self.max_retries}")
+                logger.warning(f"요청 타임아웃, 재시도 {retry_count + 1}/{self.max_retries}")
                 await asyncio.sleep(2 ** retry_count)  # 지수 백오프
                 return await self._request(method, endpoint, data, params, retry_count + 1)
             else:
@@ -144,9 +163,11 @@ class PlayautoClient:
 
         except httpx.NetworkError as e:
             # 네트워크 에러
+            self._record_metrics(method, endpoint, "network_error", started)
+            breaker.record_failure(f"network: {e}")
             if retry_count < self.max_retries:
                 # 재시도
-                print(f"[WARN] 네트워크 오류, 재시도 {retry_count + 1}/{self.max_retries}")
+                logger.warning(f"네트워크 오류, 재시도 {retry_count + 1}/{self.max_retries}")
                 await asyncio.sleep(2 ** retry_count)  # 지수 백오프
                 return await self._request(method, endpoint, data, params, retry_count + 1)
             else:
@@ -163,6 +184,13 @@ class PlayautoClient:
             # 기타 예외
             raise PlayautoAPIError(f"알 수 없는 오류: {str(e)}")
 
+    @staticmethod
+    def _record_metrics(method: str, endpoint: str, outcome: str, started: float):
+        """호출 1회(재시도 포함 각 시도)의 지연 시간/결과 기록"""
+        endpoint = metrics.normalize_endpoint(endpoint)
+        metrics.PLAYAUTO_DURATION.observe(time.perf_counter() - started, method=method.upper(), endpoint=endpoint)
+        metrics.PLAYAUTO_REQUESTS.inc(method=method.upper(), endpoint=endpoint, outcome=outcome)
+
     async def get(self, endpoint: str, params: Optional[Dict] = None) -> Dict[str, Any]:
         """
         GET 요청
@@ -240,8 +268,8 @@ class PlayautoClient:
             from .auth import get_or_fetch_token
             # 토큰 발급 시도
             token, sol_no = get_or_fetch_token()
-            print(f"[SUCCESS] API 연결 테스트 성공 (sol_no: {sol_no})")
+            logger.info(f"API 연결 테스트 성공 (sol_no: {sol_no})")
             return True
         except Exception as e:
-            print(f"[ERROR] API 연결 테스트 실패: {e}")
+            logger.error(f"API 연결 테스트 실패: {e}")
             return False
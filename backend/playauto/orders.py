@@ -10,6 +10,9 @@ from datetime import datetime, timedelta
 from .client import PlayautoClient
 from .models import PlayautoOrder, OrderItem, OrdererInfo, ReceiverInfo, DeliveryInfo, PaymentInfo
 from .exceptions import PlayautoAPIError
+from logger import get_logger
+
+logger = get_logger(__name__)
 
 
 class PlayautoOrdersAPI:
@@ -90,8 +93,8 @@ class PlayautoOrdersAPI:
             body["search_type"] = kwargs.get("search_type", "partial")
 
         # POST 요청으로 변경
-        print(f"[DEBUG] PlayAuto API 호출 시작: POST /orders")
-        print(f"[DEBUG] Request Body: {body}")
+        logger.debug("PlayAuto API 호출: POST /orders (sdate=%s, edate=%s, status=%s)",
+                     body.get("sdate"), body.get("edate"), body.get("status"))
 
         try:
             if not self.client:
@@ -100,26 +103,10 @@ class PlayautoOrdersAPI:
             else:
                 response = await self.client.post("/orders", data=body)
 
-            print(f"[DEBUG] PlayAuto API 응답 받음: {type(response)}")
-            print(f"[DEBUG] Response keys: {response.keys() if isinstance(response, dict) else 'Not a dict'}")
-
-            # 응답 구조 확인
-            if isinstance(response, dict):
-                data = response.get("data", {})
-                print(f"[DEBUG] Response.data type: {type(data)}")
-                if isinstance(data, dict):
-                    print(f"[DEBUG] Response.data.orders exists: {'orders' in data}")
-                    orders = data.get("orders", [])
-                    print(f"[DEBUG] Orders count in response: {len(orders) if isinstance(orders, list) else 'Not a list'}")
-                    if orders and len(orders) > 0:
-                        print(f"[DEBUG] First order sample: {list(orders[0].keys())[:10] if isinstance(orders[0], dict) else orders[0]}")
-
             # 응답 데이터 파싱
             return self._parse_orders_response(response)
         except Exception as e:
-            print(f"[ERROR] PlayAuto API 호출 실패: {e}")
-            import traceback
-            traceback.print_exc()
+            logger.exception(f"PlayAuto API 호출 실패: {e}")
             raise
 
     async def get_order_detail(self, playauto_order_id: str) -> PlayautoOrder:
@@ -166,12 +153,10 @@ class PlayautoOrdersAPI:
             total = response.get("recordsTotal", response.get("recordsFiltered", 0))
             page = response.get("page", 1)
 
-            print(f"[DEBUG] Parsing {len(orders_data)} orders from response")
-
             # 주문 목록 파싱
             orders = [self._parse_order(order_data) for order_data in orders_data]
 
-            print(f"[DEBUG] Successfully parsed {len(orders)} orders")
+            logger.debug("주문 %d건 파싱 완료 (전체 %s건)", len(orders), total)
 
             return {
                 "success": True,
@@ -181,9 +166,7 @@ class PlayautoOrdersAPI:
             }
 
         except Exception as e:
-            print(f"[ERROR] 주문 목록 파싱 실패: {e}")
-            import traceback
-            traceback.print_exc()
+            logger.exception(f"주문 목록 파싱 실패: {e}")
             return {
                 "success": False,
                 "total": 0,
@@ -224,13 +207,6 @@ class PlayautoOrdersAPI:
             PlayautoOrder 인스턴스
         """
         try:
-            # 디버그: 주문 데이터의 금액/수량/상태 관련 필드 확인
-            debug_fields = ['pay_amt', 'sales', 'sale_price', 'total_amount', 'sale_cnt', 'qty', 'quantity', 'ord_cnt', 'shop_sale_name', 'prod_name', 'ord_status', 'carr_no']
-            debug_values = {k: order_data.get(k) for k in debug_fields}
-            print(f"[DEBUG] Order fields: {debug_values}")
-            # 전체 키 목록도 출력 (어떤 필드가 있는지 확인)
-            print(f"[DEBUG] All order keys: {list(order_data.keys())}")
-
             # 1. 주문 상품 목록 파싱
             items_data = order_data.get("items", [])
             items = []
@@ -361,9 +337,7 @@ class PlayautoOrdersAPI:
             return order
 
         except Exception as e:
-            print(f"[ERROR] 주문 파싱 실패: {e}")
-            import traceback
-            traceback.print_exc()
+            logger.exception(f"주문 파싱 실패: {e}")
 
             # 기본 주문 반환 (에러 방지)
             fallback_id = order_data.get("uniq") or order_data.get("playauto_order_id", "ERROR")
@@ -404,8 +378,7 @@ class PlayautoOrdersAPI:
             "dupl_doubt_except_yn": dupl_doubt_except_yn
         }
 
-        print(f"[DEBUG] 출고 지시 API 호출: PUT /order/instruction")
-        print(f"[DEBUG] Request Body: {data}")
+        logger.debug("출고 지시 API 호출: PUT /order/instruction (%d건)", len(bundle_codes))
 
         if not self.client:
             async with PlayautoClient() as client:
@@ -413,7 +386,7 @@ class PlayautoOrdersAPI:
         else:
             response = await self.client.put("/order/instruction", data=data)
 
-        print(f"[DEBUG] 출고 지시 응답: {response}")
+        logger.debug("출고 지시 응답: %s", response)
         return response
 
     async def update_order(self, unliq: str, update_data: Dict) -> Dict:
@@ -529,8 +502,8 @@ class PlayautoOrdersAPI:
             body["sdate"] = start_date
             body["edate"] = end_date
 
-        print(f"[DEBUG] 출고 지시 API 호출: PUT /order/instruction")
-        print(f"[DEBUG] Request Body: {body}")
+        logger.debug("출고 지시 API 호출: PUT /order/instruction (%s)",
+                     f"{len(bundle_codes)}건" if bundle_codes else f"{start_date}~{end_date}")
 
         # PUT 요청 (base_url에 이미 /api가 포함되어 있음)
         if not self.client:
@@ -539,7 +512,7 @@ class PlayautoOrdersAPI:
         else:
             response = await self.client.put("/order/instruction", data=body)
 
-        print(f"[DEBUG] 출고 지시 응답: {response}")
+        logger.debug("출고 지시 응답: %s", response)
         return response
 
     async def update_invoice(
@@ -583,8 +556,7 @@ class PlayautoOrdersAPI:
             "dupl_doubt_except_yn": dupl_doubt_except_yn
         }
 
-        print(f"[DEBUG] 송장 업데이트 API 호출: PUT /order/setInvoice")
-        print(f"[DEBUG] Request Body: {body}")
+        logger.debug("송장 업데이트 API 호출: PUT /order/setInvoice (%d건)", len(orders))
 
         # PUT 요청 (base_url에 이미 /api가 포함되어 있음)
         if not self.client:
@@ -593,7 +565,7 @@ class PlayautoOrdersAPI:
         else:
             response = await self.client.put("/order/setInvoice", data=body)
 
-        print(f"[DEBUG] 송장 업데이트 응답: {response}")
+        logger.debug("송장 업데이트 응답: %s", response)
         return response
 
 
@@ -653,7 +625,7 @@ async def fetch_and_sync_orders(
                 # 강제 동기화 시 기존 설정 삭제
                 if force and existing:
                     db.delete_playauto_setting(f"synced_order_{playauto_order_id}")
-                    print(f"[FORCE] 기존 동기화 설정 삭제: {playauto_order_id}")
+                    logger.info(f"기존 동기화 설정 삭제: {playauto_order_id}")
 
                 # 로컬 DB에 저장
                 db.sync_playauto_order_to_local(order_data)
@@ -665,9 +637,7 @@ async def fetch_and_sync_orders(
                 # 주문이 많을 때 알림 폭주 방지
 
             except Exception as e:
-                print(f"[ERROR] 주문 동기화 실패 ({playauto_order_id}): {e}")
-                import traceback
-                traceback.print_exc()
+                logger.exception(f"주문 동기화 실패 ({playauto_order_id}): {e}")
                 fail_count += 1
 
         return {
@@ -680,7 +650,7 @@ async def fetch_and_sync_orders(
         }
 
     except Exception as e:
-        print(f"[ERROR] 주문 수집 및 동기화 실패: {e}")
+        logger.error(f"주문 수집 및 동기화 실패: {e}")
         return {
             "success": False,
             "message": f"오류 발생: {str(e)}",
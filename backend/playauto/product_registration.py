@@ -4,12 +4,27 @@
 판매 상품을 플레이오토를 통해 여러 마켓에 자동 등록
 """
 
+import asyncio
+import hashlib
+import json
+import os
+import re
+import threading
+import urllib.parse
+from collections import OrderedDict
+from functools import lru_cache
 from typing import Dict, List, Optional
 from .client import PlayautoClient
 from logger import get_logger
 
 logger = get_logger(__name__)
 
+# 상품 등록 동시 요청 수 (PlayAuto API 부하 고려)
+REGISTRATION_CONCURRENCY = int(os.getenv('PLAYAUTO_REGISTRATION_CONCURRENCY', '4'))
+
+# 상세페이지 HTML 캐시 크기 (상품 수 기준)
+DETAIL_HTML_CACHE_SIZE = int(os.getenv('DETAIL_HTML_CACHE_SIZE', '256'))
+
 
 def get_infocode_for_category(category: str) -> str:
     """
@@ -152,32 +167,41 @@ class PlayautoProductRegistration:
 
     async def register_multiple_products(
         self,
-        products: List[Dict]
+        products: List[Dict],
+        concurrency: int = REGISTRATION_CONCURRENCY
     ) -> Dict:
         """
-        여러 상품 일괄 등록
+        여러 상품 일괄 등록 (최대 concurrency개 동시 요청, 결과는 입력 순서 유지)
 
         Args:
             products: 상품 정보 리스트
+            concurrency: 동시 등록 요청 수
 
         Returns:
             일괄 등록 결과
         """
         try:
-            logger.info(f"[플레이오토] 일괄 등록 시작: {len(products)}개 상품")
+            logger.info(f"[플레이오토] 일괄 등록 시작: {len(products)}개 상품 (동시 {concurrency}개)")
 
-            results = []
-            success_count = 0
-            fail_count = 0
+            semaphore = asyncio.Semaphore(max(1, concurrency))
 
-            for product in products:
-                result = await self.register_product(product)
-                results.append(result)
+            async def register(product: Dict) -> Dict:
+                async with semaphore:
+                    return await self.register_product(product)
 
-                if result.get("success"):
-                    success_count += 1
-                else:
-                    fail_count += 1
+            # 클라이언트(커넥션/인증 헤더)를 일괄 등록 동안 공유
+            if self.client:
+                results = await asyncio.gather(*(register(product) for product in products))
+            else:
+                async with PlayautoClient() as client:
+                    self.client = client
+                    try:
+                        results = await asyncio.gather(*(register(product) for product in products))
+                    finally:
+                        self.client = None
+
+            success_count = sum(1 for result in results if result.get("success"))
+            fail_count = len(results) - success_count
 
             logger.info(f"[플레이오토] 일괄 등록 완료: 성공 {success_count}개, 실패 {fail_count}개")
 
@@ -186,7 +210,7 @@ class PlayautoProductRegistration:
                 "total": len(products),
                 "success_count": success_count,
                 "fail_count": fail_count,
-                "results": results
+                "results": list(results)
             }
 
         except Exception as e:
@@ -197,6 +221,128 @@ class PlayautoProductRegistration:
             }
 
 
+# ========================================
+# 상세페이지 HTML 렌더링
+# ========================================
+
+# /supabase-images/1_흰밥/image.jpg -> cat-1/image.jpg
+SUPABASE_IMAGE_PATTERN = re.compile(r'/supabase-images/(\d+)_[^/]+/(.+)')
+SUPABASE_PUBLIC_URL = "https://spkeunlwkrqkdwunkufy.supabase.co/storage/v1/object/public/product-images"
+
+# 템플릿별 메인 이미지 키 (먼저 출력)
+MAIN_IMAGE_KEYS = ('template1_bg', 'template2_main', 'food_template1_bg', 'food_template2_main')
+
+_DETAIL_IMAGE_ONLY_HTML = """<div style='max-width: 1000px; margin: 0 auto; text-align: center;'>
+<img src='{url}' style='width: 100%; height: auto; display: block;' alt='{name} 상세페이지' />
+</div>"""
+_FALLBACK_HTML = "<div style='padding: 20px;'><h1>{name}</h1><p>{text}</p></div>"
+_OPEN_HTML = "<div style='max-width: 1000px; margin: 0 auto; padding: 20px;'>"
+_TITLE_HTML = "<h1 style='font-size: 32px; font-weight: bold; margin-bottom: 30px; color: #333; text-align: center;'>{}</h1>"
+_MAIN_IMAGE_HTML = "<div style='text-align: center; margin: 30px 0;'><img src='{}' style='max-width: 100%; height: auto;' /></div>"
+_CORE_MESSAGE_HTML = "<h2 style='font-size: 26px; font-weight: bold; margin: 40px 0 20px; color: #444; text-align: center;'>{}</h2>"
+_SUBTITLE_HTML = "<p style='font-size: 18px; color: #666; margin: 20px 0; line-height: 1.8; text-align: center;'>{}</p>"
+_TAG_HTML = "<span style='display: inline-block; background: #f0f0f0; padding: 10px 20px; margin: 5px; border-radius: 25px; font-size: 16px;'>{}</span>"
+_TAGS_HTML = "<div style='margin: 30px 0; text-align: center;'>{}</div>"
+_SUB_IMAGE_HTML = "<div style='text-align: center; margin: 20px 0;'><img src='{}' style='max-width: 100%; height: auto;' /></div>"
+# 상품 안내 + 닫는 태그 (모든 상품 공통)
+_FOOTER_HTML = "\n".join([
+    "<div style='margin-top: 50px; padding: 30px; background: #f9f9f9; border-radius: 10px; border-left: 4px solid #4CAF50;'>",
+    "<h3 style='font-size: 20px; font-weight: bold; margin-bottom: 20px; color: #333;'>상품 안내</h3>",
+    "<ul style='font-size: 16px; color: #555; line-height: 2; padding-left: 20px;'>",
+    "<li>신선하고 품질 좋은 상품을 제공합니다</li>",
+    "<li>빠른 배송으로 신속하게 받아보실 수 있습니다</li>",
+    "<li>궁금하신 사항은 언제든지 문의해주세요</li>",
+    "</ul>",
+    "</div>",
+    "</div>",
+])
+
+# detail_page_data 해시 -> 렌더링된 HTML (LRU)
+_detail_html_cache: "OrderedDict[str, str]" = OrderedDict()
+_detail_html_lock = threading.Lock()
+
+
+@lru_cache(maxsize=4096)
+def resolve_detail_image_url(url: str) -> Optional[str]:
+    """
+    상세페이지 이미지 경로를 외부에서 접근 가능한 URL로 변환
+
+    - /supabase-images/{카테고리ID}_{이름}/{파일} → Supabase Storage 공개 URL
+    - 그 외 로컬 경로(/static, /uploads 등)는 접근 불가 → None
+
+    Returns:
+        변환된 URL (사용할 수 없으면 None)
+    """
+    if url.startswith("/supabase-images/"):
+        match = SUPABASE_IMAGE_PATTERN.match(url)
+        if not match:
+            logger.warning(f"[플레이오토] 로컬 경로 패턴 불일치, 제외: {url}")
+            return None
+        cat_id = match.group(1)
+        # URL 디코딩 (한글 파일명 처리) 후 다시 인코딩
+        filename = urllib.parse.unquote(match.group(2))
+        return f"{SUPABASE_PUBLIC_URL}/cat-{cat_id}/{urllib.parse.quote(filename)}"
+
+    if url.startswith("/"):
+        return None
+
+    if url.startswith("http"):
+        return url
+    return None
+
+
+def _iter_detail_images(images: Dict):
+    """(메인 이미지 여부, 변환된 URL) - 메인 이미지 먼저, 이후 나머지 순서대로"""
+    for key in MAIN_IMAGE_KEYS:
+        url = images.get(key)
+        if isinstance(url, str) and url:
+            resolved = resolve_detail_image_url(url)
+            if resolved:
+                yield True, resolved
+    for key, url in images.items():
+        if key not in MAIN_IMAGE_KEYS and isinstance(url, str):
+            resolved = resolve_detail_image_url(url)
+            if resolved:
+                yield False, resolved
+
+
+def _render_detail_html(data: Dict, product_name: str) -> str:
+    # 1. JPG 이미지가 있으면 그것만 사용 (모든 CSS 보존)
+    detail_image_url = data.get("detailImageUrl")
+    if detail_image_url:
+        return _DETAIL_IMAGE_ONLY_HTML.format(url=detail_image_url, name=product_name)
+
+    content = data.get("content", {})
+    images = data.get("images", {})
+
+    html_parts = [_OPEN_HTML, _TITLE_HTML.format(content.get('productName', product_name))]
+
+    sub_images = []
+    for is_main, url in _iter_detail_images(images):
+        if is_main:
+            html_parts.append(_MAIN_IMAGE_HTML.format(url))
+        else:
+            sub_images.append(url)
+
+    # 텍스트 컨텐츠
+    if "coreMessage1" in content:
+        html_parts.append(_CORE_MESSAGE_HTML.format(content['coreMessage1']))
+    if "subtitle" in content:
+        html_parts.append(_SUBTITLE_HTML.format(content['subtitle']))
+
+    # 태그
+    if "tag1" in content:
+        tags = [content.get(f'tag{i}', '') for i in range(1, 4) if content.get(f'tag{i}')]
+        if tags:
+            html_parts.append(_TAGS_HTML.format(' '.join(_TAG_HTML.format(tag) for tag in tags)))
+
+    # 나머지 이미지들 (서브 이미지, 상세 이미지 등)
+    html_parts.extend(_SUB_IMAGE_HTML.format(url) for url in sub_images)
+
+    html_parts.append(_FOOTER_HTML)
+    return "\n".join(html_parts)
+
+
 def convert_detail_page_json_to_html(detail_page_data: str, product_name: str) -> str:
     """
     detail_page_data JSON을 HTML로 변환
@@ -205,6 +351,9 @@ def convert_detail_page_json_to_html(detail_page_data: str, product_name: str) -
     1. detailImageUrl이 있으면 JPG 이미지만 사용 (모든 CSS 보존)
     2. 없으면 기존 방식 (이미지 나열)
 
+    같은 detail_page_data/상품명은 해시 기준으로 캐시된 결과를 재사용합니다
+    (채널별 등록, 재등록, sync-to-playauto).
+
     Args:
         detail_page_data: JSON 형태의 상세페이지 데이터
         product_name: 상품명 (fallback용)
@@ -213,136 +362,32 @@ def convert_detail_page_json_to_html(detail_page_data: str, product_name: str) -
         HTML 문자열
     """
     if not detail_page_data:
-        return f"<div style='padding: 20px;'><h1>{product_name}</h1><p>상품 상세 정보</p></div>"
+        return _FALLBACK_HTML.format(name=product_name, text="상품 상세 정보")
 
-    try:
-        import json
-        data = json.loads(detail_page_data)
-
-        # 1. JPG 이미지가 있으면 그것만 사용 (최고 품질)
-        detail_image_url = data.get("detailImageUrl")
-        if detail_image_url:
-            logger.info(f"[플레이오토] 상세페이지 JPG 이미지 사용: {detail_image_url[:80]}...")
-            return f"""<div style='max-width: 1000px; margin: 0 auto; text-align: center;'>
-<img src='{detail_image_url}' style='width: 100%; height: auto; display: block;' alt='{product_name} 상세페이지' />
-</div>"""
-
-        # 데이터 추출
-        content = data.get("content", {})
-        images = data.get("images", {})
-        template = data.get("template", "")
-
-        # HTML 생성
-        html_parts = [f"<div style='max-width: 1000px; margin: 0 auto; padding: 20px;'>"]
-
-        # 상품명
-        html_parts.append(f"<h1 style='font-size: 32px; font-weight: bold; margin-bottom: 30px; color: #333; text-align: center;'>{content.get('productName', product_name)}</h1>")
-
-        # 메인 이미지 (템플릿별)
-        main_image_keys = ['template1_bg', 'template2_main', 'food_template1_bg', 'food_template2_main']
-        for key in main_image_keys:
-            if key in images and images[key]:
-                url = images[key]
-
-                # 로컬 경로를 Supabase URL로 변환
-                if isinstance(url, str) and url.startswith("/supabase-images/"):
-                    # /supabase-images/1_흰밥/image.jpg -> cat-1/image.jpg
-                    import re
-                    import urllib.parse
-
-                    # 카테고리 ID 추출 (1_흰밥 -> 1)
-                    match = re.match(r'/supabase-images/(\d+)_[^/]+/(.+)', url)
-                    if match:
-                        cat_id = match.group(1)
-                        filename = match.group(2)
-                        # URL 디코딩 (한글 파일명 처리)
-                        filename = urllib.parse.unquote(filename)
-                        # Supabase Storage URL 생성
-                        url = f"https://spkeunlwkrqkdwunkufy.supabase.co/storage/v1/object/public/product-images/cat-{cat_id}/{urllib.parse.quote(filename)}"
-                        logger.info(f"[플레이오토] 로컬 경로 → Supabase URL 변환: cat-{cat_id}/{filename[:50]}")
-                    else:
-                        logger.warning(f"[플레이오토] 로컬 경로 패턴 불일치, 제외: {url}")
-                        continue
-
-                # 다른 로컬 경로(/static, /uploads 등)는 제외
-                elif isinstance(url, str) and url.startswith("/"):
-                    logger.warning(f"[플레이오토] 접근 불가 로컬 경로 제외: {url}")
-                    continue
-
-                # 외부 URL 처리
-                if isinstance(url, str) and (url.startswith("http") or url.startswith("//")):
-                    if url.startswith("//"):
-                        url = f"https:{url}"
-                    html_parts.append(f"<div style='text-align: center; margin: 30px 0;'><img src='{url}' style='max-width: 100%; height: auto;' /></div>")
-
-        # 텍스트 컨텐츠
-        if "coreMessage1" in content:
-            html_parts.append(f"<h2 style='font-size: 26px; font-weight: bold; margin: 40px 0 20px; color: #444; text-align: center;'>{content['coreMessage1']}</h2>")
-
-        if "subtitle" in content:
-            html_parts.append(f"<p style='font-size: 18px; color: #666; margin: 20px 0; line-height: 1.8; text-align: center;'>{content['subtitle']}</p>")
-
-        # 태그
-        if "tag1" in content:
-            tags = [content.get(f'tag{i}', '') for i in range(1, 4) if content.get(f'tag{i}')]
-            if tags:
-                tag_html = ' '.join([f"<span style='display: inline-block; background: #f0f0f0; padding: 10px 20px; margin: 5px; border-radius: 25px; font-size: 16px;'>{tag}</span>" for tag in tags])
-                html_parts.append(f"<div style='margin: 30px 0; text-align: center;'>{tag_html}</div>")
-
-        # 나머지 이미지들 (서브 이미지, 상세 이미지 등)
-        sub_images = []
-        for key, url in images.items():
-            if key not in main_image_keys and isinstance(url, str):
-                # 로컬 경로를 Supabase URL로 변환
-                if url.startswith("/supabase-images/"):
-                    import re
-                    import urllib.parse
-
-                    match = re.match(r'/supabase-images/(\d+)_[^/]+/(.+)', url)
-                    if match:
-                        cat_id = match.group(1)
-                        filename = match.group(2)
-                        filename = urllib.parse.unquote(filename)
-                        url = f"https://spkeunlwkrqkdwunkufy.supabase.co/storage/v1/object/public/product-images/cat-{cat_id}/{urllib.parse.quote(filename)}"
-                    else:
-                        continue
-                # 다른 로컬 경로 제외
-                elif url.startswith("/"):
-                    continue
-
-                # 외부 URL 추가
-                if url.startswith("http") or url.startswith("//"):
-                    if url.startswith("//"):
-                        url = f"https:{url}"
-                    sub_images.append(url)
-
-        # 서브 이미지 출력
-        for url in sub_images:
-            html_parts.append(f"<div style='text-align: center; margin: 20px 0;'><img src='{url}' style='max-width: 100%; height: auto;' /></div>")
-
-        # 상품 안내
-        html_parts.append("<div style='margin-top: 50px; padding: 30px; background: #f9f9f9; border-radius: 10px; border-left: 4px solid #4CAF50;'>")
-        html_parts.append("<h3 style='font-size: 20px; font-weight: bold; margin-bottom: 20px; color: #333;'>상품 안내</h3>")
-        html_parts.append("<ul style='font-size: 16px; color: #555; line-height: 2; padding-left: 20px;'>")
-        html_parts.append("<li>신선하고 품질 좋은 상품을 제공합니다</li>")
-        html_parts.append("<li>빠른 배송으로 신속하게 받아보실 수 있습니다</li>")
-        html_parts.append("<li>궁금하신 사항은 언제든지 문의해주세요</li>")
-        html_parts.append("</ul>")
-        html_parts.append("</div>")
-
-        html_parts.append("</div>")
-
-        return "\n".join(html_parts)
+    key = hashlib.sha1(f"{product_name}\0{detail_page_data}".encode("utf-8")).hexdigest()
+    with _detail_html_lock:
+        html = _detail_html_cache.get(key)
+        if html is not None:
+            _detail_html_cache.move_to_end(key)
+            return html
 
+    try:
+        html = _render_detail_html(json.loads(detail_page_data), product_name)
     except json.JSONDecodeError:
         # JSON이 아니면 그대로 반환 (이미 HTML일 수도 있음)
         if detail_page_data.strip().startswith("<"):
-            return detail_page_data
+            html = detail_page_data
         else:
-            return f"<div style='padding: 20px;'><h1>{product_name}</h1><p>{detail_page_data}</p></div>"
+            html = _FALLBACK_HTML.format(name=product_name, text=detail_page_data)
     except Exception as e:
         logger.error(f"[플레이오토] detail_page_data 변환 실패: {e}")
-        return f"<div style='padding: 20px;'><h1>{product_name}</h1><p>상품 상세 정보</p></div>"
+        return _FALLBACK_HTML.format(name=product_name, text="상품 상세 정보")
+
+    with _detail_html_lock:
+        _detail_html_cache[key] = html
+        while len(_detail_html_cache) > DETAIL_HTML_CACHE_SIZE:
+            _detail_html_cache.popitem(last=False)
+    return html
 
 
 def extract_images_from_detail_page(detail_page_data: str) -> List[str]:
@@ -359,72 +404,12 @@ def extract_images_from_detail_page(detail_page_data: str) -> List[str]:
         return []
 
     try:
-        import json
         data = json.loads(detail_page_data)
-        images = data.get("images", {})
-
-        # 우선순위 이미지 먼저
-        priority_keys = ['template1_bg', 'template2_main', 'food_template1_bg', 'food_template2_main']
         image_urls = []
-
-        # 우선순위 이미지
-        for key in priority_keys:
+        for _, url in _iter_detail_images(data.get("images", {})):
+            image_urls.append(url)
             if len(image_urls) >= 10:
                 break
-            if key in images:
-                url = images[key]
-
-                # 로컬 경로를 Supabase URL로 변환
-                if isinstance(url, str) and url.startswith("/supabase-images/"):
-                    import re
-                    import urllib.parse
-
-                    match = re.match(r'/supabase-images/(\d+)_[^/]+/(.+)', url)
-                    if match:
-                        cat_id = match.group(1)
-                        filename = match.group(2)
-                        filename = urllib.parse.unquote(filename)
-                        url = f"https://spkeunlwkrqkdwunkufy.supabase.co/storage/v1/object/public/product-images/cat-{cat_id}/{urllib.parse.quote(filename)}"
-                    else:
-                        continue
-                # 다른 로컬 경로 제외
-                elif isinstance(url, str) and url.startswith("/"):
-                    continue
-
-                # 외부 URL 추가
-                if isinstance(url, str) and (url.startswith("http") or url.startswith("//")):
-                    if url.startswith("//"):
-                        url = f"https:{url}"
-                    image_urls.append(url)
-
-        # 나머지 이미지
-        for key, url in images.items():
-            if len(image_urls) >= 10:
-                break
-            if key not in priority_keys and isinstance(url, str):
-                # 로컬 경로를 Supabase URL로 변환
-                if url.startswith("/supabase-images/"):
-                    import re
-                    import urllib.parse
-
-                    match = re.match(r'/supabase-images/(\d+)_[^/]+/(.+)', url)
-                    if match:
-                        cat_id = match.group(1)
-                        filename = match.group(2)
-                        filename = urllib.parse.unquote(filename)
-                        url = f"https://spkeunlwkrqkdwunkufy.supabase.co/storage/v1/object/public/product-images/cat-{cat_id}/{urllib.parse.quote(filename)}"
-                    else:
-                        continue
-                # 다른 로컬 경로 제외
-                elif url.startswith("/"):
-                    continue
-
-                # 외부 URL 추가
-                if url.startswith("http") or url.startswith("//"):
-                    if url.startswith("//"):
-                        url = f"https:{url}"
-                    image_urls.append(url)
-
         return image_urls
 
     except Exception as e:
@@ -432,7 +417,12 @@ def extract_images_from_detail_page(detail_page_data: str) -> List[str]:
         return []
 
 
-def build_product_data_from_db(product: Dict, site_list: List[Dict], channel_type: str = "smartstore") -> Dict:
+def build_product_data_from_db(
+    product: Dict,
+    site_list: List[Dict],
+    channel_type: str = "smartstore",
+    detail_desc: Optional[str] = None
+) -> Dict:
     """
     DB 상품 정보를 플레이오토 API 형식으로 변환
 
@@ -450,6 +440,7 @@ def build_product_data_from_db(product: Dict, site_list: List[Dict], channel_typ
             - "gmk_auction": 옥션/지마켓 (std_ol_yn="Y", opt_type="옵션없음", 단일상품)
             - "coupang": 쿠팡 (std_ol_yn="N", opt_type="조합형", 일반상품)
             - "smartstore": 스마트스토어 등 (std_ol_yn="N", opt_type="독립형", 일반상품)
+        detail_desc: 미리 변환한 상세페이지 HTML (여러 채널 등록 시 한 번만 변환하기 위함)
 
     Returns:
         플레이오토 API 형식 데이터
@@ -493,7 +484,6 @@ def build_product_data_from_db(product: Dict, site_list: List[Dict], channel_typ
     image_fields = {"sale_img1": thumbnail_url}
 
     # 채널 타입에 따른 옵션 설정 (DB에 저장된 옵션 우선 사용)
-    import json
     product_name = product.get("product_name", "기본")
     option_value = product_name.replace(",", " ").replace("  ", " ").strip()
 
@@ -671,7 +661,7 @@ def build_product_data_from_db(product: Dict, site_list: List[Dict], channel_typ
             "multi_yn": False
         },
         # detail_page_data를 HTML로 변환 (JSON 형태일 경우 자동 변환)
-        "detail_desc": convert_detail_page_json_to_html(
+        "detail_desc": detail_desc if detail_desc is not None else convert_detail_page_json_to_html(
             product.get("detail_page_data", ""),
             product.get("product_name", "상품")
         ),
@@ -712,3 +702,25 @@ def build_product_data_from_db(product: Dict, site_list: List[Dict], channel_typ
         "cost_price": int(product.get("sourcing_price", 0)),
         "street_price": int(product.get("selling_price", 0))
     }
+
+
+def build_channel_payloads(product: Dict, channel_sites: Dict[str, List[Dict]]) -> Dict[str, Dict]:
+    """
+    채널 그룹별 등록 데이터 생성 (상세페이지 HTML은 상품당 한 번만 변환)
+
+    Args:
+        product: DB 상품 정보
+        channel_sites: {channel_type: site_list} (빈 그룹은 제외)
+
+    Returns:
+        {channel_type: 플레이오토 API 형식 데이터}
+    """
+    detail_desc = convert_detail_page_json_to_html(
+        product.get("detail_page_data", ""),
+        product.get("product_name", "상품")
+    )
+    return {
+        channel_type: build_product_data_from_db(product, sites, channel_type=channel_type, detail_desc=detail_desc)
+        for channel_type, sites in channel_sites.items()
+        if sites
+    }
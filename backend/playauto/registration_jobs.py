@@ -0,0 +1,532 @@
+"""
+플레이오토 상품 등록 작업 (백그라운드)
+
+POST /api/products/register-to-playauto 는 작업만 생성하고 바로 job_id를 반환합니다.
+작업은 요청을 받은 워커의 이벤트 루프에서 실행되며 진행률/결과는 playauto_registration_jobs 테이블에 기록되므로
+어느 워커에서든 조회할 수 있습니다.
+실행 중에는 heartbeat_at을 주기적으로 갱신하고, 워커가 재시작/중단되어 갱신이 끊긴 작업은
+조회 시(및 서버 시작 시) 실패로 처리합니다. (pending/running에 영구히 머물지 않도록)
+
+- 동시 실행: 상품 × 채널 그룹(단일상품/쿠팡/스마트스토어) 등록 요청을 전역 세마포어로 최대 REGISTRATION_CONCURRENCY개까지
+- 등록 데이터: 상품당 한 번 조회/상세페이지 변환 후 채널별 데이터 생성 (build_channel_payloads)
+- 재시도: 네트워크/타임아웃 등 일시 오류는 채널 단위로 자동 재시도,
+  API가 거절한 채널은 retry_job()으로 실패한 상품/채널만 다시 등록
+"""
+
+import asyncio
+import json
+from datetime import datetime, timedelta
+from typing import Dict, List, Optional
+
+from sqlalchemy import func, inspect, select, text, update
+
+from database.database_manager import get_database_manager
+from database.db_wrapper import get_db
+from database.models import PlayautoRegistrationJob
+from logger import get_logger
+from utils.cache import clear_all_cache
+from .client import PlayautoClient
+from .product_registration import (
+    REGISTRATION_CONCURRENCY,
+    PlayautoProductRegistration,
+    build_channel_payloads,
+)
+
+logger = get_logger(__name__)
+
+# 채널 그룹 (등록 순서 = 결과 병합 순서)
+CHANNEL_GROUPS = ("gmk_auction", "coupang", "smartstore")
+
+CHANNEL_LABELS = {
+    "gmk_auction": "단일상품(옥션/지마켓)",
+    "coupang": "쿠팡(조합형)",
+    "smartstore": "스마트스토어(독립형)",
+}
+
+# 단일상품으로 등록할 마켓 코드 (옵션없음 방식) - 옥션: A001/AUCTION, 지마켓: A006/GMK
+SINGLE_PRODUCT_CODES = {"A001", "AUCTION", "A006", "GMK"}
+# 쿠팡은 조합형 옵션 필요 (B378: 실제 PlayAuto shop_cd)
+COUPANG_CODES = {"A027", "CPM", "COUPANG", "B378"}
+# ESM은 단일상품 제약이 있어 자동 등록에서 제외
+ESM_CODES = {"ESM"}
+
+# 일시 오류(네트워크/타임아웃) 자동 재시도 횟수
+TRANSIENT_RETRIES = 2
+
+# 진행 상황 DB 기록 최소 간격 (초)
+PROGRESS_INTERVAL = 1.0
+
+# 실행 중 작업의 heartbeat 갱신 주기 / 이 시간 이상 갱신이 없으면 중단된 작업으로 판정 (초)
+HEARTBEAT_INTERVAL = 30
+STALE_AFTER = 180
+
+_table_ready = False
+_semaphore: Optional[asyncio.Semaphore] = None
+_running: Dict[int, asyncio.Task] = {}
+
+
+def _get_manager():
+    global _table_ready
+    db_manager = get_database_manager()
+    if not _table_ready:
+        PlayautoRegistrationJob.__table__.create(bind=db_manager.engine, checkfirst=True)
+        _ensure_heartbeat_column(db_manager.engine)
+        _table_ready = True
+    return db_manager
+
+
+def _ensure_heartbeat_column(engine):
+    """heartbeat_at 컬럼 추가 (컬럼 도입 전에 생성된 테이블)"""
+    columns = {column['name'] for column in inspect(engine).get_columns(PlayautoRegistrationJob.__tablename__)}
+    if 'heartbeat_at' in columns:
+        return
+    column_type = 'TIMESTAMP' if engine.dialect.name == 'postgresql' else 'DATETIME'
+    with engine.begin() as conn:
+        conn.execute(text(f"ALTER TABLE playauto_registration_jobs ADD COLUMN heartbeat_at {column_type}"))
+    logger.info("[상품등록] playauto_registration_jobs.heartbeat_at 컬럼 추가")
+
+
+def _get_semaphore() -> asyncio.Semaphore:
+    """상품/채널/작업 전체에 걸친 동시 등록 요청 제한"""
+    global _semaphore
+    if _semaphore is None:
+        _semaphore = asyncio.Semaphore(max(1, REGISTRATION_CONCURRENCY))
+    return _semaphore
+
+
+def split_site_list(site_list: List[Dict]) -> Dict[str, List[Dict]]:
+    """site_list를 채널 그룹별로 분리 (ESM 제외)"""
+    groups: Dict[str, List[Dict]] = {channel: [] for channel in CHANNEL_GROUPS}
+    for site in site_list:
+        shop_cd = (site.get("shop_cd") or "").upper()
+        if shop_cd in ESM_CODES:
+            continue
+        if shop_cd in SINGLE_PRODUCT_CODES:
+            groups["gmk_auction"].append(site)
+        elif shop_cd in COUPANG_CODES:
+            groups["coupang"].append(site)
+        else:
+            groups["smartstore"].append(site)
+    return groups
+
+
+# ========================================
+# 작업 생성 / 조회
+# ========================================
+
+def create_job(product_ids: List[int], site_list: List[Dict], retry_of: Optional[int] = None) -> int:
+    with _get_manager().get_session() as session:
+        job = PlayautoRegistrationJob(
+            status='pending',
+            total_count=len(product_ids),
+            product_ids=json.dumps(product_ids),
+            site_list=json.dumps(site_list, ensure_ascii=False),
+            results='[]',
+            retry_of=retry_of,
+            heartbeat_at=datetime.now(),
+        )
+        session.add(job)
+        session.flush()
+        return job.id
+
+
+def fail_stale_jobs(job_id: Optional[int] = None) -> int:
+    """
+    heartbeat가 STALE_AFTER초 이상 끊긴 pending/running 작업을 실패 처리
+
+    작업을 실행하던 워커가 재시작/중단되면 작업 행이 진행 중 상태로 남아
+    진행 조회가 끝나지 않고 retry_job도 거부되므로, 다른 워커(또는 재시작한 워커)에서 정리합니다.
+
+    Args:
+        job_id: 지정하면 해당 작업만 확인
+
+    Returns:
+        실패 처리한 작업 수
+    """
+    now = datetime.now()
+    cutoff = now - timedelta(seconds=STALE_AFTER)
+    stmt = (
+        update(PlayautoRegistrationJob)
+        .where(
+            PlayautoRegistrationJob.status.in_(('pending', 'running')),
+            func.coalesce(PlayautoRegistrationJob.heartbeat_at, PlayautoRegistrationJob.created_at) < cutoff
+        )
+        .values(
+            status='failed',
+            completed_at=now,
+            error_message="작업을 실행하던 서버가 중단되었습니다. 재시도해주세요."
+        )
+    )
+    if job_id is not None:
+        stmt = stmt.where(PlayautoRegistrationJob.id == job_id)
+    # 이 워커에서 실행 중인 작업은 heartbeat가 늦어도 건드리지 않음
+    if _running:
+        stmt = stmt.where(PlayautoRegistrationJob.id.notin_(list(_running)))
+    with _get_manager().get_session() as session:
+        failed = session.execute(stmt).rowcount
+    if failed:
+        logger.warning(f"[상품등록] heartbeat가 끊긴 작업 {failed}개 실패 처리")
+    return failed
+
+
+def get_job(job_id: int) -> Optional[Dict]:
+    fail_stale_jobs(job_id)
+    with _get_manager().get_session() as session:
+        job = session.execute(
+            select(PlayautoRegistrationJob).where(PlayautoRegistrationJob.id == job_id)
+        ).scalar_one_or_none()
+        if job is None:
+            return None
+        return {
+            "job_id": job.id,
+            "status": job.status,
+            "total": job.total_count,
+            "processed": job.processed_count,
+            "success_count": job.success_count,
+            "fail_count": job.failed_count,
+            "progress_percent": float(job.progress_percent or 0),
+            "results": json.loads(job.results or '[]'),
+            "error": job.error_message,
+            "retry_of": job.retry_of,
+            "started_at": job.started_at.isoformat() if job.started_at else None,
+            "completed_at": job.completed_at.isoformat() if job.completed_at else None,
+            "created_at": job.created_at.isoformat() if job.created_at else None,
+        }
+
+
+def _save_progress(job_id: int, results: List[Dict], total: int, status: Optional[str] = None,
+                   error_message: Optional[str] = None):
+    success_count = sum(1 for r in results if r.get("success"))
+    values = {
+        "processed_count": len(results),
+        "success_count": success_count,
+        "failed_count": len(results) - success_count,
+        "progress_percent": round(len(results) / total * 100, 2) if total else 100,
+        "results": json.dumps(results, ensure_ascii=False, default=str),
+        "heartbeat_at": datetime.now(),
+    }
+    if status:
+        values["status"] = status
+        if status in ('completed', 'failed'):
+            values["completed_at"] = datetime.now()
+    if error_message is not None:
+        values["error_message"] = error_message
+    with _get_manager().get_session() as session:
+        session.execute(
+            update(PlayautoRegistrationJob).where(PlayautoRegistrationJob.id == job_id).values(**values)
+        )
+
+
+def start_job(product_ids: List[int], site_list: List[Dict], retry_of: Optional[int] = None,
+              channels: Optional[Dict[int, List[str]]] = None) -> int:
+    """
+    등록 작업 생성 후 백그라운드 실행 (이벤트 루프 안에서 호출)
+
+    Args:
+        channels: 상품별로 등록할 채널 그룹 제한 (재시도 시 실패한 채널만)
+    """
+    job_id = create_job(product_ids, site_list, retry_of=retry_of)
+    task = asyncio.create_task(run_job(job_id, product_ids, site_list, channels))
+    _running[job_id] = task
+    task.add_done_callback(lambda _: _running.pop(job_id, None))
+    logger.info(f"[상품등록] 작업 #{job_id} 시작: {len(product_ids)}개 상품")
+    return job_id
+
+
+def retry_job(job_id: int) -> Optional[int]:
+    """
+    실패한 상품/채널만 새 작업으로 재등록
+
+    Returns:
+        새 작업 ID (재시도할 항목이 없으면 None)
+    """
+    job = get_job(job_id)
+    if job is None:
+        raise ValueError(f"작업을 찾을 수 없습니다: {job_id}")
+    if job["status"] in ('pending', 'running'):
+        raise ValueError("진행 중인 작업은 재시도할 수 없습니다")
+
+    with _get_manager().get_session() as session:
+        row = session.execute(
+            select(PlayautoRegistrationJob.product_ids, PlayautoRegistrationJob.site_list)
+            .where(PlayautoRegistrationJob.id == job_id)
+        ).one()
+    site_list = json.loads(row.site_list or '[]')
+
+    # 작업이 중간에 실패해 처리되지 않은 상품은 전체 채널 재등록
+    processed = {result["product_id"] for result in job["results"]}
+    product_ids = [product_id for product_id in json.loads(row.product_ids or '[]') if product_id not in processed]
+    channels: Dict[int, List[str]] = {}
+    for result in job["results"]:
+        failed = [name for name, channel in (result.get("channels") or {}).items() if not channel.get("success")]
+        if failed:
+            product_ids.append(result["product_id"])
+            channels[result["product_id"]] = failed
+        elif not result.get("success"):
+            product_ids.append(result["product_id"])
+    if not product_ids:
+        return None
+    return start_job(product_ids, site_list, retry_of=job_id, channels=channels)
+
+
+# ========================================
+# 실행
+# ========================================
+
+async def run_job(job_id: int, product_ids: List[int], site_list: List[Dict],
+                  channels: Optional[Dict[int, List[str]]] = None):
+    groups = split_site_list(site_list)
+    total = len(product_ids)
+    results: List[Dict] = []
+    last_saved = 0.0
+    heartbeat = asyncio.create_task(_heartbeat(job_id))
+
+    try:
+        with _get_manager().get_session() as session:
+            session.execute(
+                update(PlayautoRegistrationJob).where(PlayautoRegistrationJob.id == job_id)
+                .values(status='running', started_at=datetime.now(), heartbeat_at=datetime.now())
+            )
+
+        db = get_db()
+        registration_api = PlayautoProductRegistration()
+
+        # 작업 동안 PlayAuto 클라이언트(커넥션/인증 헤더) 공유
+        async with PlayautoClient() as client:
+            registration_api.client = client
+
+            pending = [
+                asyncio.create_task(
+                    _register_one(db, registration_api, product_id, groups, (channels or {}).get(product_id))
+                )
+                for product_id in product_ids
+            ]
+            for finished in asyncio.as_completed(pending):
+                results.append(await finished)
+                now = asyncio.get_running_loop().time()
+                if now - last_saved >= PROGRESS_INTERVAL and len(results) < total:
+                    last_saved = now
+                    await asyncio.to_thread(_save_progress, job_id, results, total)
+
+        # 입력 순서대로 정렬해 저장
+        order = {product_id: index for index, product_id in enumerate(product_ids)}
+        results.sort(key=lambda r: order.get(r["product_id"], 0))
+        await asyncio.to_thread(_save_progress, job_id, results, total, 'completed')
+
+        clear_all_cache()
+
+        success_count = sum(1 for r in results if r.get("success"))
+        logger.info(f"[상품등록] 작업 #{job_id} 완료: 성공 {success_count}개, 실패 {total - success_count}개")
+
+    except Exception as e:
+        logger.exception(f"[상품등록] 작업 #{job_id} 실패: {e}")
+        await asyncio.to_thread(_save_progress, job_id, results, total, 'failed', str(e))
+    finally:
+        heartbeat.cancel()
+
+
+def _touch_heartbeat(job_id: int):
+    with _get_manager().get_session() as session:
+        session.execute(
+            update(PlayautoRegistrationJob).where(PlayautoRegistrationJob.id == job_id)
+            .values(heartbeat_at=datetime.now())
+        )
+
+
+async def _heartbeat(job_id: int):
+    """작업이 끝날 때까지 heartbeat_at 갱신 (진행 저장이 뜸한 긴 등록 요청 동안에도)"""
+    while True:
+        await asyncio.sleep(HEARTBEAT_INTERVAL)
+        try:
+            await asyncio.to_thread(_touch_heartbeat, job_id)
+        except Exception as e:
+            logger.warning(f"[상품등록] 작업 #{job_id} heartbeat 갱신 실패: {e}")
+
+
+async def _register_channel(registration_api: PlayautoProductRegistration, channel: str, payload: Dict) -> Dict:
+    """채널 그룹 1건 등록 (일시 오류 자동 재시도, ESM 단일상품 오류 시 ESM/A006 제외 후 재시도)"""
+    attempt = 0
+    while True:
+        async with _get_semaphore():
+            result = await registration_api.register_product(payload)
+        if result.get("success"):
+            return result
+
+        error_msg = result.get("error") or ""
+        if "ESM" in error_msg and "단일상품" in error_msg:
+            filtered = [
+                site for site in payload.get("site_list", [])
+                if site.get("shop_cd") not in ["ESM", "esm", "Esm", "A006"]
+            ]
+            if filtered and len(filtered) < len(payload.get("site_list", [])):
+                logger.warning(f"[상품등록] ESM 에러 감지 - ESM/A006 제외 후 {len(filtered)}개 채널로 재시도")
+                payload = {**payload, "site_list": filtered}
+                continue
+            return result
+
+        # register_product는 API가 응답한 실패에 data를 포함 → data가 없으면 네트워크/타임아웃 등 일시 오류
+        if "data" in result or attempt >= TRANSIENT_RETRIES:
+            return result
+        attempt += 1
+        logger.warning(f"[상품등록] {CHANNEL_LABELS[channel]} 일시 오류, 재시도 {attempt}/{TRANSIENT_RETRIES}: {error_msg}")
+        await asyncio.sleep(2 ** attempt)
+
+
+async def _register_one(db, registration_api: PlayautoProductRegistration, product_id: int,
+                        groups: Dict[str, List[Dict]], only_channels: Optional[List[str]] = None) -> Dict:
+    """상품 1개를 채널 그룹별로 동시에 등록하고 결과를 DB에 반영"""
+    try:
+        product = await asyncio.to_thread(db.get_selling_product, product_id)
+        if not product:
+            return {"product_id": product_id, "success": False, "error": "상품을 찾을 수 없습니다."}
+
+        channel_sites = {
+            channel: sites for channel, sites in groups.items()
+            if sites and (not only_channels or channel in only_channels)
+        }
+        channel_debug = {
+            "site_list_received": [s.get("shop_cd") for sites in groups.values() for s in sites],
+            "single_product_sites": [s.get("shop_cd") for s in groups["gmk_auction"]],
+            "coupang_sites": [s.get("shop_cd") for s in groups["coupang"]],
+            "smartstore_sites": [s.get("shop_cd") for s in groups["smartstore"]],
+        }
+        if not channel_sites:
+            return {
+                "product_id": product_id, "product_name": product.get("product_name"),
+                "success": False, "error": "등록 가능한 채널이 없습니다.", "channel_debug": channel_debug
+            }
+
+        # 상세페이지 변환 등 등록 데이터는 상품당 한 번만 생성
+        payloads = await asyncio.to_thread(build_channel_payloads, product, channel_sites)
+
+        channel_results = dict(zip(payloads, await asyncio.gather(*(
+            _register_channel(registration_api, channel, payload) for channel, payload in payloads.items()
+        ))))
+
+        saved = await asyncio.to_thread(_apply_results, db, product, channel_results)
+
+        succeeded = [channel for channel, result in channel_results.items() if result.get("success")]
+        errors = [
+            f"{CHANNEL_LABELS[channel]}: {result.get('error')}"
+            for channel, result in channel_results.items() if not result.get("success")
+        ]
+        coupang_debug = None
+        if "coupang" in payloads:
+            coupang_payload = payloads["coupang"]
+            coupang_debug = {
+                "opt_type": coupang_payload.get("opt_type"),
+                "std_ol_yn": coupang_payload.get("std_ol_yn"),
+                "opts": coupang_payload.get("opts"),
+                "site_list": coupang_payload.get("site_list"),
+            }
+            if not channel_results["coupang"].get("success"):
+                coupang_debug["error"] = channel_results["coupang"].get("error")
+                coupang_debug["api_response"] = channel_results["coupang"].get("data")
+
+        if succeeded:
+            logger.info(f"[상품등록] 성공: {product.get('product_name')} ({', '.join(succeeded)})")
+        else:
+            logger.error(f"[상품등록] 실패: {product.get('product_name')} - {'; '.join(errors)}")
+
+        return {
+            "product_id": product_id,
+            "product_name": product.get("product_name"),
+            # 한 채널이라도 성공하면 성공 (일부 실패는 partial, retry_job으로 실패 채널만 재등록)
+            "success": bool(succeeded),
+            "partial": bool(succeeded and errors),
+            "error": "; ".join(errors) or None,
+            "channels": {
+                channel: {
+                    "success": bool(result.get("success")),
+                    "c_sale_cd": result.get("c_sale_cd"),
+                    "error": result.get("error"),
+                    "sites": [s.get("shop_cd") for s in payloads[channel].get("site_list", [])],
+                }
+                for channel, result in channel_results.items()
+            },
+            **saved,
+            "coupang_debug": coupang_debug,
+            "channel_debug": channel_debug,
+        }
+
+    except Exception as e:
+        logger.error(f"[상품등록] 상품 등록 중 오류: ID {product_id} - {str(e)}")
+        return {"product_id": product_id, "success": False, "error": str(e)}
+
+
+def _apply_results(db, product: Dict, channel_results: Dict[str, Dict]) -> Dict:
+    """
+    성공한 채널의 c_sale_cd / ol_shop_no를 판매 상품에 저장
+
+    Returns:
+        저장한 채널별 c_sale_cd
+    """
+    c_sale_cd_gmk = channel_results.get("gmk_auction", {}).get("c_sale_cd") if channel_results.get("gmk_auction", {}).get("success") else None
+    c_sale_cd_coupang = channel_results.get("coupang", {}).get("c_sale_cd") if channel_results.get("coupang", {}).get("success") else None
+    c_sale_cd_smart = channel_results.get("smartstore", {}).get("c_sale_cd") if channel_results.get("smartstore", {}).get("success") else None
+    saved = {"c_sale_cd_gmk": c_sale_cd_gmk, "c_sale_cd_smart": c_sale_cd_smart, "c_sale_cd_coupang": c_sale_cd_coupang}
+
+    if not any(saved.values()):
+        return saved
+
+    # ol_shop_no를 채널별로 분리 (site_list 내부에는 result 필드가 없고 ol_shop_no가 있으면 성공)
+    ol_shop_no_gmk = None
+    ol_shop_no_smart = None
+    ol_shop_no_coupang = None
+    ol_shop_no_fallback = None
+    for channel in CHANNEL_GROUPS:
+        result = channel_results.get(channel)
+        if not result or not result.get("success"):
+            continue
+        for site in result.get("site_list", []) or []:
+            ol_no = site.get("ol_shop_no")
+            if not ol_no:
+                continue
+            shop_cd = site.get("shop_cd", "")
+            if not ol_shop_no_fallback:
+                ol_shop_no_fallback = ol_no
+            # GMK 채널: Z000(마스터), A001(옥션), A002(지마켓) / Coupang: B378 / 나머지: SmartStore
+            if shop_cd in ["Z000", "A001", "A002"] and c_sale_cd_gmk:
+                if not ol_shop_no_gmk or shop_cd == "Z000":  # Z000(마스터) 우선
+                    ol_shop_no_gmk = ol_no
+            elif shop_cd == "B378" and c_sale_cd_coupang:
+                if not ol_shop_no_coupang:
+                    ol_shop_no_coupang = ol_no
+            elif c_sale_cd_smart:
+                if not ol_shop_no_smart or shop_cd == "Z000":
+                    ol_shop_no_smart = ol_no
+
+    if not ol_shop_no_gmk and not ol_shop_no_smart:
+        logger.warning(f"[상품등록] ol_shop_no를 찾지 못했습니다: {product.get('product_name')}")
+
+    # 등록 성공 시 is_active = True로 변경하고 PlayAuto ID 저장
+    update_params = {"product_id": product["id"], "is_active": True}
+    has_gmk = c_sale_cd_gmk or product.get("c_sale_cd_gmk")
+    has_smart = c_sale_cd_smart or product.get("c_sale_cd_smart")
+    if c_sale_cd_gmk:
+        update_params["c_sale_cd_gmk"] = c_sale_cd_gmk
+        update_params["playauto_product_no"] = c_sale_cd_gmk  # 하위 호환성
+    if c_sale_cd_smart:
+        update_params["c_sale_cd_smart"] = c_sale_cd_smart
+        if not has_gmk:  # gmk가 없으면 smart를 playauto_product_no에 저장
+            update_params["playauto_product_no"] = c_sale_cd_smart
+    if c_sale_cd_coupang:
+        update_params["c_sale_cd_coupang"] = c_sale_cd_coupang
+        if not has_gmk and not has_smart:  # 둘 다 없으면 coupang을 playauto_product_no에 저장
+            update_params["playauto_product_no"] = c_sale_cd_coupang
+    if ol_shop_no_gmk:
+        update_params["ol_shop_no_gmk"] = ol_shop_no_gmk
+    if ol_shop_no_smart:
+        update_params["ol_shop_no_smart"] = ol_shop_no_smart
+    if ol_shop_no_coupang:
+        update_params["ol_shop_no_coupang"] = ol_shop_no_coupang
+    # 하위 호환성: ol_shop_no 필드에도 저장 (재시도 작업은 기존 값 유지)
+    if ol_shop_no_fallback and not product.get("ol_shop_no"):
+        update_params["ol_shop_no"] = ol_shop_no_fallback
+
+    db.update_selling_product(**update_params)
+    return saved
+
+
+def get_running_jobs() -> List[int]:
+    return list(_running)
@@ -13,12 +13,14 @@ from database.db_wrapper import get_db
 from .orders import fetch_and_sync_orders
 from .tracking import auto_upload_tracking_from_local
 from .products import PlayautoProductAPI
+from utils.metrics import timed_job
 
 
 # 스케줄러 인스턴스
 scheduler = AsyncIOScheduler()
 
 
+@timed_job('auto_fetch_orders')
 async def auto_fetch_orders_job():
     """주문 자동 수집 작업 (30분마다)"""
     print(f"[PLAYAUTO] 주문 자동 수집 시작: {datetime.now()}")
@@ -61,6 +63,7 @@ async def auto_fetch_orders_job():
         print(f"[ERROR] 주문 자동 수집 중 오류: {e}")
 
 
+@timed_job('auto_upload_tracking')
 async def auto_upload_tracking_job():
     """송장 자동 업로드 작업 (매일 오전 9시)"""
     print(f"[PLAYAUTO] 송장 자동 업로드 시작: {datetime.now()}")
@@ -86,6 +89,7 @@ async def auto_upload_tracking_job():
         print(f"[ERROR] 송장 자동 업로드 중 오류: {e}")
 
 
+@timed_job('sync_marketplace_codes')
 async def sync_marketplace_codes_job():
     """마켓별 상품번호 자동 동기화 작업 (1시간마다)"""
     print(f"[PLAYAUTO] 마켓 코드 동기화 시작: {datetime.now()}")
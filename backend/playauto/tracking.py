@@ -4,11 +4,22 @@
 여러 마켓에 송장번호를 일괄 등록하는 기능
 """
 
-from typing import Dict, List, Optional
+import asyncio
+import os
+from typing import Callable, Dict, List, Optional
+from logger import get_logger
 from .client import PlayautoClient
 from .models import TrackingItem
 from .exceptions import PlayautoAPIError
 
+logger = get_logger(__name__)
+
+# /order/setnotice 1회 요청당 최대 송장 수
+INVOICE_BATCH_SIZE = int(os.getenv('PLAYAUTO_INVOICE_BATCH_SIZE', '100'))
+
+# 묶음별 결과의 성공 표시값
+_SUCCESS_RESULTS = {"성공", "success", "true", "ok", "y"}
+
 
 class PlayautoTrackingAPI:
     """플레이오토 송장 등록 API"""
@@ -22,7 +33,7 @@ class PlayautoTrackingAPI:
 
     async def upload_tracking(self, tracking_data: List[Dict], overwrite: bool = False, change_complete: bool = False) -> Dict:
         """
-        송장번호 일괄 등록
+        송장번호 일괄 등록 (INVOICE_BATCH_SIZE건씩 나눠 요청)
 
         Args:
             tracking_data: 송장 정보 목록
@@ -37,22 +48,158 @@ class PlayautoTrackingAPI:
         Returns:
             업로드 결과
         """
-        # 플레이오토 API 문서에 따른 요청 데이터 구성
-        request_data = {
-            "orders": tracking_data,
-            "overwrite": overwrite,
-            "change_complete": change_complete
-        }
+        return await self.upload_tracking_batched(tracking_data, overwrite=overwrite, change_complete=change_complete)
+
+    async def upload_tracking_batched(
+        self,
+        tracking_data: List[Dict],
+        overwrite: bool = False,
+        change_complete: bool = False,
+        batch_size: int = INVOICE_BATCH_SIZE,
+        retry_count: int = 0,
+        on_chunk: Optional[Callable[[List[Dict]], None]] = None
+    ) -> Dict:
+        """
+        송장번호 배치 등록
+
+        batch_size건씩 /order/setnotice로 보내고 응답의 묶음별 결과를 각 송장에 매핑합니다.
+        요청 자체가 실패했거나 실패한 묶음은 retry_count회까지 해당 묶음만 다시 보냅니다.
+
+        Args:
+            tracking_data: 송장 정보 목록 (upload_tracking과 동일)
+            overwrite: 송장번호 덮어쓰기 여부
+            change_complete: 배송완료 상태로 즉시 변경 여부
+            batch_size: 1회 요청당 송장 수
+            retry_count: 실패한 묶음 재시도 횟수
+            on_chunk: 배치 하나가 끝날 때마다 호출 (해당 배치의 송장별 결과 목록)
+                      DB 기록 등 동기 작업이므로 이벤트 루프를 막지 않도록 스레드에서 실행
 
-        # 클라이언트가 없으면 새로 생성
+        Returns:
+            {
+                "success": bool,  # 모든 묶음이 실패했으면 False
+                "total_count": int,
+                "success_count": int,
+                "fail_count": int,
+                "failed_items": [{"bundle_no", "message"}],
+                "results": [{"bundle_no", "carr_no", "invoice_no", "success", "message", "attempt"}]
+            }
+        """
+        results = []
+        batch_size = max(1, batch_size)
+
+        async def run(client: PlayautoClient):
+            for start in range(0, len(tracking_data), batch_size):
+                chunk_results = await self._upload_chunk(
+                    client, tracking_data[start:start + batch_size], overwrite, change_complete, retry_count
+                )
+                results.extend(chunk_results)
+                if on_chunk:
+                    await asyncio.to_thread(on_chunk, chunk_results)
+
+        # 클라이언트가 없으면 모든 배치에서 하나의 클라이언트 사용
         if not self.client:
             async with PlayautoClient() as client:
-                response = await client.put("/order/setnotice", data=request_data)
+                await run(client)
         else:
-            response = await self.client.put("/order/setnotice", data=request_data)
+            await run(self.client)
+
+        failed_items = [
+            {"bundle_no": r["bundle_no"], "message": r["message"]}
+            for r in results if not r["success"]
+        ]
+        success_count = len(results) - len(failed_items)
+        return {
+            "success": success_count > 0 or not results,
+            "total_count": len(tracking_data),
+            "success_count": success_count,
+            "fail_count": len(failed_items),
+            "failed_items": failed_items,
+            "results": results
+        }
+
+    async def _upload_chunk(
+        self,
+        client: PlayautoClient,
+        chunk: List[Dict],
+        overwrite: bool,
+        change_complete: bool,
+        retry_count: int
+    ) -> List[Dict]:
+        """배치 하나 업로드 (실패한 묶음만 재시도)"""
+        results = {}
+        pending = chunk
+
+        for attempt in range(retry_count + 1):
+            request_data = {
+                "orders": pending,
+                "overwrite": overwrite,
+                "change_complete": change_complete
+            }
+            try:
+                response = await client.put("/order/setnotice", data=request_data)
+                bundle_results = self._map_bundle_results(pending, response)
+            except Exception as e:
+                bundle_results = {str(item.get("bundle_no")): (False, str(e)) for item in pending}
+
+            for item in pending:
+                success, message = bundle_results[str(item.get("bundle_no"))]
+                results[str(item.get("bundle_no"))] = {
+                    **item,
+                    "success": success,
+                    "message": message,
+                    "attempt": attempt
+                }
+
+            pending = [item for item in pending if not results[str(item.get("bundle_no"))]["success"]]
+            if not pending or attempt >= retry_count:
+                break
 
-        # 응답 처리
-        return self._parse_upload_response(response, len(tracking_data))
+            logger.warning(f"송장 {len(pending)}건 업로드 실패, 재시도 {attempt + 1}/{retry_count}")
+            await asyncio.sleep(2 ** attempt)  # 지수 백오프
+
+        return [results[str(item.get("bundle_no"))] for item in chunk]
+
+    @staticmethod
+    def _map_bundle_results(items: List[Dict], response) -> Dict[str, tuple]:
+        """
+        setnotice 응답을 묶음번호별 (성공 여부, 메시지)로 변환
+
+        응답 형식:
+            - [{"bundle_no": "묶음번호", "result": "성공", "message": ""}] (data로 감싸진 경우 포함)
+            - {"data": {"success_count": N, "fail_count": N, "failed_items": [...]}}
+        """
+        bundle_nos = [str(item.get("bundle_no")) for item in items]
+        data = response.get("data", response) if isinstance(response, dict) else response
+
+        if isinstance(data, list):
+            mapped = {}
+            for entry in data:
+                if not isinstance(entry, dict) or entry.get("bundle_no") is None:
+                    continue
+                result = str(entry.get("result", "")).strip().lower()
+                message = entry.get("message") or entry.get("messages") or ""
+                if isinstance(message, list):
+                    message = ", ".join(str(m) for m in message)
+                mapped[str(entry["bundle_no"])] = (result in _SUCCESS_RESULTS, message)
+            return {
+                bundle_no: mapped.get(bundle_no, (False, "응답에 묶음 결과가 없습니다"))
+                for bundle_no in bundle_nos
+            }
+
+        if isinstance(data, dict) and ("failed_items" in data or "success_count" in data):
+            failed = {}
+            for entry in data.get("failed_items", []) or []:
+                bundle_no = entry.get("bundle_no") if isinstance(entry, dict) else entry
+                message = (entry.get("message") or "") if isinstance(entry, dict) else ""
+                failed[str(bundle_no)] = message or "업로드 실패"
+            # 실패 목록 외 나머지가 모두 성공으로 집계된 경우에만 성공 처리
+            if int(data.get("success_count", 0)) == len(bundle_nos) - len(failed):
+                return {
+                    bundle_no: (False, failed[bundle_no]) if bundle_no in failed else (True, "")
+                    for bundle_no in bundle_nos
+                }
+
+        return {bundle_no: (False, f"알 수 없는 응답 형식: {str(response)[:200]}") for bundle_no in bundle_nos}
 
     async def upload_single_tracking(
         self,
@@ -84,42 +231,6 @@ class PlayautoTrackingAPI:
 
         return await self.upload_tracking(tracking_data, overwrite, change_complete)
 
-    def _parse_upload_response(self, response: Dict, total_count: int) -> Dict:
-        """
-        송장 업로드 응답 파싱
-
-        Args:
-            response: API 응답 데이터
-            total_count: 총 업로드 시도 수
-
-        Returns:
-            파싱된 업로드 결과
-        """
-        try:
-            # API 응답 구조에 맞게 파싱 (플레이오토 API 문서 참조)
-            data = response.get("data", {})
-            success_count = data.get("success_count", 0)
-            fail_count = data.get("fail_count", 0)
-            failed_items = data.get("failed_items", [])
-
-            return {
-                "success": True,
-                "total_count": total_count,
-                "success_count": success_count,
-                "fail_count": fail_count,
-                "failed_items": failed_items
-            }
-
-        except Exception as e:
-            print(f"[ERROR] 송장 업로드 응답 파싱 실패: {e}")
-            return {
-                "success": False,
-                "total_count": total_count,
-                "success_count": 0,
-                "fail_count": total_count,
-                "failed_items": []
-            }
-
     def _get_courier_name(self, courier_code: str) -> str:
         """
         택배사 코드에서 택배사명 조회
@@ -221,20 +332,24 @@ async def auto_upload_tracking_from_local(days: int = 7) -> Dict:
                 "fail_count": 0
             }
 
-        # 송장 데이터 구성
+        # 송장 데이터 구성 (묶음번호별 1건, 같은 묶음의 주문은 결과를 함께 반영)
         tracking_data = []
+        bundle_orders: Dict[str, List[int]] = {}
         for order in orders:
             # bundle_no가 있는 경우만 업로드
             bundle_no = order.get("bundle_no") or order.get("playauto_order_id")
             if bundle_no:
-                # carr_no 추출 (DB에 저장되어 있어야 함, 없으면 기본값 1 = CJ대한통운)
-                carr_no = order.get("carr_no") or 1
-
-                tracking_data.append({
-                    "bundle_no": bundle_no,
-                    "carr_no": carr_no,
-                    "invoice_no": order["tracking_number"]
-                })
+                if str(bundle_no) not in bundle_orders:
+                    # carr_no 추출 (DB에 저장되어 있어야 함, 없으면 기본값 1 = CJ대한통운)
+                    carr_no = order.get("carr_no") or 1
+
+                    tracking_data.append({
+                        "bundle_no": bundle_no,
+                        "carr_no": carr_no,
+                        "invoice_no": order["tracking_number"]
+                    })
+                    bundle_orders[str(bundle_no)] = []
+                bundle_orders[str(bundle_no)].append(order["id"])
 
         if not tracking_data:
             return {
@@ -245,15 +360,18 @@ async def auto_upload_tracking_from_local(days: int = 7) -> Dict:
                 "fail_count": 0
             }
 
-        # 송장 업로드
-        tracking_api = PlayautoTrackingAPI()
-        result = await tracking_api.upload_tracking(tracking_data)
+        # 송장 업로드 (배치마다 성공한 묶음의 주문을 한 번에 업로드 완료 표시)
+        def mark_uploaded(chunk_results: List[Dict]):
+            order_ids = [
+                order_id
+                for r in chunk_results if r["success"]
+                for order_id in bundle_orders[str(r["bundle_no"])]
+            ]
+            if order_ids:
+                db.mark_tracking_uploaded_bulk(order_ids)
 
-        # 업로드 성공한 주문 표시
-        if result.get("success"):
-            for i, order in enumerate(orders):
-                if i < result.get("success_count", 0):
-                    db.mark_tracking_uploaded(order["id"])
+        tracking_api = PlayautoTrackingAPI()
+        result = await tracking_api.upload_tracking_batched(tracking_data, on_chunk=mark_uploaded)
 
         return result
 
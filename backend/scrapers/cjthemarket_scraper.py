@@ -10,6 +10,9 @@ from bs4 import BeautifulSoup
 
 from .base import BaseScraper
 from models.product import ProductCreate
+from logger import get_logger
+
+logger = get_logger(__name__)
 
 # FlareSolverr 클라이언트 임포트
 try:
@@ -43,7 +46,7 @@ class CJTheMarketScraper(BaseScraper):
                 if result and result.get('html'):
                     return result.get('html')
             except Exception as e:
-                print(f"[FLARESOLVERR] 실패: {e}")
+                logger.warning(f"[FLARESOLVERR] 실패: {e}")
 
         # requests 폴백
         try:
@@ -51,7 +54,7 @@ class CJTheMarketScraper(BaseScraper):
             response.raise_for_status()
             return response.text
         except Exception as e:
-            print(f"[REQUESTS] 실패: {e}")
+            logger.warning(f"[REQUESTS] 실패: {e}")
             return None
 
     async def search_products(
@@ -74,11 +77,11 @@ class CJTheMarketScraper(BaseScraper):
             # CJ The Market 검색 URL
             search_url = f"{self.base_url}/the/search?keyword={encoded_query}"
 
-            print(f"CJ The Market: 검색 시도 - {search_url}")
+            logger.debug(f"CJ The Market: 검색 시도 - {search_url}")
 
             html = self._get_html(search_url)
             if not html:
-                print(f"CJ The Market: HTML 가져오기 실패")
+                logger.warning(f"CJ The Market: HTML 가져오기 실패")
                 return self._get_sample_products(search_query, min(10, page_size))
 
             soup = BeautifulSoup(html, 'html.parser')
@@ -144,18 +147,18 @@ class CJTheMarketScraper(BaseScraper):
                             break
 
                 except Exception as e:
-                    print(f"CJ 상품 파싱 오류: {str(e)}")
+                    logger.debug(f"CJ 상품 파싱 오류: {str(e)}")
                     continue
 
-            print(f"CJ The Market: {len(products)}개 상품 추출")
+            logger.debug(f"CJ The Market: {len(products)}개 상품 추출")
 
             # 상품이 없으면 샘플 데이터 반환
             if not products:
-                print(f"CJ The Market: 상품을 찾지 못해 샘플 데이터 반환")
+                logger.debug(f"CJ The Market: 상품을 찾지 못해 샘플 데이터 반환")
                 products = self._get_sample_products(search_query, min(10, page_size))
 
         except Exception as e:
-            print(f"CJ The Market 스크래핑 오류: {str(e)}")
+            logger.warning(f"CJ The Market 스크래핑 오류: {str(e)}")
             import traceback
             traceback.print_exc()
             products = self._get_sample_products(keyword or category or "선물세트", min(10, page_size))
@@ -203,13 +206,13 @@ class CJTheMarketScraper(BaseScraper):
             )
 
         except Exception as e:
-            print(f"CJ 파싱 상세 오류: {str(e)}")
+            logger.debug(f"CJ 파싱 상세 오류: {str(e)}")
             return None
 
     async def get_product_detail(self, product_url: str) -> Dict:
         """상품 상세 정보 가져오기"""
         try:
-            print(f"CJ The Market: 상품 상세 페이지 로드 - {product_url}")
+            logger.debug(f"CJ The Market: 상품 상세 페이지 로드 - {product_url}")
 
             html = self._get_html(product_url)
             if not html:
@@ -254,7 +257,7 @@ class CJTheMarketScraper(BaseScraper):
             }
 
         except Exception as e:
-            print(f"CJ The Market 상품 상세 정보 조회 오류: {str(e)}")
+            logger.warning(f"CJ The Market 상품 상세 정보 조회 오류: {str(e)}")
             return {}
 
     async def get_product_by_url(self, product_url: str) -> Optional[ProductCreate]:
@@ -265,7 +268,7 @@ class CJTheMarketScraper(BaseScraper):
             prd_cd = params.get('prdCd', [''])[0]
 
             if not prd_cd:
-                print(f"CJ The Market: prdCd를 찾을 수 없음 - {product_url}")
+                logger.debug(f"CJ The Market: prdCd를 찾을 수 없음 - {product_url}")
                 return None
 
             detail = await self.get_product_detail(product_url)
@@ -289,7 +292,7 @@ class CJTheMarketScraper(BaseScraper):
             )
 
         except Exception as e:
-            print(f"CJ The Market URL 상품 조회 오류: {str(e)}")
+            logger.warning(f"CJ The Market URL 상품 조회 오류: {str(e)}")
             return None
 
     async def check_price(self, product_url: str) -> float:
@@ -298,7 +301,7 @@ class CJTheMarketScraper(BaseScraper):
             detail = await self.get_product_detail(product_url)
             return detail.get("price", 0.0)
         except Exception as e:
-            print(f"CJ The Market 가격 확인 오류: {str(e)}")
+            logger.warning(f"CJ The Market 가격 확인 오류: {str(e)}")
             return 0.0
 
     def _get_sample_products(self, keyword: str, count: int) -> List[ProductCreate]:
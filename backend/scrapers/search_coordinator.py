@@ -0,0 +1,142 @@
+"""
+소싱처 동시 검색 (fan-out)
+
+여러 스크래퍼의 search_products를 동시에 실행하고, 소싱처별 제한 시간을 넘기면
+해당 소싱처만 제외한 부분 결과를 반환합니다.
+
+- 제한 시간: SOURCING_SEARCH_TIMEOUT (기본 20초), 소싱처별 SOURCING_SEARCH_TIMEOUTS="ssg=30,traders=15"
+- 동기 I/O(requests/FlareSolverr)를 쓰는 스크래퍼는 별도 스레드의 이벤트 루프에서 실행 (다른 소싱처/요청을 막지 않음)
+  전용 스레드 풀(SOURCING_SEARCH_THREADS, 기본 4)을 사용하므로 제한 시간을 넘겨 계속 실행 중인 스크래퍼가
+  DB 호출 등이 함께 쓰는 기본 executor 스레드를 점유하지 않음
+- 결과 캐시: (source, keyword, category, page, page_size) 기준 SOURCING_SEARCH_CACHE_TTL초 (기본 60초)
+"""
+
+import asyncio
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import AsyncIterator, Dict, List, Optional
+
+from models.product import ProductCreate
+from utils.cache import RedisCache, get_cache
+from logger import get_logger
+
+logger = get_logger(__name__)
+
+SEARCH_TIMEOUT = float(os.getenv('SOURCING_SEARCH_TIMEOUT', '20'))
+SEARCH_TIMEOUTS = os.getenv('SOURCING_SEARCH_TIMEOUTS', '')
+SEARCH_CACHE_TTL = int(os.getenv('SOURCING_SEARCH_CACHE_TTL', '60'))
+SEARCH_THREADS = int(os.getenv('SOURCING_SEARCH_THREADS', '4'))
+
+# 이벤트 루프를 블로킹하는 (동기 HTTP 호출을 하는) 스크래퍼
+BLOCKING_SOURCES = {"ssg", "cjthemarket"}
+
+# 블로킹 스크래퍼 전용 스레드 풀 (제한 시간 초과 후에도 스레드는 끝까지 실행되므로 기본 executor와 분리)
+_executor = ThreadPoolExecutor(max_workers=max(1, SEARCH_THREADS), thread_name_prefix='sourcing-search')
+
+
+def _run_blocking(scraper, kwargs: Dict) -> List[ProductCreate]:
+    # 코루틴은 스레드 안에서 생성 (대기 중 취소되면 시작하지 않음)
+    return asyncio.run(scraper.search_products(**kwargs))
+
+
+def _parse_timeouts(spec: str) -> Dict[str, float]:
+    timeouts = {}
+    for item in spec.split(','):
+        name, _, value = item.partition('=')
+        try:
+            if name.strip():
+                timeouts[name.strip()] = float(value)
+        except ValueError:
+            logger.warning(f"[소싱검색] 잘못된 제한 시간 설정 무시: {item}")
+    return timeouts
+
+
+class SearchCoordinator:
+    """소싱처 스크래퍼 동시 검색 코디네이터"""
+
+    def __init__(self, scrapers: Dict, timeouts: Optional[Dict[str, float]] = None,
+                 default_timeout: float = SEARCH_TIMEOUT, cache_ttl: int = SEARCH_CACHE_TTL):
+        self.scrapers = scrapers
+        self.timeouts = timeouts if timeouts is not None else _parse_timeouts(SEARCH_TIMEOUTS)
+        self.default_timeout = default_timeout
+        self.cache_ttl = cache_ttl
+
+    def _cache_key(self, source: str, keyword: Optional[str], category: Optional[str], page: int, page_size: int) -> str:
+        return f"sourcing_search:{source}:{keyword or ''}:{category or ''}:{page}:{page_size}"
+
+    async def _run_scraper(self, source: str, **kwargs) -> List[ProductCreate]:
+        scraper = self.scrapers[source]
+        if source in BLOCKING_SOURCES:
+            # 전용 스레드에서 새 이벤트 루프로 실행 (제한 시간 초과 시 스레드는 끝까지 실행되지만 결과는 버림)
+            return await asyncio.get_running_loop().run_in_executor(_executor, _run_blocking, scraper, kwargs)
+        return await scraper.search_products(**kwargs)
+
+    async def search_source(self, source: str, keyword: Optional[str] = None, category: Optional[str] = None,
+                            page: int = 1, page_size: int = 20) -> Dict:
+        """
+        소싱처 1곳 검색 (캐시 → 제한 시간 내 스크래핑)
+
+        Returns:
+            {"source", "status": ok|cached|timeout|error, "products", "elapsed_ms", "error"}
+        """
+        started = time.perf_counter()
+        cache = get_cache()
+        cache_key = self._cache_key(source, keyword, category, page, page_size)
+
+        cached = cache.get(cache_key, self.cache_ttl)
+        if cached is not None:
+            return {"source": source, "status": "cached", "products": cached, "elapsed_ms": 0, "error": None}
+
+        timeout = self.timeouts.get(source, self.default_timeout)
+        try:
+            products = await asyncio.wait_for(
+                self._run_scraper(source, category=category, keyword=keyword, page=page, page_size=page_size),
+                timeout=timeout
+            )
+        except asyncio.TimeoutError:
+            logger.warning(f"[소싱검색] {source} 제한 시간 초과 ({timeout:g}초) - 부분 결과 반환")
+            return {
+                "source": source, "status": "timeout", "products": [],
+                "elapsed_ms": round((time.perf_counter() - started) * 1000),
+                "error": f"제한 시간 초과 ({timeout:g}초)"
+            }
+        except Exception as e:
+            logger.error(f"[소싱검색] {source} 검색 실패: {e}")
+            return {
+                "source": source, "status": "error", "products": [],
+                "elapsed_ms": round((time.perf_counter() - started) * 1000),
+                "error": str(e)
+            }
+
+        if isinstance(cache, RedisCache):
+            cache.set(cache_key, products, self.cache_ttl)
+        else:
+            cache.set(cache_key, products)
+
+        return {
+            "source": source, "status": "ok", "products": products,
+            "elapsed_ms": round((time.perf_counter() - started) * 1000), "error": None
+        }
+
+    async def iter_search(self, sources: List[str], keyword: Optional[str] = None, category: Optional[str] = None,
+                          page: int = 1, page_size: int = 20) -> AsyncIterator[Dict]:
+        """소싱처들을 동시에 검색하고 끝나는 순서대로 결과 반환"""
+        tasks = [
+            asyncio.create_task(self.search_source(source, keyword, category, page, page_size))
+            for source in sources
+        ]
+        try:
+            for finished in asyncio.as_completed(tasks):
+                yield await finished
+        finally:
+            # 클라이언트 연결이 끊긴 경우 남은 검색 취소
+            for task in tasks:
+                task.cancel()
+
+    async def search(self, sources: List[str], keyword: Optional[str] = None, category: Optional[str] = None,
+                     page: int = 1, page_size: int = 20) -> List[Dict]:
+        """소싱처들을 동시에 검색 (결과는 sources 순서)"""
+        return list(await asyncio.gather(*(
+            self.search_source(source, keyword, category, page, page_size) for source in sources
+        )))
@@ -8,6 +8,9 @@ from bs4 import BeautifulSoup
 from urllib.parse import urljoin, quote
 from .base import BaseScraper
 from models.product import ProductCreate
+from logger import get_logger
+
+logger = get_logger(__name__)
 
 
 class SSGScraper(BaseScraper):
@@ -50,7 +53,7 @@ class SSGScraper(BaseScraper):
             # SSG 검색 URL 구성
             search_url = f"{self.base_url}/search.ssg?target=all&query={encoded_query}&page={page}&count={page_size}"
 
-            print(f"SSG: 검색 시도 - {search_url}")
+            logger.debug(f"SSG: 검색 시도 - {search_url}")
 
             async with httpx.AsyncClient(
                 timeout=30.0,
@@ -77,7 +80,7 @@ class SSGScraper(BaseScraper):
                     for tag, class_name in selectors:
                         product_items = soup.find_all(tag, class_=class_name)
                         if product_items:
-                            print(f"SSG: '{tag}.{class_name}' 셀렉터로 {len(product_items)}개 발견")
+                            logger.debug(f"SSG: '{tag}.{class_name}' 셀렉터로 {len(product_items)}개 발견")
                             break
 
                     for idx, item in enumerate(product_items[:page_size]):
@@ -86,16 +89,16 @@ class SSGScraper(BaseScraper):
                             if product:
                                 products.append(product)
                         except Exception as e:
-                            print(f"SSG 상품 파싱 오류 #{idx}: {str(e)}")
+                            logger.debug(f"SSG 상품 파싱 오류 #{idx}: {str(e)}")
                             continue
 
                 # 상품이 하나도 없으면 샘플 데이터 반환
                 if not products:
-                    print(f"SSG: 실제 상품을 찾지 못해 샘플 데이터 반환 (검색어: {search_query})")
+                    logger.debug(f"SSG: 실제 상품을 찾지 못해 샘플 데이터 반환 (검색어: {search_query})")
                     products = self._get_sample_products(search_query, min(10, page_size))
 
         except Exception as e:
-            print(f"SSG 스크래핑 오류: {str(e)}")
+            logger.warning(f"SSG 스크래핑 오류: {str(e)}")
             # 에러 발생 시 샘플 데이터 반환
             products = self._get_sample_products(keyword or category or "샘플", min(10, page_size))
 
@@ -225,7 +228,7 @@ class SSGScraper(BaseScraper):
             )
 
         except Exception as e:
-            print(f"SSG 상품 파싱 상세 오류: {str(e)}")
+            logger.debug(f"SSG 상품 파싱 상세 오류: {str(e)}")
             return None
 
     async def get_product_detail(self, product_url: str) -> Dict:
@@ -272,7 +275,7 @@ class SSGScraper(BaseScraper):
                 }
 
         except Exception as e:
-            print(f"SSG 상품 상세 정보 조회 오류: {str(e)}")
+            logger.warning(f"SSG 상품 상세 정보 조회 오류: {str(e)}")
             return {}
 
     async def check_price(self, product_url: str) -> float:
@@ -283,7 +286,7 @@ class SSGScraper(BaseScraper):
             detail = await self.get_product_detail(product_url)
             return detail.get("price", 0.0)
         except Exception as e:
-            print(f"SSG 가격 확인 오류: {str(e)}")
+            logger.warning(f"SSG 가격 확인 오류: {str(e)}")
             return 0.0
 
     def _get_sample_products(self, keyword: str, count: int) -> List[ProductCreate]:
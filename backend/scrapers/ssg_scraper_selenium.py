@@ -9,6 +9,9 @@ from bs4 import BeautifulSoup
 
 from .base import BaseScraper
 from models.product import ProductCreate
+from logger import get_logger
+
+logger = get_logger(__name__)
 
 # FlareSolverr 클라이언트 임포트
 try:
@@ -43,7 +46,7 @@ class SSGSeleniumScraper(BaseScraper):
                 if result and result.get('html'):
                     return result.get('html')
             except Exception as e:
-                print(f"[FLARESOLVERR] 실패: {e}")
+                logger.warning(f"[FLARESOLVERR] 실패: {e}")
 
         # requests 폴백
         try:
@@ -51,7 +54,7 @@ class SSGSeleniumScraper(BaseScraper):
             response.raise_for_status()
             return response.text
         except Exception as e:
-            print(f"[REQUESTS] 실패: {e}")
+            logger.warning(f"[REQUESTS] 실패: {e}")
             return None
 
     async def search_products(
@@ -74,11 +77,11 @@ class SSGSeleniumScraper(BaseScraper):
             # SSG 검색 URL
             search_url = f"{self.base_url}/search.ssg?target=all&query={encoded_query}&page={page}"
 
-            print(f"SSG: 검색 시도 - {search_url}")
+            logger.debug(f"SSG: 검색 시도 - {search_url}")
 
             html = self._get_html(search_url)
             if not html:
-                print(f"SSG: HTML 가져오기 실패")
+                logger.warning(f"SSG: HTML 가져오기 실패")
                 return self._get_sample_products(search_query, min(10, page_size))
 
             soup = BeautifulSoup(html, 'html.parser')
@@ -165,18 +168,18 @@ class SSGSeleniumScraper(BaseScraper):
                         break
 
                 except Exception as e:
-                    print(f"SSG 상품 파싱 오류: {str(e)}")
+                    logger.debug(f"SSG 상품 파싱 오류: {str(e)}")
                     continue
 
-            print(f"SSG: {len(products)}개 상품 추출")
+            logger.debug(f"SSG: {len(products)}개 상품 추출")
 
             # 상품이 없으면 샘플 데이터 반환
             if not products:
-                print(f"SSG: 상품을 찾지 못해 샘플 데이터 반환")
+                logger.debug(f"SSG: 상품을 찾지 못해 샘플 데이터 반환")
                 products = self._get_sample_products(search_query, min(10, page_size))
 
         except Exception as e:
-            print(f"SSG 스크래핑 오류: {str(e)}")
+            logger.warning(f"SSG 스크래핑 오류: {str(e)}")
             import traceback
             traceback.print_exc()
             products = self._get_sample_products(keyword or category or "샘플", min(10, page_size))
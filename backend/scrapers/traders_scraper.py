@@ -7,6 +7,9 @@ from bs4 import BeautifulSoup
 from urllib.parse import urljoin, quote
 from .base import BaseScraper
 from models.product import ProductCreate
+from logger import get_logger
+
+logger = get_logger(__name__)
 
 
 class TradersScraper(BaseScraper):
@@ -50,11 +53,11 @@ class TradersScraper(BaseScraper):
 
             # 상품이 하나도 없으면 샘플 데이터 반환
             if not products:
-                print(f"Traders: 실제 상품을 찾지 못해 샘플 데이터 반환 (검색어: {search_query})")
+                logger.debug(f"Traders: 실제 상품을 찾지 못해 샘플 데이터 반환 (검색어: {search_query})")
                 products = self._get_sample_products(search_query, min(10, page_size))
 
         except Exception as e:
-            print(f"Traders 스크래핑 오류: {str(e)}")
+            logger.warning(f"Traders 스크래핑 오류: {str(e)}")
             # 에러 발생 시 샘플 데이터 반환
             products = self._get_sample_products(keyword or category or "샘플", min(10, page_size))
 
@@ -80,7 +83,7 @@ class TradersScraper(BaseScraper):
 
                 for search_url in search_urls:
                     try:
-                        print(f"Traders: 검색 시도 - {search_url}")
+                        logger.debug(f"Traders: 검색 시도 - {search_url}")
                         response = await client.get(search_url)
 
                         if response.status_code == 200:
@@ -100,7 +103,7 @@ class TradersScraper(BaseScraper):
                             for tag, class_name in selectors:
                                 product_items = soup.find_all(tag, class_=class_name)
                                 if product_items:
-                                    print(f"Traders: '{tag}.{class_name}' 셀렉터로 {len(product_items)}개 발견")
+                                    logger.debug(f"Traders: '{tag}.{class_name}' 셀렉터로 {len(product_items)}개 발견")
                                     break
 
                             for idx, item in enumerate(product_items[:page_size]):
@@ -109,18 +112,18 @@ class TradersScraper(BaseScraper):
                                     if product:
                                         products.append(product)
                                 except Exception as e:
-                                    print(f"Traders 상품 파싱 오류 #{idx}: {str(e)}")
+                                    logger.debug(f"Traders 상품 파싱 오류 #{idx}: {str(e)}")
                                     continue
 
                             if products:
                                 break  # 상품을 찾으면 루프 종료
 
                     except Exception as e:
-                        print(f"Traders URL 시도 실패 ({search_url}): {str(e)}")
+                        logger.warning(f"Traders URL 시도 실패 ({search_url}): {str(e)}")
                         continue
 
         except Exception as e:
-            print(f"Traders HTTP 검색 오류: {str(e)}")
+            logger.warning(f"Traders HTTP 검색 오류: {str(e)}")
 
         return products
 
@@ -249,7 +252,7 @@ class TradersScraper(BaseScraper):
             )
 
         except Exception as e:
-            print(f"Traders 상품 파싱 상세 오류: {str(e)}")
+            logger.debug(f"Traders 상품 파싱 상세 오류: {str(e)}")
             return None
 
     async def get_product_detail(self, product_url: str) -> Dict:
@@ -296,7 +299,7 @@ class TradersScraper(BaseScraper):
                 }
 
         except Exception as e:
-            print(f"Traders 상품 상세 정보 조회 오류: {str(e)}")
+            logger.warning(f"Traders 상품 상세 정보 조회 오류: {str(e)}")
             return {}
 
     async def check_price(self, product_url: str) -> float:
@@ -307,7 +310,7 @@ class TradersScraper(BaseScraper):
             detail = await self.get_product_detail(product_url)
             return detail.get("price", 0.0)
         except Exception as e:
-            print(f"Traders 가격 확인 오류: {str(e)}")
+            logger.warning(f"Traders 가격 확인 오류: {str(e)}")
             return 0.0
 
     def _get_sample_products(self, keyword: str, count: int) -> List[ProductCreate]:
@@ -10,6 +10,7 @@ from apscheduler.schedulers.asyncio import AsyncIOScheduler
 from apscheduler.triggers.cron import CronTrigger
 from database.db_wrapper import get_db
 from services.tracking_upload_service import TrackingUploadService
+from utils.metrics import timed_job
 
 
 class TrackingScheduler:
@@ -100,6 +101,7 @@ class TrackingScheduler:
             print(f"[ERROR] 스케줄 등록 실패: {e}")
             raise
 
+    @timed_job('tracking_upload')
     async def _scheduled_upload(self, retry_count: int, notify_discord: bool, notify_slack: bool):
         """스케줄된 업로드 실행"""
         try:
@@ -4,13 +4,16 @@
 로컬 DB에서 송장이 등록된 주문을 찾아 플레이오토로 자동 업로드합니다.
 """
 
-import asyncio
+import time
 from datetime import datetime
 from typing import List, Dict, Optional
 from database.db_wrapper import get_db
 from playauto.tracking import PlayautoTrackingAPI
 import json
 
+# 진행률 DB 기록 최소 간격 (초)
+PROGRESS_INTERVAL = 1.0
+
 
 class TrackingUploadService:
     """자동 송장 업로드 서비스"""
@@ -70,37 +73,12 @@ class TrackingUploadService:
                 total_count=len(orders)
             )
 
-            # 4. 각 주문별로 업로드 시도
-            success_count = 0
-            failed_count = 0
-
-            for idx, order in enumerate(orders):
-                try:
-                    # 개별 송장 업로드
-                    result = await self._upload_single_tracking(
-                        job_id=job_id,
-                        order=order,
-                        retry_count=retry_count
-                    )
-
-                    if result['success']:
-                        success_count += 1
-                    else:
-                        failed_count += 1
-
-                except Exception as e:
-                    print(f"[ERROR] 주문 {order.get('order_number')} 업로드 실패: {e}")
-                    failed_count += 1
-                    self._log_upload_detail(
-                        job_id=job_id,
-                        order=order,
-                        status='failed',
-                        error_message=str(e)
-                    )
-
-                # 진행률 업데이트
-                progress = ((idx + 1) / len(orders)) * 100
-                self._update_job_progress(job_id, progress)
+            # 4. 배치 업로드 (배치마다 결과 기록/업로드 완료 표시를 한 번에)
+            success_count, failed_count = await self._upload_batched(
+                job_id=job_id,
+                orders=orders,
+                retry_count=retry_count
+            )
 
             # 5. 작업 완료
             self._update_job_status(
@@ -141,82 +119,87 @@ class TrackingUploadService:
             )
             raise
 
-    async def _upload_single_tracking(
+    async def _upload_batched(
         self,
         job_id: int,
-        order: Dict,
+        orders: List[Dict],
         retry_count: int = 3
-    ) -> Dict:
+    ) -> tuple:
         """
-        개별 송장 업로드 (재시도 포함)
+        묶음번호별 송장을 배치로 업로드하고 묶음별 결과를 주문에 반영
 
         Args:
             job_id: 작업 ID
-            order: 주문 정보
-            retry_count: 재시도 횟수
+            orders: 업로드 대기 주문 목록
+            retry_count: 실패한 묶음 재시도 횟수
 
         Returns:
-            업로드 결과
+            (성공 주문 수, 실패 주문 수)
         """
-        for attempt in range(retry_count + 1):
-            try:
-                # 플레이오토 API로 송장 업로드
-                tracking_data = [{
-                    'order_no': order.get('order_number'),
-                    'carrier_code': order.get('carrier_code', 'UNKNOWN'),
-                    'tracking_number': order.get('tracking_number')
-                }]
-
-                result = await self.tracking_api.upload_tracking(tracking_data)
-
-                if result.get('success'):
-                    # 성공 로그
-                    self._log_upload_detail(
-                        job_id=job_id,
-                        order=order,
-                        status='success',
-                        retry_attempt=attempt
-                    )
-
-                    # 로컬 DB에 업로드 완료 표시
-                    self._mark_order_uploaded(order.get('id'))
-
-                    return {'success': True}
-                else:
-                    # 실패했지만 재시도
-                    if attempt < retry_count:
-                        print(f"[WARN] 주문 {order.get('order_number')} 업로드 실패, 재시도 {attempt + 1}/{retry_count}")
-                        await asyncio.sleep(2 ** attempt)  # 지수 백오프
-                        continue
+        total = len(orders)
+        tracking_data = []
+        bundle_orders: Dict[str, List[Dict]] = {}
+        no_bundle_orders = []
+
+        for order in orders:
+            bundle_no = order.get('bundle_no')
+            if not bundle_no:
+                no_bundle_orders.append(order)
+                continue
+            if str(bundle_no) not in bundle_orders:
+                tracking_data.append({
+                    'bundle_no': bundle_no,
+                    'carr_no': self.tracking_api.get_carrier_code_number(order.get('carrier_code') or 'CJ'),
+                    'invoice_no': order.get('tracking_number')
+                })
+                bundle_orders[str(bundle_no)] = []
+            bundle_orders[str(bundle_no)].append(order)
+
+        success_count = 0
+        failed_count = 0
+        processed = 0
+        last_progress = time.monotonic()
+
+        # 묶음번호가 없는 주문은 업로드 불가
+        if no_bundle_orders:
+            self._log_upload_details(job_id, [
+                (order, 'failed', 0, '플레이오토 묶음번호가 없습니다') for order in no_bundle_orders
+            ])
+            failed_count += len(no_bundle_orders)
+            processed += len(no_bundle_orders)
+
+        def on_chunk(chunk_results: List[Dict]):
+            nonlocal success_count, failed_count, processed, last_progress
+
+            details = []
+            uploaded_ids = []
+            for r in chunk_results:
+                for order in bundle_orders[str(r['bundle_no'])]:
+                    if r['success']:
+                        details.append((order, 'success', r['attempt'], None))
+                        uploaded_ids.append(order.get('id'))
+                        success_count += 1
                     else:
-                        # 최종 실패
-                        error_msg = result.get('message', '알 수 없는 오류')
-                        self._log_upload_detail(
-                            job_id=job_id,
-                            order=order,
-                            status='failed',
-                            retry_attempt=attempt,
-                            error_message=error_msg
-                        )
-                        return {'success': False, 'error': error_msg}
-
-            except Exception as e:
-                if attempt < retry_count:
-                    print(f"[WARN] 주문 {order.get('order_number')} 업로드 중 오류, 재시도 {attempt + 1}/{retry_count}: {e}")
-                    await asyncio.sleep(2 ** attempt)
-                    continue
-                else:
-                    # 최종 실패
-                    self._log_upload_detail(
-                        job_id=job_id,
-                        order=order,
-                        status='failed',
-                        retry_attempt=attempt,
-                        error_message=str(e)
-                    )
-                    return {'success': False, 'error': str(e)}
-
-        return {'success': False, 'error': '최대 재시도 횟수 초과'}
+                        details.append((order, 'failed', r['attempt'], r['message'] or '알 수 없는 오류'))
+                        failed_count += 1
+                    processed += 1
+
+            self._log_upload_details(job_id, details)
+            self._mark_orders_uploaded(uploaded_ids)
+
+            now = time.monotonic()
+            if now - last_progress >= PROGRESS_INTERVAL:
+                last_progress = now
+                self._update_job_progress(job_id, (processed / total) * 100)
+
+        if tracking_data:
+            await self.tracking_api.upload_tracking_batched(
+                tracking_data,
+                retry_count=retry_count,
+                on_chunk=on_chunk
+            )
+
+        return success_count, failed_count
 
     def _get_pending_orders(self) -> List[Dict]:
         """
@@ -229,6 +212,7 @@ class TrackingUploadService:
                 SELECT DISTINCT
                     o.id,
                     o.order_number,
+                    o.playauto_order_id AS bundle_no,
                     oi.tracking_number,
                     o.customer_name
                 FROM orders o
@@ -322,45 +306,43 @@ class TrackingUploadService:
             """, (progress, job_id))
             conn.commit()
 
-    def _log_upload_detail(
-        self,
-        job_id: int,
-        order: Dict,
-        status: str,
-        retry_attempt: int = 0,
-        error_message: str = None
-    ):
-        """개별 송장 업로드 로그"""
+    def _log_upload_details(self, job_id: int, details: List[tuple]):
+        """
+        송장 업로드 로그 일괄 기록
+
+        Args:
+            details: [(주문 정보, status, retry_attempt, error_message)]
+        """
+        if not details:
+            return
+
         with self.db.get_connection() as conn:
             cursor = conn.cursor()
-            cursor.execute("""
+            cursor.executemany("""
                 INSERT INTO tracking_upload_details
                 (job_id, order_id, order_no, carrier_code, tracking_number, status, retry_attempt, error_message, uploaded_at)
                 VALUES (?, ?, ?, ?, ?, ?, ?, ?, CURRENT_TIMESTAMP)
-            """, (
-                job_id,
-                order.get('id'),
-                order.get('order_number'),
-                order.get('carrier_code', 'UNKNOWN'),
-                order.get('tracking_number'),
-                status,
-                retry_attempt,
-                error_message
-            ))
+            """, [
+                (
+                    job_id,
+                    order.get('id'),
+                    order.get('order_number'),
+                    order.get('carrier_code', 'UNKNOWN'),
+                    order.get('tracking_number'),
+                    status,
+                    retry_attempt,
+                    error_message
+                )
+                for order, status, retry_attempt, error_message in details
+            ])
             conn.commit()
 
-    def _mark_order_uploaded(self, order_id: int):
-        """주문을 업로드 완료로 표시"""
-        with self.db.get_connection() as conn:
-            cursor = conn.cursor()
-            cursor.execute("""
-                UPDATE orders
-                SET tracking_uploaded_at = CURRENT_TIMESTAMP,
-                    synced_to_playauto = 1,
-                    updated_at = CURRENT_TIMESTAMP
-                WHERE id = ?
-            """, (order_id,))
-            conn.commit()
+    def _mark_orders_uploaded(self, order_ids: List[int]):
+        """주문을 업로드 완료로 일괄 표시"""
+        if not order_ids:
+            return
+
+        self.db.mark_tracking_uploaded_bulk(order_ids)
 
     async def _send_notifications(
         self,
@@ -0,0 +1,73 @@
+"""
+내용 주소 이미지 저장소 정리(sweep_unreferenced) 테스트
+
+참조 수에 잡히지 않은 채 상품 행에서 재사용 중인 blob URL은 유지되고,
+미리보기처럼 상품 행에 저장되지 않은 참조 수는 객체를 붙잡지 않는지 확인합니다. (임시 SQLite DB 사용)
+"""
+import os
+import sys
+import tempfile
+from datetime import datetime, timedelta
+sys.path.append('.')
+
+_tmp_dir = tempfile.mkdtemp()
+os.environ['DATABASE_URL'] = f"sqlite:///{os.path.join(_tmp_dir, 'image_store_test.db')}"
+
+from sqlalchemy import select
+
+from database.models import ImageBlob, MySellingProduct
+from utils import image_store, supabase_storage
+
+
+def _add_blob(session, digest: str, ref_count: int = 0) -> str:
+    storage_path = f"{image_store.BLOB_PREFIX}{digest}.jpg"
+    session.add(ImageBlob(
+        content_hash=digest,
+        storage_path=storage_path,
+        size=100,
+        content_type='image/jpeg',
+        ref_count=ref_count,
+        last_referenced_at=datetime.now() - timedelta(hours=image_store.UNREFERENCED_GRACE_HOURS + 1)
+    ))
+    return storage_path
+
+
+def test_reused_url_survives_sweep():
+    """상품 썸네일/상세페이지에서 쓰는 blob은 참조 수가 0이어도 유지"""
+    # Storage 호출 없이 DB 상태만 확인
+    supabase_storage.supabase = None
+
+    db_manager = image_store._get_manager()
+    MySellingProduct.__table__.create(bind=db_manager.engine, checkfirst=True)
+
+    with db_manager.get_session() as session:
+        thumbnail_path = _add_blob(session, 'a' * 64)
+        detail_path = _add_blob(session, 'b' * 64)
+        orphan_path = _add_blob(session, 'c' * 64)
+        # 미리보기/일괄 가져오기로 참조 수만 올라간 객체
+        preview_path = _add_blob(session, 'd' * 64, ref_count=3)
+
+        # 기존 blob URL을 그대로 넘겨 만든 상품 (참조 수 증가 없음)
+        session.add(MySellingProduct(
+            id=1,
+            product_name='재사용 상품',
+            selling_price=10000,
+            thumbnail_url=supabase_storage.get_public_url(thumbnail_path),
+            detail_page_data=f'{{"images": ["{supabase_storage.get_public_url(detail_path)}"]}}'
+        ))
+
+    image_store.sweep_unreferenced()
+
+    with db_manager.get_session() as session:
+        remaining = dict(session.execute(select(ImageBlob.storage_path, ImageBlob.ref_count)).all())
+
+    assert thumbnail_path in remaining, "썸네일로 재사용 중인 blob이 삭제됨"
+    assert detail_path in remaining, "상세페이지에서 재사용 중인 blob이 삭제됨"
+    assert remaining[thumbnail_path] == 1 and remaining[detail_path] == 1, "참조 수가 실제 사용 수로 맞춰지지 않음"
+    assert orphan_path not in remaining, "참조 없는 blob이 정리되지 않음"
+    assert preview_path not in remaining, "상품 행에 없는 참조 수 때문에 blob이 유지됨"
+    print("OK 재사용 URL 유지 / 참조 없는 blob 정리 / 미리보기 참조 수 무시")
+
+
+if __name__ == '__main__':
+    test_reused_url_survives_sweep()
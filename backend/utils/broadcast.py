@@ -0,0 +1,116 @@
+"""
+워커 간 브로드캐스트 채널
+
+Gunicorn 워커마다 자기 WebSocket 연결만 알고 있으므로,
+한 워커에서 발생한 이벤트를 모든 워커의 연결에 전달하기 위해 사용합니다.
+
+- RedisBroker: Redis pub/sub (REDIS_URL 설정 시)
+- InMemoryBroker: 단일 프로세스용 (Redis 미설치/미설정, 테스트)
+
+발행한 워커도 채널을 통해 자기 메시지를 받으므로 수신 콜백 한 곳에서만 로컬 전달하면 됩니다.
+"""
+
+import asyncio
+import json
+import os
+from typing import Awaitable, Callable, Optional
+
+try:
+    import redis.asyncio as aioredis
+    REDIS_AVAILABLE = True
+except ImportError:
+    REDIS_AVAILABLE = False
+
+
+CHANNEL = os.getenv('BROADCAST_CHANNEL', 'ws:broadcast')
+
+# 수신 콜백: (topic, payload 문자열)
+Handler = Callable[[Optional[str], str], Awaitable[None]]
+
+
+class InMemoryBroker:
+    """프로세스 내 브로커 (발행 즉시 콜백 호출)"""
+
+    name = 'memory'
+
+    def __init__(self):
+        self._handler: Optional[Handler] = None
+
+    async def start(self, handler: Handler):
+        self._handler = handler
+
+    async def stop(self):
+        self._handler = None
+
+    async def publish(self, topic: Optional[str], payload: str):
+        if self._handler:
+            await self._handler(topic, payload)
+
+
+class RedisBroker:
+    """Redis pub/sub 브로커 (연결이 끊기면 재접속, 발행 실패 시 로컬에만 전달)"""
+
+    name = 'redis'
+
+    def __init__(self, redis_url: str, channel: str = CHANNEL):
+        self.redis_url = redis_url
+        self.channel = channel
+        self._client = None
+        self._handler: Optional[Handler] = None
+        self._listener: Optional[asyncio.Task] = None
+
+    async def start(self, handler: Handler):
+        self._handler = handler
+        self._client = aioredis.from_url(self.redis_url, socket_connect_timeout=5)
+        await self._client.ping()
+        self._listener = asyncio.create_task(self._listen())
+
+    async def stop(self):
+        if self._listener:
+            self._listener.cancel()
+            await asyncio.gather(self._listener, return_exceptions=True)
+        if self._client:
+            await self._client.aclose()
+        self._handler = None
+
+    async def publish(self, topic: Optional[str], payload: str):
+        try:
+            await self._client.publish(self.channel, json.dumps({'topic': topic, 'payload': payload}))
+        except Exception as e:
+            print(f"[Broadcast] Redis 발행 실패, 현재 워커에만 전달: {e}")
+            await self._handler(topic, payload)
+
+    async def _listen(self):
+        delay = 1
+        while True:
+            pubsub = self._client.pubsub()
+            try:
+                await pubsub.subscribe(self.channel)
+                delay = 1
+                async for message in pubsub.listen():
+                    if message.get('type') != 'message':
+                        continue
+                    try:
+                        envelope = json.loads(message['data'])
+                        await self._handler(envelope.get('topic'), envelope['payload'])
+                    except Exception as e:
+                        print(f"[Broadcast] 메시지 처리 실패: {e}")
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                print(f"[Broadcast] Redis 구독 끊김, {delay}초 후 재접속: {e}")
+                await asyncio.sleep(delay)
+                delay = min(delay * 2, 30)
+            finally:
+                try:
+                    await pubsub.aclose()
+                except Exception:
+                    pass
+
+
+def create_broker():
+    """Redis 우선, 없으면 메모리 브로커"""
+    redis_url = os.getenv('REDIS_URL', os.getenv('REDIS_PRIVATE_URL'))
+    if REDIS_AVAILABLE and redis_url:
+        return RedisBroker(redis_url)
+    return InMemoryBroker()
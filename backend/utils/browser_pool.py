@@ -0,0 +1,197 @@
+"""
+브라우저 세션 풀 (FlareSolverr)
+
+FlareSolverr는 세션 없이 요청하면 요청마다 헤드리스 Chrome을 새로 띄웠다가 닫습니다 (수 초의 콜드 스타트).
+이 풀은 미리 만든 세션(브라우저 인스턴스)을 빌려주고 돌려받아 재사용합니다.
+
+- 크기 제한: BROWSER_POOL_SIZE개 (0이면 풀 비활성화 → 기존처럼 세션 없이 요청)
+- 재활용: 세션당 BROWSER_SESSION_MAX_REQUESTS회 사용 또는 BROWSER_SESSION_MAX_AGE초 경과 시 폐기 후 새로 생성
+- 장애 감지: 브라우저 크래시/세션 유실/타임아웃으로 실패하면 해당 세션 폐기
+- 대기: 모든 세션이 사용 중이면 BROWSER_LEASE_TIMEOUT초까지 기다리고, 그래도 없으면 세션 없이 요청
+
+스크래퍼는 동기 코드(스레드)에서 호출하므로 threading 기반으로 동작합니다.
+"""
+
+import atexit
+import os
+import re
+import threading
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from typing import Iterator, List, Optional
+
+from logger import get_logger
+from utils import metrics
+
+logger = get_logger(__name__)
+
+BROWSER_POOL_SIZE = int(os.getenv('BROWSER_POOL_SIZE', '2'))
+BROWSER_SESSION_MAX_REQUESTS = int(os.getenv('BROWSER_SESSION_MAX_REQUESTS', '50'))
+BROWSER_SESSION_MAX_AGE = float(os.getenv('BROWSER_SESSION_MAX_AGE', '1800'))
+BROWSER_LEASE_TIMEOUT = float(os.getenv('BROWSER_LEASE_TIMEOUT', '10'))
+
+# 세션(브라우저)이 더 이상 쓸 수 없는 상태임을 나타내는 FlareSolverr 오류 메시지
+_CRASH_PATTERN = re.compile(
+    r"timeout|session.*(not found|doesn't exist|does not exist|invalid)|invalid session"
+    r"|chrome not reachable|disconnected|no such window|target (window|frame) already closed|crash",
+    re.IGNORECASE
+)
+
+
+def is_crash_error(error: Optional[str]) -> bool:
+    """FlareSolverr 오류가 세션 폐기가 필요한 종류인지 여부"""
+    return bool(error) and bool(_CRASH_PATTERN.search(error))
+
+
+@dataclass
+class BrowserSession:
+    session_id: str
+    created_at: float = field(default_factory=time.monotonic)
+    requests: int = 0
+    crashed: bool = False
+
+
+class BrowserPool:
+    """FlareSolverr 세션 풀 (lease / release)"""
+
+    def __init__(self, client, size: int = BROWSER_POOL_SIZE,
+                 max_requests: int = BROWSER_SESSION_MAX_REQUESTS,
+                 max_age: float = BROWSER_SESSION_MAX_AGE,
+                 lease_timeout: float = BROWSER_LEASE_TIMEOUT):
+        self.client = client
+        self.size = size
+        self.max_requests = max_requests
+        self.max_age = max_age
+        self.lease_timeout = lease_timeout
+        self._idle: List[BrowserSession] = []
+        self._total = 0  # 사용 중 + 대기 + 생성 중
+        self._cond = threading.Condition()
+        self._closed = False
+
+    def _expired(self, session: BrowserSession) -> bool:
+        return (session.requests >= self.max_requests
+                or time.monotonic() - session.created_at >= self.max_age)
+
+    def _destroy(self, session: BrowserSession, event: str):
+        metrics.BROWSER_SESSIONS.inc(event=event)
+        self.client.destroy_session(session.session_id)
+
+    def acquire(self, timeout: Optional[float] = None) -> Optional[BrowserSession]:
+        """
+        세션 빌리기 (대기 세션 → 새로 생성 → 반납 대기)
+
+        Returns:
+            세션 (풀 비활성화/생성 실패/대기 시간 초과 시 None)
+        """
+        if self.size <= 0:
+            return None
+
+        deadline = time.monotonic() + (self.lease_timeout if timeout is None else timeout)
+        while True:
+            stale = None
+            with self._cond:
+                while True:
+                    if self._closed:
+                        return None
+                    if self._idle:
+                        session = self._idle.pop()
+                        if not self._expired(session):
+                            return session
+                        # 대기 중 수명이 지난 세션은 폐기하고 다시 시도
+                        self._total -= 1
+                        stale = session
+                        break
+                    if self._total < self.size:
+                        self._total += 1
+                        break
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        metrics.BROWSER_SESSIONS.inc(event="lease_timeout")
+                        return None
+                    self._cond.wait(remaining)
+            if stale is None:
+                break
+            self._destroy(stale, "recycled")
+
+        # 세션 생성은 락 밖에서 (수 초 걸림)
+        session_id = self.client.create_session_id()
+        if not session_id:
+            with self._cond:
+                self._total -= 1
+                self._cond.notify()
+            return None
+        metrics.BROWSER_SESSIONS.inc(event="created")
+        return BrowserSession(session_id)
+
+    def release(self, session: BrowserSession, crashed: bool = False):
+        """세션 반납 (크래시/사용 횟수/수명 초과 시 폐기)"""
+        retire = crashed or self._closed or self._expired(session)
+        with self._cond:
+            if not retire:
+                self._idle.append(session)
+            else:
+                self._total -= 1
+            self._cond.notify()
+
+        if retire:
+            if crashed:
+                logger.warning(f"[브라우저풀] 세션 장애 감지, 폐기: {session.session_id}")
+            self._destroy(session, "crashed" if crashed else "recycled")
+
+    @contextmanager
+    def lease(self, timeout: Optional[float] = None) -> Iterator[Optional[BrowserSession]]:
+        """
+        with pool.lease() as session: ... (session이 None이면 세션 없이 요청)
+
+        블록 안에서 사용 횟수(session.requests)를 늘리고, 세션 장애면 session.crashed = True로 표시
+        """
+        session = self.acquire(timeout)
+        try:
+            yield session
+        except BaseException:
+            if session is not None:
+                self.release(session, crashed=True)
+                session = None
+            raise
+        finally:
+            if session is not None:
+                self.release(session, crashed=session.crashed)
+
+    def close(self):
+        """대기 중인 세션 모두 종료 (사용 중인 세션은 반납 시 종료)"""
+        with self._cond:
+            self._closed = True
+            idle, self._idle = self._idle, []
+            self._total -= len(idle)
+            self._cond.notify_all()
+        for session in idle:
+            try:
+                self._destroy(session, "closed")
+            except Exception:
+                pass
+
+    def stats(self) -> dict:
+        with self._cond:
+            return {
+                "size": self.size,
+                "total": self._total,
+                "idle": len(self._idle),
+                "in_use": self._total - len(self._idle),
+            }
+
+
+_pool: Optional[BrowserPool] = None
+_pool_lock = threading.Lock()
+
+
+def get_browser_pool() -> BrowserPool:
+    """FlareSolverr 세션 풀 싱글톤"""
+    global _pool
+    if _pool is None:
+        with _pool_lock:
+            if _pool is None:
+                from utils.flaresolverr import get_flaresolverr_client
+                _pool = BrowserPool(get_flaresolverr_client())
+                atexit.register(_pool.close)
+    return _pool
@@ -0,0 +1,203 @@
+"""
+서킷 브레이커
+
+외부 서비스(FlareSolverr, PlayAuto, Supabase Storage, Webhook)가 장애일 때
+매 요청이 전체 타임아웃을 기다리지 않도록 연속 실패 시 호출을 즉시 차단합니다.
+
+상태:
+- closed: 정상 호출. 연속 실패가 failure_threshold회에 도달하면 open
+- open: 호출 즉시 실패 (CircuitOpenError). recovery_timeout초가 지나면 half_open
+- half_open: 탐색 호출 half_open_max_calls개만 허용. 성공하면 closed, 실패하면 다시 open
+
+설정: CIRCUIT_FAILURE_THRESHOLD (기본 5), CIRCUIT_RECOVERY_TIMEOUT (기본 30초)
+
+Usage:
+    breaker = get_breaker("playauto")
+    if not breaker.allow():
+        raise CircuitOpenError(breaker)
+    ... 호출 후 breaker.record_success() / breaker.record_failure()
+
+    # 또는 예외 기반
+    result = breaker.call(func, *args)
+    result = await breaker.call_async(coro_func, *args)
+"""
+
+import os
+import threading
+import time
+from typing import Callable, Dict, Optional
+
+from logger import get_logger
+from utils import metrics
+
+logger = get_logger(__name__)
+
+CIRCUIT_FAILURE_THRESHOLD = int(os.getenv('CIRCUIT_FAILURE_THRESHOLD', '5'))
+CIRCUIT_RECOVERY_TIMEOUT = float(os.getenv('CIRCUIT_RECOVERY_TIMEOUT', '30'))
+
+CLOSED = 'closed'
+OPEN = 'open'
+HALF_OPEN = 'half_open'
+
+
+class CircuitOpenError(Exception):
+    """서킷이 열려 호출이 차단됨"""
+
+    def __init__(self, breaker: "CircuitBreaker"):
+        self.name = breaker.name
+        self.retry_after = breaker.retry_after()
+        super().__init__(f"{self.name} 서킷 차단 중 (연속 실패) - {self.retry_after:.0f}초 후 재시도")
+
+
+class CircuitBreaker:
+    """연속 실패 기반 서킷 브레이커 (스레드/이벤트 루프 어디서 호출해도 안전)"""
+
+    def __init__(self, name: str, failure_threshold: int = CIRCUIT_FAILURE_THRESHOLD,
+                 recovery_timeout: float = CIRCUIT_RECOVERY_TIMEOUT, half_open_max_calls: int = 1):
+        self.name = name
+        self.failure_threshold = failure_threshold
+        self.recovery_timeout = recovery_timeout
+        self.half_open_max_calls = half_open_max_calls
+        self._state = CLOSED
+        self._failures = 0
+        self._opened_at = 0.0
+        self._probes = 0
+        self._probe_started = 0.0
+        self._last_error: Optional[str] = None
+        self._lock = threading.Lock()
+
+    def _transition(self, state: str):
+        self._state = state
+        metrics.CIRCUIT_BREAKER.inc(name=self.name, event=state)
+        if state == OPEN:
+            self._opened_at = time.monotonic()
+            logger.warning(f"[서킷] {self.name} 차단 (연속 실패 {self._failures}회): {self._last_error}")
+        elif state == CLOSED:
+            logger.info(f"[서킷] {self.name} 복구")
+
+    @property
+    def state(self) -> str:
+        with self._lock:
+            if self._state == OPEN and time.monotonic() - self._opened_at >= self.recovery_timeout:
+                return HALF_OPEN
+            return self._state
+
+    def is_open(self) -> bool:
+        """호출이 확실히 차단되는 상태인지 (상태를 바꾸거나 탐색 슬롯을 쓰지 않음)"""
+        return self.state == OPEN
+
+    def retry_after(self) -> float:
+        with self._lock:
+            if self._state != OPEN:
+                return 0.0
+            return max(0.0, self.recovery_timeout - (time.monotonic() - self._opened_at))
+
+    def allow(self) -> bool:
+        """호출 허용 여부 (half_open이면 탐색 호출 슬롯 사용)"""
+        with self._lock:
+            if self._state == OPEN:
+                if time.monotonic() - self._opened_at < self.recovery_timeout:
+                    metrics.CIRCUIT_BREAKER.inc(name=self.name, event='rejected')
+                    return False
+                self._transition(HALF_OPEN)
+                self._probes = 0
+            if self._state == HALF_OPEN:
+                # 결과가 기록되지 않은 탐색 호출이 있어도 recovery_timeout 후에는 다시 탐색
+                if self._probes >= self.half_open_max_calls and \
+                        time.monotonic() - self._probe_started < self.recovery_timeout:
+                    metrics.CIRCUIT_BREAKER.inc(name=self.name, event='rejected')
+                    return False
+                if self._probes >= self.half_open_max_calls:
+                    self._probes = 0
+                if self._probes == 0:
+                    self._probe_started = time.monotonic()
+                self._probes += 1
+            return True
+
+    def record_success(self):
+        with self._lock:
+            self._failures = 0
+            if self._state != CLOSED:
+                self._transition(CLOSED)
+
+    def record_failure(self, error: Optional[str] = None):
+        with self._lock:
+            self._failures += 1
+            self._last_error = error
+            if self._state == HALF_OPEN or (self._state == CLOSED and self._failures >= self.failure_threshold):
+                self._transition(OPEN)
+
+    def call(self, func: Callable, *args, is_failure: Optional[Callable[[Exception], bool]] = None, **kwargs):
+        """
+        func 실행 (차단 중이면 CircuitOpenError)
+
+        예외는 실패로 기록 후 그대로 전달. is_failure(e)가 False인 예외(잘못된 요청 등)는
+        서비스가 응답한 것으로 보고 성공으로 기록합니다.
+        """
+        if not self.allow():
+            raise CircuitOpenError(self)
+        try:
+            result = func(*args, **kwargs)
+        except Exception as e:
+            self._record_exception(e, is_failure)
+            raise
+        self.record_success()
+        return result
+
+    async def call_async(self, func: Callable, *args, is_failure: Optional[Callable[[Exception], bool]] = None, **kwargs):
+        """call()의 비동기 버전 (func는 코루틴 함수)"""
+        if not self.allow():
+            raise CircuitOpenError(self)
+        try:
+            result = await func(*args, **kwargs)
+        except Exception as e:
+            self._record_exception(e, is_failure)
+            raise
+        self.record_success()
+        return result
+
+    def _record_exception(self, e: Exception, is_failure: Optional[Callable[[Exception], bool]]):
+        if is_failure is None or is_failure(e):
+            self.record_failure(f"{type(e).__name__}: {e}")
+        else:
+            self.record_success()
+
+    def reset(self):
+        with self._lock:
+            self._failures = 0
+            self._probes = 0
+            if self._state != CLOSED:
+                self._transition(CLOSED)
+
+    def snapshot(self) -> Dict:
+        state = self.state
+        with self._lock:
+            return {
+                "state": state,
+                "consecutive_failures": self._failures,
+                "retry_after": round(max(0.0, self.recovery_timeout - (time.monotonic() - self._opened_at)), 1)
+                if state == OPEN else 0,
+                "last_error": self._last_error,
+            }
+
+
+_breakers: Dict[str, CircuitBreaker] = {}
+_breakers_lock = threading.Lock()
+
+
+def get_breaker(name: str, **options) -> CircuitBreaker:
+    """이름별 서킷 브레이커 (처음 호출 시 options로 생성)"""
+    breaker = _breakers.get(name)
+    if breaker is None:
+        with _breakers_lock:
+            breaker = _breakers.get(name)
+            if breaker is None:
+                breaker = _breakers[name] = CircuitBreaker(name, **options)
+    return breaker
+
+
+def breaker_states() -> Dict[str, Dict]:
+    """모든 서킷 상태 (/health용)"""
+    with _breakers_lock:
+        breakers = list(_breakers.values())
+    return {breaker.name: breaker.snapshot() for breaker in breakers}
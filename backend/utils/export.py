@@ -0,0 +1,87 @@
+"""
+대량 데이터 스트리밍 내보내기 (NDJSON / CSV)
+
+행 이터레이터를 받아 한 줄씩 인코딩하여 StreamingResponse로 흘려보냅니다.
+전체 결과를 리스트로 만들지 않으므로 행 수와 관계없이 메모리 사용량이 일정합니다.
+"""
+
+import csv
+import io
+import json
+from typing import Any, Dict, Iterable, Iterator, List, Optional
+
+from fastapi.responses import StreamingResponse
+
+EXPORT_FORMATS = ('ndjson', 'csv')
+
+# 작은 조각을 모아서 전송 (행마다 write 호출 방지)
+_FLUSH_BYTES = 64 * 1024
+
+
+def _buffered(chunks: Iterable[str]) -> Iterator[bytes]:
+    buffer: List[str] = []
+    size = 0
+    for chunk in chunks:
+        buffer.append(chunk)
+        size += len(chunk)
+        if size >= _FLUSH_BYTES:
+            yield ''.join(buffer).encode('utf-8')
+            buffer.clear()
+            size = 0
+    if buffer:
+        yield ''.join(buffer).encode('utf-8')
+
+
+def iter_ndjson(rows: Iterable[Dict[str, Any]]) -> Iterator[str]:
+    """행마다 JSON 한 줄"""
+    for row in rows:
+        yield json.dumps(row, ensure_ascii=False, default=str) + '\n'
+
+
+def iter_csv(rows: Iterable[Dict[str, Any]], columns: Optional[List[str]] = None) -> Iterator[str]:
+    """첫 행의 키(또는 columns)를 헤더로 사용하는 CSV (Excel 호환 BOM 포함)"""
+    output = io.StringIO()
+    writer = None
+
+    for row in rows:
+        if writer is None:
+            fieldnames = columns or list(row.keys())
+            writer = csv.DictWriter(output, fieldnames=fieldnames, extrasaction='ignore')
+            output.write('\ufeff')
+            writer.writeheader()
+        writer.writerow(row)
+        yield output.getvalue()
+        output.seek(0)
+        output.truncate(0)
+
+    if writer is None and columns:
+        yield '\ufeff' + ','.join(columns) + '\r\n'
+
+
+def streaming_export_response(
+    rows: Iterable[Dict[str, Any]],
+    export_format: str,
+    filename: str,
+    columns: Optional[List[str]] = None
+) -> StreamingResponse:
+    """
+    행 이터레이터를 NDJSON/CSV 스트리밍 응답으로 변환
+
+    Args:
+        rows: 행 dict 이터레이터 (database.pagination.stream_rows 등)
+        export_format: 'ndjson' 또는 'csv'
+        filename: 확장자를 제외한 다운로드 파일명
+        columns: CSV 컬럼 순서 (생략 시 첫 행 기준)
+    """
+    if export_format == 'csv':
+        body = iter_csv(rows, columns)
+        media_type = 'text/csv; charset=utf-8'
+    else:
+        body = iter_ndjson(rows)
+        media_type = 'application/x-ndjson'
+
+    return StreamingResponse(
+        _buffered(body),
+        media_type=media_type,
+        headers={'Content-Disposition': f'attachment; filename="{filename}.{export_format}"'}
+    )
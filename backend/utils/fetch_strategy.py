@@ -0,0 +1,394 @@
+"""
+도메인별 페이지 가져오기 전략 추적
+
+전략 (싼 순서):
+- direct: requests로 바로 요청
+- cookie_replay: FlareSolverr가 통과하며 받은 쿠키 + User-Agent로 requests 요청
+- flaresolverr: 헤드리스 브라우저로 요청 (Cloudflare 우회, 수 초~60초)
+
+도메인·전략별 성공률과 지연 시간(EWMA)을 기록하고, 잘 되는 전략 중 가장 싼 것부터 시도합니다.
+성공률이 FETCH_HEALTHY_RATE 아래로 떨어진 전략은 뒤로 밀리고, 더 싼 전략이면
+FETCH_PROBE_INTERVAL초마다 한 번씩 맨 앞에서 다시 시도해 복구 여부를 확인합니다.
+JavaScript 렌더링이 필요한 소싱처는 FlareSolverr 우선, direct는 마지막 폴백입니다.
+
+통계는 워커 프로세스 메모리에서 갱신하고, 바뀐 항목만 FETCH_STATS_FLUSH_SECONDS초마다
+fetch_strategy_stats 테이블에 저장합니다 (flush_stats). 시작 시 load_persisted_stats()로 불러와
+재시작 직후에도 막힌 전략을 처음부터 다시 시도하지 않습니다.
+여러 워커가 같은 도메인을 갱신하면 마지막으로 저장한 워커의 값이 남습니다.
+"""
+
+import os
+import re
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from typing import Dict, List, Optional, Tuple
+from urllib.parse import urlsplit
+
+from sqlalchemy import delete, select, update
+from sqlalchemy.exc import IntegrityError
+
+from database.database_manager import get_database_manager
+from database.models import FetchStrategyStat
+from utils import metrics
+
+FETCH_EWMA_ALPHA = float(os.getenv('FETCH_EWMA_ALPHA', '0.3'))
+FETCH_HEALTHY_RATE = float(os.getenv('FETCH_HEALTHY_RATE', '0.5'))
+FETCH_PROBE_INTERVAL = float(os.getenv('FETCH_PROBE_INTERVAL', '600'))
+FETCH_COOKIE_TTL = float(os.getenv('FETCH_COOKIE_TTL', '1800'))
+FETCH_TRACKER_MAX_DOMAINS = int(os.getenv('FETCH_TRACKER_MAX_DOMAINS', '1000'))
+FETCH_STATS_FLUSH_SECONDS = int(os.getenv('FETCH_STATS_FLUSH_SECONDS', '60'))
+# 이 기간 동안 갱신되지 않은 도메인 통계는 삭제
+FETCH_STATS_RETENTION_DAYS = int(os.getenv('FETCH_STATS_RETENTION_DAYS', '30'))
+
+STRATEGIES = ('direct', 'cookie_replay', 'flaresolverr')
+JS_STRATEGIES = ('flaresolverr', 'direct')
+
+# 봇 차단/챌린지 페이지 (200 응답이어도 실패로 처리)
+# 제목 전체가 챌린지/차단 페이지 제목과 일치할 때만 (상품명의 '자외선 차단' 등은 제외)
+_TITLE_PATTERN = re.compile(r'<title[^>]*>(.*?)</title>', re.IGNORECASE | re.DOTALL)
+_BLOCKED_TITLE = re.compile(
+    r'^(?:just a moment(?:\.{3}|…)?'
+    r'|잠시만 기다리십시오(?:\.{3}|…)?'
+    r'|attention required! \| cloudflare'
+    r'|checking your browser.*'
+    r'|access denied'
+    r'|사용자 활동 검토 요청.*)$',
+    re.IGNORECASE
+)
+# Cloudflare 챌린지 스크립트/폼 (정상 페이지에도 붙는 봇 관리 스크립트 scripts/jsd는 제외)
+_CHALLENGE_MARKER = re.compile(r'cf-chl-|cf_chl_opt|/cdn-cgi/challenge-platform/(?!scripts/jsd)')
+
+
+def domain_of(url: str) -> str:
+    """URL → 통계 키 도메인 (www. 제외)"""
+    host = (urlsplit(url if '//' in url else '//' + url).hostname or '').lower()
+    return host[4:] if host.startswith('www.') else host
+
+
+def is_blocked_html(html: Optional[str]) -> bool:
+    """빈 응답 또는 봇 차단/챌린지 페이지 여부"""
+    if not html:
+        return True
+    head = html[:20000]
+    title = _TITLE_PATTERN.search(head)
+    if title and _BLOCKED_TITLE.match(' '.join(title.group(1).split())):
+        return True
+    return bool(_CHALLENGE_MARKER.search(head))
+
+
+@dataclass
+class StrategyStats:
+    attempts: int = 0
+    successes: int = 0
+    success_rate: float = 1.0  # EWMA (기록이 없으면 낙관적으로 1)
+    latency: Optional[float] = None  # 성공 요청 지연 시간 EWMA (초)
+    last_attempt: float = 0.0
+    last_success: float = 0.0
+
+
+class FetchStrategyTracker:
+    """도메인별 가져오기 전략 성공률/지연 시간 추적"""
+
+    def __init__(self, alpha: float = FETCH_EWMA_ALPHA, healthy_rate: float = FETCH_HEALTHY_RATE,
+                 probe_interval: float = FETCH_PROBE_INTERVAL, cookie_ttl: float = FETCH_COOKIE_TTL,
+                 max_domains: int = FETCH_TRACKER_MAX_DOMAINS):
+        self.alpha = alpha
+        self.healthy_rate = healthy_rate
+        self.probe_interval = probe_interval
+        self.cookie_ttl = cookie_ttl
+        self.max_domains = max_domains
+        self._domains: "OrderedDict[str, Dict[str, StrategyStats]]" = OrderedDict()
+        self._cookies: Dict[str, Tuple[Dict[str, str], str, float]] = {}
+        self._dirty = set()  # 마지막 저장 이후 바뀐 (domain, strategy)
+        self._resets: List[Optional[str]] = []  # 저장소에서도 지울 도메인 (None이면 전체)
+        self._lock = threading.Lock()
+
+    def _stats_for(self, domain: str) -> Dict[str, StrategyStats]:
+        stats = self._domains.get(domain)
+        if stats is None:
+            stats = self._domains[domain] = {}
+            if len(self._domains) > self.max_domains:
+                evicted, _ = self._domains.popitem(last=False)
+                self._cookies.pop(evicted, None)
+        else:
+            self._domains.move_to_end(domain)
+        return stats
+
+    def plan(self, domain: str, needs_js: bool = False) -> List[str]:
+        """
+        시도할 전략 순서
+
+        잘 되는 전략(기록 없음 포함)을 싼 순서로, 그보다 싼데 밀려난 전략은 탐색 주기마다 맨 앞에,
+        나머지 밀려난 전략은 마지막 폴백으로 둡니다.
+        """
+        base = JS_STRATEGIES if needs_js else STRATEGIES
+        has_cookies = self.get_cookies(domain) is not None
+        now = time.monotonic()
+
+        with self._lock:
+            stats = self._domains.get(domain, {})
+            healthy, demoted = [], []
+            for strategy in base:
+                if strategy == 'cookie_replay' and not has_cookies:
+                    continue
+                st = stats.get(strategy)
+                if st is None or st.success_rate >= self.healthy_rate:
+                    healthy.append(strategy)
+                else:
+                    demoted.append(strategy)
+
+            cheapest = base.index(healthy[0]) if healthy else len(base)
+            probes = []
+            for strategy in list(demoted):
+                st = stats[strategy]
+                if base.index(strategy) < cheapest and now - st.last_attempt >= self.probe_interval:
+                    # 동시에 들어온 다른 요청이 같은 탐색을 반복하지 않도록 바로 표시
+                    st.last_attempt = now
+                    probes.append(strategy)
+                    demoted.remove(strategy)
+
+        return probes + healthy + demoted
+
+    def record(self, domain: str, strategy: str, ok: bool, elapsed: float):
+        """전략 시도 결과 기록"""
+        metrics.FETCH_STRATEGY.inc(strategy=strategy, outcome='ok' if ok else 'fail')
+        now = time.monotonic()
+        with self._lock:
+            st = self._stats_for(domain).setdefault(strategy, StrategyStats())
+            if st.attempts == 0:
+                st.success_rate = 1.0 if ok else 0.0
+            else:
+                st.success_rate += self.alpha * ((1.0 if ok else 0.0) - st.success_rate)
+            st.attempts += 1
+            st.last_attempt = now
+            self._dirty.add((domain, strategy))
+            if ok:
+                st.successes += 1
+                st.last_success = now
+                st.latency = elapsed if st.latency is None else st.latency + self.alpha * (elapsed - st.latency)
+
+    def store_cookies(self, domain: str, cookies: Dict[str, str], user_agent: str):
+        """FlareSolverr가 받은 쿠키 저장 (cookie_replay용)"""
+        if not cookies:
+            return
+        with self._lock:
+            self._cookies[domain] = (dict(cookies), user_agent, time.monotonic())
+
+    def get_cookies(self, domain: str) -> Optional[Tuple[Dict[str, str], str]]:
+        """유효한 (쿠키, User-Agent) 또는 None"""
+        entry = self._cookies.get(domain)
+        if entry is None:
+            return None
+        cookies, user_agent, stored_at = entry
+        if time.monotonic() - stored_at >= self.cookie_ttl:
+            with self._lock:
+                self._cookies.pop(domain, None)
+            return None
+        return cookies, user_agent
+
+    def reset(self, domain: Optional[str] = None):
+        """통계 초기화 (domain 미지정 시 전체)"""
+        with self._lock:
+            if domain is None:
+                self._domains.clear()
+                self._cookies.clear()
+                self._dirty.clear()
+            else:
+                self._domains.pop(domain, None)
+                self._cookies.pop(domain, None)
+                self._dirty = {key for key in self._dirty if key[0] != domain}
+            self._resets.append(domain)
+
+    def take_changes(self) -> Tuple[List[Optional[str]], List[Dict]]:
+        """마지막 저장 이후의 초기화 요청과 바뀐 통계 행을 꺼냄 (flush_stats용)"""
+        now, wall_now = time.monotonic(), datetime.now()
+        with self._lock:
+            resets, self._resets = self._resets, []
+            rows = []
+            for domain, strategy in self._dirty:
+                st = self._domains.get(domain, {}).get(strategy)
+                if st is None:
+                    continue  # 도메인 수 제한으로 밀려난 통계
+                rows.append({
+                    'domain': domain,
+                    'strategy': strategy,
+                    'attempts': st.attempts,
+                    'successes': st.successes,
+                    'success_rate': st.success_rate,
+                    'latency': st.latency,
+                    'last_success_at': wall_now - timedelta(seconds=now - st.last_success) if st.last_success else None,
+                })
+            self._dirty.clear()
+        return resets, rows
+
+    def requeue_changes(self, resets: List[Optional[str]], rows: List[Dict]):
+        """저장에 실패한 변경을 다음 저장 때 다시 시도"""
+        with self._lock:
+            self._resets[:0] = resets
+            self._dirty.update((row['domain'], row['strategy']) for row in rows)
+
+    def load(self, rows: List[Dict]):
+        """저장된 통계 불러오기 (오래된 것부터, 이미 기록된 전략은 유지)"""
+        now, wall_now = time.monotonic(), datetime.now()
+        with self._lock:
+            for row in rows:
+                stats = self._stats_for(row['domain'])
+                if row['strategy'] in stats:
+                    continue
+                last_success_at = row.get('last_success_at')
+                stats[row['strategy']] = StrategyStats(
+                    attempts=row['attempts'],
+                    successes=row['successes'],
+                    success_rate=row['success_rate'],
+                    latency=row['latency'],
+                    last_attempt=now,  # 밀려난 전략은 탐색 주기가 지난 뒤 다시 시도
+                    last_success=now - (wall_now - last_success_at).total_seconds() if last_success_at else 0.0,
+                )
+
+    def stats(self) -> Dict:
+        now = time.monotonic()
+        with self._lock:
+            domains = {
+                domain: {
+                    strategy: {
+                        "attempts": st.attempts,
+                        "successes": st.successes,
+                        "success_rate": round(st.success_rate, 3),
+                        "latency_ms": round(st.latency * 1000) if st.latency is not None else None,
+                        "last_success_ago_s": round(now - st.last_success) if st.last_success else None,
+                    }
+                    for strategy, st in stats.items()
+                }
+                for domain, stats in self._domains.items()
+            }
+            cookies = {domain: round(now - stored_at) for domain, (_, _, stored_at) in self._cookies.items()}
+
+        return {
+            "healthy_rate": self.healthy_rate,
+            "probe_interval": self.probe_interval,
+            "domains": {
+                domain: {
+                    "strategies": strategies,
+                    "preferred": self._preferred(strategies),
+                    "cookie_age_s": cookies.get(domain),
+                }
+                for domain, strategies in domains.items()
+            },
+        }
+
+    def _preferred(self, strategies: Dict[str, Dict]) -> Optional[str]:
+        """통계상 현재 가장 싼 정상 전략"""
+        for strategy in STRATEGIES:
+            st = strategies.get(strategy)
+            if st and st["success_rate"] >= self.healthy_rate:
+                return strategy
+        return None
+
+
+_tracker: Optional[FetchStrategyTracker] = None
+_tracker_lock = threading.Lock()
+
+
+def get_fetch_tracker() -> FetchStrategyTracker:
+    """가져오기 전략 추적기 싱글톤"""
+    global _tracker
+    if _tracker is None:
+        with _tracker_lock:
+            if _tracker is None:
+                _tracker = FetchStrategyTracker()
+    return _tracker
+
+
+# ========================================
+# 통계 저장 / 불러오기 (fetch_strategy_stats)
+# ========================================
+
+_table_ready = False
+
+
+def _get_manager():
+    global _table_ready
+    db_manager = get_database_manager()
+    if not _table_ready:
+        FetchStrategyStat.__table__.create(bind=db_manager.engine, checkfirst=True)
+        _table_ready = True
+    return db_manager
+
+
+def load_persisted_stats(tracker: Optional[FetchStrategyTracker] = None) -> int:
+    """
+    저장된 통계를 추적기에 불러오기 (서버 시작 시 1회)
+
+    Returns:
+        불러온 (도메인, 전략) 수
+    """
+    tracker = tracker or get_fetch_tracker()
+    cutoff = datetime.now() - timedelta(days=FETCH_STATS_RETENTION_DAYS)
+    with _get_manager().get_session() as session:
+        records = session.execute(
+            select(FetchStrategyStat)
+            .where(FetchStrategyStat.updated_at >= cutoff)
+            .order_by(FetchStrategyStat.updated_at.desc())
+            .limit(tracker.max_domains * len(STRATEGIES))
+        ).scalars().all()
+        rows = [
+            {
+                'domain': record.domain,
+                'strategy': record.strategy,
+                'attempts': record.attempts,
+                'successes': record.successes,
+                'success_rate': record.success_rate,
+                'latency': record.latency,
+                'last_success_at': record.last_success_at,
+            }
+            for record in reversed(records)
+        ]
+    tracker.load(rows)
+    return len(rows)
+
+
+def flush_stats(tracker: Optional[FetchStrategyTracker] = None) -> int:
+    """
+    마지막 저장 이후 바뀐 통계를 저장 (주기 작업/종료 시)
+
+    Returns:
+        저장한 (도메인, 전략) 수
+    """
+    tracker = tracker or get_fetch_tracker()
+    resets, rows = tracker.take_changes()
+    if not resets and not rows:
+        return 0
+
+    now = datetime.now()
+    try:
+        with _get_manager().get_session() as session:
+            for domain in resets:
+                query = delete(FetchStrategyStat)
+                if domain is not None:
+                    query = query.where(FetchStrategyStat.domain == domain)
+                session.execute(query)
+
+            for row in rows:
+                updated = session.execute(
+                    update(FetchStrategyStat)
+                    .where(FetchStrategyStat.domain == row['domain'], FetchStrategyStat.strategy == row['strategy'])
+                    .values(updated_at=now, **row)
+                ).rowcount
+                if not updated:
+                    session.add(FetchStrategyStat(updated_at=now, **row))
+
+            session.execute(
+                delete(FetchStrategyStat)
+                .where(FetchStrategyStat.updated_at < now - timedelta(days=FETCH_STATS_RETENTION_DAYS))
+            )
+    except IntegrityError:
+        # 다른 워커가 같은 (도메인, 전략)을 먼저 추가한 경우 → 다음 저장 때 갱신
+        tracker.requeue_changes(resets, rows)
+        return 0
+    except Exception:
+        tracker.requeue_changes(resets, rows)
+        raise
+    return len(rows)
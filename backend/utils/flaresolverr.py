@@ -3,9 +3,13 @@ FlareSolverr 클라이언트
 Cloudflare 보호를 우회하기 위한 프록시 서비스 연동
 """
 import os
+import time
 import requests
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, Tuple
 from logger import get_logger
+from utils import metrics
+from utils.browser_pool import get_browser_pool, is_crash_error
+from utils.circuit_breaker import get_breaker
 
 logger = get_logger(__name__)
 
@@ -34,6 +38,13 @@ class FlareSolverrClient:
 
     def create_session(self) -> Optional[str]:
         """세션 생성 (브라우저 인스턴스 재사용)"""
+        session_id = self.create_session_id()
+        if session_id:
+            self.session_id = session_id
+        return session_id
+
+    def create_session_id(self) -> Optional[str]:
+        """세션 생성 후 ID만 반환 (클라이언트 기본 세션으로 설정하지 않음 - 브라우저 풀용)"""
         try:
             response = requests.post(
                 self.base_url,
@@ -44,9 +55,9 @@ class FlareSolverrClient:
             )
             data = response.json()
             if data.get("status") == "ok":
-                self.session_id = data.get("session")
-                logger.info(f"FlareSolverr 세션 생성: {self.session_id}")
-                return self.session_id
+                session_id = data.get("session")
+                logger.info(f"FlareSolverr 세션 생성: {session_id}")
+                return session_id
             else:
                 logger.error(f"세션 생성 실패: {data.get('message')}")
                 return None
@@ -105,6 +116,28 @@ class FlareSolverrClient:
                 "message": str
             }
         """
+        return self.fetch_page(url, session_id=session_id, max_timeout=max_timeout, cookies=cookies)[0]
+
+    def fetch_page(
+        self,
+        url: str,
+        session_id: str = None,
+        max_timeout: int = 60000,
+        cookies: list = None
+    ) -> Tuple[Optional[Dict[str, Any]], Optional[str]]:
+        """
+        페이지 요청 (get_page와 동일, 실패 사유 함께 반환)
+
+        Returns:
+            (응답 데이터, 실패 시 오류 메시지 / 타임아웃이면 "timeout" / 서킷 차단 중이면 "circuit_open")
+        """
+        # FlareSolverr 장애 시 60초 타임아웃을 반복해서 기다리지 않도록 즉시 실패
+        breaker = get_breaker("flaresolverr")
+        if not breaker.allow():
+            return None, "circuit_open"
+
+        started = time.perf_counter()
+        outcome = "error"
         try:
             payload = {
                 "cmd": "request.get",
@@ -127,23 +160,40 @@ class FlareSolverrClient:
                 json=payload,
                 timeout=max_timeout / 1000 + 10  # 약간의 여유
             )
+            # 요청 전송 ~ 응답 헤더 수신 (세션 없으면 브라우저 기동 시간 포함)
+            metrics.BROWSER_TTFB.observe(
+                response.elapsed.total_seconds(), session="pooled" if "session" in payload else "none")
 
             data = response.json()
+            # FlareSolverr가 응답했으면 서비스는 정상 (대상 사이트 실패는 서킷과 무관)
+            breaker.record_success()
+
+            # 대기 시간 = 전체 시간 - FlareSolverr 브라우저 처리 시간 (startTimestamp~endTimestamp, ms)
+            if data.get("startTimestamp") and data.get("endTimestamp"):
+                solve_seconds = (data["endTimestamp"] - data["startTimestamp"]) / 1000
+                metrics.FLARESOLVERR_QUEUE.observe(max(0.0, time.perf_counter() - started - solve_seconds))
 
             if data.get("status") == "ok":
+                outcome = "ok"
                 solution = data.get("solution", {})
                 logger.info(f"FlareSolverr 성공: status={solution.get('status')}")
-                return data
+                return data, None
             else:
+                outcome = "failed"
                 logger.error(f"FlareSolverr 실패: {data.get('message')}")
-                return None
+                return None, data.get("message") or "unknown"
 
         except requests.Timeout:
+            outcome = "timeout"
+            breaker.record_failure("timeout")
             logger.error(f"FlareSolverr 타임아웃: {url}")
-            return None
+            return None, "timeout"
         except Exception as e:
+            breaker.record_failure(str(e))
             logger.error(f"FlareSolverr 오류: {e}")
-            return None
+            return None, str(e)
+        finally:
+            metrics.FLARESOLVERR_DURATION.observe(time.perf_counter() - started, outcome=outcome)
 
     def extract_cookies_for_requests(self, flaresolverr_cookies: list) -> Dict[str, str]:
         """
@@ -187,6 +237,10 @@ class FlareSolverrClient:
 # 싱글톤 인스턴스
 _client = None
 
+# 서버 상태 확인 결과 캐시 (요청마다 /health 호출하지 않음)
+HEALTH_CHECK_TTL = float(os.getenv("FLARESOLVERR_HEALTH_TTL", "30"))
+_health = {"available": False, "checked_at": 0.0}
+
 
 def get_flaresolverr_client() -> FlareSolverrClient:
     """FlareSolverr 클라이언트 인스턴스 반환"""
@@ -196,6 +250,16 @@ def get_flaresolverr_client() -> FlareSolverrClient:
     return _client
 
 
+def _is_available(client: FlareSolverrClient) -> bool:
+    if get_breaker("flaresolverr").is_open():
+        return False
+    now = time.monotonic()
+    if now - _health["checked_at"] >= HEALTH_CHECK_TTL:
+        _health["available"] = client.is_available()
+        _health["checked_at"] = now
+    return _health["available"]
+
+
 def solve_cloudflare(url: str, max_timeout: int = 60000) -> Optional[Dict[str, Any]]:
     """
     Cloudflare 보호 우회하여 페이지 내용 가져오기
@@ -215,11 +279,17 @@ def solve_cloudflare(url: str, max_timeout: int = 60000) -> Optional[Dict[str, A
     """
     client = get_flaresolverr_client()
 
-    if not client.is_available():
+    if not _is_available(client):
         logger.warning("FlareSolverr 사용 불가")
         return None
 
-    result = client.get_page(url, max_timeout=max_timeout)
+    # 풀에서 빌린 브라우저 세션으로 요청 (세션이 없으면 요청마다 브라우저를 새로 띄움)
+    with get_browser_pool().lease() as session:
+        result, error = client.fetch_page(
+            url, session_id=session.session_id if session else None, max_timeout=max_timeout)
+        if session is not None:
+            session.requests += 1
+            session.crashed = result is None and is_crash_error(error)
 
     if result and result.get("status") == "ok":
         solution = result.get("solution", {})
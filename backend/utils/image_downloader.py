@@ -9,9 +9,11 @@ from pathlib import Path
 from typing import Optional
 from datetime import datetime
 
+from utils.image_ingest import MAX_IMAGE_BYTES, ImageRejected, ingest_url
+
 # Supabase Storage import
 try:
-    from utils.supabase_storage import upload_image_from_bytes, delete_image, get_public_url, supabase
+    from utils.supabase_storage import upload_ingested_image, delete_image, get_public_url, supabase
     SUPABASE_AVAILABLE = True
 except ImportError:
     SUPABASE_AVAILABLE = False
@@ -55,76 +57,77 @@ def download_thumbnail(image_url: str, product_id: Optional[int] = None) -> Opti
         else:
             filename = f"{url_hash}.{ext}"
 
-        # Content-Type 매핑
-        content_type_map = {
-            'jpg': 'image/jpeg',
-            'jpeg': 'image/jpeg',
-            'png': 'image/png',
-            'gif': 'image/gif',
-            'webp': 'image/webp'
-        }
-        content_type = content_type_map.get(ext, 'image/jpeg')
-
         # 이미지 다운로드
         headers = {
             'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
             'Referer': image_url.split('/')[0] + '//' + image_url.split('/')[2] if len(image_url.split('/')) > 2 else image_url
         }
 
-        response = requests.get(image_url, headers=headers, timeout=15, stream=True)
-        response.raise_for_status()
-
-        # 이미지 데이터를 메모리에 로드
-        image_data = b''
-        max_size = 10 * 1024 * 1024  # 최대 10MB
-        current_size = 0
-
-        for chunk in response.iter_content(chunk_size=8192):
-            current_size += len(chunk)
-            if current_size > max_size:
-                print(f"[IMAGE ERROR] 이미지 크기가 너무 큽니다 (> 10MB): {image_url}")
-                return None
-            image_data += chunk
-
-        # Supabase Storage에 업로드 (프로덕션 환경)
-        if SUPABASE_AVAILABLE and supabase and os.getenv('ENVIRONMENT') == 'production':
-            storage_path = f"thumbnails/{filename}"
-            public_url = upload_image_from_bytes(image_data, storage_path, content_type)
+        use_storage = SUPABASE_AVAILABLE and supabase and os.getenv('ENVIRONMENT') == 'production'
 
-            if public_url:
-                print(f"[IMAGE] 썸네일 Supabase Storage 업로드 완료: {filename}")
-                return public_url
-            else:
-                print(f"[IMAGE ERROR] Supabase Storage 업로드 실패, 로컬 저장소로 fallback")
-
-        # 로컬 파일시스템에 저장 (개발 환경 또는 fallback)
-        thumbnails_dir = Path(__file__).parent.parent / "static" / "thumbnails"
+        # 이전에 저장한 원본 URL이면 다운로드 없이 기존 객체 재사용
+        if use_storage:
+            try:
+                from utils import image_store
+                stored = image_store.lookup_source(image_url)
+                if stored:
+                    print(f"[IMAGE] 썸네일 재사용 (다운로드 생략): {stored.storage_path}")
+                    return stored.url
+            except Exception as e:
+                print(f"[IMAGE WARN] 이미지 저장소 조회 실패: {e}")
 
+        # 이미지 스트리밍 다운로드 (이미지가 아니거나 10MB 초과면 즉시 중단)
         try:
-            thumbnails_dir.mkdir(parents=True, exist_ok=True)
-        except Exception as e:
-            print(f"[IMAGE ERROR] 디렉토리 생성 실패: {e}")
-            # 컨테이너 읽기 전용 환경에서는 실패
-            # 이 경우 원본 URL 반환
-            return image_url
-
-        file_path = thumbnails_dir / filename
+            image = ingest_url(image_url, headers=headers, timeout=15, max_size=MAX_IMAGE_BYTES)
+        except ImageRejected as e:
+            print(f"[IMAGE ERROR] {e}: {image_url}")
+            return None
 
-        # 이미 파일이 존재하면 기존 경로 반환
-        if file_path.exists():
-            return f"/static/thumbnails/{filename}"
+        with image:
+            # Supabase Storage에 업로드 (프로덕션 환경, 같은 내용은 기존 객체 재사용)
+            if use_storage:
+                try:
+                    from utils import image_store
+                    stored = image_store.store_ingested(image, source_url=image_url)
+                    public_url = stored.url if stored else None
+                except Exception as e:
+                    # 저장소 DB를 쓸 수 없으면 기존 방식으로 업로드
+                    print(f"[IMAGE WARN] 이미지 저장소 사용 실패, 직접 업로드: {e}")
+                    public_url = upload_ingested_image(image, f"thumbnails/{filename}")
+
+                if public_url:
+                    print(f"[IMAGE] 썸네일 Supabase Storage 업로드 완료: {filename}")
+                    return public_url
+                else:
+                    print(f"[IMAGE ERROR] Supabase Storage 업로드 실패, 로컬 저장소로 fallback")
+
+            # 로컬 파일시스템에 저장 (개발 환경 또는 fallback)
+            thumbnails_dir = Path(__file__).parent.parent / "static" / "thumbnails"
+
+            try:
+                thumbnails_dir.mkdir(parents=True, exist_ok=True)
+            except Exception as e:
+                print(f"[IMAGE ERROR] 디렉토리 생성 실패: {e}")
+                # 컨테이너 읽기 전용 환경에서는 실패
+                # 이 경우 원본 URL 반환
+                return image_url
+
+            file_path = thumbnails_dir / filename
+
+            # 이미 파일이 존재하면 기존 경로 반환
+            if file_path.exists():
+                return f"/static/thumbnails/{filename}"
 
-        # 파일로 저장
-        try:
-            with open(file_path, 'wb') as f:
-                f.write(image_data)
+            # 파일로 저장
+            try:
+                image.save_to(file_path)
 
-            print(f"[IMAGE] 썸네일 로컬 저장 완료: {filename}")
-            return f"/static/thumbnails/{filename}"
-        except Exception as e:
-            print(f"[IMAGE ERROR] 로컬 파일 저장 실패: {e}")
-            # 저장 실패시 원본 URL 반환
-            return image_url
+                print(f"[IMAGE] 썸네일 로컬 저장 완료: {filename}")
+                return f"/static/thumbnails/{filename}"
+            except Exception as e:
+                print(f"[IMAGE ERROR] 로컬 파일 저장 실패: {e}")
+                # 저장 실패시 원본 URL 반환
+                return image_url
 
     except requests.exceptions.Timeout:
         print(f"[IMAGE ERROR] 썸네일 다운로드 타임아웃: {image_url}")
@@ -160,6 +163,11 @@ def delete_thumbnail(thumbnail_path: str) -> bool:
             # -> thumbnails/abc.jpg
             if '/public/product-images/' in thumbnail_path:
                 storage_path = thumbnail_path.split('/public/product-images/')[-1]
+
+                # 내용 주소 저장소 객체는 다른 상품과 공유될 수 있으므로 참조만 해제
+                from utils import image_store
+                if image_store.is_blob_path(storage_path):
+                    return image_store.release(storage_path)
                 return delete_image(storage_path)
 
         # 로컬 파일 경로인 경우
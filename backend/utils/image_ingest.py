@@ -0,0 +1,269 @@
+"""
+이미지 스트리밍 수집
+
+다운로드/업로드 이미지를 청크 단위로 받으면서
+- 첫 바이트로 포맷 판별 (이미지가 아니면 즉시 중단)
+- Content-Length/누적 크기로 용량 초과 즉시 중단
+- sha256을 수신과 동시에 계산 (내용 주소 저장소용)
+- 작은 이미지는 미리 할당한 메모리 버퍼, 큰 이미지는 임시 파일에 기록
+  (임시 파일은 Storage 업로드 시 파일 객체로 스트리밍 전송)
+
+Usage:
+    with ingest_url(url) as image:
+        image.size, image.content_hash, image.content_type
+        upload_ingested_image(image, "blobs/...")
+"""
+
+import hashlib
+import io
+import os
+import tempfile
+from typing import Iterable, Optional, Tuple, Union
+
+try:
+    from PIL import Image
+    PIL_AVAILABLE = True
+except ImportError:
+    PIL_AVAILABLE = False
+
+
+# 이미지 최대 크기 (바이트)
+MAX_IMAGE_BYTES = int(os.getenv('MAX_IMAGE_BYTES', str(10 * 1024 * 1024)))
+
+# 이 크기를 넘으면 메모리 대신 임시 파일에 기록
+SPOOL_THRESHOLD = int(os.getenv('IMAGE_SPOOL_THRESHOLD', str(2 * 1024 * 1024)))
+
+CHUNK_SIZE = 64 * 1024
+
+# 포맷 판별에 필요한 앞부분 바이트 수
+SNIFF_BYTES = 16
+
+# 확장자 → MIME 타입
+CONTENT_TYPES = {
+    'jpg': 'image/jpeg',
+    'png': 'image/png',
+    'gif': 'image/gif',
+    'webp': 'image/webp',
+    'avif': 'image/avif',
+}
+
+
+class ImageRejected(ValueError):
+    """용량 초과 또는 이미지가 아닌 데이터"""
+
+    def __init__(self, message: str, too_large: bool = False):
+        super().__init__(message)
+        self.too_large = too_large
+
+
+def sniff_extension(head: bytes) -> Optional[str]:
+    """파일 앞부분(매직 바이트)으로 이미지 포맷 판별 (이미지가 아니면 None)"""
+    if head[:3] == b'\xff\xd8\xff':
+        return 'jpg'
+    if head[:8] == b'\x89PNG\r\n\x1a\n':
+        return 'png'
+    if head[:6] in (b'GIF87a', b'GIF89a'):
+        return 'gif'
+    if head[:4] == b'RIFF' and head[8:12] == b'WEBP':
+        return 'webp'
+    if head[4:8] == b'ftyp' and head[8:12] in (b'avif', b'avis'):
+        return 'avif'
+    return None
+
+
+class IngestedImage:
+    """
+    청크 단위로 수신한 이미지
+
+    write()로 청크를 넣고 finish()로 마무리합니다.
+    사용 후 close()(또는 with 문)로 임시 파일을 정리합니다.
+    """
+
+    def __init__(self, max_size: int = MAX_IMAGE_BYTES, expected_size: Optional[int] = None):
+        if expected_size is not None and expected_size > max_size:
+            raise ImageRejected(f"이미지 크기가 너무 큽니다 ({expected_size} > {max_size} bytes)", too_large=True)
+
+        self.max_size = max_size
+        self.size = 0
+        self.ext: Optional[str] = None
+        self._hash = hashlib.sha256()
+        self._head = b''
+        self._spool_path: Optional[str] = None
+        self._spool_file = None
+        # Content-Length를 알면 그만큼 미리 할당 (재할당/복사 없음)
+        initial = expected_size if expected_size and expected_size <= SPOOL_THRESHOLD else 0
+        self._buffer = bytearray(initial)
+
+    # ---------- 수신 ----------
+
+    def write(self, chunk: bytes):
+        if not chunk:
+            return
+        new_size = self.size + len(chunk)
+        if new_size > self.max_size:
+            raise ImageRejected(f"이미지 크기가 너무 큽니다 (> {self.max_size} bytes)", too_large=True)
+
+        if self.ext is None:
+            self._head += chunk[:SNIFF_BYTES]
+            if len(self._head) >= SNIFF_BYTES:
+                self._sniff()
+
+        self._hash.update(chunk)
+        if self._spool_file is None and new_size > SPOOL_THRESHOLD:
+            self._spill()
+
+        if self._spool_file is not None:
+            self._spool_file.write(chunk)
+        elif new_size <= len(self._buffer):
+            self._buffer[self.size:new_size] = chunk
+        else:
+            del self._buffer[self.size:]
+            self._buffer += chunk
+        self.size = new_size
+
+    def finish(self) -> 'IngestedImage':
+        if self.ext is None:
+            self._sniff()
+        if self._spool_file is not None:
+            self._spool_file.flush()
+        else:
+            del self._buffer[self.size:]
+        return self
+
+    def _sniff(self):
+        self.ext = sniff_extension(self._head)
+        if self.ext is None:
+            raise ImageRejected("이미지 파일이 아닙니다 (지원 포맷: JPEG, PNG, GIF, WebP, AVIF)")
+
+    def _spill(self):
+        fd, self._spool_path = tempfile.mkstemp(prefix='ingest_', suffix='.img')
+        self._spool_file = os.fdopen(fd, 'wb')
+        self._spool_file.write(memoryview(self._buffer)[:self.size])
+        self._buffer = bytearray()
+
+    # ---------- 결과 ----------
+
+    @property
+    def content_hash(self) -> str:
+        return self._hash.hexdigest()
+
+    @property
+    def content_type(self) -> str:
+        return CONTENT_TYPES.get(self.ext, 'application/octet-stream')
+
+    @property
+    def spooled(self) -> bool:
+        return self._spool_path is not None
+
+    def upload_source(self) -> Union[bytes, io.BufferedReader]:
+        """
+        Storage 업로드용 데이터
+
+        메모리 버퍼면 bytes, 임시 파일이면 열린 파일 객체 (호출자가 닫음, httpx가 청크 단위로 전송)
+        """
+        if self._spool_path is not None:
+            return open(self._spool_path, 'rb')
+        return bytes(self._buffer)
+
+    def getvalue(self) -> bytes:
+        """전체 바이트 (필요한 경우에만 사용)"""
+        if self._spool_path is not None:
+            with open(self._spool_path, 'rb') as f:
+                return f.read()
+        return bytes(self._buffer)
+
+    def dimensions(self) -> Tuple[Optional[int], Optional[int]]:
+        """이미지 가로/세로 (헤더만 읽음)"""
+        if not PIL_AVAILABLE:
+            return None, None
+        try:
+            source = self._spool_path if self._spool_path else io.BytesIO(self._buffer)
+            with Image.open(source) as img:
+                return img.size
+        except Exception:
+            return None, None
+
+    def save_to(self, path) -> None:
+        """로컬 파일로 저장 (임시 파일이면 이동)"""
+        if self._spool_path is not None:
+            self._spool_file.close()
+            os.replace(self._spool_path, path)
+            self._spool_path = None
+            self._spool_file = None
+            return
+        with open(path, 'wb') as f:
+            f.write(self._buffer)
+
+    def close(self):
+        if self._spool_file is not None:
+            self._spool_file.close()
+            self._spool_file = None
+        if self._spool_path is not None:
+            try:
+                os.unlink(self._spool_path)
+            except OSError:
+                pass
+            self._spool_path = None
+        self._buffer = bytearray()
+
+    def __enter__(self) -> 'IngestedImage':
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+# ========================================
+# 수집 경로
+# ========================================
+
+def ingest_chunks(
+    chunks: Iterable[bytes],
+    max_size: int = MAX_IMAGE_BYTES,
+    expected_size: Optional[int] = None
+) -> IngestedImage:
+    image = IngestedImage(max_size, expected_size)
+    try:
+        for chunk in chunks:
+            image.write(chunk)
+        return image.finish()
+    except BaseException:
+        image.close()
+        raise
+
+
+def ingest_url(
+    image_url: str,
+    headers: Optional[dict] = None,
+    timeout: int = 15,
+    max_size: int = MAX_IMAGE_BYTES
+) -> IngestedImage:
+    """
+    URL 이미지 스트리밍 다운로드
+
+    Raises:
+        ImageRejected: 용량 초과/이미지 아님 (Content-Length만으로 판단 가능하면 본문을 받지 않음)
+        requests.exceptions.RequestException: 네트워크 오류
+    """
+    import requests
+
+    with requests.get(image_url, headers=headers, timeout=timeout, stream=True) as response:
+        response.raise_for_status()
+        content_length = response.headers.get('Content-Length')
+        expected = int(content_length) if content_length and content_length.isdigit() else None
+        return ingest_chunks(response.iter_content(chunk_size=CHUNK_SIZE), max_size, expected)
+
+
+async def ingest_upload(upload, max_size: int = MAX_IMAGE_BYTES) -> IngestedImage:
+    """FastAPI UploadFile을 청크 단위로 수집 (전체를 한 번에 read하지 않음)"""
+    image = IngestedImage(max_size, getattr(upload, 'size', None))
+    try:
+        while True:
+            chunk = await upload.read(CHUNK_SIZE)
+            if not chunk:
+                break
+            image.write(chunk)
+        return image.finish()
+    except BaseException:
+        image.close()
+        raise
@@ -0,0 +1,357 @@
+"""
+내용 주소 기반(content-addressed) 이미지 저장소
+
+같은 이미지(동일 sha256)는 Storage에 한 번만 올리고 기존 공개 URL을 재사용합니다.
+
+- 저장 경로: blobs/{sha256}.{ext}
+- image_blobs: 해시별 저장 경로와 참조 수 (저장/조회할 때마다 +1, 마지막 참조 시각 갱신)
+- image_sources: 원본 URL → 해시 (같은 소싱 이미지 URL은 다시 다운로드하지 않음)
+- 참조 수는 추정치: 미리보기/일괄 가져오기처럼 상품 행에 저장되지 않는 조회도 +1,
+  기존 blob URL을 그대로 넘겨 저장한 경우(썸네일 URL 지정, 상세페이지 이미지 등)는 누락
+- 실제 사용 여부는 상품 행(썸네일/상세페이지 데이터)이 기준: 유예 기간 동안 참조되지 않은
+  객체는 sweep_unreferenced()가 참조 수를 실제 사용 수로 맞추고, 사용 중이 아니면 삭제
+
+Usage:
+    stored = store_bytes(data, content_type="image/jpeg")
+    stored.url, stored.deduplicated
+    release(stored.url)
+"""
+
+import hashlib
+import re
+from collections import Counter
+from datetime import datetime, timedelta
+from typing import Dict, NamedTuple, Optional
+
+from sqlalchemy import delete, func, or_, select, update
+from sqlalchemy.exc import IntegrityError
+
+from database.database_manager import get_database_manager
+from database.models import ImageBlob, ImageSource, MySellingProduct
+from utils.image_ingest import CONTENT_TYPES, MAX_IMAGE_BYTES, ImageRejected, ingest_url, sniff_extension
+
+BLOB_PREFIX = 'blobs/'
+
+# 상품 행의 URL/JSON에서 객체 경로를 찾기 위한 패턴
+_BLOB_PATH = re.compile(rf"{BLOB_PREFIX}[0-9a-f]{{64}}\.[a-z0-9]+")
+
+# 참조가 0이 된 객체를 삭제하기까지의 유예 기간
+UNREFERENCED_GRACE_HOURS = 24
+
+_tables_ready = False
+
+
+class StoredImage(NamedTuple):
+    url: str
+    storage_path: str
+    content_hash: str
+    deduplicated: bool  # True면 업로드 없이 기존 객체 재사용
+
+
+def _get_manager():
+    global _tables_ready
+    db_manager = get_database_manager()
+    if not _tables_ready:
+        for model in (ImageBlob, ImageSource):
+            model.__table__.create(bind=db_manager.engine, checkfirst=True)
+        _tables_ready = True
+    return db_manager
+
+
+def content_hash(data: bytes) -> str:
+    return hashlib.sha256(data).hexdigest()
+
+
+def is_blob_path(storage_path: str) -> bool:
+    return storage_path.startswith(BLOB_PREFIX)
+
+
+def _url_hash(source_url: str) -> str:
+    return hashlib.sha1(source_url.encode('utf-8')).hexdigest()
+
+
+def _acquire(session, digest: str) -> Optional[str]:
+    """해시가 이미 저장되어 있으면 참조 수를 올리고 저장 경로 반환"""
+    updated = session.execute(
+        update(ImageBlob)
+        .where(ImageBlob.content_hash == digest)
+        .values(ref_count=ImageBlob.ref_count + 1, last_referenced_at=datetime.now())
+    ).rowcount
+    if not updated:
+        return None
+    return session.execute(
+        select(ImageBlob.storage_path).where(ImageBlob.content_hash == digest)
+    ).scalar()
+
+
+def _remember_source(session, source_url: str, digest: str):
+    url_hash = _url_hash(source_url)
+    updated = session.execute(
+        update(ImageSource).where(ImageSource.url_hash == url_hash).values(content_hash=digest)
+    ).rowcount
+    if not updated:
+        session.add(ImageSource(url_hash=url_hash, source_url=source_url, content_hash=digest))
+
+
+# ========================================
+# 저장 / 조회
+# ========================================
+
+def _store(digest: str, ext: str, content_type: str, size: int, upload, source_url: Optional[str]) -> Optional[StoredImage]:
+    """해시가 이미 있으면 참조만 추가, 없으면 upload(storage_path)로 올리고 등록"""
+    from utils.supabase_storage import get_public_url
+
+    db_manager = _get_manager()
+
+    with db_manager.get_session() as session:
+        storage_path = _acquire(session, digest)
+        if storage_path and source_url:
+            _remember_source(session, source_url, digest)
+    if storage_path:
+        return StoredImage(get_public_url(storage_path), storage_path, digest, True)
+
+    storage_path = f"{BLOB_PREFIX}{digest}.{ext}"
+    public_url = upload(storage_path)
+    if not public_url:
+        return None
+
+    try:
+        with db_manager.get_session() as session:
+            session.add(ImageBlob(
+                content_hash=digest,
+                storage_path=storage_path,
+                size=size,
+                content_type=content_type,
+                ref_count=1
+            ))
+            if source_url:
+                _remember_source(session, source_url, digest)
+    except IntegrityError:
+        # 같은 이미지를 동시에 업로드한 경우 (upsert로 같은 경로에 덮어씀) → 참조만 추가
+        with db_manager.get_session() as session:
+            _acquire(session, digest)
+            if source_url:
+                _remember_source(session, source_url, digest)
+
+    return StoredImage(public_url, storage_path, digest, False)
+
+
+def store_bytes(
+    data: bytes,
+    content_type: Optional[str] = None,
+    source_url: Optional[str] = None
+) -> Optional[StoredImage]:
+    """
+    이미지 바이트 저장 (같은 내용이 이미 있으면 업로드하지 않고 기존 URL 반환)
+
+    Args:
+        data: 이미지 바이트
+        content_type: MIME 타입 (없으면 내용으로 판별)
+        source_url: 원본 URL (있으면 URL → 해시 매핑 기록)
+
+    Returns:
+        StoredImage 또는 업로드 실패 시 None
+    """
+    from utils.supabase_storage import upload_image_from_bytes
+
+    ext = sniff_extension(data[:16])
+    if ext:
+        content_type = CONTENT_TYPES[ext]
+    else:
+        ext, content_type = 'jpg', content_type or 'image/jpeg'
+
+    return _store(
+        content_hash(data), ext, content_type, len(data),
+        lambda storage_path: upload_image_from_bytes(data, storage_path, content_type),
+        source_url
+    )
+
+
+def store_ingested(image, source_url: Optional[str] = None) -> Optional[StoredImage]:
+    """
+    스트리밍 수집한 이미지(utils.image_ingest.IngestedImage) 저장
+
+    수집 중 계산한 해시를 그대로 사용하므로 중복이면 본문을 다시 읽지 않습니다.
+    """
+    from utils.supabase_storage import upload_ingested_image
+
+    return _store(
+        image.content_hash, image.ext, image.content_type, image.size,
+        lambda storage_path: upload_ingested_image(image, storage_path),
+        source_url
+    )
+
+
+def lookup_source(source_url: str) -> Optional[StoredImage]:
+    """
+    이전에 저장한 원본 URL이면 다운로드 없이 참조를 추가하고 기존 객체 반환
+
+    Returns:
+        StoredImage 또는 처음 보는 URL이면 None
+    """
+    from utils.supabase_storage import get_public_url
+
+    with _get_manager().get_session() as session:
+        digest = session.execute(
+            select(ImageSource.content_hash).where(ImageSource.url_hash == _url_hash(source_url))
+        ).scalar()
+        if not digest:
+            return None
+        storage_path = _acquire(session, digest)
+    if not storage_path:
+        return None
+    return StoredImage(get_public_url(storage_path), storage_path, digest, True)
+
+
+def store_from_url(image_url: str, max_size: int = MAX_IMAGE_BYTES, timeout: int = 15) -> Optional[StoredImage]:
+    """URL 이미지를 스트리밍 다운로드하여 저장 (이미 저장한 URL/내용이면 재사용)"""
+    import requests
+
+    if image_url.startswith('//'):
+        image_url = 'https:' + image_url
+
+    stored = lookup_source(image_url)
+    if stored:
+        return stored
+
+    try:
+        with ingest_url(image_url, timeout=timeout, max_size=max_size, headers={
+            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
+        }) as image:
+            return store_ingested(image, source_url=image_url)
+    except ImageRejected as e:
+        print(f"[IMAGE ERROR] {e}: {image_url}")
+        return None
+    except requests.exceptions.RequestException as e:
+        print(f"[IMAGE ERROR] 이미지 다운로드 실패: {image_url} ({e})")
+        return None
+
+
+def storage_path_from_url(url_or_path: str) -> str:
+    """공개 URL이면 버킷 내 경로로 변환"""
+    from utils.supabase_storage import BUCKET_NAME
+    from urllib.parse import unquote
+
+    # get_public_url()의 두 형식 (Supabase 공개 URL / 로컬 fallback)
+    for marker in (f"/public/{BUCKET_NAME}/", "/supabase-images/"):
+        if marker in url_or_path:
+            return unquote(url_or_path.split(marker, 1)[1].split('?', 1)[0])
+    return url_or_path
+
+
+# ========================================
+# 참조 해제 / 정리
+# ========================================
+
+def release(url_or_path: str) -> bool:
+    """
+    참조 1개 해제 (객체 삭제는 sweep_unreferenced에서 유예 기간 후)
+
+    Returns:
+        내용 주소 저장소의 객체였으면 True
+    """
+    storage_path = storage_path_from_url(url_or_path)
+    if not is_blob_path(storage_path):
+        return False
+
+    with _get_manager().get_session() as session:
+        session.execute(
+            update(ImageBlob)
+            .where(ImageBlob.storage_path == storage_path, ImageBlob.ref_count > 0)
+            .values(ref_count=ImageBlob.ref_count - 1, last_referenced_at=datetime.now())
+        )
+    return True
+
+
+def _live_references(session, storage_path: str) -> int:
+    """상품 썸네일/상세페이지 데이터에서 객체 경로를 사용 중인 행 수"""
+    return session.execute(
+        select(func.count(MySellingProduct.id)).where(or_(
+            MySellingProduct.thumbnail_url.contains(storage_path, autoescape=True),
+            MySellingProduct.detail_page_data.contains(storage_path, autoescape=True),
+        ))
+    ).scalar() or 0
+
+
+def _live_reference_counts(session) -> Counter:
+    """상품 행 전체를 한 번 훑어 객체 경로별 사용 행 수 집계"""
+    counts = Counter()
+    rows = session.execute(
+        select(MySellingProduct.thumbnail_url, MySellingProduct.detail_page_data).where(or_(
+            MySellingProduct.thumbnail_url.contains(BLOB_PREFIX),
+            MySellingProduct.detail_page_data.contains(BLOB_PREFIX),
+        ))
+    )
+    for thumbnail_url, detail_page_data in rows:
+        counts.update(set(_BLOB_PATH.findall(f"{thumbnail_url or ''} {detail_page_data or ''}")))
+    return counts
+
+
+def sweep_unreferenced(grace_hours: int = UNREFERENCED_GRACE_HOURS) -> int:
+    """
+    유예 기간 동안 참조되지 않은 객체 정리
+
+    참조 수는 추정치이므로 상품 행의 실제 사용 수로 맞추고, 사용 중이 아닌 객체만 삭제합니다.
+    (미리보기 등으로 올라간 참조 수가 객체를 계속 붙잡아 두지 않도록)
+
+    Returns:
+        삭제한 객체 수
+    """
+    from utils.supabase_storage import delete_image
+
+    cutoff = datetime.now() - timedelta(hours=grace_hours)
+    db_manager = _get_manager()
+    with db_manager.get_session() as session:
+        live = _live_reference_counts(session)
+        stale = session.execute(
+            select(ImageBlob.id, ImageBlob.storage_path, ImageBlob.content_hash, ImageBlob.ref_count)
+            .where(ImageBlob.last_referenced_at < cutoff)
+        ).all()
+
+        candidates = []
+        for blob_id, storage_path, digest, ref_count in stale:
+            in_use = live.get(storage_path, 0)
+            if ref_count != in_use:
+                # 그 사이 다시 참조되었으면 건너뜀 (마지막 참조 시각 조건)
+                session.execute(
+                    update(ImageBlob)
+                    .where(ImageBlob.id == blob_id, ImageBlob.last_referenced_at < cutoff)
+                    .values(ref_count=in_use)
+                )
+            if not in_use:
+                candidates.append((blob_id, storage_path, digest))
+
+    deleted = 0
+    for blob_id, storage_path, digest in candidates:
+        with db_manager.get_session() as session:
+            # 집계 이후 저장된 상품 행이 있으면 유지
+            if _live_references(session, storage_path):
+                continue
+            removed = session.execute(
+                delete(ImageBlob).where(ImageBlob.id == blob_id, ImageBlob.last_referenced_at < cutoff)
+            ).rowcount
+            if removed:
+                session.execute(delete(ImageSource).where(ImageSource.content_hash == digest))
+        if removed and delete_image(storage_path):
+            deleted += 1
+
+    if deleted:
+        print(f"[STORAGE] 참조 없는 이미지 {deleted}개 삭제")
+    return deleted
+
+
+def get_stats() -> Dict:
+    with _get_manager().get_session() as session:
+        row = session.execute(
+            select(
+                func.count(ImageBlob.id),
+                func.coalesce(func.sum(ImageBlob.size), 0),
+                func.coalesce(func.sum(ImageBlob.ref_count), 0),
+            )
+        ).one()
+    blobs, stored_bytes, references = int(row[0]), int(row[1]), int(row[2])
+    return {
+        'blob_count': blobs,
+        'reference_count': references,
+        'stored_mb': round(stored_bytes / (1024 * 1024), 2),
+    }
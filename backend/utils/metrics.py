@@ -0,0 +1,502 @@
+"""
+애플리케이션 메트릭 (Prometheus 텍스트 포맷)
+
+- Counter / Histogram 레지스트리 (외부 의존성 없음, 스레드 안전)
+- MetricsMiddleware: 라우트별 요청 수/지연 시간 (ASGI)
+- instrument_engine: SQLAlchemy 쿼리 시간
+- timed_job: 스케줄러 작업 소요 시간 데코레이터
+
+다중 워커 (Gunicorn):
+    워커마다 METRICS_DIR/{pid}.json 으로 스냅샷을 주기적으로 기록하고,
+    /metrics 요청을 받은 워커가 디렉토리 전체를 합산해 응답합니다.
+    종료된 워커의 값은 mark_process_dead()로 _archive.json에 누적되어 카운터가 줄지 않습니다.
+
+Usage:
+    from utils import metrics
+    metrics.SCRAPE_DURATION.observe(1.2, source='ssg', status='available')
+    with metrics.PLAYAUTO_DURATION.time(method='POST', endpoint='/orders'):
+        ...
+"""
+
+import asyncio
+import functools
+import json
+import os
+import re
+import tempfile
+import threading
+import time
+from bisect import bisect_left
+from contextlib import contextmanager
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from logger import get_logger
+
+logger = get_logger(__name__)
+
+# 워커별 스냅샷 디렉토리
+METRICS_DIR = os.getenv('METRICS_DIR', os.path.join(tempfile.gettempdir(), 'onbaek-metrics'))
+
+# 스냅샷 기록 주기 (초)
+METRICS_FLUSH_INTERVAL = float(os.getenv('METRICS_FLUSH_INTERVAL', '10'))
+
+_ARCHIVE_FILE = '_archive.json'
+
+# 기본 버킷 (초)
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0)
+
+
+class Counter:
+    """단조 증가 카운터"""
+
+    kind = 'counter'
+
+    def __init__(self, name: str, documentation: str, labelnames: Iterable[str] = ()):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._values: Dict[Tuple[str, ...], float] = {}
+        self._lock = threading.Lock()
+
+    def _key(self, labels: Dict) -> Tuple[str, ...]:
+        return tuple(str(labels.get(name, '')) for name in self.labelnames)
+
+    def inc(self, amount: float = 1, **labels):
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0) + amount
+
+    def snapshot(self) -> Dict:
+        with self._lock:
+            values = [[list(key), value] for key, value in self._values.items()]
+        return {'type': self.kind, 'help': self.documentation, 'labels': list(self.labelnames), 'values': values}
+
+
+class Histogram(Counter):
+    """버킷 히스토그램 (누적 전 버킷별 카운트, 합계, 개수)"""
+
+    kind = 'histogram'
+
+    def __init__(self, name: str, documentation: str, labelnames: Iterable[str] = (),
+                 buckets: Iterable[float] = DEFAULT_BUCKETS):
+        super().__init__(name, documentation, labelnames)
+        self.buckets = tuple(sorted(buckets))
+        self._values: Dict[Tuple[str, ...], list] = {}
+
+    def observe(self, value: float, **labels):
+        key = self._key(labels)
+        index = bisect_left(self.buckets, value)  # len(buckets) = +Inf
+        with self._lock:
+            entry = self._values.get(key)
+            if entry is None:
+                entry = self._values[key] = [[0] * (len(self.buckets) + 1), 0.0, 0]
+            entry[0][index] += 1
+            entry[1] += value
+            entry[2] += 1
+
+    @contextmanager
+    def time(self, **labels):
+        """블록 소요 시간 기록 (예외 발생 시에도 기록)"""
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(time.perf_counter() - started, **labels)
+
+    def snapshot(self) -> Dict:
+        with self._lock:
+            values = [[list(key), list(counts), total, count] for key, (counts, total, count) in self._values.items()]
+        return {
+            'type': self.kind, 'help': self.documentation, 'labels': list(self.labelnames),
+            'buckets': list(self.buckets), 'values': values
+        }
+
+
+class MetricsRegistry:
+    """메트릭 레지스트리 (프로세스당 1개)"""
+
+    def __init__(self):
+        self._metrics: Dict[str, Counter] = {}
+        self._lock = threading.Lock()
+        self._writer: Optional[threading.Thread] = None
+        self._stop = threading.Event()
+
+    def _register(self, metric):
+        with self._lock:
+            existing = self._metrics.get(metric.name)
+            if existing is not None:
+                return existing
+            self._metrics[metric.name] = metric
+            return metric
+
+    def counter(self, name: str, documentation: str, labelnames: Iterable[str] = ()) -> Counter:
+        return self._register(Counter(name, documentation, labelnames))
+
+    def histogram(self, name: str, documentation: str, labelnames: Iterable[str] = (),
+                  buckets: Iterable[float] = DEFAULT_BUCKETS) -> Histogram:
+        return self._register(Histogram(name, documentation, labelnames, buckets))
+
+    def snapshot(self) -> Dict[str, Dict]:
+        with self._lock:
+            metrics = list(self._metrics.values())
+        return {metric.name: metric.snapshot() for metric in metrics}
+
+    # ---------- 다중 워커 ----------
+
+    def flush(self):
+        """현재 프로세스 스냅샷을 METRICS_DIR/{pid}.json 에 기록 (원자적 교체)"""
+        try:
+            os.makedirs(METRICS_DIR, exist_ok=True)
+            path = os.path.join(METRICS_DIR, f'{os.getpid()}.json')
+            tmp_path = f'{path}.tmp'
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump(self.snapshot(), f)
+            os.replace(tmp_path, path)
+        except OSError as e:
+            logger.warning(f"메트릭 스냅샷 기록 실패: {e}")
+
+    def start_writer(self):
+        """주기적 스냅샷 기록 스레드 시작 (워커 프로세스에서 호출)"""
+        if self._writer and self._writer.is_alive():
+            return
+        self._stop.clear()
+        self._writer = threading.Thread(target=self._write_loop, name='metrics-writer', daemon=True)
+        self._writer.start()
+
+    def stop_writer(self):
+        self._stop.set()
+        if self._writer:
+            self._writer.join(timeout=5)
+        self.flush()
+
+    def _write_loop(self):
+        while not self._stop.wait(METRICS_FLUSH_INTERVAL):
+            self.flush()
+
+    def collect(self) -> Dict[str, Dict]:
+        """모든 워커 스냅샷 합산 (현재 프로세스는 최신 값 사용)"""
+        own = f'{os.getpid()}.json'
+        snapshots = [self.snapshot()]
+        if os.path.isdir(METRICS_DIR):
+            for filename in os.listdir(METRICS_DIR):
+                if not filename.endswith('.json') or filename == own:
+                    continue
+                pid = filename[:-len('.json')]
+                if pid.isdigit() and not _pid_alive(int(pid)):
+                    # 훅 없이 종료된 프로세스 (개발 서버 재시작 등)
+                    _remove(os.path.join(METRICS_DIR, filename))
+                    continue
+                snapshot = _read_snapshot(os.path.join(METRICS_DIR, filename))
+                if snapshot:
+                    snapshots.append(snapshot)
+        return _merge(snapshots)
+
+
+def _pid_alive(pid: int) -> bool:
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except OSError:
+        pass
+    return True
+
+
+def _remove(path: str):
+    try:
+        os.remove(path)
+    except OSError:
+        pass
+
+
+def _read_snapshot(path: str) -> Optional[Dict]:
+    try:
+        with open(path, encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+
+def _merge(snapshots: List[Dict]) -> Dict[str, Dict]:
+    merged: Dict[str, Dict] = {}
+    for snapshot in snapshots:
+        for name, metric in snapshot.items():
+            target = merged.setdefault(name, {**metric, 'values': {}})
+            for entry in metric['values']:
+                key = tuple(entry[0])
+                if metric['type'] == 'counter':
+                    target['values'][key] = target['values'].get(key, 0) + entry[1]
+                    continue
+                current = target['values'].get(key)
+                if current is None or len(current[0]) != len(entry[1]):
+                    target['values'][key] = [list(entry[1]), entry[2], entry[3]]
+                else:
+                    current[0] = [a + b for a, b in zip(current[0], entry[1])]
+                    current[1] += entry[2]
+                    current[2] += entry[3]
+    for metric in merged.values():
+        metric['values'] = [
+            [list(key), *(value if isinstance(value, list) else [value])]
+            for key, value in metric['values'].items()
+        ]
+    return merged
+
+
+def mark_process_dead(pid: int):
+    """
+    종료된 워커의 스냅샷을 아카이브에 누적하고 삭제 (gunicorn child_exit 훅에서 호출)
+    """
+    path = os.path.join(METRICS_DIR, f'{pid}.json')
+    snapshot = _read_snapshot(path)
+    if snapshot is None:
+        return
+    archive_path = os.path.join(METRICS_DIR, _ARCHIVE_FILE)
+    archive = _read_snapshot(archive_path) or {}
+    try:
+        tmp_path = f'{archive_path}.tmp'
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(_merge([archive, snapshot]), f)
+        os.replace(tmp_path, archive_path)
+        os.remove(path)
+    except OSError as e:
+        logger.warning(f"종료 워커 메트릭 정리 실패 (pid {pid}): {e}")
+
+
+# ========================================
+# 출력
+# ========================================
+
+def _escape(value) -> str:
+    return str(value).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+
+def _format_labels(names: List[str], values: List[str], extra: Optional[Tuple[str, str]] = None) -> str:
+    pairs = list(zip(names, values))
+    if extra:
+        pairs.append(extra)
+    if not pairs:
+        return ''
+    return '{' + ','.join(f'{name}="{_escape(value)}"' for name, value in pairs) + '}'
+
+
+def _format_bound(bound: float) -> str:
+    return repr(float(bound))
+
+
+def render_prometheus(metrics: Dict[str, Dict]) -> str:
+    """Prometheus 텍스트 포맷 (0.0.4)"""
+    lines = []
+    for name in sorted(metrics):
+        metric = metrics[name]
+        lines.append(f"# HELP {name} {metric['help']}")
+        lines.append(f"# TYPE {name} {metric['type']}")
+        labelnames = metric['labels']
+        for entry in metric['values']:
+            labelvalues = entry[0]
+            if metric['type'] == 'counter':
+                lines.append(f"{name}{_format_labels(labelnames, labelvalues)} {float(entry[1])}")
+                continue
+            counts, total, count = entry[1], entry[2], entry[3]
+            cumulative = 0
+            for bound, bucket_count in zip(list(metric['buckets']) + ['+Inf'], counts):
+                cumulative += bucket_count
+                le = bound if bound == '+Inf' else _format_bound(bound)
+                lines.append(f"{name}_bucket{_format_labels(labelnames, labelvalues, ('le', le))} {cumulative}")
+            lines.append(f"{name}_sum{_format_labels(labelnames, labelvalues)} {float(total)}")
+            lines.append(f"{name}_count{_format_labels(labelnames, labelvalues)} {count}")
+    return '\n'.join(lines) + '\n'
+
+
+def _quantile(buckets: List[float], counts: List[int], q: float) -> Optional[float]:
+    """버킷 카운트로 분위수 추정 (버킷 내 선형 보간)"""
+    total = sum(counts)
+    if not total:
+        return None
+    rank = q * total
+    cumulative = 0
+    for i, bucket_count in enumerate(counts):
+        if cumulative + bucket_count >= rank and bucket_count:
+            if i >= len(buckets):
+                return buckets[-1] if buckets else None
+            lower = buckets[i - 1] if i > 0 else 0.0
+            return lower + (buckets[i] - lower) * (rank - cumulative) / bucket_count
+        cumulative += bucket_count
+    return buckets[-1] if buckets else None
+
+
+def summarize(metrics: Dict[str, Dict]) -> Dict[str, List[Dict]]:
+    """관리자 페이지용 JSON 요약 (히스토그램: 건수/평균/p50/p95, 카운터: 값)"""
+    summary: Dict[str, List[Dict]] = {}
+    for name in sorted(metrics):
+        metric = metrics[name]
+        rows = []
+        for entry in metric['values']:
+            row = dict(zip(metric['labels'], entry[0]))
+            if metric['type'] == 'counter':
+                row['value'] = entry[1]
+            else:
+                counts, total, count = entry[1], entry[2], entry[3]
+                p50 = _quantile(metric['buckets'], counts, 0.5)
+                p95 = _quantile(metric['buckets'], counts, 0.95)
+                row.update({
+                    'count': count,
+                    'avg_ms': round(total / count * 1000, 2) if count else None,
+                    'p50_ms': round(p50 * 1000, 2) if p50 is not None else None,
+                    'p95_ms': round(p95 * 1000, 2) if p95 is not None else None,
+                })
+            rows.append(row)
+        if metric['type'] == 'histogram':
+            rows.sort(key=lambda r: r['count'], reverse=True)
+        summary[name] = rows
+    return summary
+
+
+# ========================================
+# 레지스트리 및 공용 메트릭
+# ========================================
+
+registry = MetricsRegistry()
+
+HTTP_REQUESTS = registry.counter(
+    'http_requests_total', 'HTTP 요청 수', ('method', 'route', 'status'))
+HTTP_DURATION = registry.histogram(
+    'http_request_duration_seconds', 'HTTP 요청 처리 시간', ('method', 'route'))
+DB_QUERY_DURATION = registry.histogram(
+    'db_query_duration_seconds', 'DB 쿼리 실행 시간', ('operation',),
+    buckets=(0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0))
+SCRAPE_DURATION = registry.histogram(
+    'scrape_duration_seconds', '소싱처별 상품 상태 확인 시간', ('source', 'status'))
+FLARESOLVERR_QUEUE = registry.histogram(
+    'flaresolverr_queue_seconds', 'FlareSolverr 대기 시간 (전체 - 브라우저 처리 시간)')
+FLARESOLVERR_DURATION = registry.histogram(
+    'flaresolverr_request_duration_seconds', 'FlareSolverr 요청 전체 시간', ('outcome',))
+BROWSER_TTFB = registry.histogram(
+    'browser_ttfb_seconds', '브라우저(FlareSolverr) 페이지 요청 첫 바이트까지 시간', ('session',))
+BROWSER_SESSIONS = registry.counter(
+    'browser_sessions_total', '브라우저 풀 세션 이벤트', ('event',))
+FETCH_STRATEGY = registry.counter(
+    'fetch_strategy_attempts_total', '페이지 가져오기 전략별 시도 결과', ('strategy', 'outcome'))
+CIRCUIT_BREAKER = registry.counter(
+    'circuit_breaker_events_total', '서킷 브레이커 상태 전환/차단 수', ('name', 'event'))
+PLAYAUTO_DURATION = registry.histogram(
+    'playauto_request_duration_seconds', 'PlayAuto API 호출 시간', ('method', 'endpoint'))
+PLAYAUTO_REQUESTS = registry.counter(
+    'playauto_requests_total', 'PlayAuto API 호출 결과', ('method', 'endpoint', 'outcome'))
+JOB_DURATION = registry.histogram(
+    'scheduler_job_duration_seconds', '스케줄러 작업 소요 시간', ('job', 'status'),
+    buckets=(0.1, 0.5, 1.0, 5.0, 10.0, 30.0, 60.0, 120.0, 300.0, 600.0, 1800.0))
+
+
+def collect() -> Dict[str, Dict]:
+    return registry.collect()
+
+
+def render() -> str:
+    """/metrics 응답 본문 (모든 워커 합산)"""
+    return render_prometheus(registry.collect())
+
+
+def summary() -> Dict[str, List[Dict]]:
+    return summarize(registry.collect())
+
+
+_ID_SEGMENT = re.compile(r'/[^/]*\d[^/]*')
+
+
+def normalize_endpoint(endpoint: str) -> str:
+    """숫자가 들어간 경로 구간을 :id로 치환 (라벨 카디널리티 제한)"""
+    return _ID_SEGMENT.sub('/:id', endpoint.split('?', 1)[0])
+
+
+# ========================================
+# 계측 헬퍼
+# ========================================
+
+class MetricsMiddleware:
+    """
+    라우트별 요청 수/처리 시간 (ASGI)
+
+    라벨은 실제 경로가 아닌 라우트 템플릿(/api/products/{product_id})을 사용합니다.
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope['type'] != 'http':
+            await self.app(scope, receive, send)
+            return
+
+        started = time.perf_counter()
+        status = {'code': 500}
+
+        async def send_wrapper(message):
+            if message['type'] == 'http.response.start':
+                status['code'] = message['status']
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            route = scope.get('route')
+            route_path = getattr(route, 'path', None) or 'unmatched'
+            method = scope.get('method', '')
+            HTTP_DURATION.observe(time.perf_counter() - started, method=method, route=route_path)
+            HTTP_REQUESTS.inc(method=method, route=route_path, status=status['code'])
+
+
+def instrument_engine(engine):
+    """SQLAlchemy 엔진에 쿼리 시간 측정 이벤트 등록"""
+    from sqlalchemy import event
+
+    @event.listens_for(engine, 'before_cursor_execute')
+    def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        conn.info.setdefault('_metrics_started', []).append(time.perf_counter())
+
+    @event.listens_for(engine, 'after_cursor_execute')
+    def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        stack = conn.info.get('_metrics_started')
+        if not stack:
+            return
+        operation = statement.lstrip().split(None, 1)[0].upper() if statement.strip() else 'OTHER'
+        if operation not in ('SELECT', 'INSERT', 'UPDATE', 'DELETE', 'WITH'):
+            operation = 'OTHER'
+        DB_QUERY_DURATION.observe(time.perf_counter() - stack.pop(), operation=operation)
+
+    @event.listens_for(engine, 'handle_error')
+    def _handle_error(exception_context):
+        conn = exception_context.connection
+        if conn is not None and conn.info.get('_metrics_started'):
+            conn.info['_metrics_started'].pop()
+
+
+def timed_job(name: str):
+    """스케줄러 작업 소요 시간 기록 데코레이터 (동기/비동기 함수 모두 지원)"""
+
+    def decorator(func):
+        if asyncio.iscoroutinefunction(func):
+            @functools.wraps(func)
+            async def async_wrapper(*args, **kwargs):
+                started = time.perf_counter()
+                status = 'error'
+                try:
+                    result = await func(*args, **kwargs)
+                    status = 'ok'
+                    return result
+                finally:
+                    JOB_DURATION.observe(time.perf_counter() - started, job=name, status=status)
+            return async_wrapper
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            started = time.perf_counter()
+            status = 'error'
+            try:
+                result = func(*args, **kwargs)
+                status = 'ok'
+                return result
+            finally:
+                JOB_DURATION.observe(time.perf_counter() - started, job=name, status=status)
+        return wrapper
+
+    return decorator
@@ -0,0 +1,61 @@
+"""
+빠른 JSON 응답
+
+orjson이 설치되어 있으면 orjson으로, 없으면 표준 json으로 직렬화합니다.
+대량 목록 엔드포인트는 fast_json()으로 응답을 직접 만들어
+FastAPI의 jsonable_encoder 재귀 변환 단계를 건너뜁니다.
+"""
+
+from datetime import date, datetime
+from decimal import Decimal
+from typing import Any, Optional
+
+from fastapi.responses import JSONResponse
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+
+def _default(value: Any) -> Any:
+    """orjson이 기본 지원하지 않는 타입 처리"""
+    if isinstance(value, Decimal):
+        return float(value)
+    if isinstance(value, (set, frozenset)):
+        return list(value)
+    if hasattr(value, 'model_dump'):
+        return value.model_dump()
+    raise TypeError(f"JSON 직렬화 불가 타입: {type(value).__name__}")
+
+
+class FastJSONResponse(JSONResponse):
+    """orjson 기반 JSON 응답 (미설치 시 표준 JSONResponse와 동일)"""
+
+    def render(self, content: Any) -> bytes:
+        if ORJSON_AVAILABLE:
+            return orjson.dumps(content, default=_default, option=orjson.OPT_NON_STR_KEYS)
+        return super().render(_to_builtin(content))
+
+
+def _to_builtin(value: Any) -> Any:
+    # 표준 json 폴백용 (datetime/Decimal 처리)
+    if isinstance(value, dict):
+        return {k: _to_builtin(v) for k, v in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [_to_builtin(v) for v in value]
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    if isinstance(value, Decimal):
+        return float(value)
+    return value
+
+
+def fast_json(content: Any, status_code: int = 200, headers: Optional[dict] = None) -> FastJSONResponse:
+    """
+    jsonable_encoder를 거치지 않는 JSON 응답 생성
+
+    content는 dict/list/str/int/float/bool/None, datetime, Decimal 조합이어야 합니다.
+    """
+    return FastJSONResponse(content=content, status_code=status_code, headers=headers)
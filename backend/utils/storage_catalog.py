@@ -0,0 +1,382 @@
+"""
+스토리지 카탈로그
+
+Supabase Storage 객체 메타데이터(경로, 크기, 이미지 크기, 해시, 썸네일 여부)를
+storage_objects 테이블에 보관하여 관리자 갤러리/통계를 원격 list 호출 없이 조회합니다.
+
+갱신 경로:
+- write-through: supabase_storage.upload_image*/delete_image 호출 시 즉시 반영
+- 주기적 재동기화: reconcile()이 Storage 목록과 비교하여 누락/삭제/변경 반영
+  (Supabase 대시보드 등 앱 밖에서 바뀐 객체 처리)
+"""
+
+import hashlib
+import io
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from sqlalchemy import case, delete, func, select, update
+from sqlalchemy.exc import IntegrityError
+
+from database.database_manager import get_database_manager
+from database.models import StorageObject
+from database.serializers import fetch_dicts
+
+try:
+    from PIL import Image
+    PIL_AVAILABLE = True
+except ImportError:
+    PIL_AVAILABLE = False
+
+
+THUMBS_DIR = 'thumbs'
+
+# Storage list API 페이지 크기
+LIST_PAGE_SIZE = 1000
+
+# 재동기화 시 폴더 목록 동시 조회 수
+RECONCILE_CONCURRENCY = 4
+
+_table_ready = False
+_last_reconciled_at: Optional[datetime] = None
+
+
+def _get_manager():
+    """카탈로그 테이블이 없으면 생성 후 DatabaseManager 반환"""
+    global _table_ready
+    db_manager = get_database_manager()
+    if not _table_ready:
+        StorageObject.__table__.create(bind=db_manager.engine, checkfirst=True)
+        _table_ready = True
+    return db_manager
+
+
+def split_path(storage_path: str) -> Tuple[str, str]:
+    """'cat-1/image.jpg' → ('cat-1', 'image.jpg')"""
+    folder, _, filename = storage_path.rpartition('/')
+    return folder, filename
+
+
+def original_path_for_thumbnail(storage_path: str) -> Optional[str]:
+    """
+    기본 썸네일 경로면 원본 경로 반환 ('cat-1/thumbs/a.jpg' → 'cat-1/a.jpg')
+
+    썸네일이 아닌 경로나 크기별 변형 경로(thumbs/400/...)는 None
+    """
+    parts = storage_path.split('/')
+    if len(parts) >= 2 and parts[-2] == THUMBS_DIR:
+        return '/'.join(parts[:-2] + [parts[-1]])
+    return None
+
+
+def _is_catalog_path(storage_path: str) -> bool:
+    # thumbs 하위 객체는 원본 행의 has_thumbnail로만 관리
+    return THUMBS_DIR not in storage_path.split('/')[:-1]
+
+
+def describe_image(data: bytes) -> Dict:
+    """이미지 크기(헤더만 읽음)와 sha256 해시"""
+    info = {'content_hash': hashlib.sha256(data).hexdigest(), 'width': None, 'height': None}
+    if PIL_AVAILABLE:
+        try:
+            with Image.open(io.BytesIO(data)) as img:
+                info['width'], info['height'] = img.size
+        except Exception:
+            pass
+    return info
+
+
+# ========================================
+# write-through
+# ========================================
+
+def record_upload(storage_path: str, data: bytes, content_type: Optional[str] = None):
+    """업로드된 객체를 카탈로그에 반영 (썸네일 경로면 원본의 썸네일 여부만 갱신)"""
+    if original_path_for_thumbnail(storage_path) is not None or not _is_catalog_path(storage_path):
+        record_object(storage_path, len(data), content_type)
+        return
+    record_object(storage_path, len(data), content_type, **describe_image(data))
+
+
+def record_object(
+    storage_path: str,
+    size: int,
+    content_type: Optional[str] = None,
+    content_hash: Optional[str] = None,
+    width: Optional[int] = None,
+    height: Optional[int] = None
+):
+    """메타데이터를 이미 알고 있는 업로드 객체 반영 (스트리밍 업로드용, 본문을 다시 읽지 않음)"""
+    original = original_path_for_thumbnail(storage_path)
+    if original is not None:
+        mark_thumbnail(original, True)
+        return
+    if not _is_catalog_path(storage_path):
+        return
+
+    folder, filename = split_path(storage_path)
+    values = {
+        'folder': folder,
+        'filename': filename,
+        'size': size,
+        'content_type': content_type,
+        'content_hash': content_hash,
+        'width': width,
+        'height': height,
+        'etag': None,
+        'modified_at': datetime.now().isoformat(),
+        'synced_at': datetime.now(),
+    }
+
+    db_manager = _get_manager()
+    try:
+        with db_manager.get_session() as session:
+            updated = session.execute(
+                update(StorageObject).where(StorageObject.path == storage_path).values(**values)
+            ).rowcount
+            if not updated:
+                session.add(StorageObject(path=storage_path, has_thumbnail=False, **values))
+    except IntegrityError:
+        # 동시에 같은 경로를 등록한 경우 갱신으로 재시도
+        with db_manager.get_session() as session:
+            session.execute(
+                update(StorageObject).where(StorageObject.path == storage_path).values(**values)
+            )
+
+
+def mark_thumbnail(original_path: str, has_thumbnail: bool = True):
+    with _get_manager().get_session() as session:
+        session.execute(
+            update(StorageObject)
+            .where(StorageObject.path == original_path)
+            .values(has_thumbnail=has_thumbnail)
+        )
+
+
+def remove_objects(paths: Iterable[str]):
+    """삭제된 객체 반영 (썸네일 경로면 원본의 썸네일 여부 해제)"""
+    originals, thumbs_of = [], []
+    for path in paths:
+        original = original_path_for_thumbnail(path)
+        if original is not None:
+            thumbs_of.append(original)
+        elif _is_catalog_path(path):
+            originals.append(path)
+
+    if not originals and not thumbs_of:
+        return
+    with _get_manager().get_session() as session:
+        if originals:
+            session.execute(delete(StorageObject).where(StorageObject.path.in_(originals)))
+        if thumbs_of:
+            session.execute(
+                update(StorageObject)
+                .where(StorageObject.path.in_(thumbs_of))
+                .values(has_thumbnail=False)
+            )
+
+
+def remove_folder(folder: str):
+    with _get_manager().get_session() as session:
+        session.execute(delete(StorageObject).where(StorageObject.folder == folder))
+
+
+# ========================================
+# 조회
+# ========================================
+
+def is_populated() -> bool:
+    """한 번이라도 동기화되어 카탈로그를 신뢰할 수 있는지"""
+    if _last_reconciled_at is not None:
+        return True
+    with _get_manager().get_session() as session:
+        return session.execute(select(StorageObject.id).limit(1)).first() is not None
+
+
+def folder_stats() -> List[Dict]:
+    """폴더별 이미지 수/용량/썸네일 수 (숨김 파일 제외)"""
+    is_image = ~StorageObject.filename.like('.%')
+    stmt = (
+        select(
+            StorageObject.folder,
+            func.sum(case((is_image, 1), else_=0)).label('image_count'),
+            func.coalesce(func.sum(case((is_image, StorageObject.size), else_=0)), 0).label('size'),
+            func.sum(case((is_image & StorageObject.has_thumbnail, 1), else_=0)).label('thumbnail_count'),
+        )
+        .group_by(StorageObject.folder)
+    )
+    with _get_manager().get_session() as session:
+        return [
+            {
+                'folder': row.folder,
+                'image_count': int(row.image_count or 0),
+                'size': int(row.size or 0),
+                'thumbnail_count': int(row.thumbnail_count or 0),
+            }
+            for row in session.execute(stmt)
+        ]
+
+
+def list_folder(folder: str) -> List[Dict]:
+    """폴더 내 이미지 메타데이터 (파일명 순)"""
+    stmt = (
+        select(
+            StorageObject.path, StorageObject.filename, StorageObject.size,
+            StorageObject.width, StorageObject.height, StorageObject.content_type,
+            StorageObject.has_thumbnail, StorageObject.modified_at
+        )
+        .where(StorageObject.folder == folder, ~StorageObject.filename.like('.%'))
+        .order_by(StorageObject.filename)
+    )
+    with _get_manager().get_session() as session:
+        return fetch_dicts(session, stmt)
+
+
+def get_content_hashes(paths: Iterable[str]) -> Dict[str, Optional[str]]:
+    """경로별 기록된 sha256 (카탈로그에 없는 경로는 결과에서 빠짐)"""
+    paths = list(paths)
+    if not paths:
+        return {}
+    with _get_manager().get_session() as session:
+        rows = session.execute(
+            select(StorageObject.path, StorageObject.content_hash).where(StorageObject.path.in_(paths))
+        )
+        return {path: digest for path, digest in rows}
+
+
+def get_status() -> Dict:
+    with _get_manager().get_session() as session:
+        row = session.execute(
+            select(func.count(StorageObject.id), func.max(StorageObject.synced_at))
+        ).one()
+    return {
+        'object_count': row[0],
+        'last_synced_at': row[1].isoformat() if isinstance(row[1], datetime) else row[1],
+        'last_reconciled_at': _last_reconciled_at.isoformat() if _last_reconciled_at else None,
+    }
+
+
+# ========================================
+# 재동기화
+# ========================================
+
+def _list_all(bucket, path: str) -> List[Dict]:
+    entries: List[Dict] = []
+    offset = 0
+    while True:
+        page = bucket.list(path, {'limit': LIST_PAGE_SIZE, 'offset': offset})
+        entries.extend(page)
+        if len(page) < LIST_PAGE_SIZE:
+            return entries
+        offset += LIST_PAGE_SIZE
+
+
+def _list_folder_objects(bucket, folder: str) -> Tuple[str, List[Dict], set]:
+    files = [f for f in _list_all(bucket, folder) if f.get('id') is not None]
+    try:
+        thumbs = {
+            f['name'] for f in _list_all(bucket, f"{folder}/{THUMBS_DIR}")
+            if f.get('id') is not None
+        }
+    except Exception:
+        thumbs = set()
+    return folder, files, thumbs
+
+
+def _sync_folder(session, folder: str, files: List[Dict], thumbs: set, now: datetime) -> Dict[str, int]:
+    counts = {'added': 0, 'updated': 0, 'removed': 0}
+    existing = {
+        obj.path: obj
+        for obj in session.query(StorageObject).filter(StorageObject.folder == folder)
+    }
+
+    for entry in files:
+        filename = entry['name']
+        path = f"{folder}/{filename}" if folder else filename
+        metadata = entry.get('metadata') or {}
+        values = {
+            'size': metadata.get('size') or 0,
+            'content_type': metadata.get('mimetype'),
+            'etag': metadata.get('eTag'),
+            'has_thumbnail': filename in thumbs,
+            'modified_at': entry.get('updated_at') or entry.get('created_at'),
+        }
+
+        obj = existing.pop(path, None)
+        if obj is None:
+            session.add(StorageObject(path=path, folder=folder, filename=filename, synced_at=now, **values))
+            counts['added'] += 1
+            continue
+
+        changed = any(getattr(obj, key) != value for key, value in values.items() if key != 'etag')
+        if obj.etag and values['etag'] and obj.etag != values['etag']:
+            # 앱 밖에서 내용이 바뀐 경우 write-through로 기록한 크기/해시는 무효
+            obj.width = obj.height = obj.content_hash = None
+            changed = True
+        if changed or obj.etag != values['etag']:
+            for key, value in values.items():
+                setattr(obj, key, value)
+            obj.synced_at = now
+            counts['updated'] += 1
+
+    for obj in existing.values():
+        session.delete(obj)
+        counts['removed'] += 1
+
+    return counts
+
+
+def reconcile(folders: Optional[List[str]] = None) -> Dict:
+    """
+    Storage 목록과 카탈로그 동기화
+
+    Args:
+        folders: 동기화할 폴더 (None이면 버킷 전체, 사라진 폴더의 행도 삭제)
+
+    Returns:
+        {"folders", "added", "updated", "removed", "elapsed_sec"}
+    """
+    global _last_reconciled_at
+    from utils.supabase_storage import supabase, BUCKET_NAME
+
+    if not supabase:
+        raise RuntimeError("Supabase client not initialized")
+
+    started = datetime.now()
+    bucket = supabase.storage.from_(BUCKET_NAME)
+    full_scan = folders is None
+    if full_scan:
+        folders = [
+            f['name'] for f in _list_all(bucket, "")
+            if f.get('id') is None and f['name'] != THUMBS_DIR and not f['name'].startswith('.')
+        ]
+
+    with ThreadPoolExecutor(max_workers=RECONCILE_CONCURRENCY) as executor:
+        listings = list(executor.map(lambda folder: _list_folder_objects(bucket, folder), folders))
+
+    totals = {'added': 0, 'updated': 0, 'removed': 0}
+    with _get_manager().get_session() as session:
+        for folder, files, thumbs in listings:
+            for key, value in _sync_folder(session, folder, files, thumbs, started).items():
+                totals[key] += value
+
+        if full_scan:
+            stale = session.execute(
+                delete(StorageObject).where(StorageObject.folder.notin_(folders))
+            ).rowcount if folders else session.execute(delete(StorageObject)).rowcount
+            totals['removed'] += stale or 0
+
+    _last_reconciled_at = datetime.now()
+    elapsed = (_last_reconciled_at - started).total_seconds()
+    print(
+        f"[STORAGE] 카탈로그 동기화 완료: 폴더 {len(folders)}개, "
+        f"추가 {totals['added']} / 갱신 {totals['updated']} / 삭제 {totals['removed']} ({elapsed:.1f}s)"
+    )
+    return {'folders': len(folders), **totals, 'elapsed_sec': round(elapsed, 2)}
+
+
+def ensure_populated():
+    """카탈로그가 비어 있으면 최초 1회 동기화"""
+    if not is_populated():
+        reconcile()
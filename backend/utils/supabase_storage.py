@@ -9,6 +9,8 @@ from typing import Optional, List, Tuple
 from supabase import create_client, Client
 from dotenv import load_dotenv
 
+from utils.circuit_breaker import get_breaker
+
 # PIL import (썸네일 생성용)
 try:
     from PIL import Image
@@ -39,6 +41,20 @@ else:
     print("[WARN] Supabase credentials not found - Storage features disabled")
 
 
+def _is_storage_outage(e: Exception) -> bool:
+    """서버 오류(5xx)/연결 실패만 서킷 실패로 집계 (없는 파일 등 4xx 응답은 제외)"""
+    status = getattr(e, 'status', None)
+    try:
+        return status is None or int(status) >= 500
+    except (TypeError, ValueError):
+        return True
+
+
+def _storage_call(func, *args, **kwargs):
+    """Storage API 호출 (Supabase 장애 시 타임아웃을 기다리지 않고 즉시 실패)"""
+    return get_breaker("supabase_storage").call(func, *args, is_failure=_is_storage_outage, **kwargs)
+
+
 def ensure_bucket_exists():
     """버킷이 존재하는지 확인하고 없으면 생성"""
     if not supabase:
@@ -62,6 +78,23 @@ def ensure_bucket_exists():
         return False
 
 
+def _catalog_upload(storage_path: str, file_data: bytes, content_type: Optional[str]):
+    """스토리지 카탈로그 write-through (실패해도 업로드 결과에는 영향 없음)"""
+    try:
+        from utils.storage_catalog import record_upload
+        record_upload(storage_path, file_data, content_type)
+    except Exception as e:
+        print(f"[WARN] Storage catalog update failed for {storage_path}: {e}")
+
+
+def _catalog_remove(storage_paths: List[str]):
+    try:
+        from utils.storage_catalog import remove_objects
+        remove_objects(storage_paths)
+    except Exception as e:
+        print(f"[WARN] Storage catalog update failed for {storage_paths}: {e}")
+
+
 def upload_image(file_path: Path, storage_path: str) -> Optional[str]:
     """
     이미지를 Supabase Storage에 업로드
@@ -87,11 +120,13 @@ def upload_image(file_path: Path, storage_path: str) -> Optional[str]:
             file_data = f.read()
 
         # 업로드 (upsert: 덮어쓰기 허용)
-        result = supabase.storage.from_(BUCKET_NAME).upload(
+        result = _storage_call(
+            supabase.storage.from_(BUCKET_NAME).upload,
             storage_path,
             file_data,
             file_options={"content-type": f"image/{file_path.suffix[1:]}", "upsert": "true"}
         )
+        _catalog_upload(storage_path, file_data, f"image/{file_path.suffix[1:]}")
 
         # 공개 URL 생성
         public_url = get_public_url(storage_path)
@@ -120,11 +155,13 @@ def upload_image_from_bytes(file_data: bytes, storage_path: str, content_type: s
 
     try:
         # 업로드
-        result = supabase.storage.from_(BUCKET_NAME).upload(
+        result = _storage_call(
+            supabase.storage.from_(BUCKET_NAME).upload,
             storage_path,
             file_data,
             file_options={"content-type": content_type, "upsert": "true"}
         )
+        _catalog_upload(storage_path, file_data, content_type)
 
         # 공개 URL 생성
         public_url = get_public_url(storage_path)
@@ -135,6 +172,45 @@ def upload_image_from_bytes(file_data: bytes, storage_path: str, content_type: s
         return None
 
 
+def upload_ingested_image(image, storage_path: str) -> Optional[str]:
+    """
+    스트리밍 수집한 이미지(utils.image_ingest.IngestedImage)를 Supabase Storage에 업로드
+
+    임시 파일로 내려간 큰 이미지는 파일 객체로 넘겨 청크 단위로 전송하고,
+    카탈로그에는 수집 중 계산한 해시/크기를 기록합니다 (본문을 다시 읽지 않음).
+
+    Returns:
+        업로드된 이미지의 공개 URL 또는 None
+    """
+    if not supabase:
+        print("[ERROR] Supabase client not initialized")
+        return None
+
+    source = image.upload_source()
+    try:
+        _storage_call(
+            supabase.storage.from_(BUCKET_NAME).upload,
+            storage_path,
+            source,
+            file_options={"content-type": image.content_type, "upsert": "true"}
+        )
+    except Exception as e:
+        print(f"[ERROR] Failed to upload {storage_path}: {e}")
+        return None
+    finally:
+        if hasattr(source, 'close'):
+            source.close()
+
+    try:
+        from utils.storage_catalog import record_object
+        width, height = image.dimensions()
+        record_object(storage_path, image.size, image.content_type, image.content_hash, width, height)
+    except Exception as e:
+        print(f"[WARN] Storage catalog update failed for {storage_path}: {e}")
+
+    return get_public_url(storage_path)
+
+
 def get_public_url(storage_path: str) -> str:
     """
     Storage 경로에 대한 공개 URL 생성
@@ -172,7 +248,7 @@ def list_images(folder: str = "") -> List[str]:
         return []
 
     try:
-        files = supabase.storage.from_(BUCKET_NAME).list(folder)
+        files = _storage_call(supabase.storage.from_(BUCKET_NAME).list, folder)
         return [f"{folder}/{file['name']}" if folder else file['name'] for file in files]
     except Exception as e:
         print(f"[ERROR] Failed to list images in {folder}: {e}")
@@ -193,7 +269,8 @@ def delete_image(storage_path: str) -> bool:
         return False
 
     try:
-        supabase.storage.from_(BUCKET_NAME).remove([storage_path])
+        _storage_call(supabase.storage.from_(BUCKET_NAME).remove, [storage_path])
+        _catalog_remove([storage_path])
         print(f"[OK] Deleted: {storage_path}")
         return True
     except Exception as e:
@@ -311,27 +388,17 @@ def upload_image_from_url(image_url: str, storage_path: str) -> Optional[str]:
 
     try:
         import requests
-        from mimetypes import guess_type
+        from utils.image_ingest import ingest_url
 
-        # 이미지 다운로드
+        # 이미지 다운로드 (스트리밍, 이미지가 아니거나 너무 크면 중단)
         print(f"[INFO] Downloading image from: {image_url[:100]}...")
-        response = requests.get(image_url, timeout=10, headers={
+        with ingest_url(image_url, timeout=10, headers={
             'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
-        })
-        response.raise_for_status()
-
-        image_data = response.content
-        print(f"[OK] Downloaded {len(image_data)} bytes")
-
-        # Content-Type 추출
-        content_type = response.headers.get('Content-Type', 'image/jpeg')
-        if not content_type.startswith('image/'):
-            # URL에서 추측
-            guessed_type, _ = guess_type(image_url.split('?')[0])
-            content_type = guessed_type or 'image/jpeg'
+        }) as image:
+            print(f"[OK] Downloaded {image.size} bytes")
 
-        # Supabase에 업로드
-        public_url = upload_image_from_bytes(image_data, storage_path, content_type)
+            # Supabase에 업로드
+            public_url = upload_ingested_image(image, storage_path)
 
         if public_url:
             print(f"[OK] Uploaded to Supabase: {storage_path}")
@@ -0,0 +1,409 @@
+"""
+썸네일 생성 파이프라인
+
+Supabase Storage 이미지에 대해 여러 크기/포맷의 썸네일을 일괄 생성합니다.
+
+- 폴더마다 원본/썸네일 목록을 한 번씩만 조회하여 set으로 존재 여부 판단
+- 다운로드 → 리사이즈 → 업로드를 제한된 동시성으로 처리
+  (네트워크 I/O는 스레드, Pillow 리사이즈는 프로세스 풀에서 실행)
+- 매니페스트(JSON)에 원본 eTag와 완료된 변형을 기록하여 재실행 시 즉시 건너뜀
+
+썸네일 경로:
+    기본 변형 (200px JPEG): {folder}/thumbs/{filename}   (기존 경로와 호환)
+    그 외 변형:             {folder}/thumbs/{size}/{stem}.{ext}
+
+Usage:
+    pipeline = ThumbnailPipeline(parse_variants("200:jpeg,400:webp"))
+    stats = asyncio.run(pipeline.run())
+"""
+
+import asyncio
+import io
+import json
+import os
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, Iterable, List, NamedTuple, Optional, Set, Tuple
+
+try:
+    from PIL import Image, features
+    PIL_AVAILABLE = True
+except ImportError:
+    PIL_AVAILABLE = False
+
+
+# 포맷 이름 → (Pillow 포맷, MIME 타입, 확장자)
+THUMBNAIL_FORMATS: Dict[str, Tuple[str, str, str]] = {
+    'jpeg': ('JPEG', 'image/jpeg', 'jpg'),
+    'webp': ('WEBP', 'image/webp', 'webp'),
+    'avif': ('AVIF', 'image/avif', 'avif'),
+}
+
+MANIFEST_PATH = Path(os.getenv(
+    'THUMBNAIL_MANIFEST_PATH',
+    str(Path(__file__).parent.parent / 'thumbnail_manifest.json')
+))
+
+# 목록 조회 페이지 크기 (Storage list API 기본값은 100개)
+LIST_PAGE_SIZE = 1000
+
+
+class ThumbnailVariant(NamedTuple):
+    """썸네일 변형 (최대 변 길이 + 포맷)"""
+    size: int
+    fmt: str = 'jpeg'
+
+    @property
+    def key(self) -> str:
+        return f"{self.size}.{self.fmt}"
+
+    @property
+    def content_type(self) -> str:
+        return THUMBNAIL_FORMATS[self.fmt][1]
+
+
+DEFAULT_VARIANT = ThumbnailVariant(200, 'jpeg')
+
+
+def available_formats() -> Set[str]:
+    """현재 Pillow 빌드에서 저장 가능한 포맷"""
+    if not PIL_AVAILABLE:
+        return set()
+    formats = {'jpeg'}
+    for fmt in ('webp', 'avif'):
+        if features.check(fmt):
+            formats.add(fmt)
+    return formats
+
+
+def parse_variants(spec: str) -> List[ThumbnailVariant]:
+    """
+    "200:jpeg,400:webp,400:avif" 형식의 변형 목록 파싱
+
+    포맷을 생략하면 jpeg. 현재 환경에서 지원하지 않는 포맷은 경고 후 제외합니다.
+
+    Raises:
+        ValueError: 크기/포맷이 잘못된 경우
+    """
+    supported = available_formats()
+    variants: List[ThumbnailVariant] = []
+    for item in spec.split(','):
+        item = item.strip()
+        if not item:
+            continue
+        size_str, _, fmt = item.partition(':')
+        fmt = (fmt or 'jpeg').lower()
+        if fmt == 'jpg':
+            fmt = 'jpeg'
+        if fmt not in THUMBNAIL_FORMATS:
+            raise ValueError(f"지원하지 않는 썸네일 포맷: {fmt}")
+        size = int(size_str)
+        if size <= 0:
+            raise ValueError(f"잘못된 썸네일 크기: {size_str}")
+        if fmt not in supported:
+            print(f"[WARN] Pillow에서 {fmt} 저장을 지원하지 않아 제외: {item}")
+            continue
+        variant = ThumbnailVariant(size, fmt)
+        if variant not in variants:
+            variants.append(variant)
+    return variants
+
+
+def thumbnail_path(original_path: str, variant: ThumbnailVariant) -> str:
+    """원본 경로에 대한 썸네일 Storage 경로"""
+    folder, _, filename = original_path.rpartition('/')
+    prefix = f"{folder}/thumbs" if folder else "thumbs"
+    if variant == DEFAULT_VARIANT:
+        return f"{prefix}/{filename}"
+    stem = filename.rsplit('.', 1)[0]
+    return f"{prefix}/{variant.size}/{stem}.{THUMBNAIL_FORMATS[variant.fmt][2]}"
+
+
+# ========================================
+# 이미지 처리 (프로세스 풀에서 실행)
+# ========================================
+
+def _flatten_to_rgb(img):
+    """투명 배경(RGBA/LA/P)을 흰색 배경 RGB로 변환"""
+    if img.mode in ('RGBA', 'LA', 'P'):
+        if img.mode == 'P':
+            img = img.convert('RGBA')
+        background = Image.new('RGB', img.size, (255, 255, 255))
+        background.paste(img, mask=img.split()[-1] if img.mode in ('RGBA', 'LA') else None)
+        return background
+    if img.mode != 'RGB':
+        return img.convert('RGB')
+    return img
+
+
+def render_thumbnails(
+    image_data: bytes,
+    variants: Iterable[Tuple[int, str]],
+    quality: int = 85
+) -> Dict[Tuple[int, str], bytes]:
+    """
+    원본을 한 번만 디코딩하여 여러 변형의 썸네일 생성
+
+    큰 크기부터 축소하므로 작은 변형은 앞 단계 결과에서 다시 축소합니다.
+
+    Returns:
+        {(size, fmt): 썸네일 바이트}
+    """
+    variants = list(variants)
+    img = Image.open(io.BytesIO(image_data))
+    # JPEG는 디코딩 단계에서 가장 큰 변형 크기 근처로 축소 (draft 모드)
+    largest = max(size for size, _ in variants)
+    img.draft('RGB', (largest, largest))
+    img = _flatten_to_rgb(img)
+
+    results: Dict[Tuple[int, str], bytes] = {}
+    for size, fmt in sorted(variants, key=lambda v: v[0], reverse=True):
+        img.thumbnail((size, size), Image.Resampling.LANCZOS)
+        buffer = io.BytesIO()
+        pil_format = THUMBNAIL_FORMATS[fmt][0]
+        if pil_format == 'JPEG':
+            img.save(buffer, format='JPEG', quality=quality, optimize=True)
+        else:
+            img.save(buffer, format=pil_format, quality=quality)
+        results[(size, fmt)] = buffer.getvalue()
+    return results
+
+
+# ========================================
+# 매니페스트
+# ========================================
+
+class ThumbnailManifest:
+    """
+    처리 완료 기록
+
+    {"images": {"folder/a.jpg": {"etag": "...", "variants": ["200.jpeg", ...], "updated_at": "..."}}}
+    원본 eTag가 같고 필요한 변형이 모두 기록되어 있으면 Storage 조회 없이 건너뜁니다.
+    """
+
+    def __init__(self, path: Path = MANIFEST_PATH):
+        self.path = Path(path)
+        self.images: Dict[str, Dict] = {}
+        self._dirty = 0
+
+    def load(self) -> 'ThumbnailManifest':
+        if self.path.exists():
+            try:
+                data = json.loads(self.path.read_text(encoding='utf-8'))
+                self.images = data.get('images', {})
+            except (OSError, ValueError) as e:
+                print(f"[WARN] 썸네일 매니페스트 읽기 실패, 새로 시작: {e}")
+                self.images = {}
+        return self
+
+    def is_complete(self, original_path: str, etag: Optional[str], variant_keys: Set[str]) -> bool:
+        entry = self.images.get(original_path)
+        if not entry or not etag or entry.get('etag') != etag:
+            return False
+        return variant_keys.issubset(entry.get('variants', ()))
+
+    def record(self, original_path: str, etag: Optional[str], variant_keys: Iterable[str]):
+        entry = self.images.get(original_path)
+        if entry is None or entry.get('etag') != etag:
+            entry = {'etag': etag, 'variants': []}
+            self.images[original_path] = entry
+        entry['variants'] = sorted(set(entry['variants']) | set(variant_keys))
+        entry['updated_at'] = datetime.now().isoformat()
+        self._dirty += 1
+
+    def save(self, force: bool = True, every: int = 50):
+        """변경이 every건 이상 쌓였거나 force면 원자적으로 저장 (중단 후 재개용)"""
+        if not self._dirty or (not force and self._dirty < every):
+            return
+        tmp_path = self.path.with_suffix('.tmp')
+        tmp_path.write_text(json.dumps({'images': self.images}, ensure_ascii=False), encoding='utf-8')
+        os.replace(tmp_path, self.path)
+        self._dirty = 0
+
+
+# ========================================
+# 파이프라인
+# ========================================
+
+def _etag(file_obj: Dict) -> Optional[str]:
+    metadata = file_obj.get('metadata') or {}
+    return metadata.get('eTag') or file_obj.get('updated_at')
+
+
+class ThumbnailPipeline:
+    """
+    Storage 전체 썸네일 생성기
+
+    Args:
+        variants: 생성할 변형 목록 (기본 200px JPEG)
+        io_concurrency: 동시 다운로드/업로드 수
+        cpu_workers: Pillow 리사이즈 프로세스 수 (기본 CPU 수)
+        manifest: 매니페스트 (None이면 기본 경로)
+        force: 기존 썸네일이 있어도 다시 생성
+        folders: 처리할 폴더 제한 (None이면 전체)
+    """
+
+    def __init__(
+        self,
+        variants: Optional[List[ThumbnailVariant]] = None,
+        io_concurrency: int = 8,
+        cpu_workers: Optional[int] = None,
+        manifest: Optional[ThumbnailManifest] = None,
+        force: bool = False,
+        folders: Optional[List[str]] = None,
+        quality: int = 85
+    ):
+        # supabase 클라이언트는 메인 프로세스에서만 필요 (프로세스 풀 워커에서 생성하지 않음)
+        from utils.supabase_storage import supabase, BUCKET_NAME
+
+        self.bucket = supabase.storage.from_(BUCKET_NAME) if supabase else None
+        self.variants = variants or [DEFAULT_VARIANT]
+        self.variant_keys = {v.key for v in self.variants}
+        self.io_concurrency = max(io_concurrency, 1)
+        self.cpu_workers = cpu_workers or os.cpu_count() or 2
+        self.manifest = manifest or ThumbnailManifest().load()
+        self.force = force
+        self.folders = folders
+        self.quality = quality
+        self.stats = {'processed': 0, 'created': 0, 'skipped': 0, 'failed': 0}
+
+    # ---------- Storage 호출 (동기 클라이언트 → 스레드) ----------
+
+    def _list_all(self, path: str) -> List[Dict]:
+        """폴더 전체 목록 (페이지 단위로 끝까지 조회)"""
+        entries: List[Dict] = []
+        offset = 0
+        while True:
+            page = self.bucket.list(path, {'limit': LIST_PAGE_SIZE, 'offset': offset})
+            entries.extend(page)
+            if len(page) < LIST_PAGE_SIZE:
+                return entries
+            offset += LIST_PAGE_SIZE
+
+    def _list_names(self, path: str) -> Set[str]:
+        try:
+            return {f"{path}/{e['name']}" for e in self._list_all(path) if e.get('id') is not None}
+        except Exception:
+            return set()  # 썸네일 폴더가 아직 없을 수 있음
+
+    def _upload(self, path: str, data: bytes, content_type: str):
+        self.bucket.upload(path, data, file_options={"content-type": content_type, "upsert": "true"})
+        try:
+            # 스토리지 카탈로그의 썸네일 여부 갱신 (DB 없이 실행해도 업로드는 계속)
+            from utils.storage_catalog import record_upload
+            record_upload(path, data, content_type)
+        except Exception as e:
+            print(f"  [WARN] Storage catalog update failed for {path}: {e}")
+
+    # ---------- 단계 ----------
+
+    async def _scan_folder(self, folder: str, queue: asyncio.Queue):
+        """폴더 하나의 원본 목록과 변형별 썸네일 목록을 한 번씩 조회하여 작업 등록"""
+        files = await asyncio.to_thread(self._list_all, folder)
+        images = [f for f in files if f.get('id') is not None]
+        print(f"[INFO] {folder}: 이미지 {len(images)}개")
+
+        pending = []
+        for file_obj in images:
+            original_path = f"{folder}/{file_obj['name']}"
+            etag = _etag(file_obj)
+            if not self.force and self.manifest.is_complete(original_path, etag, self.variant_keys):
+                self.stats['processed'] += 1
+                self.stats['skipped'] += 1
+                continue
+            pending.append((original_path, etag))
+
+        if not pending:
+            return
+
+        existing: Set[str] = set()
+        if not self.force:
+            thumb_dirs = {thumbnail_path(f"{folder}/x", v).rpartition('/')[0] for v in self.variants}
+            listings = await asyncio.gather(*(asyncio.to_thread(self._list_names, d) for d in thumb_dirs))
+            for names in listings:
+                existing |= names
+
+        for original_path, etag in pending:
+            missing = [v for v in self.variants if thumbnail_path(original_path, v) not in existing]
+            if not missing:
+                # 썸네일은 이미 있고 매니페스트만 없던 경우
+                self.manifest.record(original_path, etag, self.variant_keys)
+                self.stats['processed'] += 1
+                self.stats['skipped'] += 1
+                continue
+            await queue.put((original_path, etag, missing))
+
+    async def _process(self, original_path: str, etag: Optional[str], missing: List[ThumbnailVariant], executor):
+        data = await asyncio.to_thread(self.bucket.download, original_path)
+        if not data:
+            raise ValueError("다운로드 실패")
+
+        loop = asyncio.get_running_loop()
+        rendered = await loop.run_in_executor(
+            executor, render_thumbnails, data, [tuple(v) for v in missing], self.quality
+        )
+        del data
+
+        await asyncio.gather(*(
+            asyncio.to_thread(self._upload, thumbnail_path(original_path, v), rendered[tuple(v)], v.content_type)
+            for v in missing
+        ))
+        self.manifest.record(original_path, etag, self.variant_keys)
+
+    async def _worker(self, queue: asyncio.Queue, executor):
+        while True:
+            item = await queue.get()
+            if item is None:
+                queue.task_done()
+                return
+            original_path, etag, missing = item
+            try:
+                await self._process(original_path, etag, missing, executor)
+                self.stats['created'] += 1
+                print(f"  [OK] {original_path} ({', '.join(v.key for v in missing)})")
+            except Exception as e:
+                self.stats['failed'] += 1
+                print(f"  [FAIL] {original_path}: {e}")
+            finally:
+                self.stats['processed'] += 1
+                self.manifest.save(force=False)
+                queue.task_done()
+
+    async def run(self) -> Dict[str, int]:
+        """전체 실행 후 통계 반환"""
+        if self.bucket is None:
+            raise RuntimeError("Supabase client not initialized")
+        if not PIL_AVAILABLE:
+            raise RuntimeError("PIL not available - cannot create thumbnails")
+
+        if self.folders is None:
+            roots = await asyncio.to_thread(self._list_all, "")
+            folders = [
+                f['name'] for f in roots
+                if f.get('id') is None and f['name'] != 'thumbs' and not f['name'].startswith('.')
+            ]
+        else:
+            folders = self.folders
+        print(f"[INFO] 폴더 {len(folders)}개, 변형: {', '.join(sorted(self.variant_keys))}")
+
+        # 큐 크기를 제한하여 스캔이 처리보다 너무 앞서가지 않도록 함
+        queue: asyncio.Queue = asyncio.Queue(maxsize=self.io_concurrency * 4)
+
+        with ProcessPoolExecutor(max_workers=self.cpu_workers) as executor:
+            workers = [asyncio.create_task(self._worker(queue, executor)) for _ in range(self.io_concurrency)]
+            try:
+                for folder in folders:
+                    try:
+                        await self._scan_folder(folder, queue)
+                    except Exception as e:
+                        print(f"  [ERROR] Failed to process folder {folder}: {e}")
+                for _ in workers:
+                    await queue.put(None)
+                await asyncio.gather(*workers)
+            finally:
+                for worker in workers:
+                    worker.cancel()
+                self.manifest.save()
+
+        return dict(self.stats)
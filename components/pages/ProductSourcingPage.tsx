@@ -46,6 +46,9 @@ interface PriceHistory {
   checked_at: string;
 }
 
+// 등록 작업 진행 조회 최대 시간 (서버 중단 등으로 작업이 끝나지 않아도 무한히 조회하지 않도록)
+const REGISTRATION_POLL_TIMEOUT_MS = 30 * 60 * 1000;
+
 interface ProductSourcingPageProps {
   isMobile?: boolean;
 }
@@ -425,7 +428,30 @@ export default function ProductSourcingPage({ isMobile = false }: ProductSourcin
         })
       });
 
-      const data = await response.json();
+      let data = await response.json();
+
+      // 등록은 백그라운드 작업으로 실행됨 → 완료될 때까지 진행 상황 조회
+      if (response.ok && data.job_id) {
+        const jobUrl = `${API_BASE_URL}/api/products/register-to-playauto/jobs/${data.job_id}`;
+        const pollDeadline = Date.now() + REGISTRATION_POLL_TIMEOUT_MS;
+        do {
+          await new Promise((resolve) => setTimeout(resolve, 1500));
+          const jobResponse = await fetch(jobUrl);
+          data = await jobResponse.json();
+          if (!jobResponse.ok) break;
+          console.log(`[상품등록] 진행률 ${data.progress_percent}% (${data.processed}/${data.total})`);
+        } while ((data.status === 'pending' || data.status === 'running') && Date.now() < pollDeadline);
+
+        if (data.status === 'failed') {
+          data = { ...data, success: false, detail: data.error || '상품 등록 작업이 실패했습니다.' };
+        } else if (data.status === 'pending' || data.status === 'running') {
+          data = {
+            ...data,
+            success: false,
+            detail: `등록 작업(#${data.job_id})이 아직 끝나지 않았습니다. 잠시 후 상품 목록에서 등록 결과를 확인해주세요.`
+          };
+        }
+      }
 
       // 디버깅: 전체 응답 콘솔 출력
       console.log('=== PlayAuto 상품 등록 응답 ===');